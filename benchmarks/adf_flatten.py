@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+ADF flattener 성능 비교 (이전 재귀 구현 vs modules.adf.flatten_adf).
+
+표/목록/패널/코드 블록/미디어가 섞인 합성 ADF 문서를 원하는 크기(MB)로 만들어
+두 구현의 처리 시간을 비교하고, 깊게 중첩된 문서에서 재귀 한도에 걸리는지 확인한다.
+
+사용법:
+    python benchmarks/adf_flatten.py --sizes 1,4 --runs 5
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.adf import flatten_adf  # noqa: E402
+
+
+def legacy_flatten(node) -> str:
+    """user-042 이전 JiraFieldNormalizer._flatten_adf_node (비교 기준)."""
+    if isinstance(node, dict):
+        node_type = node.get("type")
+        if node_type == "text":
+            return node.get("text", "")
+        if node_type == "hardBreak":
+            return "\n"
+        content = node.get("content", [])
+        text = "".join(legacy_flatten(child) for child in content)
+        if node_type in {"paragraph", "heading"} and text:
+            return f"{text}\n"
+        return text
+    if isinstance(node, list):
+        return "".join(legacy_flatten(child) for child in node)
+    return ""
+
+
+def _text(value: str) -> dict:
+    return {"type": "text", "text": value}
+
+
+def _para(value: str) -> dict:
+    return {"type": "paragraph", "content": [_text(value)]}
+
+
+def _section(index: int) -> list[dict]:
+    """P2 스타일 description 한 덩어리 (표 안 목록, 패널 안 목록 포함)."""
+    cell = lambda kind, value: {"type": kind, "content": [_para(value)]}  # noqa: E731
+    return [
+        {"type": "heading", "attrs": {"level": 3}, "content": [_text("Observed:")]},
+        _para(f"{index}. 로비 진입 후 상점 탭을 열면 클라이언트가 종료됩니다."),
+        {"type": "panel", "content": [{"type": "bulletList", "content": [
+            {"type": "listItem", "content": [
+                _para(f"재현율 {index % 10 * 10}%"),
+                {"type": "orderedList", "content": [{"type": "listItem", "content": [_para("Android 14 / Galaxy S23")]}]},
+            ]},
+        ]}]},
+        {"type": "table", "content": [
+            {"type": "tableRow", "content": [cell("tableHeader", "Platform"), cell("tableHeader", "Result")]},
+            *(
+                {"type": "tableRow", "content": [
+                    {"type": "tableCell", "content": [{"type": "bulletList", "content": [
+                        {"type": "listItem", "content": [_para(platform)]},
+                    ]}]},
+                    cell("tableCell", "Fail" if row % 2 else "Pass"),
+                ]}
+                for row, platform in enumerate(("iOS", "Android", "PC"))
+            ),
+        ]},
+        {"type": "codeBlock", "attrs": {"language": "text"}, "content": [_text("E/Unity: NullReferenceException\n  at Shop.Open()")]},
+        {"type": "mediaSingle", "content": [{"type": "media", "attrs": {"type": "file", "id": str(index), "alt": f"shot_{index}.png"}}]},
+    ]
+
+
+def build_document(target_mb: float) -> tuple[dict, int]:
+    sections: list[dict] = []
+    section_bytes = len(json.dumps(_section(0), ensure_ascii=False).encode("utf-8"))
+    count = max(1, int(target_mb * 1024 * 1024 / section_bytes))
+    for index in range(count):
+        sections.extend(_section(index))
+    doc = {"type": "doc", "version": 1, "content": sections}
+    return doc, len(json.dumps(doc, ensure_ascii=False).encode("utf-8"))
+
+
+def _median_ms(func, doc, runs: int) -> float:
+    # 큰 트리에서는 GC 타이밍이 결과를 흔들므로 timeit처럼 측정 중에는 끈다
+    timings = []
+    gc.disable()
+    try:
+        for _ in range(runs):
+            started = time.perf_counter()
+            func(doc)
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        gc.enable()
+    return statistics.median(timings)
+
+
+def _deep_document(depth: int, content: Optional[list] = None) -> dict:
+    node = {"type": "panel", "content": content or [_para("leaf")]}
+    for _ in range(depth):
+        node = {"type": "panel", "content": [node]}
+    return {"type": "doc", "content": [node]}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ADF flattening.")
+    parser.add_argument("--sizes", default="1,4", help="Comma-separated document sizes in MB")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--nesting", type=int, default=50, help="Container depth for the nested variant")
+    args = parser.parse_args()
+
+    print(f"{'size':>8} {'legacy ms':>10} {'stack ms':>10} {'speedup':>8}")
+    for size in (float(value) for value in args.sizes.split(",") if value.strip()):
+        doc, size_bytes = build_document(size)
+        legacy_ms = _median_ms(legacy_flatten, doc, args.runs)
+        stack_ms = _median_ms(flatten_adf, doc, args.runs)
+        print(f"{size_bytes / 1024 / 1024:>6.1f}MB {legacy_ms:>10.1f} {stack_ms:>10.1f} {legacy_ms / stack_ms:>7.2f}x")
+
+        # 같은 내용을 컨테이너 args.nesting단 안에 넣은 경우 (이전 구현은 단계마다 문자열을 다시 join)
+        nested = _deep_document(args.nesting, doc["content"])
+        legacy_ms = _median_ms(legacy_flatten, nested, args.runs)
+        stack_ms = _median_ms(flatten_adf, nested, args.runs)
+        label = f"+{args.nesting}lvl"
+        print(f"{label:>8} {legacy_ms:>10.1f} {stack_ms:>10.1f} {legacy_ms / stack_ms:>7.2f}x")
+
+    depth = sys.getrecursionlimit() * 2
+    deep = _deep_document(depth)
+    try:
+        legacy_flatten(deep)
+        legacy_result = "ok"
+    except RecursionError:
+        legacy_result = "RecursionError"
+    stack_result = "ok" if flatten_adf(deep) == "leaf\n" else "wrong output"
+    print(f"\nnesting depth {depth}: legacy={legacy_result}, stack={stack_result}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
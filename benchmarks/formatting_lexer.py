@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+formatting 라인 판별 before/after 비교 (라인별 정규식 반복 vs tokenize_wiki_lines 한 번).
+
+비교 기준(before)은 git에서 lexer 도입 이전의 modules/formatting.py를 읽어 별도 모듈로 로드한다.
+같은 합성 description(섹션/코드 블록/표/미디어/불릿 포함)을 두 구현에 넣어
+extract_description_sections, format_bilingual_block 처리 시간을 재고 결과가 같은지 확인한다.
+
+사용법:
+    python benchmarks/formatting_lexer.py --lines 10000 --runs 5
+    python benchmarks/formatting_lexer.py --baseline-ref <git ref>
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import statistics
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules import formatting  # noqa: E402
+
+_BLOCK = [
+    "Observed:",
+    "* 로비 진입 후 상점 탭을 열면 클라이언트가 종료됩니다.",
+    "  # 재현율 {n}0%",
+    "!shot_{n}.png|thumbnail!",
+    "[^video_{n}.mp4] - 재현 영상",
+    "",
+    "{code:java}",
+    "E/Unity: NullReferenceException at Shop.Open()",
+    "{code}",
+    "||플랫폼||결과||",
+    "|iOS|실패|",
+    "|Android|성공|",
+    "",
+    "Expected:",
+    "상점 탭이 정상적으로 열려야 합니다.",
+    "[log_{n}.txt|https://example.com/log_{n}.txt]",
+]
+
+
+def synthetic_description(line_count: int) -> tuple[str, str]:
+    """(원문, 번역문) 합성 description."""
+    original: list[str] = []
+    translated: list[str] = []
+    n = 0
+    while len(original) < line_count:
+        for line in _BLOCK:
+            line = line.replace("{n}", str(n))
+            original.append(line)
+            if line and not line.startswith(("!", "[", "{", "Observed", "Expected")):
+                translated.append(f"EN {line}")
+        n += 1
+    return "\n".join(original[:line_count]), "\n".join(translated)
+
+
+def _default_baseline_ref() -> str:
+    """lexer 도입 커밋의 부모 (찾지 못하면 HEAD)."""
+    result = subprocess.run(
+        ["git", "log", "-1", "--format=%H", "--grep=^\\[user-044\\]"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=False,
+    )
+    commit = result.stdout.strip()
+    return f"{commit}^" if commit else "HEAD"
+
+
+def load_baseline(ref: str) -> types.ModuleType:
+    source = subprocess.run(
+        ["git", "show", f"{ref}:modules/formatting.py"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    module = types.ModuleType("formatting_baseline")
+    exec(compile(source, f"{ref}:modules/formatting.py", "exec"), module.__dict__)
+    return module
+
+
+def _median_ms(func, runs: int) -> float:
+    timings = []
+    gc.disable()
+    try:
+        for _ in range(runs):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        gc.enable()
+    return statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark wiki markup line classification.")
+    parser.add_argument("--lines", type=int, default=10000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--baseline-ref", default=None, help="Git ref of the 'before' modules/formatting.py")
+    args = parser.parse_args()
+
+    ref = args.baseline_ref or _default_baseline_ref()
+    baseline = load_baseline(ref)
+    original, translated = synthetic_description(args.lines)
+
+    cases = {
+        "extract_description_sections": lambda module: module.extract_description_sections(original),
+        "format_bilingual_block": lambda module: module.format_bilingual_block(original, translated),
+    }
+    print(f"baseline: {ref}, {args.lines} lines")
+    print(f"{'function':<30} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for name, case in cases.items():
+        if case(baseline) != case(formatting):
+            print(f"❌ {name}: output differs from baseline")
+            return 1
+        before = _median_ms(lambda: case(baseline), args.runs)
+        after = _median_ms(lambda: case(formatting), args.runs)
+        print(f"{name:<30} {before:>10.1f} {after:>10.1f} {before / after:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
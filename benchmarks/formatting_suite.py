@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+formatting/언어 판별/용어집 후보 추출 micro-benchmark (처리량 + peak 메모리).
+
+benchmarks/synthetic_ticket.py의 합성 티켓(1KB ~ 5MB)에 대해 다음 함수를 측정한다.
+- formatting.extract_description_sections
+- formatting.format_bilingual_block
+- formatting.extract_attachments_markup
+- language.detect_text_language
+- PromptBuilder.get_candidate_entries (glossaries/pubg_glossary.json, matcher 컴파일 이후)
+
+시간은 GC를 끈 상태로 --runs번 실행한 최솟값(ms)과 처리량(MB/s), 메모리는 tracemalloc peak(KiB)로 별도 실행에서 잰다.
+결과는 JSON으로 저장하고, --compare로 저장된 baseline과 비교해 기준(--time-threshold,
+--memory-threshold)보다 느려지거나 메모리가 늘어난 항목이 있으면 1을 반환한다.
+baseline(benchmarks/formatting_baseline.json)은 머신마다 다르므로 비교 전에 같은 머신에서
+--save-baseline으로 만든다.
+
+사용법:
+    python benchmarks/formatting_suite.py --sizes 1KB,64KB,1MB,5MB --output /tmp/formatting.json
+    python benchmarks/formatting_suite.py --save-baseline
+    python benchmarks/formatting_suite.py --compare
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic_ticket import SyntheticTicket, format_size, generate_ticket, parse_size  # noqa: E402
+from modules import formatting, language  # noqa: E402
+
+BASELINE_PATH = Path(__file__).resolve().parent / "formatting_baseline.json"
+DEFAULT_SIZES = "1KB,64KB,1MB,5MB"
+DEFAULT_GLOSSARY = "pubg_glossary.json"
+
+
+def _prompt_builder(glossary_file: str):
+    """실제 용어집으로 PromptBuilder를 만든다 (OpenAI 클라이언트 없이 엔진의 로더만 사용)."""
+    from modules.translation_engine import TranslationEngine
+
+    engine = TranslationEngine(openai_api_key="", client=object())
+    engine.load_glossary(glossary_file, "Benchmark")
+    return engine.prompt_builder
+
+
+def build_cases(glossary_file: str = DEFAULT_GLOSSARY) -> dict[str, Callable[[SyntheticTicket], object]]:
+    prompt_builder = _prompt_builder(glossary_file)
+    return {
+        "extract_description_sections": lambda ticket: formatting.extract_description_sections(ticket.description),
+        "format_bilingual_block": lambda ticket: formatting.format_bilingual_block(ticket.description, ticket.translation),
+        "extract_attachments_markup": lambda ticket: formatting.extract_attachments_markup(ticket.description),
+        "detect_text_language": lambda ticket: language.detect_text_language(ticket.description),
+        "get_candidate_entries": lambda ticket: prompt_builder.get_candidate_entries([ticket.summary, ticket.description], "ko"),
+    }
+
+
+def _best_ms(func: Callable[[], object], runs: int) -> float:
+    # timeit과 같이 최솟값을 쓴다 (공유 머신의 스케줄링 노이즈는 시간을 늘리는 쪽으로만 작용)
+    timings = []
+    gc.disable()
+    try:
+        for _ in range(runs):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        gc.enable()
+    return min(timings)
+
+
+def _peak_kib(func: Callable[[], object]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def run_suite(
+    sizes: list[int],
+    runs: int = 5,
+    seed: int = 7,
+    functions: Optional[list[str]] = None,
+    glossary_file: str = DEFAULT_GLOSSARY,
+) -> dict:
+    cases = build_cases(glossary_file)
+    if functions:
+        unknown = set(functions) - set(cases)
+        if unknown:
+            raise ValueError(f"Unknown function(s): {', '.join(sorted(unknown))}")
+        cases = {name: case for name, case in cases.items() if name in functions}
+
+    results: dict[str, dict] = {}
+    for size in sizes:
+        ticket = generate_ticket(size, seed=seed)
+        for name, case in cases.items():
+            run = lambda: case(ticket)  # noqa: E731
+            run()  # warm-up (정규식/matcher 컴파일)
+            best_ms = _best_ms(run, runs)
+            results[f"{name}@{format_size(size)}"] = {
+                "function": name,
+                "size_bytes": ticket.size_bytes,
+                "best_ms": round(best_ms, 3),
+                "mb_per_s": round(ticket.size_bytes / 1024 / 1024 / (best_ms / 1000), 2) if best_ms > 0 else None,
+                "peak_kib": round(_peak_kib(run), 1),
+            }
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "runs": runs,
+            "glossary": glossary_file,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: dict,
+    baseline: dict,
+    time_threshold: float = 0.5,
+    memory_threshold: float = 0.1,
+    min_ms: float = 1.0,
+) -> list[str]:
+    """baseline 대비 regression 목록 (best_ms/peak_kib가 (1 + threshold)배를 넘은 항목).
+
+    baseline 시간이 min_ms보다 짧은 항목은 측정 노이즈가 커서 시간 비교에서 제외한다.
+    """
+    regressions: list[str] = []
+    for key, base in baseline.get("results", {}).items():
+        now = current.get("results", {}).get(key)
+        if now is None:
+            continue
+        for metric, threshold in (("best_ms", time_threshold), ("peak_kib", memory_threshold)):
+            before, after = base.get(metric), now.get(metric)
+            if not before or after is None:
+                continue
+            if metric == "best_ms" and before < min_ms:
+                continue
+            if after > before * (1 + threshold):
+                regressions.append(f"{key} {metric}: {before} -> {after} ({after / before:.2f}x)")
+    return regressions
+
+
+def _print_results(report: dict, baseline: Optional[dict] = None) -> None:
+    base_results = (baseline or {}).get("results", {})
+    header = f"{'case':<38} {'ms':>10} {'MB/s':>9} {'peak KiB':>10}"
+    print(header + (f" {'vs base':>8}" if baseline else ""))
+    for key, result in report["results"].items():
+        line = f"{key:<38} {result['best_ms']:>10.2f} {result['mb_per_s'] or 0:>9.1f} {result['peak_kib']:>10.1f}"
+        base = base_results.get(key)
+        if base and base.get("best_ms"):
+            line += f" {result['best_ms'] / base['best_ms']:>7.2f}x"
+        print(line)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Formatting micro-benchmark suite.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated ticket sizes (e.g. 1KB,1MB,5MB)")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--functions", default=None, help="Comma-separated subset of functions to run")
+    parser.add_argument("--glossary", default=DEFAULT_GLOSSARY)
+    parser.add_argument("--output", default=None, help="Write results JSON to this path")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    parser.add_argument("--save-baseline", action="store_true", help="Write results to --baseline")
+    parser.add_argument("--compare", action="store_true", help="Compare against --baseline and fail on regressions")
+    # 시간은 공유 머신에서 실행마다 수십 % 흔들리므로 넉넉하게, tracemalloc peak는 결정적이므로 좁게 둔다
+    parser.add_argument("--time-threshold", type=float, default=0.5)
+    parser.add_argument("--memory-threshold", type=float, default=0.1)
+    parser.add_argument("--min-ms", type=float, default=1.0, help="Skip time comparison for faster baseline cases")
+    args = parser.parse_args()
+
+    sizes = [parse_size(value) for value in args.sizes.split(",") if value.strip()]
+    functions = [name.strip() for name in args.functions.split(",")] if args.functions else None
+    report = run_suite(sizes, runs=args.runs, seed=args.seed, functions=functions, glossary_file=args.glossary)
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    _print_results(report, baseline)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"📝 Results written to {args.output}")
+    if args.save_baseline:
+        Path(args.baseline).write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"📝 Baseline written to {args.baseline}")
+
+    if baseline is not None:
+        regressions = compare(report, baseline, args.time_threshold, args.memory_threshold, args.min_ms)
+        if regressions:
+            print("\n❌ Regressions vs baseline:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print("\n✅ No regressions vs baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
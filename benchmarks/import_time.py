@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+cold start import 시간 프로파일러 (`python -X importtime` 기반).
+
+모듈을 새 인터프리터에서 import하고 stderr의 importtime 출력을 파싱해
+누적 import 시간과 가장 비싼 모듈 목록을 보여준다.
+`--check`를 주면 benchmarks/import_budget.json의 예산과 비교해 초과 시 1을 반환한다.
+
+사용법:
+    python benchmarks/import_time.py handler
+    python benchmarks/import_time.py --check
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+BUDGET_PATH = Path(__file__).resolve().parent / "import_budget.json"
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass
+class ImportProfile:
+    module: str
+    cumulative_us: int = 0
+    # 모듈 이름 -> (self us, cumulative us)
+    modules: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    def top(self, limit: int = 15) -> list[tuple[str, int, int]]:
+        ranked = sorted(self.modules.items(), key=lambda item: item[1][1], reverse=True)
+        return [(name, self_us, cumulative_us) for name, (self_us, cumulative_us) in ranked[:limit]]
+
+    def imported(self, package: str) -> bool:
+        """package 자체 또는 하위 모듈이 import되었는지."""
+        prefix = f"{package}."
+        return any(name == package or name.startswith(prefix) for name in self.modules)
+
+
+def profile_import(module: str, runs: int = 1) -> ImportProfile:
+    """새 인터프리터에서 module을 import하고 importtime 결과를 파싱한다.
+
+    runs > 1이면 누적 시간이 가장 짧은 실행을 사용한다(측정 노이즈 완화).
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH", "")]))
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+
+    best: ImportProfile | None = None
+    for _ in range(max(1, runs)):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=PROJECT_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{completed.stderr[-2000:]}")
+
+        rows: list[tuple[str, int, int, int]] = []
+        for line in completed.stderr.splitlines():
+            match = _IMPORTTIME_LINE.match(line)
+            if not match:
+                continue
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent)))
+
+        # importtime은 하위 모듈을 부모보다 먼저(더 깊은 들여쓰기로) 출력한다.
+        # 인터프리터 시작 시 로드되는 site 등을 제외하고 대상 모듈의 subtree만 남긴다.
+        profile = ImportProfile(module=module)
+        target_index = next((i for i, row in enumerate(rows) if row[0] == module), None)
+        if target_index is not None:
+            target_depth = rows[target_index][3]
+            start = target_index
+            while start > 0 and rows[start - 1][3] > target_depth:
+                start -= 1
+            for name, self_us, cumulative_us, _ in rows[start:target_index + 1]:
+                profile.modules[name] = (self_us, cumulative_us)
+            profile.cumulative_us = rows[target_index][2]
+
+        if best is None or profile.cumulative_us < best.cumulative_us:
+            best = profile
+    assert best is not None
+    return best
+
+
+def load_budget(path: Path = BUDGET_PATH) -> dict:
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def check_budget(budget: dict, runs: int = 3, timing: bool = True) -> list[str]:
+    """예산 위반 메시지 목록을 반환 (비어 있으면 통과).
+
+    timing=False면 금지 모듈만 검사한다 (측정 환경에 따라 흔들리는 wall-clock 예산 제외).
+    """
+    violations: list[str] = []
+    for module, rule in budget.get("modules", {}).items():
+        profile = profile_import(module, runs=runs if timing else 1)
+        for package in rule.get("forbidden_imports", []):
+            if profile.imported(package):
+                violations.append(f"import {module} pulls in forbidden package '{package}'")
+        max_us = rule.get("max_cumulative_us")
+        if timing and max_us is not None and profile.cumulative_us > max_us:
+            violations.append(
+                f"import {module} took {profile.cumulative_us} us (budget {max_us} us)"
+            )
+    return violations
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Profile module import time with -X importtime.")
+    parser.add_argument("modules", nargs="*", default=["handler"], help="Modules to profile (default: handler)")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest modules to print")
+    parser.add_argument("--check", action="store_true", help=f"Check against {BUDGET_PATH.name}")
+    args = parser.parse_args()
+
+    if args.check:
+        violations = check_budget(load_budget())
+        for message in violations:
+            print(f"❌ {message}")
+        if not violations:
+            print("✅ Import budget OK")
+        return 1 if violations else 0
+
+    for module in args.modules:
+        profile = profile_import(module)
+        print(f"\n=== import {module}: {profile.cumulative_us / 1000:.1f} ms cumulative ===")
+        print(f"{'module':<50} {'self ms':>9} {'cumul ms':>9}")
+        for name, self_us, cumulative_us in profile.top(args.top):
+            print(f"{name:<50} {self_us / 1000:>9.1f} {cumulative_us / 1000:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
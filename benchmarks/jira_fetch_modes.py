@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+이슈 조회 모드(full vs lean) 응답 크기/지연 시간 비교.
+
+같은 이슈를 JIRA_FETCH_MODE=full(항상 renderedFields 포함)과 lean(raw 값만, 필요한 필드만 보충 조회)으로
+번갈아 조회하고 JiraClient.fetch_stats에 기록된 요청 수/응답 바이트/지연 시간을 비교한다.
+
+- JIRA_URL/JIRA_EMAIL/JIRA_API_TOKEN 환경 변수와 --issue가 있으면 실제 Jira를 조회
+- 없으면 큰 P2 스타일 description(ADF raw + HTML rendered)을 돌려주는 로컬 스텁을 사용
+
+사용법:
+    python benchmarks/jira_fetch_modes.py --runs 10
+    JIRA_URL=... JIRA_EMAIL=... JIRA_API_TOKEN=... python benchmarks/jira_fetch_modes.py --issue P2-70735
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+DEFAULT_FIELDS = ["summary", "description", "customfield_10399"]
+
+
+def _stub_issue(paragraphs: int) -> dict:
+    lines = [f"{i}. 로비 진입 후 상점 탭을 열면 클라이언트가 종료됩니다. (재현율 {i % 10 * 10}%)" for i in range(paragraphs)]
+    adf = {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": line}]} for line in lines],
+    }
+    html = "".join(f'<p><span class="text">{line}</span></p>' for line in lines)
+    return {
+        "fields": {"summary": "[Client] 상점 진입 시 크래시", "description": adf, "customfield_10399": None},
+        "renderedFields": {"summary": None, "description": html, "customfield_10399": None},
+    }
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):  # noqa: D401 - 벤치마크 출력 억제
+        return
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        fields = (query.get("fields") or [""])[0].split(",")
+        issue = self.server.issue
+        payload = {"key": "P2-1", "fields": {name: issue["fields"].get(name) for name in fields}}
+        if "renderedFields" in (query.get("expand") or [""])[0]:
+            payload["renderedFields"] = {name: issue["renderedFields"].get(name) for name in fields}
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _start_stub(paragraphs: int) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.issue = _stub_issue(paragraphs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(jira_url: str, email: str, token: str, issue_key: str, fields: list[str], runs: int) -> dict:
+    from modules.jira_client import JiraClient
+
+    summary: dict = {}
+    for mode in ("full", "lean"):
+        client = JiraClient(jira_url, email, token, fetch_mode=mode)
+        latencies = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            client.fetch_issue_fields(issue_key, fields)
+            latencies.append((time.perf_counter() - started) * 1000)
+        stats = client.fetch_stats.as_dict()
+        summary[mode] = {
+            "requests_per_fetch": sum(entry["requests"] for entry in stats.values()) / runs,
+            "bytes_per_fetch": sum(entry["bytes"] for entry in stats.values()) / runs,
+            "median_ms": round(statistics.median(latencies), 1),
+            "stats": stats,
+        }
+    return summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare full vs lean Jira issue fetch.")
+    parser.add_argument("--issue", help="Issue key to fetch from the real Jira (requires JIRA_* env)")
+    parser.add_argument("--fields", default=",".join(DEFAULT_FIELDS))
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--paragraphs", type=int, default=400, help="Stub description size")
+    args = parser.parse_args()
+    fields = [field.strip() for field in args.fields.split(",") if field.strip()]
+
+    if args.issue and os.getenv("JIRA_URL"):
+        summary = run(
+            os.environ["JIRA_URL"],
+            os.getenv("JIRA_EMAIL", ""),
+            os.getenv("JIRA_API_TOKEN", ""),
+            args.issue,
+            fields,
+            args.runs,
+        )
+    else:
+        os.environ.setdefault("JIRA_RATE_LIMIT", "0")
+        server = _start_stub(args.paragraphs)
+        try:
+            summary = run(f"http://127.0.0.1:{server.server_port}", "bench", "bench", "P2-1", fields, args.runs)
+        finally:
+            server.shutdown()
+
+    print(f"{'mode':<6} {'req/fetch':>10} {'bytes/fetch':>12} {'median ms':>10}")
+    for mode, row in summary.items():
+        print(f"{mode:<6} {row['requests_per_fetch']:>10.2f} {row['bytes_per_fetch']:>12.0f} {row['median_ms']:>10.1f}")
+    full_bytes = summary["full"]["bytes_per_fetch"]
+    if full_bytes:
+        print(f"\nlean/full bytes: {summary['lean']['bytes_per_fetch'] / full_bytes:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
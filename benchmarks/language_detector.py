@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+language.detect_text_language before/after 비교 (패턴별 findall/search 반복 vs 합친 정규식 search).
+
+비교 기준(before)은 git에서 단일 스캔 도입 이전의 modules/language.py를 읽어 별도 모듈로 로드한다.
+tests/data/language_corpus.jsonl의 짧은 문자열(청크/summary 크기)과 합성 티켓 description 전체에 대해
+두 구현의 판정이 모두 같은지 확인하고 처리 시간을 비교한다.
+
+사용법:
+    python benchmarks/language_detector.py --runs 5
+    python benchmarks/language_detector.py --baseline-ref <git ref>
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic_ticket import generate_ticket, parse_size  # noqa: E402
+from modules import language  # noqa: E402
+
+CORPUS_PATH = PROJECT_ROOT / "tests" / "data" / "language_corpus.jsonl"
+
+
+def _default_baseline_ref() -> str:
+    """단일 스캔 도입 커밋의 부모 (찾지 못하면 HEAD)."""
+    result = subprocess.run(
+        ["git", "log", "-1", "--format=%H", "--grep=^\\[user-049\\]"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=False,
+    )
+    commit = result.stdout.strip()
+    return f"{commit}^" if commit else "HEAD"
+
+
+def load_baseline(ref: str) -> types.ModuleType:
+    source = subprocess.run(
+        ["git", "show", f"{ref}:modules/language.py"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    module = types.ModuleType("language_baseline")
+    exec(compile(source, f"{ref}:modules/language.py", "exec"), module.__dict__)
+    return module
+
+
+def _best_ms(func, runs: int) -> float:
+    timings = []
+    gc.disable()
+    try:
+        for _ in range(runs):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        gc.enable()
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark language detection.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--size", default="1MB", help="Synthetic description size for the large-text case")
+    parser.add_argument("--baseline-ref", default=None, help="Git ref of the 'before' modules/language.py")
+    args = parser.parse_args()
+
+    ref = args.baseline_ref or _default_baseline_ref()
+    baseline = load_baseline(ref)
+    with CORPUS_PATH.open(encoding="utf-8") as handle:
+        corpus = [json.loads(line)["text"] for line in handle]
+    ticket = generate_ticket(parse_size(args.size), seed=7)
+    english_ticket = ticket.translation
+
+    cases = {
+        f"corpus ({len(corpus)} texts)": lambda module: [module.detect_text_language(text) for text in corpus],
+        f"description {args.size} (ko)": lambda module: module.detect_text_language(ticket.description),
+        f"translation {args.size} (en)": lambda module: module.detect_text_language(english_ticket),
+    }
+    print(f"baseline: {ref}")
+    print(f"{'case':<30} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for name, case in cases.items():
+        if case(baseline) != case(language):
+            print(f"❌ {name}: decisions differ from baseline")
+            return 1
+        before = _best_ms(lambda: case(baseline), args.runs)
+        after = _best_ms(lambda: case(language), args.runs)
+        print(f"{name:<30} {before:>10.2f} {after:>10.2f} {before / after:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
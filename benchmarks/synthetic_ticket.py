@@ -0,0 +1,130 @@
+"""
+벤치마크용 합성 Jira 티켓 생성기 (같은 seed/크기면 항상 같은 결과).
+
+P2 스타일 description을 원하는 UTF-8 바이트 크기까지 이어 붙인다.
+섹션 헤더(Observed/Expected/Note/Video/QA Environment), 불릿/번호 목록, 코드 블록, 표,
+미디어 전용/미디어+텍스트 라인, 한국어/영어/혼합 문장이 섞이며,
+format_bilingual_block 입력용으로 원문 텍스트 라인마다 대응하는 번역 라인도 함께 만든다.
+
+사용법:
+    from benchmarks.synthetic_ticket import generate_ticket, parse_size
+    ticket = generate_ticket(parse_size("1MB"), seed=7)
+    ticket.description, ticket.translation, ticket.summary
+"""
+from __future__ import annotations
+
+import random
+import re
+from dataclasses import dataclass
+
+# (한국어, 영어) 문장 쌍. 용어는 glossaries/pubg_glossary.json과 겹치도록 고른다.
+_SENTENCES = (
+    ("로비 진입 후 상점 탭을 열면 클라이언트가 종료됩니다.", "The client quits when opening the shop tab after entering the lobby."),
+    ("경쟁전 매치 종료 후 결과 화면이 표시되지 않습니다.", "The result screen is not displayed after a Ranked match ends."),
+    ("관전 중 팀원을 전환하면 화면이 멈춥니다.", "The screen freezes when switching teammates while Spectating."),
+    ("다시 보기 파일을 불러오면 로딩이 끝나지 않습니다.", "Loading never finishes when opening a Replay file."),
+    ("보급품 상자를 열 때 아이템 목록이 비어 있습니다.", "The item list is empty when opening a care package."),
+    ("인벤토리에서 총기를 장착하면 부착물이 사라집니다.", "Attachments disappear when equipping a gun from the inventory."),
+    ("차량 탑승 직후 미니맵 위치가 갱신되지 않아야 합니다.", "The minimap position should not update right after boarding a vehicle."),
+    ("설정 메뉴에서 감도를 변경해도 저장되지 않는 것을 확인했습니다.", "Observe that sensitivity changes in the settings menu are not saved."),
+)
+_MIXED = (
+    "Shop UI 진입 시 NullReferenceException 발생",
+    "Ranked 모드에서 Replay 버튼 비활성화",
+    "PC / PS5 모두 재현 (build 31.2)",
+    "Care Package 낙하 위치가 minimap과 다름",
+)
+_EN_ONLY = (
+    "Steps were verified on the latest QA build.",
+    "This issue is not reproducible on the previous patch.",
+    "Please check the attached client log for the stack trace.",
+)
+_PLATFORMS = ("iOS", "Android", "PC", "PS5", "Xbox")
+_RESULTS = (("실패", "Fail"), ("성공", "Pass"), ("재현 안 됨", "Not reproduced"))
+_SECTIONS = ("Observed:", "Expected Result:", "Note:", "Video/영상:")
+
+
+@dataclass(frozen=True)
+class SyntheticTicket:
+    summary: str
+    description: str
+    # description의 텍스트/표 라인에 대응하는 번역문 (format_bilingual_block의 translated 입력)
+    translation: str
+    size_bytes: int
+
+
+def parse_size(value: str) -> int:
+    """'512', '1KB', '2.5MB' 같은 크기 문자열 -> 바이트 수."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*(B|KB|MB)?\s*", value, re.IGNORECASE)
+    if not match:
+        raise ValueError(f"Invalid size: {value!r}")
+    number = float(match.group(1))
+    unit = (match.group(2) or "B").upper()
+    return int(number * {"B": 1, "KB": 1024, "MB": 1024 * 1024}[unit])
+
+
+def format_size(size_bytes: int) -> str:
+    if size_bytes >= 1024 * 1024 and size_bytes % (1024 * 1024) == 0:
+        return f"{size_bytes // (1024 * 1024)}MB"
+    if size_bytes >= 1024 and size_bytes % 1024 == 0:
+        return f"{size_bytes // 1024}KB"
+    return f"{size_bytes}B"
+
+
+def _section(rng: random.Random, index: int) -> tuple[list[str], list[str]]:
+    """섹션 하나의 (원문 라인, 번역 라인)."""
+    original: list[str] = [rng.choice(_SECTIONS)]
+    translated: list[str] = []
+
+    def text(line_ko: str, line_en: str, prefix: str = "") -> None:
+        original.append(f"{prefix}{line_ko}")
+        translated.append(f"{prefix}{line_en}")
+
+    for _ in range(rng.randint(2, 5)):
+        ko, en = rng.choice(_SENTENCES)
+        text(ko, en, prefix=rng.choice(("", "* ", "# ", "  - ")))
+    if rng.random() < 0.5:
+        mixed = rng.choice(_MIXED)
+        text(mixed, mixed)
+    if rng.random() < 0.3:
+        english = rng.choice(_EN_ONLY)
+        text(english, english)
+    if rng.random() < 0.6:
+        original.append(f"!shot_{index}.png|thumbnail!")
+    if rng.random() < 0.4:
+        ko, en = rng.choice(_SENTENCES)
+        text(f"[^clip_{index}.mp4] {ko}", f"[^clip_{index}.mp4] {en}")
+    if rng.random() < 0.3:
+        original.extend(["{code:java}", f"E/Unity: NullReferenceException at Shop.Open() #{index}", "  at Lobby.Enter()", "{code}"])
+    if rng.random() < 0.4:
+        original.append("||플랫폼||결과||")
+        translated.append("||Platform||Result||")
+        for platform in rng.sample(_PLATFORMS, 3):
+            ko, en = rng.choice(_RESULTS)
+            original.append(f"|{platform}|{ko}|")
+            translated.append(f"|{platform}|{en}|")
+    original.append("")
+    return original, translated
+
+
+def generate_ticket(size_bytes: int, seed: int = 0) -> SyntheticTicket:
+    """UTF-8 기준 size_bytes 이상이 될 때까지 섹션을 이어 붙인 합성 티켓."""
+    rng = random.Random(seed)
+    original: list[str] = []
+    translated: list[str] = []
+    total = 0
+    index = 0
+    while total < size_bytes:
+        section_original, section_translated = _section(rng, index)
+        original.extend(section_original)
+        translated.extend(section_translated)
+        total += sum(len(line.encode("utf-8")) + 1 for line in section_original)
+        index += 1
+    original.extend(["*[QA 환경 / QA Environment]*", "빌드 31.2.0 / PC, PS5", ""])
+    description = "\n".join(original).strip("\n")
+    return SyntheticTicket(
+        summary=f"[Client][Shop] {_SENTENCES[seed % len(_SENTENCES)][0]}",
+        description=description,
+        translation="\n".join(translated),
+        size_bytes=len(description.encode("utf-8")),
+    )
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+warm invocation 지연 시간 벤치마크.
+
+로컬 HTTP 스텁 서버(Jira REST + OpenAI chat completions 흉내)를 띄운 뒤
+lambda_handler를 반복 호출하여, translator 캐시를 끈 경우(before)와 켠 경우(after)의
+호출당 지연 시간과 새로 맺은 TCP 커넥션 수를 비교한다.
+또한 프로세스 캐시를 비운 상태에서 첫 요청 지연 시간을 /health?warm=true 선행 여부별로 비교한다.
+
+사용법:
+    python benchmarks/warm_invocation.py --invocations 50
+
+주의: 스텁은 평문 HTTP/localhost이므로 TLS 핸드셰이크 비용은 측정에 포함되지 않는다.
+실제 Jira Cloud/OpenAI(HTTPS, 원격)에서는 커넥션 재사용 효과가 이보다 크다.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+ISSUE_FIELDS = {
+    "summary": "[Client] 로비에서 크래시 발생",
+    "description": "Observed:\n로비 진입 시 클라이언트가 종료됩니다.\n\nExpected:\n정상적으로 로비에 진입해야 합니다.",
+    "customfield_10399": "1. 클라이언트 실행\n2. 로비 진입",
+}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):  # noqa: D401 - 벤치마크 출력 억제
+        return
+
+    def _send_json(self, payload: dict, status: int = 200):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if "/rest/api/2/issue/" in self.path:
+            self._send_json({"fields": ISSUE_FIELDS, "renderedFields": {}})
+            return
+        if self.path.startswith("/rest/api/2/serverInfo"):
+            self._send_json({"version": "bench"})
+            return
+        if self.path.startswith("/v1/models/"):
+            model_id = self.path.rsplit("/", 1)[-1]
+            self._send_json({"id": model_id, "object": "model", "created": 0, "owned_by": "bench"})
+            return
+        self._send_json({}, status=404)
+
+    def do_PUT(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        request = json.loads(raw or b"{}")
+        user_msg = request.get("messages", [{}])[-1].get("content", "")
+        translations = []
+        try:
+            payload = json.loads(user_msg.split("\n", 1)[1])
+            translations = [{"id": item["id"], "translated": f"T:{item['text']}"} for item in payload["items"]]
+        except Exception:
+            pass
+        self._send_json(
+            {
+                "id": "chatcmpl-bench",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request.get("model", "bench"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {
+                            "role": "assistant",
+                            "content": json.dumps({"translations": translations}, ensure_ascii=False),
+                        },
+                    }
+                ],
+            }
+        )
+
+
+def _start_stub_server() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.lock = threading.Lock()
+    server.connections = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _run(handler_module, server: ThreadingHTTPServer, invocations: int, cache: str) -> dict:
+    os.environ["TRANSLATOR_CACHE"] = cache
+    handler_module._TRANSLATOR_CACHE.clear()
+    event = {
+        "headers": {"Content-Type": "application/json"},
+        "body": json.dumps({"issue_key": "P2-1", "update": True}),
+    }
+
+    # 첫 호출(cold)은 통계에서 제외
+    handler_module.lambda_handler(event, context=None)
+    connections_before = server.connections
+
+    latencies_ms: list[float] = []
+    for _ in range(invocations):
+        started = time.perf_counter()
+        response = handler_module.lambda_handler(event, context=None)
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+        if response["statusCode"] != 200:
+            raise RuntimeError(f"unexpected response: {response}")
+
+    latencies_ms.sort()
+    return {
+        "cache": cache,
+        "invocations": invocations,
+        "median_ms": round(statistics.median(latencies_ms), 2),
+        "p95_ms": round(latencies_ms[int(len(latencies_ms) * 0.95) - 1], 2),
+        "new_connections": server.connections - connections_before,
+    }
+
+
+def _first_request(handler_module, warm: bool) -> dict:
+    from modules.translation_engine import clear_glossary_cache
+
+    os.environ["TRANSLATOR_CACHE"] = "on"
+    handler_module._TRANSLATOR_CACHE.clear()
+    clear_glossary_cache()
+    event = {
+        "headers": {"Content-Type": "application/json"},
+        "body": json.dumps({"issue_key": "P2-1", "update": True}),
+    }
+
+    warm_ms = None
+    if warm:
+        started = time.perf_counter()
+        handler_module.lambda_handler({"resource": "/health", "queryStringParameters": {"warm": "true"}}, None)
+        warm_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    started = time.perf_counter()
+    response = handler_module.lambda_handler(event, context=None)
+    if response["statusCode"] != 200:
+        raise RuntimeError(f"unexpected response: {response}")
+    return {
+        "warm_up": warm,
+        "warm_up_ms": warm_ms,
+        "first_request_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark warm lambda_handler invocations with/without translator reuse.")
+    parser.add_argument("--invocations", type=int, default=30)
+    args = parser.parse_args()
+
+    server = _start_stub_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ.update(
+        {
+            "JIRA_URL": base_url,
+            "JIRA_EMAIL": "bench@example.com",
+            "JIRA_API_TOKEN": "bench-token",
+            "OPENAI_API_KEY": "sk-bench",
+            "OPENAI_BASE_URL": f"{base_url}/v1",
+        }
+    )
+
+    import handler
+
+    results = [
+        _run(handler, server, args.invocations, cache="off"),
+        _run(handler, server, args.invocations, cache="on"),
+        _first_request(handler, warm=False),
+        _first_request(handler, warm=True),
+    ]
+    print(json.dumps(results, indent=2))
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
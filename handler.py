@@ -1,13 +1,41 @@
 from __future__ import annotations
 
 import base64
+import hashlib
+import hmac
+import importlib
+import itertools
 import json
 import os
 import re
+import threading
+import time
 import urllib.parse
 from collections.abc import Sequence
 
-from jira_trans import JiraTicketTranslator, parse_issue_url
+from modules.jira_client import STEPS_FIELD_CANDIDATES, parse_issue_url
+
+# jira_trans는 openai/pydantic/requests를 끌어오므로 모듈 로드 시점에 import하지 않는다.
+# /health나 잘못된 입력(400) 같은 경로는 이 SDK들 없이 응답할 수 있어야 cold start가 짧아진다.
+_LAZY_ATTRS = {
+    "JiraTicketTranslator": "jira_trans",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _lazy_attr(name: str):
+    """지연 로드 대상 심볼을 반환 (테스트에서 monkeypatch한 값이 있으면 그 값을 사용)."""
+    if name in globals():
+        return globals()[name]
+    return __getattr__(name)
 
 
 def _json_response(status_code: int, payload: dict) -> dict:
@@ -90,6 +118,12 @@ def _parse_request_payload(event: dict) -> dict:
     merged = dict(event or {})
     body_raw = merged.get("body") or ""
 
+    # 쿼리 파라미터(?async=true, GET /translate?issue_key=...)를 먼저 병합하고 body 값이 우선한다.
+    query = merged.get("queryStringParameters") or {}
+    if isinstance(query, dict):
+        for key, value in query.items():
+            merged.setdefault(key, value)
+
     if merged.get("isBase64Encoded"):
         if isinstance(body_raw, str):
             body_raw = body_raw.encode("utf-8", "ignore")
@@ -107,8 +141,8 @@ def _parse_request_payload(event: dict) -> dict:
         elif "application/x-www-form-urlencoded" in content_type:
             parsed = {}
             for k, v in urllib.parse.parse_qs(body_raw).items():
-                # 반복 키로 들어오는 fields_to_translate는 배열 형태를 유지한다.
-                if k == "fields_to_translate":
+                # 반복 키로 들어오는 fields_to_translate/issue_keys는 배열 형태를 유지한다.
+                if k in ("fields_to_translate", "issue_keys"):
                     parsed[k] = v if isinstance(v, list) else [v]
                 else:
                     parsed[k] = v[0] if isinstance(v, list) else v
@@ -122,9 +156,62 @@ def _parse_request_payload(event: dict) -> dict:
     if isinstance(parsed, dict):
         merged.update(parsed)
 
+    if "issue_keys" in merged:
+        merged["issue_keys"] = _normalize_issue_keys(merged.get("issue_keys"))
+    if "jql" in merged:
+        jql = merged.get("jql")
+        if jql is not None and not isinstance(jql, str):
+            raise ValueError("jql은 문자열이어야 합니다.")
+        merged["jql"] = (jql or "").strip() or None
+
     return merged
 
 
+_ISSUE_KEY_PATTERN = re.compile(r"[A-Z][A-Z0-9_]*-\d+")
+
+
+def _normalize_issue_keys(value) -> list[str] | None:
+    """issue_keys 입력(list, JSON 배열 문자열, CSV 문자열)을 list[str]로 정규화."""
+    if value is None:
+        return None
+
+    if isinstance(value, str):
+        text = value.strip()
+        if text.startswith("["):
+            try:
+                value = json.loads(text)
+            except Exception:
+                raise ValueError("issue_keys JSON 배열을 파싱할 수 없습니다.")
+        else:
+            value = text.split(",")
+
+    if not isinstance(value, Sequence) or isinstance(value, (bytes, bytearray)):
+        raise ValueError("issue_keys는 이슈 키 배열이어야 합니다.")
+
+    keys = [str(item).strip().upper() for item in value if str(item).strip()]
+    invalid = [key for key in keys if not _ISSUE_KEY_PATTERN.fullmatch(key)]
+    if invalid:
+        raise ValueError(f"Invalid issue_keys: {', '.join(invalid)}")
+
+    # 중복 키는 순서를 유지한 채 제거한다.
+    deduped = list(dict.fromkeys(keys))
+    return deduped or None
+
+
+def _batch_limits(event: dict) -> tuple[int, int]:
+    """(최대 이슈 수, 동시성) — 환경 변수 상한 안에서 요청의 concurrency를 허용."""
+    max_issues = max(1, int(os.getenv("BATCH_MAX_ISSUES", "50")))
+    max_concurrency = max(1, int(os.getenv("BATCH_CONCURRENCY", "4")))
+    requested = event.get("concurrency")
+    if requested in (None, ""):
+        return max_issues, max_concurrency
+    try:
+        concurrency = int(requested)
+    except (TypeError, ValueError):
+        raise ValueError("concurrency는 정수여야 합니다.")
+    return max_issues, max(1, min(concurrency, max_concurrency))
+
+
 def _load_required_env() -> tuple[str, str, str, str]:
     jira_url = os.getenv("JIRA_URL", "https://cloud.jira.krafton.com").rstrip("/")
     jira_email = os.getenv("JIRA_EMAIL")
@@ -139,6 +226,50 @@ def _load_required_env() -> tuple[str, str, str, str]:
     return jira_url, jira_email, jira_api_token, openai_api_key
 
 
+# 컨테이너 단위(warm invocation 간) translator 캐시.
+# JiraClient의 requests.Session, TranslationEngine의 OpenAI 클라이언트가 들고 있는
+# 커넥션 풀(TLS 세션 포함)을 호출 간에 재사용하기 위함이다.
+_TRANSLATOR_CACHE: dict[tuple, "JiraTicketTranslator"] = {}
+_TRANSLATOR_CACHE_LOCK = threading.Lock()
+
+
+def _translator_cache_key(jira_url: str, jira_email: str, jira_api_token: str, openai_api_key: str) -> tuple:
+    # 비밀값은 키에 평문으로 남기지 않는다.
+    secret_digest = hashlib.sha256(f"{jira_api_token}\0{openai_api_key}".encode("utf-8")).hexdigest()
+    return (_lazy_attr("JiraTicketTranslator"), jira_url, jira_email, secret_digest)
+
+
+def _get_translator(jira_url: str, jira_email: str, jira_api_token: str, openai_api_key: str):
+    """환경 설정이 같으면 이전 호출의 translator(및 HTTP 클라이언트)를 재사용한다.
+
+    요청별 상태(용어집 등)는 translate_issue 시작 시 초기화된다.
+    TRANSLATOR_CACHE=off로 캐시를 끌 수 있다(벤치마크/디버깅용).
+    """
+    translator_cls = _lazy_attr("JiraTicketTranslator")
+    if os.getenv("TRANSLATOR_CACHE", "on").strip().lower() in {"0", "off", "false", "no"}:
+        return translator_cls(
+            jira_url=jira_url,
+            email=jira_email,
+            api_token=jira_api_token,
+            openai_api_key=openai_api_key,
+        )
+
+    key = _translator_cache_key(jira_url, jira_email, jira_api_token, openai_api_key)
+    with _TRANSLATOR_CACHE_LOCK:
+        translator = _TRANSLATOR_CACHE.get(key)
+        if translator is None:
+            translator = translator_cls(
+                jira_url=jira_url,
+                email=jira_email,
+                api_token=jira_api_token,
+                openai_api_key=openai_api_key,
+            )
+            # 자격 증명이 교체되면 이전 클라이언트는 버린다 (항목은 최대 1개 유지).
+            _TRANSLATOR_CACHE.clear()
+            _TRANSLATOR_CACHE[key] = translator
+        return translator
+
+
 def _resolve_issue_key(issue_key, issue_url) -> str:
     # issue_key 우선, 없으면 URL에서 추출
     if issue_key:
@@ -149,43 +280,407 @@ def _resolve_issue_key(issue_key, issue_url) -> str:
     raise ValueError("issue_key 또는 issue_url 중 하나는 필수입니다.")
 
 
+def _is_health_request(event: dict) -> bool:
+    """/health 경로 요청 또는 EventBridge 스케줄(keep-warm) 이벤트인지."""
+    path = event.get("resource") or event.get("path") or event.get("rawPath") or ""
+    if isinstance(path, str) and path.rstrip("/").endswith("/health"):
+        return True
+    return event.get("source") == "aws.events" or event.get("detail-type") == "Scheduled Event"
+
+
+def _wants_warm_up(event: dict) -> bool:
+    # ?warm=true 쿼리, 직접 호출/스케줄 Input의 {"warm": true}, 스케줄 이벤트 자체
+    query = event.get("queryStringParameters") or {}
+    if _coerce_bool(query.get("warm")) or _coerce_bool(event.get("warm")):
+        return True
+    return event.get("source") == "aws.events"
+
+
+def _warm_up(open_connections: bool = True) -> dict:
+    """translator를 생성(캐시)하고 용어집/matcher/커넥션을 미리 준비한다."""
+    started = time.perf_counter()
+    jira_url, jira_email, jira_api_token, openai_api_key = _load_required_env()
+    translator = _get_translator(jira_url, jira_email, jira_api_token, openai_api_key)
+    result = translator.warm_up(open_connections=open_connections)
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+def _handle_health(event: dict) -> dict:
+    """헬스 체크. warm 요청이면 첫 번역 요청이 낼 초기화 비용을 여기서 미리 소모한다."""
+    if not _wants_warm_up(event):
+        return _json_response(200, {"status": "ok"})
+    try:
+        warm = _warm_up()
+    except EnvironmentError as e:
+        print(f"❌ Configuration Error: {str(e)}")
+        return _json_response(503, {"status": "error", "error": str(e), "type": type(e).__name__})
+    connections = warm.get("connections") or {}
+    status = "ok" if all(item.get("ok") for item in connections.values()) else "degraded"
+    print(f"🔥 Warm-up finished in {warm['elapsed_ms']}ms (status={status})")
+    return _json_response(200, {"status": status, "warm": warm})
+
+
+def _normalize_translation_request(event: dict, trust_webhook_fields: bool = True) -> dict:
+    """파싱된 event를 검증해 번역 요청 dict로 정규화 (동기 실행/비동기 job 공용).
+
+    - 단일 이슈: {"issue_key", "fields_to_translate", "update"}
+    - webhook: 단일 이슈 + {"webhook_fields"} (payload의 issue.fields)
+      + {"previous_fields"} (changelog의 변경 전 값, 있을 때만)
+      trust_webhook_fields=False(서명 검증 없음)면 issue.fields는 쓰지 않고 Jira에서 다시 조회한다.
+    - 증분 재번역: 단일 이슈/webhook 요청에 {"incremental": True}
+    - 여러 이슈: {"issue_keys", "jql", "fields_to_translate", "update", "concurrency"}
+    """
+    fields = _normalize_fields_to_translate(event.get("fields_to_translate"))  # None이면 자동 결정
+    do_update = _coerce_bool(event.get("update", False))
+
+    if event.get("webhookEvent"):
+        issue = event.get("issue")
+        if not isinstance(issue, dict) or not issue.get("key"):
+            raise ValueError("webhook payload에 issue.key가 없습니다.")
+        webhook_fields = issue.get("fields") or {}
+        if not isinstance(webhook_fields, dict):
+            raise ValueError("webhook payload의 issue.fields는 객체여야 합니다.")
+        request = {
+            "issue_key": str(issue["key"]).strip().upper(),
+            "fields_to_translate": fields,
+            "update": do_update,
+        }
+        if trust_webhook_fields:
+            request["webhook_fields"] = webhook_fields
+        else:
+            print("ℹ️ Webhook signature not configured; re-fetching issue fields from Jira")
+        previous_fields = _changelog_previous_fields(event.get("changelog"))
+        if previous_fields:
+            request["previous_fields"] = previous_fields
+        if _wants_incremental(event):
+            request["incremental"] = True
+        return request
+
+    if event.get("issue_keys") or event.get("jql"):
+        max_issues, concurrency = _batch_limits(event)
+        issue_keys = list(event.get("issue_keys") or [])
+        if len(issue_keys) > max_issues:
+            raise ValueError(f"issue_keys는 최대 {max_issues}개까지 지정할 수 있습니다.")
+        return {
+            "issue_keys": issue_keys,
+            "jql": event.get("jql"),
+            "fields_to_translate": fields,
+            "update": do_update,
+            "concurrency": concurrency,
+        }
+
+    issue_key = _resolve_issue_key(event.get("issue_key"), event.get("issue_url"))
+    request = {"issue_key": issue_key, "fields_to_translate": fields, "update": do_update}
+    # ADF 원형 유지 모드 (v3 API): 요청의 "adf" 값, 없으면 JIRA_ADF_MODE 환경 변수
+    if _coerce_bool(event.get("adf", os.getenv("JIRA_ADF_MODE", False))):
+        request["adf"] = True
+    elif _wants_incremental(event):
+        request["incremental"] = True
+    return request
+
+
+def _wants_incremental(event: dict) -> bool:
+    """증분 재번역 모드: 요청의 "incremental" 값, 없으면 JIRA_INCREMENTAL_MODE 환경 변수."""
+    return _coerce_bool(event.get("incremental", os.getenv("JIRA_INCREMENTAL_MODE", False)))
+
+
+def _changelog_previous_fields(changelog) -> dict[str, str]:
+    """webhook changelog.items에서 필드별 변경 전 문자열(fromString)을 모은다."""
+    if not isinstance(changelog, dict):
+        return {}
+    previous: dict[str, str] = {}
+    for item in changelog.get("items") or []:
+        if not isinstance(item, dict):
+            continue
+        field = item.get("fieldId") or item.get("field")
+        value = item.get("fromString")
+        if isinstance(field, str) and isinstance(value, str) and value:
+            previous[field] = value
+    return previous
+
+
+def _execute_translation(request: dict) -> dict:
+    """정규화된 번역 요청을 실행하고 응답 본문 dict를 반환."""
+    # 보안을 위해 외부 주입 차단: 환경 변수 기반으로만 구성
+    jira_url, jira_email, jira_api_token, openai_api_key = _load_required_env()
+    translator = _get_translator(jira_url, jira_email, jira_api_token, openai_api_key)
+
+    if "issue_keys" in request:
+        return _execute_batch(translator, request)
+
+    def run() -> dict:
+        if "webhook_fields" in request:
+            return translator.translate_issue_from_webhook(
+                issue_key=request["issue_key"],
+                webhook_fields=request["webhook_fields"],
+                fields_to_translate=request.get("fields_to_translate"),
+                perform_update=request.get("update", False),
+                previous_fields=request.get("previous_fields"),
+                incremental=request.get("incremental", False),
+            )
+        if request.get("adf"):
+            return translator.translate_issue_adf(
+                issue_key=request["issue_key"],
+                fields_to_translate=request.get("fields_to_translate"),
+                perform_update=request.get("update", False),
+            )
+        return translator.translate_issue(
+            issue_key=request["issue_key"],
+            fields_to_translate=request.get("fields_to_translate"),
+            perform_update=request.get("update", False),
+            incremental=request.get("incremental", False),
+            previous_fields=request.get("previous_fields"),
+        )
+
+    # 같은 이슈/필드/update 요청이 동시에(또는 직후에) 들어오면 한 번만 번역하고 결과를 공유한다.
+    single_flight = _single_flight()
+    if single_flight is None:
+        results_obj, coalesced = run(), False
+    else:
+        from modules.single_flight import flight_key
+
+        key = flight_key(
+            request["issue_key"],
+            request.get("fields_to_translate"),
+            request.get("update", False),
+            mode="adf" if request.get("adf") else "incremental" if request.get("incremental") else None,
+            content={
+                name: request[name] for name in ("webhook_fields", "previous_fields") if request.get(name)
+            },
+        )
+        results_obj, coalesced = single_flight.do(key, run)
+        if coalesced:
+            print(f"🔗 Reused in-flight/recent result for {request['issue_key']}")
+    return {
+        "issue_key": request["issue_key"],
+        **results_obj,
+        "coalesced": coalesced,
+    }
+
+
+_SINGLE_FLIGHT = None
+_SINGLE_FLIGHT_READY = False
+_SINGLE_FLIGHT_LOCK = threading.Lock()
+
+
+def _single_flight():
+    """컨테이너 단위 SingleFlight (SINGLE_FLIGHT=off면 None)."""
+    global _SINGLE_FLIGHT, _SINGLE_FLIGHT_READY
+    with _SINGLE_FLIGHT_LOCK:
+        if not _SINGLE_FLIGHT_READY:
+            from modules.single_flight import build_single_flight
+
+            _SINGLE_FLIGHT = build_single_flight()
+            _SINGLE_FLIGHT_READY = True
+        return _SINGLE_FLIGHT
+
+
+def _execute_batch(translator, request: dict) -> dict:
+    """issue_keys 및/또는 jql로 지정된 여러 이슈를 한 번에 번역."""
+    max_issues, _ = _batch_limits({})
+    issue_keys = list(request.get("issue_keys") or [])
+
+    # JQL 검색 시 번역에 필요한 필드를 함께 받아 와 이슈별 fetch를 생략한다.
+    fields = request.get("fields_to_translate")
+    projection = list(dict.fromkeys(["summary", *(fields or ["description", *STEPS_FIELD_CANDIDATES])]))
+    prefetched: dict[str, dict[str, str]] = {}
+
+    jql = request.get("jql")
+    if jql:
+        remaining = max_issues - len(issue_keys)
+        if remaining > 0:
+            found = translator.search_issues(jql, projection, page_size=min(100, remaining))
+            for key, issue_fields in itertools.islice(found, remaining):
+                prefetched.setdefault(key, issue_fields)
+            issue_keys = list(dict.fromkeys([*issue_keys, *prefetched]))
+    if not issue_keys:
+        raise ValueError("번역할 이슈가 없습니다 (issue_keys/jql 결과가 비어 있음).")
+
+    batch_obj = translator.translate_issues(
+        issue_keys,
+        fields_to_translate=fields,
+        perform_update=request.get("update", False),
+        max_workers=request.get("concurrency") or _batch_limits({})[1],
+        prefetched=prefetched,
+        prefetched_fields=projection,
+    )
+    return {"issue_keys": issue_keys, **batch_obj}
+
+
+# --- Jira webhook ---
+
+# 번역 대상 webhook 이벤트 (그 외 이벤트는 200으로 무시)
+_WEBHOOK_EVENTS = {"jira:issue_created", "jira:issue_updated"}
+
+
+class WebhookSignatureError(ValueError):
+    pass
+
+
+def _is_webhook_request(event: dict) -> bool:
+    path = event.get("resource") or event.get("path") or event.get("rawPath") or ""
+    return isinstance(path, str) and path.rstrip("/").endswith("/webhook")
+
+
+def _raw_body_bytes(event: dict) -> bytes:
+    body = event.get("body") or ""
+    if event.get("isBase64Encoded"):
+        return base64.b64decode(body)
+    return body.encode("utf-8") if isinstance(body, str) else bytes(body)
+
+
+def _verify_webhook_signature(event: dict) -> None:
+    """JIRA_WEBHOOK_SECRET이 설정돼 있으면 X-Hub-Signature(sha256=HMAC)를 검증한다."""
+    secret = os.getenv("JIRA_WEBHOOK_SECRET")
+    if not secret:
+        return
+    headers = {str(k).lower(): v for k, v in (event.get("headers") or {}).items()}
+    signature = str(headers.get("x-hub-signature") or "")
+    expected = "sha256=" + hmac.new(secret.encode("utf-8"), _raw_body_bytes(event), hashlib.sha256).hexdigest()
+    if not hmac.compare_digest(signature, expected):
+        raise WebhookSignatureError("webhook 서명이 올바르지 않습니다.")
+
+
+# --- 비동기 job 모드 ---
+
+_JOB_BACKEND: tuple | None = None
+_JOB_BACKEND_LOCK = threading.Lock()
+_JOB_ID_PATH = re.compile(r"/translate/([0-9a-fA-F]{32})/?$")
+
+
+def _async_jobs_enabled() -> bool:
+    """JOB_BACKEND가 명시적으로 설정된 경우에만 async 모드를 허용한다.
+
+    memory/sqlite 구현은 실행 환경 하나 안에서만 공유되고 배포 스택에는 worker가 없으므로,
+    설정 없이 job을 받으면 "queued"에 영원히 머문다.
+    """
+    return bool(os.getenv("JOB_BACKEND", "").strip())
+
+
+def _job_backend():
+    """(JobStore, JobQueue) — 컨테이너 단위로 1회 생성 (JOB_BACKEND=memory|sqlite)."""
+    global _JOB_BACKEND
+    with _JOB_BACKEND_LOCK:
+        if _JOB_BACKEND is None:
+            from modules.jobs import build_job_backend
+
+            _JOB_BACKEND = build_job_backend()
+        return _JOB_BACKEND
+
+
+def _job_status_id(event: dict) -> str | None:
+    """GET /translate/{job_id} 요청이면 job id를 반환."""
+    method = (event.get("httpMethod") or (event.get("requestContext") or {}).get("http", {}).get("method") or "")
+    if method.upper() != "GET":
+        return None
+    job_id = (event.get("pathParameters") or {}).get("job_id")
+    if job_id:
+        return str(job_id)
+    match = _JOB_ID_PATH.search(event.get("path") or event.get("rawPath") or "")
+    return match.group(1) if match else None
+
+
+def _handle_job_status(job_id: str) -> dict:
+    if not _async_jobs_enabled():
+        return _json_response(404, {"error": "async job mode is not enabled", "type": "NotFound"})
+    store, _ = _job_backend()
+    record = store.get(job_id)
+    if record is None:
+        return _json_response(404, {"error": f"job not found: {job_id}", "type": "NotFound"})
+    return _json_response(200, record.as_dict())
+
+
+def _enqueue_translation(request: dict) -> dict:
+    if not _async_jobs_enabled():
+        raise ValueError("비동기 job 모드가 활성화되어 있지 않습니다 (JOB_BACKEND 미설정).")
+    # 설정 오류는 job을 만들기 전에 바로 알린다.
+    _load_required_env()
+    store, job_queue = _job_backend()
+    record = store.create(request)
+    job_queue.enqueue(record.job_id)
+    print(f"📨 Queued job {record.job_id}")
+    return _json_response(
+        202,
+        {"job_id": record.job_id, "status": record.status, "status_url": f"/translate/{record.job_id}"},
+    )
+
+
+def worker_handler(event, context):
+    """비동기 job worker 진입점.
+
+    - SQS 형식 이벤트({"Records": [{"body": "{\"job_id\": ...}"}]})면 해당 job만 처리
+    - 그 외에는 큐가 빌 때까지 처리하되, Lambda 남은 시간이 JOB_WORKER_MIN_REMAINING_MS 미만이면 중단
+    """
+    from modules.jobs import process_job, run_worker
+
+    store, job_queue = _job_backend()
+    records = (event or {}).get("Records") or []
+    if records:
+        processed = 0
+        for record in records:
+            job_id = json.loads(record.get("body") or "{}").get("job_id")
+            if job_id and process_job(store, job_id, _execute_translation) is not None:
+                processed += 1
+        return {"processed": processed}
+
+    min_remaining_ms = int(os.getenv("JOB_WORKER_MIN_REMAINING_MS", "30000"))
+    remaining = getattr(context, "get_remaining_time_in_millis", None)
+    processed = run_worker(
+        store,
+        job_queue,
+        _execute_translation,
+        max_jobs=(event or {}).get("max_jobs"),
+        should_continue=lambda: remaining is None or remaining() > min_remaining_ms,
+    )
+    return {"processed": processed}
+
+
 def lambda_handler(event, context):
     """
     AWS Lambda 진입점.
-    - API Gateway proxy event(body/json/form) 파싱
+    - /health (및 EventBridge keep-warm 스케줄) 처리
+    - GET /translate/{job_id}: 비동기 job 상태/결과 조회
+    - API Gateway proxy event(body/json/form/query) 파싱
     - 환경 변수 기반으로 Jira/OpenAI 설정 로드
     - JiraTicketTranslator 호출 후 JSON 응답 반환
+      (issue_keys/jql이 있으면 여러 이슈를 동시에 번역해 이슈별 결과/에러를 반환)
+    - POST /webhook: Jira webhook payload의 issue.fields를 재조회 없이 번역에 사용
+    - async=true면 job을 큐에 넣고 202 + job_id 반환 (worker_handler가 처리)
     """
     try:
-        event = _parse_request_payload(event or {})
-
-        issue_key = _resolve_issue_key(event.get("issue_key"), event.get("issue_url"))
-        fields = _normalize_fields_to_translate(event.get("fields_to_translate"))  # None이면 자동 결정
-        do_update = _coerce_bool(event.get("update", False))
-
-        # 보안을 위해 외부 주입 차단: 환경 변수 기반으로만 구성
-        jira_url, jira_email, jira_api_token, openai_api_key = _load_required_env()
-
-        translator = JiraTicketTranslator(
-            jira_url=jira_url,
-            email=jira_email,
-            api_token=jira_api_token,
-            openai_api_key=openai_api_key,
+        if _is_health_request(event or {}):
+            return _handle_health(event or {})
+
+        job_id = _job_status_id(event or {})
+        if job_id:
+            return _handle_job_status(job_id)
+
+        raw_event = event or {}
+        is_webhook_route = _is_webhook_request(raw_event)
+        if is_webhook_route:
+            _verify_webhook_signature(raw_event)
+
+        event = _parse_request_payload(raw_event)
+        # webhook 형태의 본문은 issue.fields를 그대로 번역하므로 경로와 무관하게 서명을 검증한다
+        if event.get("webhookEvent") and not is_webhook_route:
+            _verify_webhook_signature(raw_event)
+        if event.get("webhookEvent") and event["webhookEvent"] not in _WEBHOOK_EVENTS:
+            print(f"ℹ️ Ignoring webhook event {event['webhookEvent']}")
+            return _json_response(200, {"ignored": True, "webhookEvent": event["webhookEvent"]})
+        # 서명을 검증하지 않은 webhook 본문의 필드 값은 신뢰하지 않는다 (누구나 임의 내용을 이슈에 쓰게 됨)
+        request = _normalize_translation_request(
+            event, trust_webhook_fields=bool(os.getenv("JIRA_WEBHOOK_SECRET"))
         )
 
-        results_obj = translator.translate_issue(
-            issue_key=issue_key,
-            fields_to_translate=fields,
-            perform_update=do_update,
-        )
-
-        response_data = {
-            "issue_key": issue_key,
-            **results_obj,
-        }
+        if _coerce_bool(event.get("async")):
+            return _enqueue_translation(request)
 
-        return _json_response(200, response_data)
+        return _json_response(200, _execute_translation(request))
 
+    except WebhookSignatureError as e:
+        print(f"❌ Unauthorized webhook: {str(e)}")
+        return _json_response(401, {"error": str(e), "type": type(e).__name__})
     except ValueError as e:
         print(f"❌ Bad Request: {str(e)}")
         return _json_response(400, {"error": str(e), "type": type(e).__name__})
@@ -195,3 +690,13 @@ def lambda_handler(event, context):
     except Exception as e:
         print(f"❌ Error: {str(e)}")
         return _json_response(500, {"error": str(e), "type": type(e).__name__})
+
+
+# provisioned concurrency / SnapStart 환경에서는 init 단계에서 미리 warm-up해
+# 첫 요청이 용어집 로드와 TLS 핸드셰이크 비용을 내지 않도록 한다.
+# init 단계에서는 커넥션을 맺지 않는다 (실행 환경이 재개될 때 끊겨 있을 수 있으므로).
+if _coerce_bool(os.getenv("WARM_ON_INIT")):
+    try:
+        _warm_up(open_connections=False)
+    except Exception as _warm_exc:  # init 실패로 함수 전체가 죽지 않도록
+        print(f"⚠️ Warm-up on init failed: {_warm_exc}")
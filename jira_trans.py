@@ -1,7 +1,8 @@
 import re
 from collections.abc import Sequence
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+from prompts import PROMPT_VERSION
 from models import (
     FieldTranslationJob,
     TranslationChunk,
@@ -10,10 +11,15 @@ from models import (
 )
 
 # New modules
-from modules import formatting, language
+from modules import adf, batch_translation, formatting, language
+from modules.fingerprints import FingerprintStore, default_fingerprint_store, issue_fingerprint
+from modules.glossary_compliance import ComplianceReport
 from modules.jira_client import JiraClient, parse_issue_url
 from modules.translation_engine import TranslationEngine, run_batch_translation_orchestration
 
+if TYPE_CHECKING:
+    from modules.bulk_update import BulkUpdateSummary
+
 # Backward-compat re-exports (tests/external code may import these from jira_trans)
 __all__ = [
     "JiraTicketTranslator",
@@ -30,6 +36,9 @@ class JiraTicketTranslator:
 
     DESCRIPTION_SECTIONS = formatting.DESCRIPTION_SECTIONS
 
+    # 변경 없는 재번역을 건너뛰기 위한 이슈별 fingerprint 저장소 (None이면 비활성화)
+    fingerprint_store: Optional[FingerprintStore] = None
+
     def __init__(self, jira_url: str, email: str, api_token: str, openai_api_key: str):
         """
         Args:
@@ -42,6 +51,8 @@ class JiraTicketTranslator:
         self.jira_client = JiraClient(jira_url, email, api_token)
         self.translation_engine = TranslationEngine(openai_api_key)
         
+        self.fingerprint_store = default_fingerprint_store()
+
         # Initialize compatibility properties
         self.jira_url = self.jira_client.jira_url
         self.email = email
@@ -96,6 +107,10 @@ class JiraTicketTranslator:
     def prompt_builder(self, value):
         self.translation_engine.prompt_builder = value
 
+    def reset_request_state(self) -> None:
+        """요청 간 공유되면 안 되는 상태를 초기화 (HTTP 클라이언트와 캐시는 유지)."""
+        self.translation_engine.reset_request_state()
+
     # --- Delegated Methods (kept for test compatibility) ---
 
     def restore_attachments_markup(self, text: str, attachments: list[str]) -> str:
@@ -172,6 +187,71 @@ class JiraTicketTranslator:
     ) -> dict[str, str]:
         return self.translation_engine._call_openai_batch_once(chunks, target_language)
 
+    def _check_glossary_compliance(
+        self,
+        chunks: Sequence[TranslationChunk],
+        translations: dict[str, str],
+        direction_lang: str,
+    ) -> ComplianceReport:
+        return self.translation_engine.check_glossary_compliance(chunks, translations, direction_lang)
+
+    def _repair_glossary_batch(
+        self,
+        chunks: Sequence[TranslationChunk],
+        translations: dict[str, str],
+        report: ComplianceReport,
+        direction_lang: str,
+    ) -> dict[str, str]:
+        return self.translation_engine.repair_glossary_violations(chunks, translations, report, direction_lang)
+
+    def _enforce_glossary_compliance(
+        self,
+        chunks: Sequence[TranslationChunk],
+        chunk_translations: dict[str, str],
+        target_language: Optional[str] = None,
+    ) -> ComplianceReport:
+        """번역 후 용어집 준수 여부를 검사하고, 위반 청크만 모아 repair 배치를 1회 수행.
+
+        repair 결과는 위반 용어 수가 줄어든 청크에 한해 chunk_translations에 반영한다.
+        """
+        translatable = [chunk for chunk in chunks if not chunk.skip_translation]
+        direction_lang = self.translation_engine.resolve_chunks_direction_lang(translatable, target_language)
+
+        report = self._check_glossary_compliance(translatable, chunk_translations, direction_lang)
+        if not report.non_compliant:
+            return report
+
+        print(f"📚 Glossary compliance: {len(report.non_compliant)} chunk(s) need repair")
+        try:
+            repaired = self._repair_glossary_batch(translatable, chunk_translations, report, direction_lang)
+        except Exception as exc:
+            print(f"⚠️ Glossary repair failed, keeping original translations: {exc}")
+            return report
+
+        missing_before = {item.chunk_id: len(item.missing_ids) for item in report.non_compliant}
+        candidates = {chunk_id: text for chunk_id, text in repaired.items() if chunk_id in missing_before and text}
+        if not candidates:
+            return report
+
+        recheck = self._check_glossary_compliance(
+            [chunk for chunk in translatable if chunk.id in candidates],
+            candidates,
+            direction_lang,
+        )
+        rechecked = {item.chunk_id: item for item in recheck.chunks}
+
+        final_chunks = []
+        for item in report.chunks:
+            after = rechecked.get(item.chunk_id)
+            if after is not None and len(after.missing_ids) < missing_before.get(item.chunk_id, 0):
+                chunk_translations[item.chunk_id] = candidates[item.chunk_id]
+                report.repaired_chunk_ids.append(item.chunk_id)
+                final_chunks.append(after)
+            else:
+                final_chunks.append(item)
+        report.chunks = final_chunks
+        return report
+
     def _plan_field_translation_job(
         self,
         field: str,
@@ -179,6 +259,13 @@ class JiraTicketTranslator:
     ) -> Optional[FieldTranslationJob]:
         return self.translation_engine.plan_field_translation_job(field, value)
 
+    def _plan_incremental_description_job(
+        self,
+        value: str,
+        previous_value: Optional[str] = None,
+    ) -> Optional[FieldTranslationJob]:
+        return self.translation_engine.plan_incremental_description_job(value, previous_value)
+
     def fetch_issue_fields(
         self,
         issue_key: str,
@@ -186,21 +273,67 @@ class JiraTicketTranslator:
     ) -> dict[str, str]:
         return self.jira_client.fetch_issue_fields(issue_key, fields_to_fetch)
 
-    def update_issue_fields(self, issue_key: str, field_payload: dict[str, str]) -> None:
-        self.jira_client.update_issue_fields(issue_key, field_payload)
+    def update_issue_fields(
+        self,
+        issue_key: str,
+        field_payload: dict[str, str],
+        notify_users: Optional[bool] = None,
+    ) -> None:
+        self.jira_client.update_issue_fields(issue_key, field_payload, notify_users=notify_users)
+
+    def fetch_issue_adf(self, issue_key: str, fields_to_fetch: Sequence[str]) -> dict:
+        return self.jira_client.fetch_issue_adf(issue_key, fields_to_fetch)
+
+    def update_issue_adf_fields(self, issue_key: str, field_payload: dict) -> None:
+        self.jira_client.update_issue_fields(issue_key, field_payload, api_version=3)
+
+    def diff_update_payload(
+        self,
+        payload: dict[str, str],
+        issue_fields: dict[str, str],
+    ) -> tuple[dict[str, str], list[str]]:
+        """(실제로 바뀌는 필드만 남긴 payload, 현재 값과 같아 제외한 필드 목록).
+
+        issue_fields는 fetch 시 normalize_field_value로 정규화된 값이므로 payload도 같은 방식으로 비교한다.
+        """
+        changed: dict[str, str] = {}
+        unchanged: list[str] = []
+        for field, value in payload.items():
+            current = issue_fields.get(field)
+            if current is not None and self.jira_client.normalize_field_value(value) == current:
+                unchanged.append(field)
+            else:
+                changed[field] = value
+        return changed, unchanged
 
     # Formatting wrappers (kept for test compatibility)
     def _match_translated_line_format(self, original_line: str, translated_line: str) -> str:
         return formatting.match_translated_line_format(original_line, translated_line)
 
-    def _format_bilingual_block(self, original: str, translated: str, header: Optional[str] = None) -> str:
-        return formatting.format_bilingual_block(original, translated, header)
+    def _format_bilingual_block(
+        self,
+        original: str,
+        translated: str,
+        header: Optional[str] = None,
+        cell_translations: Optional[dict[str, str]] = None,
+    ) -> str:
+        return formatting.format_bilingual_block(original, translated, header, cell_translations)
 
     def _extract_description_sections(self, text: str) -> list[tuple[Optional[str], str]]:
         return formatting.extract_description_sections(text)
 
-    @staticmethod
-    def _determine_glossary(project_key: str, summary: str = "") -> tuple[str, str]:
+    # 프로젝트 키별 glossary (파일명, 이름). 매핑에 없는 프로젝트는 _DEFAULT_GLOSSARY 사용.
+    _PROJECT_GLOSSARIES: dict[str, tuple[str, str]] = {
+        "PUBG": ("pubg_glossary.json", "PUBG"),
+        "PM": ("pubg_glossary.json", "PUBG"),
+        "PUBGXBSG": ("pubg_outbreak_glossary.json", "PUBG Outbreak"),
+        "PAYDAY": ("pubg_heist_glossary.json", "PUBG Heist Royale"),
+    }
+    _BINARYSPOT_GLOSSARY: tuple[str, str] = ("pubg_binaryspot_glossary.json", "PUBG BinarySpot")
+    _DEFAULT_GLOSSARY: tuple[str, str] = ("pbb_glossary.json", "PBB(Project Black Budget)")
+
+    @classmethod
+    def _determine_glossary(cls, project_key: str, summary: str = "") -> tuple[str, str]:
         """프로젝트 키(+ 선택적 summary)로 glossary 파일명과 이름을 결정.
 
         PUBG-/PM- 티켓에서 summary에 '[BS]'가 있으면 BinarySpot glossary 사용.
@@ -210,15 +343,40 @@ class JiraTicketTranslator:
         # PUBG/PM 계열: summary에 [BS] 또는 [BS_...] 태그 있으면 BinarySpot
         # [BS] 또는 [BS_xxx] 매칭, [BSG] 등 다른 태그는 제외
         if project_key in ("PUBG", "PM") and re.search(r"\[BS[\]_]", summary):
-            return ("pubg_binaryspot_glossary.json", "PUBG BinarySpot")
+            return cls._BINARYSPOT_GLOSSARY
 
-        mapping = {
-            "PUBG": ("pubg_glossary.json", "PUBG"),
-            "PM": ("pubg_glossary.json", "PUBG"),
-            "PUBGXBSG": ("pubg_outbreak_glossary.json", "PUBG Outbreak"),
-            "PAYDAY": ("pubg_heist_glossary.json", "PUBG Heist Royale"),
-        }
-        return mapping.get(project_key, ("pbb_glossary.json", "PBB(Project Black Budget)"))
+        return cls._PROJECT_GLOSSARIES.get(project_key, cls._DEFAULT_GLOSSARY)
+
+    @classmethod
+    def glossary_catalog(cls) -> list[tuple[str, str]]:
+        """_determine_glossary가 반환할 수 있는 모든 glossary (중복 제거, 파일명 순서 유지)."""
+        candidates = [cls._DEFAULT_GLOSSARY, *cls._PROJECT_GLOSSARIES.values(), cls._BINARYSPOT_GLOSSARY]
+        return list(dict.fromkeys(candidates))
+
+    def warm_up(self, open_connections: bool = True) -> dict:
+        """첫 요청 전에 비싼 초기화를 미리 수행 (health check / provisioned concurrency 용).
+
+        - 모든 glossary를 로드해 프로세스 캐시에 올리고 matcher 정규식을 컴파일
+        - open_connections=True면 Jira/OpenAI에 가벼운 요청을 보내 TLS 커넥션을 풀에 확보
+
+        개별 단계가 실패해도 예외를 던지지 않고 결과 dict에 기록한다.
+        """
+        glossaries: dict[str, int] = {}
+        for filename, _ in self.glossary_catalog():
+            try:
+                glossaries[filename] = self.translation_engine.preload_glossary(filename)
+            except Exception as exc:
+                print(f"⚠️ Glossary preload failed for {filename}: {exc}")
+                glossaries[filename] = 0
+        result: dict = {"glossaries": glossaries}
+        if open_connections:
+            result["connections"] = {
+                "jira": self.jira_client.warm_up_connection(),
+                "openai": self.translation_engine.warm_up_connection(),
+            }
+        result["jira_transport"] = self.jira_client.transport_stats()
+        result["jira_fetch"] = self.jira_client.fetch_stats.as_dict()
+        return result
 
     # 알려진 프로젝트의 steps 필드 하드코딩 맵핑
     _KNOWN_STEPS_FIELDS: dict[str, str] = {
@@ -238,34 +396,277 @@ class JiraTicketTranslator:
         detected = jira_client.detect_steps_field(project_key)
         return detected or "customfield_10399"
 
+    def prefetch_steps_fields(self, project_keys: Sequence[str]) -> dict[str, Optional[str]]:
+        """알려지지 않은 프로젝트들의 steps 필드를 createmeta 한 번으로 미리 탐지해 캐시에 채운다."""
+        unknown = [key for key in dict.fromkeys(project_keys) if key not in self._KNOWN_STEPS_FIELDS]
+        if not unknown:
+            return {}
+        return self.jira_client.prefetch_steps_fields(unknown)
+
+    def _resolve_fields_to_translate(
+        self,
+        project_key: str,
+        fields_to_translate: Optional[list[str]] = None,
+    ) -> tuple[str, list[str]]:
+        """(steps 필드 ID, 번역할 필드 목록) 결정."""
+        # Steps 필드: 알려진 프로젝트는 하드코딩 직반환, 미지 프로젝트만 createmeta 탐지
+        steps_field = self._resolve_steps_field(project_key, self.jira_client)
+
+        if fields_to_translate is None:
+            fields_to_translate = ['summary', 'description', steps_field]
+        return steps_field, fields_to_translate
+
+    def _fetch_fields_for_translation(self, issue_key: str, fields_to_translate: list[str]) -> dict[str, str]:
+        """번역 대상 필드 + glossary 라우팅용 summary를 단 1회 fetch."""
+        print(f"📥 Fetching issue {issue_key}...")
+        fetch_fields = fields_to_translate if "summary" in fields_to_translate else ["summary"] + fields_to_translate
+        return self.fetch_issue_fields(issue_key, fetch_fields)
+
+    def _fields_from_webhook(
+        self,
+        issue_key: str,
+        webhook_fields: dict,
+        fields_to_translate: list[str],
+    ) -> dict[str, str]:
+        """webhook payload의 issue.fields를 fetch 결과와 같은 형태로 정규화.
+
+        payload에 아예 없는 필드(및 glossary 라우팅용 summary)만 Jira에서 추가로 조회한다.
+        값이 null/빈 값으로 들어온 필드는 실제로 비어 있는 것으로 보고 조회하지 않는다.
+        """
+        needed = fields_to_translate if "summary" in fields_to_translate else ["summary"] + fields_to_translate
+        issue_fields: dict[str, str] = {}
+        missing: list[str] = []
+        for field in needed:
+            if field not in webhook_fields:
+                missing.append(field)
+                continue
+            normalized = self.jira_client.normalize_field_value(webhook_fields.get(field))
+            if normalized:
+                issue_fields[field] = normalized
+
+        if missing:
+            print(f"📥 Fetching {len(missing)} field(s) missing from webhook for {issue_key}...")
+            issue_fields.update(self.fetch_issue_fields(issue_key, missing))
+        return issue_fields
+
+    def translate_issue_from_webhook(
+        self,
+        issue_key: str,
+        webhook_fields: dict,
+        target_language: Optional[str] = None,
+        fields_to_translate: Optional[list[str]] = None,
+        perform_update: bool = False,
+        previous_fields: Optional[dict[str, str]] = None,
+        incremental: bool = False,
+    ) -> dict:
+        """Jira webhook의 issue.fields로 번역 (payload에 있는 필드는 Jira 재조회 없이 사용).
+
+        previous_fields는 changelog의 변경 전 값 (증분 재번역에서 수정된 문단 판별에 사용).
+        """
+        project_key = issue_key.split("-")[0].upper()
+        _, fields = self._resolve_fields_to_translate(project_key, fields_to_translate)
+        issue_fields = self._fields_from_webhook(issue_key, webhook_fields or {}, fields)
+        return self.translate_issue(
+            issue_key,
+            target_language=target_language,
+            fields_to_translate=fields,
+            perform_update=perform_update,
+            issue_fields=issue_fields,
+            incremental=incremental,
+            previous_fields=previous_fields,
+        )
+
+    def fork(self) -> "JiraTicketTranslator":
+        """HTTP 클라이언트(Jira 세션, OpenAI 클라이언트)를 공유하는 독립 translator.
+
+        여러 이슈를 동시에 번역할 때 worker별로 사용한다. 용어집/matcher는 프로세스 캐시로 공유된다.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.jira_client = self.jira_client
+        clone.translation_engine = self.translation_engine.fork()
+        clone.fingerprint_store = self.fingerprint_store
+        clone.jira_url = self.jira_url
+        clone.email = self.email
+        clone.api_token = self.api_token
+        return clone
+
+    def search_issue_keys(self, jql: str, max_results: int = 50) -> list[str]:
+        return self.jira_client.search_issue_keys(jql, max_results)
+
+    def search_issues(
+        self,
+        jql: str,
+        fields: Sequence[str],
+        page_size: int = 100,
+        expand_rendered: Optional[bool] = None,
+    ):
+        return self.jira_client.search_issues(jql, fields, page_size=page_size, expand_rendered=expand_rendered)
+
+    def translate_issues(
+        self,
+        issue_keys: Sequence[str],
+        target_language: Optional[str] = None,
+        fields_to_translate: Optional[list[str]] = None,
+        perform_update: bool = False,
+        max_workers: int = 4,
+        prefetched: Optional[dict[str, dict[str, str]]] = None,
+        prefetched_fields: Sequence[str] = (),
+    ) -> dict:
+        """여러 이슈를 제한된 동시성으로 번역 (modules.batch_translation 참고)."""
+        return batch_translation.translate_issues(
+            self,
+            issue_keys,
+            target_language=target_language,
+            fields_to_translate=fields_to_translate,
+            perform_update=perform_update,
+            max_workers=max_workers,
+            prefetched=prefetched,
+            prefetched_fields=prefetched_fields,
+        )
+
+    def bulk_update_issue_fields(
+        self,
+        updates,
+        max_concurrency: int = 8,
+        checkpoint_path: Optional[str] = None,
+        notify_users: Optional[bool] = None,
+    ) -> "BulkUpdateSummary":
+        """(issue_key, payload) 스트림을 동시성 제한된 PUT으로 보낸다 (modules.bulk_update 참고).
+
+        속도 제한은 JiraClient 세션의 사이트별 공유 token bucket이 담당한다.
+        """
+        from modules.bulk_update import BulkUpdateWriter  # requests를 import하므로 사용 시점에 로드
+
+        writer = BulkUpdateWriter(
+            self.jira_client,
+            max_concurrency=max_concurrency,
+            checkpoint_path=checkpoint_path,
+            notify_users=notify_users,
+        )
+        return writer.run(updates)
+
+    def issue_fingerprint(
+        self,
+        project_key: str,
+        fields_to_translate: Sequence[str],
+        issue_fields: dict[str, str],
+        target_language: Optional[str] = None,
+    ) -> str:
+        """번역 입력 fingerprint: 번역 대상 필드 원문 + 용어집(버전 포함) + 프롬프트 버전 + 모델 + 대상 언어."""
+        glossary_file, glossary_name = self._determine_glossary(project_key, issue_fields.get("summary", ""))
+        context = {
+            "glossary": [glossary_file, glossary_name, self.translation_engine.glossary_version(glossary_file)],
+            "prompt_version": PROMPT_VERSION,
+            "model": self.translation_engine.openai_model,
+            "target_language": target_language or "auto",
+        }
+        return issue_fingerprint({field: issue_fields.get(field, "") for field in fields_to_translate}, context)
+
+    def is_unchanged_since_last_update(
+        self,
+        issue_key: str,
+        fields_to_translate: Sequence[str],
+        issue_fields: dict[str, str],
+        target_language: Optional[str] = None,
+    ) -> bool:
+        """마지막으로 번역/업데이트한 이후 번역 입력이 바뀌지 않았는지 (저장소가 없으면 False)."""
+        if self.fingerprint_store is None:
+            return False
+        project_key = issue_key.split("-")[0].upper()
+        fingerprint = self.issue_fingerprint(project_key, fields_to_translate, issue_fields, target_language)
+        return self.fingerprint_store.contains(issue_key, fingerprint)
+
+    @staticmethod
+    def _untranslated_chunk_ids(chunks: Sequence[TranslationChunk], chunk_translations: dict[str, str]) -> list[str]:
+        """번역 대상인데 번역 결과가 비어 있는 청크 id (fingerprint를 기록하지 않을 근거)."""
+        return [
+            chunk.id
+            for chunk in chunks
+            if not chunk.skip_translation and chunk.clean_text.strip() and not chunk_translations.get(chunk.id, "").strip()
+        ]
+
+    def _record_fingerprints(
+        self,
+        issue_key: str,
+        fields_to_translate: Sequence[str],
+        issue_fields: dict[str, str],
+        payload: dict[str, str],
+        target_language: Optional[str],
+        include_source: bool = False,
+    ) -> None:
+        """업데이트 결과가 반영된 필드의 fingerprint를 기록.
+
+        원문 fingerprint는 include_source(업데이트가 필요 없던 경우)일 때만 함께 기록한다.
+        PUT 후에도 원문 fingerprint를 남기면, 번역을 되돌려 원문으로 돌아간 이슈가 "변경 없음"으로 건너뛰어진다.
+        """
+        if self.fingerprint_store is None:
+            return
+        project_key = issue_key.split("-")[0].upper()
+        updated_fields = dict(issue_fields)
+        for field, value in payload.items():
+            updated_fields[field] = self.jira_client.normalize_field_value(value)
+        fingerprints = [self.issue_fingerprint(project_key, fields_to_translate, updated_fields, target_language)]
+        if include_source:
+            fingerprints.insert(0, self.issue_fingerprint(project_key, fields_to_translate, issue_fields, target_language))
+        fingerprints = list(dict.fromkeys(fingerprints))
+        try:
+            self.fingerprint_store.put(issue_key, fingerprints)
+        except Exception as exc:
+            print(f"⚠️ Failed to record fingerprint for {issue_key}: {exc}")
+
     def translate_issue(
         self,
         issue_key: str,
         target_language: Optional[str] = None,
         fields_to_translate: Optional[list[str]] = None,
-        perform_update: bool = False
+        perform_update: bool = False,
+        repair_glossary: bool = True,
+        issue_fields: Optional[dict[str, str]] = None,
+        pretranslated: Optional[dict[str, str]] = None,
+        incremental: bool = False,
+        previous_fields: Optional[dict[str, str]] = None,
     ) -> dict:
         """
         Jira 이슈를 번역 (한글→영어, 영어→한글 자동 번역)
+
+        repair_glossary가 True이면 번역 후 용어집 준수 여부를 검사하고
+        위반 청크만 repair 배치로 재요청한다.
+        issue_fields를 넘기면 Jira fetch를 생략하고, pretranslated(chunk id -> 번역문)에 있는
+        청크는 LLM 배치에서 제외한다 (여러 이슈의 summary를 묶어 번역한 경우).
+        perform_update=True이고 마지막 업데이트 이후 번역 입력 fingerprint가 같으면
+        LLM 호출 없이 {"skipped": "unchanged"} 결과를 반환한다.
+        incremental=True이면 이미 번역된 description을 건너뛰지 않고 새로 추가/수정된 문단만 번역해
+        기존 bilingual 블록에 끼워 넣는다 (previous_fields["description"]이 있으면 수정된 문단도 판별).
         """
+        # warm 재사용 시 이전 요청의 용어집 등이 남지 않도록 초기화
+        self.reset_request_state()
+
         # 1. 티켓 타입 판별 및 설정
         project_key = issue_key.split("-")[0].upper()
-
-        # Steps 필드: 알려진 프로젝트는 하드코딩 직반환, 미지 프로젝트만 createmeta 탐지
-        steps_field = self._resolve_steps_field(project_key, self.jira_client)
-
-        if fields_to_translate is None:
-            fields_to_translate = ['summary', 'description', steps_field]
+        steps_field, fields_to_translate = self._resolve_fields_to_translate(project_key, fields_to_translate)
 
         # 2. 이슈 조회 (summary 포함해서 단 1회 fetch)
-        print(f"📥 Fetching issue {issue_key}...")
-        fetch_fields = fields_to_translate if "summary" in fields_to_translate else ["summary"] + fields_to_translate
-        issue_fields = self.fetch_issue_fields(issue_key, fetch_fields)
+        if issue_fields is None:
+            issue_fields = self._fetch_fields_for_translation(issue_key, fields_to_translate)
 
         if not issue_fields:
             print(f"⚠️ No fields found for {issue_key}")
             return {"results": {}, "update_payload": {}, "updated": False, "error": "no_fields"}
 
+        # 우리 PUT 등으로 재호출되었지만 번역 입력이 그대로면 LLM 호출 없이 종료
+        if perform_update and self.is_unchanged_since_last_update(
+            issue_key, fields_to_translate, issue_fields, target_language
+        ):
+            print(f"⏭️ Skipping {issue_key} (unchanged since last translation)")
+            return {
+                "results": {},
+                "update_payload": {},
+                "updated": False,
+                "error": None,
+                "skipped": "unchanged",
+                "metrics": {},
+            }
+
         # summary로 glossary 결정 (extra API call 없이 이미 fetch한 데이터 재사용)
         summary_for_routing = issue_fields.get("summary", "")
         glossary_file, glossary_name = self._determine_glossary(project_key, summary_for_routing)
@@ -291,6 +692,15 @@ class JiraTicketTranslator:
             print(f"🔄 Translating {field}...")
             skip_reason = None
             if field == "description" and self._is_description_already_translated(field_value):
+                if incremental:
+                    job = self._plan_incremental_description_job(
+                        field_value, (previous_fields or {}).get("description")
+                    )
+                    if job:
+                        print(f"🧩 Re-translating {len(job.chunks)} changed paragraph(s) of {field}")
+                        jobs[field] = job
+                        all_chunks.extend(job.chunks)
+                        continue
                 skip_reason = "already translated"
             elif field == "summary" and self._is_bilingual_summary(field_value):
                 skip_reason = "already bilingual"
@@ -309,16 +719,41 @@ class JiraTicketTranslator:
             all_chunks.extend(job.chunks)
 
         chunk_translations: dict[str, str] = {}
-        if all_chunks:
+        pretranslated = {
+            chunk.id: pretranslated[chunk.id] for chunk in all_chunks if chunk.id in (pretranslated or {})
+        }
+        # 표만 있던 섹션은 표 라인을 뺀 뒤 보낼 텍스트가 없다 (셀은 별도 chunk)
+        pending_chunks = [
+            chunk for chunk in all_chunks if chunk.id not in pretranslated and chunk.clean_text.strip()
+        ]
+        if pending_chunks:
             try:
-                chunk_translations = self._call_openai_batch(all_chunks, target_language)
+                chunk_translations = self._call_openai_batch(pending_chunks, target_language)
             except Exception as exc:
                 print(f"⚠️ Batch translation failed, falling back to per-field mode: {exc}")
                 chunk_translations = self._translate_chunks_individually(jobs, target_language)
+        chunk_translations.update(pretranslated)
+
+        metrics: dict = {}
+        if repair_glossary and chunk_translations:
+            compliance = self._enforce_glossary_compliance(all_chunks, chunk_translations, target_language)
+            metrics["glossary_compliance"] = compliance.as_dict()
 
         for field, job in jobs.items():
+            if job.mode == "description_incremental":
+                restored_by_id = {
+                    chunk.id: self.restore_attachments_markup(chunk_translations.get(chunk.id, ""), chunk.attachments)
+                    for chunk in job.chunks
+                }
+                # 번역이 하나도 없으면(배치 실패) 기존 값을 다시 쓰지 않도록 비워 둔다
+                if any(text.strip() for text in restored_by_id.values()):
+                    translation_results[field]["translated"] = self.translation_engine.assemble_incremental_description(
+                        job, restored_by_id
+                    )
+                continue
             assembled: list[str] = []
-            for chunk in job.chunks:
+            cell_translations = self.translation_engine.table_cell_translations(job, chunk_translations)
+            for chunk in job.content_chunks:
                 translated_raw = chunk_translations.get(chunk.id, "")
                 restored = self.restore_attachments_markup(translated_raw, chunk.attachments)
                 if job.mode == "description":
@@ -335,6 +770,7 @@ class JiraTicketTranslator:
                             chunk.original_text,
                             restored,
                             header=chunk.header,
+                            cell_translations=cell_translations,
                         )
                     if block:
                         assembled.append(block)
@@ -348,18 +784,164 @@ class JiraTicketTranslator:
             translation_results[field]["translated"] = translated_value
 
         payload = self.build_field_update_payload(translation_results)
+        # Jira에 이미 같은 값이 있는 필드는 PUT에서 제외 (watcher 알림/webhook 재호출 감소)
+        changed_payload, unchanged_fields = self.diff_update_payload(payload, issue_fields)
+        updated = False
+        error = None
+        if perform_update and changed_payload:
+            try:
+                self.update_issue_fields(issue_key, changed_payload)
+                updated = True
+            except Exception as exc:
+                error = str(exc)
+        elif perform_update and payload:
+            print(f"⏭️ No field changes for {issue_key}; skipping update")
+        # 모든 청크/필드가 번역됐고, 업데이트에 성공했거나 Jira 값이 이미 같았던 경우(번역할 것이 없던 경우 포함)만 기록
+        # (일부 필드/청크 번역이 실패했으면 다음 호출에서 다시 시도)
+        untranslated = self._untranslated_chunk_ids(all_chunks, chunk_translations)
+        untranslated += [field for field in jobs if field not in payload]
+        if untranslated:
+            print(f"⚠️ Not recording fingerprint for {issue_key}; untranslated: {', '.join(untranslated)}")
+        if perform_update and error is None and not untranslated and (updated or not changed_payload):
+            self._record_fingerprints(
+                issue_key, fields_to_translate, issue_fields, payload, target_language, include_source=not changed_payload
+            )
+
+        return {
+            "results": translation_results,
+            "update_payload": payload,
+            "unchanged_fields": unchanged_fields,
+            "updated": updated,
+            "error": error,
+            "metrics": metrics,
+        }
+
+    def translate_issue_adf(
+        self,
+        issue_key: str,
+        target_language: Optional[str] = None,
+        fields_to_translate: Optional[list[str]] = None,
+        perform_update: bool = False,
+        repair_glossary: bool = True,
+    ) -> dict:
+        """ADF 원형 유지 모드 번역 (v3 API로 조회/업데이트).
+
+        리치 텍스트 필드(ADF)는 text 노드만 segment로 뽑아(chunk id = "필드@노드 경로") 한 배치로 번역하고,
+        각 단락 아래에 번역 색상 단락을 끼워 넣은 ADF를 그대로 PUT한다.
+        wiki 마크업 변환/renderedFields 조회 없이 표·패널·미디어 구조가 유지된다.
+        summary는 기존과 같은 "원문 / 번역" 형식, 그 밖의 문자열 필드는 번역하지 않는다.
+        반환 형식은 translate_issue와 같고 "mode": "adf"가 추가된다.
+        """
+        self.reset_request_state()
+        project_key = issue_key.split("-")[0].upper()
+        _, fields_to_translate = self._resolve_fields_to_translate(project_key, fields_to_translate)
+        fetch_fields = fields_to_translate if "summary" in fields_to_translate else ["summary", *fields_to_translate]
+        print(f"📥 Fetching issue {issue_key} (ADF)...")
+        raw_fields = self.fetch_issue_adf(issue_key, fetch_fields)
+        # fingerprint/diff/결과 표시는 기존 경로와 같은 정규화 문자열로 비교한다
+        issue_fields = {}
+        for field, value in raw_fields.items():
+            normalized = self.jira_client.normalize_field_value(value)
+            if normalized:
+                issue_fields[field] = normalized
+        if not issue_fields:
+            print(f"⚠️ No fields found for {issue_key}")
+            return {"results": {}, "update_payload": {}, "updated": False, "error": "no_fields", "mode": "adf"}
+
+        if perform_update and self.is_unchanged_since_last_update(
+            issue_key, fields_to_translate, issue_fields, target_language
+        ):
+            print(f"⏭️ Skipping {issue_key} (unchanged since last translation)")
+            return {
+                "results": {},
+                "update_payload": {},
+                "updated": False,
+                "error": None,
+                "skipped": "unchanged",
+                "metrics": {},
+                "mode": "adf",
+            }
+
+        glossary_file, glossary_name = self._determine_glossary(project_key, issue_fields.get("summary", ""))
+        self.translation_engine.load_glossary(glossary_file, glossary_name)
+
+        chunks: list[TranslationChunk] = []
+        segments: dict[str, list[adf.AdfSegment]] = {}
+        for field in fields_to_translate:
+            value = raw_fields.get(field)
+            if isinstance(value, dict) and value.get("type") == "doc":
+                segments[field] = adf.extract_adf_segments(value)
+                chunks.extend(
+                    TranslationChunk(
+                        id=segment.chunk_id(field),
+                        field=field,
+                        original_text=segment.text,
+                        clean_text=segment.text,
+                        attachments=[],
+                    )
+                    for segment in segments[field]
+                )
+            elif field == "summary" and issue_fields.get(field) and not self._is_bilingual_summary(issue_fields[field]):
+                text = issue_fields[field]
+                chunks.append(TranslationChunk(id=field, field=field, original_text=text, clean_text=text, attachments=[]))
+            elif field in issue_fields:
+                print(f"⏭️ Skipping {field} (not an ADF field)")
+
+        chunk_translations: dict[str, str] = {}
+        metrics: dict = {"segments": len(chunks)}
+        if chunks:
+            print(f"🔄 Translating {len(chunks)} ADF segment(s)...")
+            try:
+                chunk_translations = self._call_openai_batch(chunks, target_language)
+            except Exception as exc:
+                print(f"⚠️ Batch translation failed, falling back to per-chunk mode: {exc}")
+                chunk_translations = self._translate_chunk_list(chunks, target_language)
+            if repair_glossary and chunk_translations:
+                metrics["glossary_compliance"] = self._enforce_glossary_compliance(
+                    chunks, chunk_translations, target_language
+                ).as_dict()
+
+        payload: dict = {}
+        translation_results: dict[str, dict[str, str]] = {}
+        for field, field_segments in segments.items():
+            translations = {
+                segment.path: chunk_translations.get(segment.chunk_id(field), "") for segment in field_segments
+            }
+            if not any(translations.values()):
+                continue
+            payload[field] = adf.apply_adf_translations(raw_fields[field], translations)
+        if chunk_translations.get("summary"):
+            payload["summary"] = self.format_summary_value(issue_fields["summary"], chunk_translations["summary"])
+        for field, value in payload.items():
+            translation_results[field] = {
+                "original": issue_fields.get(field, ""),
+                "translated": self.jira_client.normalize_field_value(value),
+            }
+
+        changed_payload, unchanged_fields = self.diff_update_payload(payload, issue_fields)
         updated = False
         error = None
-        if perform_update and payload:
+        if perform_update and changed_payload:
             try:
-                self.update_issue_fields(issue_key, payload)
+                self.update_issue_adf_fields(issue_key, changed_payload)
                 updated = True
             except Exception as exc:
                 error = str(exc)
+        untranslated = self._untranslated_chunk_ids(chunks, chunk_translations)
+        untranslated += [field for field in dict.fromkeys(chunk.field for chunk in chunks) if field not in payload]
+        if untranslated:
+            print(f"⚠️ Not recording fingerprint for {issue_key}; untranslated: {', '.join(untranslated)}")
+        if perform_update and error is None and not untranslated and (updated or not changed_payload):
+            self._record_fingerprints(
+                issue_key, fields_to_translate, issue_fields, payload, target_language, include_source=not changed_payload
+            )
 
         return {
             "results": translation_results,
             "update_payload": payload,
+            "unchanged_fields": unchanged_fields,
             "updated": updated,
             "error": error,
+            "metrics": metrics,
+            "mode": "adf",
         }
@@ -43,6 +43,19 @@ class FieldTranslationJob:
     original_value: str
     chunks: list[TranslationChunk]
     mode: str = "default"
+    # mode == "description_incremental": 기존 bilingual description을 나눈 문단 목록
+    # (formatting.parse_bilingual_description 결과, chunk id의 번호가 인덱스)
+    segments: Optional[list] = None
+    # mode == "description": 표 셀 값 -> 셀 번역 chunk id (셀 chunk는 chunks 끝에 붙는다)
+    table_cells: Optional[dict[str, str]] = None
+
+    @property
+    def content_chunks(self) -> list[TranslationChunk]:
+        """표 셀 chunk를 뺀 chunk (필드 값 조립 순서)."""
+        if not self.table_cells:
+            return self.chunks
+        cell_ids = set(self.table_cells.values())
+        return [chunk for chunk in self.chunks if chunk.id not in cell_ids]
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,393 @@
+"""Atlassian Document Format(ADF) → Jira wiki 마크업 변환.
+
+Jira Cloud v3 API/webhook은 description 등 리치 텍스트 필드를 ADF(JSON 트리)로 보낸다.
+번역 파이프라인(modules.formatting)은 wiki 마크업을 기준으로 미디어/표/코드 블록을 구분하므로
+ADF도 v2 API가 돌려주는 wiki 마크업과 같은 형태로 펼친다.
+
+- 표: ||헤더||헤더|| / |셀|셀| (셀 안 줄바꿈은 공백)
+- 목록: * / # (중첩 깊이만큼 반복)
+- 코드 블록: {code:언어} ... {code}
+- 미디어: 이미지 확장자면 !파일명|thumbnail!, 그 외 [^파일명]
+- 멘션: [~accountid:...], 링크: [텍스트|URL], 텍스트 mark: *굵게* _기울임_ {{코드}} 등
+- 제목(heading)은 섹션 헤더 판별(match_section_header)이 그대로 동작하도록 텍스트만 출력
+- panel/expand/blockquote/layout 등 컨테이너는 내용만 출력
+
+큰 문서(표 안의 목록 안의 패널 등)에서도 재귀 한도에 걸리지 않도록 명시적 스택으로 순회하고,
+출력은 하나의 리스트에 모아 마지막에 한 번만 join한다.
+
+ADF 원형 유지 모드(v3 API)용으로 text 노드를 번역 segment로 뽑고(extract_adf_segments),
+번역문을 원래 단락 아래에 번역 색상(#4c9aff) 단락으로 끼워 넣는(apply_adf_translations) 함수도 제공한다.
+"""
+from __future__ import annotations
+
+import copy
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from modules import formatting
+
+# wiki 마크업 경로의 {color:#4c9aff}와 같은 번역 표시 색상
+TRANSLATION_COLOR = "#4c9aff"
+
+_IMAGE_NAME = re.compile(r"\.(png|jpe?g|gif|bmp|webp|svg)$", re.IGNORECASE)
+
+# 스택 항목은 모두 (node, arg, in_cell) 3-tuple이다.
+# node가 dict/list면 방문할 노드(arg = 목록 prefix), 아래 정수면 제어 토큰이다.
+_END_BLOCK = 0  # arg = 블록 시작 시 출력 길이: 블록에 내용이 있었으면 줄바꿈(셀 안에서는 공백)
+_END_CELL = 1  # 셀 끝 공백 제거
+_EMIT = 2  # arg = 출력할 문자열
+
+_MARK_WRAPPERS = {
+    "strong": ("*", "*"),
+    "em": ("_", "_"),
+    "strike": ("-", "-"),
+    "underline": ("+", "+"),
+    "code": ("{{", "}}"),
+    "subsup": ("", ""),
+}
+
+
+def _apply_marks(text: str, marks) -> str:
+    if not marks or not text:
+        return text
+    for mark in marks:
+        if not isinstance(mark, dict):
+            continue
+        mark_type = mark.get("type")
+        attrs = mark.get("attrs") or {}
+        if mark_type == "link" and attrs.get("href"):
+            href = attrs["href"]
+            text = f"[{href}]" if text == href else f"[{text}|{href}]"
+        elif mark_type == "textColor" and attrs.get("color"):
+            text = f"{{color:{attrs['color']}}}{text}{{color}}"
+        elif mark_type in _MARK_WRAPPERS:
+            prefix, suffix = _MARK_WRAPPERS[mark_type]
+            text = f"{prefix}{text}{suffix}"
+    return text
+
+
+def _media_markup(node: dict, inline: bool) -> str:
+    attrs = node.get("attrs") or {}
+    if attrs.get("type") == "link" and attrs.get("url"):
+        return f"[{attrs['url']}]"
+    name = attrs.get("alt") or attrs.get("id") or ""
+    if not name:
+        return ""
+    if not inline and _IMAGE_NAME.search(name):
+        return f"!{name}|thumbnail!"
+    return f"[^{name}]"
+
+
+def _code_text(node: dict) -> str:
+    return "".join(
+        child.get("text", "") for child in node.get("content") or () if isinstance(child, dict)
+    )
+
+
+def _leaf_text(node: dict, node_type: Optional[str]) -> str:
+    """자식 없이 문자열 하나로 끝나는 inline 노드."""
+    attrs = node.get("attrs") or {}
+    if node_type == "text":
+        return _apply_marks(node.get("text", ""), node.get("marks"))
+    if node_type == "mention":
+        if attrs.get("id"):
+            return f"[~accountid:{attrs['id']}]"
+        return attrs.get("text", "")
+    if node_type == "emoji":
+        return attrs.get("text") or attrs.get("shortName", "")
+    if node_type in {"inlineCard", "blockCard", "embedCard"}:
+        return f"[{attrs['url']}]" if attrs.get("url") else ""
+    if node_type == "status":
+        return attrs.get("text", "")
+    if node_type == "date":
+        return str(attrs.get("timestamp", ""))
+    if node_type == "placeholder":
+        return attrs.get("text", "")
+    return ""
+
+
+_LEAF_TYPES = frozenset({"text", "mention", "emoji", "inlineCard", "blockCard", "embedCard", "status", "date", "placeholder"})
+
+
+def _emit_inline(content: list, out: list[str], in_cell: bool) -> bool:
+    """inline 노드만 있는 단락 내용을 바로 출력한다. 블록/미디어가 섞여 있으면 False (출력은 되돌림)."""
+    start = len(out)
+    for child in content:
+        child_type = child.get("type") if child.__class__ is dict else None
+        if child_type == "text":
+            text = child.get("text")
+            if text:
+                out.append(_apply_marks(text, child.get("marks")))
+        elif child_type == "hardBreak":
+            out.append(" " if in_cell else "\n")
+        elif child_type in _LEAF_TYPES:
+            text = _leaf_text(child, child_type)
+            if text:
+                out.append(text)
+        else:
+            del out[start:]
+            return False
+    return True
+
+
+def flatten_adf(root) -> str:
+    """ADF 노드(dict) 또는 노드 목록을 wiki 마크업 문자열로 변환 (strip하지 않음)."""
+    out: list[str] = []
+    stack: list[tuple] = [(root, "", False)]
+    push = stack.append
+    pop = stack.pop
+
+    while stack:
+        node, arg, in_cell = pop()
+        node_class = node.__class__
+        if node_class is list:
+            for child in reversed(node):
+                push((child, arg, in_cell))
+            continue
+        if node_class is not dict:
+            if node is _END_BLOCK:
+                if len(out) > arg:
+                    out.append(" " if in_cell else "\n")
+            elif node is _END_CELL:
+                while out and (out[-1] == " " or out[-1] == "\n"):
+                    out.pop()
+            elif node is _EMIT:
+                out.append(arg)
+            continue
+
+        node_type = node.get("type")
+        content = node.get("content") or ()
+        if node_type == "paragraph" or node_type == "heading":
+            # 대부분의 단락은 text/hardBreak만 가지므로 스택을 거치지 않고 바로 출력한다
+            start = len(out)
+            if _emit_inline(content, out, in_cell):
+                if len(out) > start:
+                    out.append(" " if in_cell else "\n")
+            else:
+                push((_END_BLOCK, start, in_cell))
+                for child in reversed(content):
+                    push((child, "", in_cell))
+            continue
+        if node_type == "listItem":
+            # 첫 단락은 "* " 뒤에 이어 쓰고, 중첩 목록은 자기 prefix로 새 줄을 시작한다
+            for child in reversed(content):
+                push((child, arg, in_cell))
+            if arg:
+                out.append(f"{arg} ")
+            continue
+        if node_type == "tableCell" or node_type == "tableHeader":
+            out.append("||" if node_type == "tableHeader" else "|")
+            if len(content) == 1 and content[0].get("type") == "paragraph":
+                if _emit_inline(content[0].get("content") or (), out, True):
+                    continue
+            push((_END_CELL, None, True))
+            for child in reversed(content):
+                push((child, "", True))
+            continue
+        if node_type == "tableRow":
+            cells = [child for child in content if child.__class__ is dict]
+            if cells:
+                push((_EMIT, "||\n" if cells[-1].get("type") == "tableHeader" else "|\n", False))
+                for cell in reversed(cells):
+                    push((cell, "", True))
+            continue
+        if node_type == "table":
+            for child in reversed(content):
+                push((child, "", False))
+            continue
+        if node_type == "bulletList" or node_type == "orderedList":
+            marker = "*" if node_type == "bulletList" else "#"
+            child_prefix = "" if in_cell else arg + marker
+            for child in reversed(content):
+                push((child, child_prefix, in_cell))
+            continue
+        if node_type in _LEAF_TYPES:
+            text = _leaf_text(node, node_type)
+            if text:
+                out.append(text)
+            continue
+        if node_type == "hardBreak":
+            out.append(" " if in_cell else "\n")
+            continue
+        if node_type == "rule":
+            if not in_cell:
+                out.append("----\n")
+            continue
+        if node_type == "codeBlock":
+            code = _code_text(node)
+            if in_cell:
+                if code:
+                    out.append(f"{{{{{code}}}}}")
+                continue
+            language = (node.get("attrs") or {}).get("language")
+            out.append(f"{{code:{language}}}\n" if language else "{code}\n")
+            if code:
+                out.append(f"{code}\n")
+            out.append("{code}\n")
+            continue
+        if node_type == "media" or node_type == "mediaInline":
+            markup = _media_markup(node, inline=node_type == "mediaInline")
+            if markup:
+                out.append(markup)
+            continue
+        if node_type == "mediaSingle" or node_type == "mediaGroup":
+            markup = " ".join(filter(None, (
+                _media_markup(child, inline=node_type == "mediaGroup")
+                for child in content
+                if child.__class__ is dict
+            )))
+            if markup:
+                out.append(markup)
+                out.append(" " if in_cell else "\n")
+            continue
+        # doc, panel, expand, blockquote, layoutSection 등: 내용만
+        for child in reversed(content):
+            push((child, "", in_cell))
+
+    return "".join(out)
+
+
+@dataclass(frozen=True)
+class AdfSegment:
+    """번역 대상 text 노드. path는 doc부터 content 인덱스를 따라간 위치 (예: (3, 0, 1))."""
+
+    path: tuple[int, ...]
+    text: str
+
+    def chunk_id(self, field: str) -> str:
+        return f"{field}@{'.'.join(map(str, self.path))}"
+
+
+# 번역문을 끼워 넣는 블록 단위 (이 노드의 형제로 번역 블록을 추가)
+_TEXT_BLOCKS = frozenset({"paragraph", "heading"})
+
+
+def _node_at(root: dict, path: tuple[int, ...]) -> dict:
+    node = root
+    for index in path:
+        node = node["content"][index]
+    return node
+
+
+def _has_translation_color(node: dict) -> bool:
+    return any(
+        mark.get("type") == "textColor" and (mark.get("attrs") or {}).get("color", "").lower() == TRANSLATION_COLOR
+        for mark in node.get("marks") or ()
+        if isinstance(mark, dict)
+    )
+
+
+def _is_translation_block(block: dict) -> bool:
+    """이전 번역에서 끼워 넣은 블록 (인라인 코드를 뺀 text 노드가 모두 번역 색상)."""
+    texts = [
+        child for child in block.get("content") or ()
+        if isinstance(child, dict) and child.get("type") == "text" and not _is_inline_code(child)
+    ]
+    return bool(texts) and all(_has_translation_color(child) for child in texts)
+
+
+def _is_inline_code(node: dict) -> bool:
+    return any(isinstance(mark, dict) and mark.get("type") == "code" for mark in node.get("marks") or ())
+
+
+def _block_segments(block: dict, path: tuple[int, ...]) -> list[AdfSegment]:
+    segments = []
+    for index, child in enumerate(block.get("content") or ()):
+        if not isinstance(child, dict) or child.get("type") != "text":
+            continue
+        text = child.get("text") or ""
+        # 인라인 코드는 번역하지 않는다
+        if not text.strip() or _is_inline_code(child):
+            continue
+        segments.append(AdfSegment((*path, index), text))
+    return segments
+
+
+def extract_adf_segments(doc: dict) -> list[AdfSegment]:
+    """번역할 text 노드를 문서 순서대로 반환한다.
+
+    - 코드 블록, 인라인 코드, 공백뿐인 text는 제외
+    - 섹션 헤더(Observed: 등)만 있는 단락은 제외하고, 번역 스킵 섹션(QA Environment)은 다음 헤더까지 제외
+    - 바로 다음 형제가 이전 번역 블록인 단락(이미 번역됨)과 번역 블록 자체는 제외
+    """
+    segments: list[AdfSegment] = []
+    if not isinstance(doc, dict):
+        return segments
+    stack: list[tuple[dict, tuple[int, ...]]] = [(doc, ())]
+    while stack:
+        node, path = stack.pop()
+        content = node.get("content") or []
+        skipping_section = False
+        pending: list[tuple[dict, tuple[int, ...]]] = []
+        for index, child in enumerate(content):
+            if not isinstance(child, dict):
+                continue
+            child_type = child.get("type")
+            child_path = (*path, index)
+            if child_type == "codeBlock":
+                continue
+            if child_type not in _TEXT_BLOCKS:
+                if child.get("content") and not skipping_section:
+                    pending.append((child, child_path))
+                continue
+            header = formatting.match_section_header(flatten_adf(child).strip())
+            if header:
+                skipping_section = formatting.should_skip_section_translation(header)
+                continue
+            if skipping_section or _is_translation_block(child):
+                continue
+            following = content[index + 1] if index + 1 < len(content) else None
+            if isinstance(following, dict) and following.get("type") == child_type and _is_translation_block(following):
+                continue
+            segments.extend(_block_segments(child, child_path))
+        # 문서 순서를 유지하도록 하위 컨테이너는 역순으로 스택에 넣는다
+        stack.extend(reversed(pending))
+    segments.sort(key=lambda segment: segment.path)
+    return segments
+
+
+def _translation_block(block: dict, translated: dict[int, str]) -> dict:
+    """원래 블록을 복사해 text 노드를 번역문으로 바꾸고 번역 색상을 입힌 블록."""
+    new_block = {key: copy.deepcopy(value) for key, value in block.items() if key != "content"}
+    new_content = []
+    for index, child in enumerate(block.get("content") or ()):
+        if isinstance(child, dict) and child.get("type") == "text":
+            marks = [
+                copy.deepcopy(mark) for mark in child.get("marks") or ()
+                if isinstance(mark, dict) and mark.get("type") != "textColor"
+            ]
+            original = child.get("text", "")
+            text = translated.get(index)
+            if text is None:
+                text = original
+            else:
+                # text 노드 사이 띄어쓰기는 원문 노드의 앞뒤 공백을 따른다
+                text = original[: len(original) - len(original.lstrip())] + text + original[len(original.rstrip()):]
+            if not text.strip():
+                continue
+            if not _is_inline_code(child):
+                marks.append({"type": "textColor", "attrs": {"color": TRANSLATION_COLOR}})
+            new_content.append({**{k: v for k, v in child.items() if k not in {"text", "marks"}}, "text": text, "marks": marks})
+        elif isinstance(child, dict) and child.get("type") in {"media", "mediaInline"}:
+            # 미디어는 원문 블록에 이미 있으므로 번역 블록에는 넣지 않는다
+            continue
+        else:
+            new_content.append(copy.deepcopy(child))
+    new_block["content"] = new_content
+    return new_block
+
+
+def apply_adf_translations(doc: dict, translations: dict[tuple[int, ...], str]) -> dict:
+    """번역문(segment path -> 번역)을 반영한 새 문서. 원문은 그대로 두고 각 블록 아래에 번역 블록을 추가한다."""
+    patched = copy.deepcopy(doc)
+    by_block: dict[tuple[int, ...], dict[int, str]] = {}
+    for path, text in translations.items():
+        if text and text.strip() and len(path) >= 2:
+            by_block.setdefault(path[:-1], {})[path[-1]] = text.strip()
+    # 뒤쪽 블록부터 끼워 넣어야 앞쪽 블록의 경로가 바뀌지 않는다
+    for block_path in sorted(by_block, reverse=True):
+        parent = _node_at(patched, block_path[:-1])
+        block = parent["content"][block_path[-1]]
+        parent["content"].insert(block_path[-1] + 1, _translation_block(block, by_block[block_path]))
+    return patched
@@ -0,0 +1,203 @@
+"""httpx.AsyncClient 기반 비동기 Jira 클라이언트.
+
+배치/백필처럼 여러 이슈를 다루는 흐름에서 Jira I/O를 LLM 호출과 겹쳐 실행하기 위한 클라이언트다.
+응답 해석/필드 정규화는 JiraFieldNormalizer를 통해 동기 JiraClient와 같은 코드를 쓴다.
+
+- 커넥션 풀: httpx.Limits(max_connections, max_keepalive_connections), HTTP/1.1 keep-alive
+  (HTTP/2용 h2 패키지는 번들에 포함하지 않는다)
+- 동시 요청 제한: asyncio.Semaphore(max_concurrency)
+- 속도 제한: 동기 JiraClient 세션과 같은 사이트별 공유 TokenBucket (429를 받으면 함께 멈춘다)
+- 재시도: modules.jira_transport.RetryPolicy와 같은 규칙 (GET은 일시적 오류 전반, PUT은 안전한 오류만)
+
+사용법:
+    async with AsyncJiraClient(url, email, token) as client:
+        fields = await client.fetch_issue_fields("P2-1", ["summary", "description"])
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Sequence
+from typing import Optional
+
+import httpx
+
+from modules.jira_client import FETCH_MODES, FetchStats, JiraFieldNormalizer, notify_users_default
+from modules.jira_transport import IDEMPOTENT_METHODS, RetryPolicy, TokenBucket, parse_retry_after, shared_token_bucket
+from modules.steps_field_cache import NOT_CACHED, default_steps_field_cache
+
+
+class AsyncJiraClient(JiraFieldNormalizer):
+    def __init__(
+        self,
+        jira_url: str,
+        email: str,
+        api_token: str,
+        *,
+        max_connections: int = 20,
+        max_concurrency: int = 8,
+        timeout: float = 15.0,
+        fetch_mode: Optional[str] = None,
+        policy: Optional[RetryPolicy] = None,
+        bucket: Optional[TokenBucket] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.jira_url = jira_url.rstrip("/")
+        self.fetch_mode = (fetch_mode or os.getenv("JIRA_FETCH_MODE", "lean")).strip().lower()
+        if self.fetch_mode not in FETCH_MODES:
+            raise EnvironmentError(f"Unknown JIRA_FETCH_MODE: {self.fetch_mode}")
+        self.policy = policy or RetryPolicy.from_env()
+        self.fetch_stats = FetchStats()
+        # 같은 사이트의 동기 JiraClient 세션과 속도 제한을 공유한다 (JIRA_RATE_LIMIT=0이면 제한 없음)
+        self.bucket = bucket if bucket is not None else shared_token_bucket(self.jira_url)
+        self._steps_field_cache: dict[str, Optional[str]] = {}
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._client = httpx.AsyncClient(
+            auth=(email, api_token),
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncJiraClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    def _should_retry_exception(self, method: str, exc: Exception) -> bool:
+        if method in IDEMPOTENT_METHODS:
+            return isinstance(exc, httpx.TransportError)
+        # 요청을 보내지 못한 경우만 비멱등 요청을 재시도한다.
+        return isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout))
+
+    async def _request(self, method: str, url: str, *, kind: Optional[str] = None, **kwargs) -> httpx.Response:
+        """동시성/속도 제한 + 재시도를 적용한 요청 한 번. kind가 있으면 fetch_stats에 기록한다."""
+        method = method.upper()
+        attempt = 0
+        while True:
+            last_attempt = attempt >= self.policy.max_retries
+            if self.bucket is not None:
+                await self.bucket.acquire_async()
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            try:
+                async with self._semaphore:
+                    response = await self._client.request(method, url, **kwargs)
+            except Exception as exc:
+                if last_attempt or not self._should_retry_exception(method, exc):
+                    raise
+                delay = self.policy.backoff(attempt)
+                print(f"⚠️ Jira {method} failed ({type(exc).__name__}), retrying in {delay:.2f}s")
+            else:
+                if kind:
+                    self.fetch_stats.record(kind, response, (loop.time() - started) * 1000)
+                if last_attempt or not self.policy.should_retry_status(method, response.status_code):
+                    return response
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                delay = (
+                    self.policy.backoff(attempt)
+                    if retry_after is None
+                    else min(retry_after, self.policy.max_retry_after)
+                )
+                if response.status_code == 429 and self.bucket is not None:
+                    self.bucket.pause(delay)
+                print(f"⚠️ Jira {method} returned {response.status_code}, retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _get_json(self, kind: str, endpoint: str, params: dict) -> dict:
+        response = await self._request("GET", endpoint, kind=kind, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    async def detect_steps_field(self, project_key: str) -> Optional[str]:
+        """JiraClient.detect_steps_field와 동일 (실패 시 None, 인스턴스 + 프로세스/디스크 TTL 캐시)."""
+        if project_key in self._steps_field_cache:
+            return self._steps_field_cache[project_key]
+        shared_cache = default_steps_field_cache()
+        cached = shared_cache.get(self.jira_url, project_key)
+        if cached is not NOT_CACHED:
+            self._steps_field_cache[project_key] = cached
+            return cached
+
+        detected = None
+        try:
+            data = await self._get_json(
+                "createmeta",
+                f"{self.jira_url}/rest/api/2/issue/createmeta",
+                self._createmeta_params(project_key),
+            )
+            detected = self._steps_field_from_createmeta(data)
+            shared_cache.put(self.jira_url, project_key, detected)
+        except Exception as exc:
+            print(f"⚠️ Steps field detection failed for {project_key}: {exc}")
+
+        self._steps_field_cache[project_key] = detected
+        return detected
+
+    async def fetch_issue_fields(
+        self,
+        issue_key: str,
+        fields_to_fetch: Optional[Sequence[str]] = None,
+        mode: Optional[str] = None,
+    ) -> dict[str, str]:
+        """JiraClient.fetch_issue_fields와 동일한 결과 (lean/full 모드 포함)."""
+        fields_to_fetch = list(fields_to_fetch or ["summary", "description"])
+        endpoint = f"{self.jira_url}/rest/api/2/issue/{issue_key}"
+        if (mode or self.fetch_mode) == "full":
+            data = await self._get_json(
+                "full", endpoint, {"fields": ",".join(fields_to_fetch), "expand": "renderedFields"}
+            )
+            return self._normalize_issue_fields(data, fields_to_fetch)
+
+        data = await self._get_json("lean", endpoint, {"fields": ",".join(fields_to_fetch)})
+        fetched_fields = self._normalize_issue_fields(data, fields_to_fetch)
+        missing = self._fields_needing_render(data, fields_to_fetch, fetched_fields)
+        if missing:
+            rendered = await self._get_json(
+                "lean_rendered", endpoint, {"fields": ",".join(missing), "expand": "renderedFields"}
+            )
+            fetched_fields.update(self._normalize_issue_fields(rendered, missing))
+        return fetched_fields
+
+    async def fetch_many(
+        self,
+        issue_keys: Sequence[str],
+        fields_to_fetch: Optional[Sequence[str]] = None,
+    ) -> dict[str, dict[str, str] | Exception]:
+        """여러 이슈를 동시에 조회. 실패한 이슈는 예외 객체를 값으로 담는다 (입력 순서 유지)."""
+        keys = list(dict.fromkeys(issue_keys))
+        results = await asyncio.gather(
+            *(self.fetch_issue_fields(key, fields_to_fetch) for key in keys),
+            return_exceptions=True,
+        )
+        return dict(zip(keys, results))
+
+    async def update_issue_fields(
+        self,
+        issue_key: str,
+        field_payload: dict[str, str],
+        notify_users: Optional[bool] = None,
+    ) -> None:
+        """JiraClient.update_issue_fields와 동일 (notifyUsers=false 권한 부족 시 알림을 켠 채 재전송)."""
+        if not field_payload:
+            print("ℹ️ 업데이트할 필드가 없습니다.")
+            return
+
+        if notify_users is None:
+            notify_users = notify_users_default()
+        endpoint = f"{self.jira_url}/rest/api/2/issue/{issue_key}"
+        params = {} if notify_users else {"notifyUsers": "false"}
+        response = await self._request("PUT", endpoint, params=params, json={"fields": field_payload})
+        if params and response.status_code == 403:
+            print("⚠️ notifyUsers=false not permitted; retrying with notifications")
+            response = await self._request("PUT", endpoint, json={"fields": field_payload})
+        if response.is_error:
+            print(f"❌ Jira API Error ({response.status_code})")
+            print(f"Response: {response.text}")
+        response.raise_for_status()
+        print("✅ Jira 이슈가 업데이트되었습니다.")
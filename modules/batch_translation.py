@@ -0,0 +1,236 @@
+"""여러 Jira 이슈를 한 요청에서 번역하는 배치 실행기.
+
+처리 순서:
+1. 이슈 필드 fetch (동시성 제한된 thread pool, JQL 검색으로 받아 온 필드가 있으면 생략)
+2. 같은 용어집 + 같은 번역 방향을 쓰는 summary들을 하나의 LLM 배치로 묶어 번역
+3. 이슈별 나머지 필드 번역/업데이트 (thread pool, 묶어 번역한 summary는 재사용)
+
+worker마다 translator.fork()로 만든 translator를 사용하므로 용어집 상태는 이슈별로 독립이고,
+HTTP 커넥션 풀과 용어집/matcher 캐시(프로세스 단위)는 공유된다.
+한 이슈의 실패는 다른 이슈에 영향을 주지 않으며 errors에 이슈별로 기록된다.
+"""
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+from models import TranslationChunk
+
+# 여러 이슈의 청크를 한 배치에 넣을 때 chunk id 앞에 붙이는 구분자 ("P2-1::summary")
+PACKED_ID_SEPARATOR = "::"
+
+
+@dataclass
+class _IssueWork:
+    issue_key: str
+    translator: object
+    fields_to_translate: list[str]
+    issue_fields: dict[str, str] = field(default_factory=dict)
+    pretranslated: dict[str, str] = field(default_factory=dict)
+    # 마지막 업데이트 이후 번역 입력이 그대로인 이슈 (summary 묶음 번역에서 제외)
+    unchanged: bool = False
+
+
+def _error_payload(exc: Exception) -> dict:
+    return {"error": str(exc), "type": type(exc).__name__}
+
+
+def _prepare(
+    translator,
+    issue_key: str,
+    fields_to_translate: Optional[list[str]],
+    prefetched: Optional[dict[str, str]] = None,
+    prefetched_fields: Sequence[str] = (),
+    perform_update: bool = False,
+    target_language: Optional[str] = None,
+) -> _IssueWork:
+    worker = translator.fork()
+    project_key = issue_key.split("-")[0].upper()
+    _, fields = worker._resolve_fields_to_translate(project_key, fields_to_translate)
+    # JQL 검색에서 필요한 필드를 모두 받아 왔으면 이슈별 fetch를 생략한다.
+    if prefetched is not None and {"summary", *fields} <= set(prefetched_fields):
+        issue_fields = dict(prefetched)
+    else:
+        issue_fields = worker._fetch_fields_for_translation(issue_key, fields)
+    unchanged = perform_update and worker.is_unchanged_since_last_update(issue_key, fields, issue_fields, target_language)
+    return _IssueWork(
+        issue_key=issue_key,
+        translator=worker,
+        fields_to_translate=fields,
+        issue_fields=issue_fields,
+        unchanged=unchanged,
+    )
+
+
+def _summary_chunk(work: _IssueWork) -> Optional[TranslationChunk]:
+    """묶음 번역 대상 summary 청크 (이미 이중언어이거나 번역 대상이 아니면 None)."""
+    if work.unchanged or "summary" not in work.fields_to_translate:
+        return None
+    summary = work.issue_fields.get("summary")
+    if not summary or work.translator._is_bilingual_summary(summary):
+        return None
+    job = work.translator._plan_field_translation_job("summary", summary)
+    if not job or len(job.chunks) != 1:
+        return None
+    return job.chunks[0]
+
+
+def _group_summaries(
+    works: Sequence[_IssueWork],
+    target_language: Optional[str],
+) -> dict[tuple[str, str, str], list[tuple[_IssueWork, TranslationChunk]]]:
+    """(glossary 파일, glossary 이름, 번역 방향)별 summary 청크 그룹."""
+    groups: dict[tuple[str, str, str], list[tuple[_IssueWork, TranslationChunk]]] = {}
+    for work in works:
+        chunk = _summary_chunk(work)
+        if chunk is None:
+            continue
+        project_key = work.issue_key.split("-")[0].upper()
+        glossary_file, glossary_name = work.translator._determine_glossary(project_key, work.issue_fields["summary"])
+        direction = work.translator.translation_engine.resolve_direction_lang(chunk.clean_text, target_language)
+        groups.setdefault((glossary_file, glossary_name, direction), []).append((work, chunk))
+    return groups
+
+
+def _translate_summary_group(
+    translator,
+    glossary: tuple[str, str],
+    members: list[tuple[_IssueWork, TranslationChunk]],
+    target_language: Optional[str],
+) -> int:
+    """그룹의 summary들을 한 번의 LLM 배치로 번역해 각 이슈의 pretranslated에 채운다.
+
+    반환: 번역 결과를 받은 summary 수 (실패 시 0 — 이슈별 번역 단계에서 다시 번역된다)
+    """
+    worker = translator.fork()
+    worker.reset_request_state()
+    worker.translation_engine.load_glossary(*glossary)
+    packed = [
+        dataclasses.replace(chunk, id=f"{work.issue_key}{PACKED_ID_SEPARATOR}{chunk.id}")
+        for work, chunk in members
+    ]
+    try:
+        translations = worker._call_openai_batch(packed, target_language)
+    except Exception as exc:
+        print(f"⚠️ Packed summary batch failed ({glossary[0]}): {exc}")
+        return 0
+
+    filled = 0
+    for (work, chunk), packed_chunk in zip(members, packed):
+        translated = translations.get(packed_chunk.id)
+        if translated:
+            work.pretranslated[chunk.id] = translated
+            filled += 1
+    return filled
+
+
+def translate_issues(
+    translator,
+    issue_keys: Sequence[str],
+    *,
+    target_language: Optional[str] = None,
+    fields_to_translate: Optional[list[str]] = None,
+    perform_update: bool = False,
+    max_workers: int = 4,
+    prefetched: Optional[dict[str, dict[str, str]]] = None,
+    prefetched_fields: Sequence[str] = (),
+) -> dict:
+    """여러 이슈를 번역하고 이슈별 결과/에러를 한 번에 반환한다.
+
+    prefetched(이슈 키 -> 정규화된 필드)는 JQL 검색으로 이미 받아 온 필드이며,
+    prefetched_fields는 그 검색에서 요청한 필드 목록이다.
+
+    Returns:
+        {"results": {key: translate_issue 결과}, "errors": {key: {"error", "type"}},
+         "batch": {"total", "succeeded", "failed", "packed_summaries", "packed_batches"}}
+    """
+    issue_keys = list(dict.fromkeys(issue_keys))
+    results: dict[str, dict] = {}
+    errors: dict[str, dict] = {}
+    packed_summaries = 0
+    packed_batches = 0
+
+    if issue_keys:
+        if fields_to_translate is None:
+            # 필드를 자동 결정하는 경우 미지 프로젝트의 steps 필드를 createmeta 한 번으로 미리 탐지
+            try:
+                translator.prefetch_steps_fields([key.split("-")[0].upper() for key in issue_keys])
+            except Exception as exc:
+                print(f"⚠️ Steps field prefetch failed: {exc}")
+        workers = max(1, min(int(max_workers), len(issue_keys)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jira-translate") as pool:
+            # 1. fetch
+            futures = {
+                key: pool.submit(
+                    _prepare,
+                    translator,
+                    key,
+                    fields_to_translate,
+                    (prefetched or {}).get(key),
+                    prefetched_fields,
+                    perform_update,
+                    target_language,
+                )
+                for key in issue_keys
+            }
+            works: list[_IssueWork] = []
+            for key, future in futures.items():
+                try:
+                    works.append(future.result())
+                except Exception as exc:
+                    print(f"❌ Failed to fetch {key}: {exc}")
+                    errors[key] = _error_payload(exc)
+
+            # 2. summary 묶음 번역 (summary가 2개 이상인 그룹만)
+            groups = {
+                group_key: members
+                for group_key, members in _group_summaries(works, target_language).items()
+                if len(members) > 1
+            }
+            summary_futures = [
+                pool.submit(_translate_summary_group, translator, group_key[:2], members, target_language)
+                for group_key, members in groups.items()
+            ]
+            for future in summary_futures:
+                filled = future.result()
+                if filled:
+                    packed_batches += 1
+                    packed_summaries += filled
+
+            # 3. 이슈별 번역
+            translate_futures = {
+                work.issue_key: pool.submit(
+                    work.translator.translate_issue,
+                    issue_key=work.issue_key,
+                    target_language=target_language,
+                    fields_to_translate=work.fields_to_translate,
+                    perform_update=perform_update,
+                    issue_fields=work.issue_fields,
+                    pretranslated=work.pretranslated,
+                )
+                for work in works
+            }
+            for key, future in translate_futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as exc:
+                    print(f"❌ Failed to translate {key}: {exc}")
+                    errors[key] = _error_payload(exc)
+
+    # 입력 순서대로 정렬
+    results = {key: results[key] for key in issue_keys if key in results}
+    errors = {key: errors[key] for key in issue_keys if key in errors}
+    return {
+        "results": results,
+        "errors": errors,
+        "batch": {
+            "total": len(issue_keys),
+            "succeeded": len(results),
+            "failed": len(errors),
+            "packed_summaries": packed_summaries,
+            "packed_batches": packed_batches,
+        },
+    }
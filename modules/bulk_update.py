@@ -0,0 +1,190 @@
+"""백필용 Jira 일괄 업데이트 writer.
+
+백필은 수천 건의 update_issue_fields 호출로 끝나는데, 한 건씩 순서대로 보내면
+Jira가 허용하는 속도보다 훨씬 느리다. BulkUpdateWriter는 (issue_key, payload) 스트림을 받아
+
+- 동시성 제한된 thread pool로 PUT을 보내고 (입력은 스트림으로 읽어 in-flight 개수만 메모리에 유지)
+- TokenBucket으로 초당 요청 수를 제한하며
+  (JiraClient 세션은 이미 사이트별 공유 버킷을 쓰므로 기본값은 추가 제한 없음)
+- 재시도는 JiraClient transport(RetryingSession)에 맡기고 (PUT은 적용되지 않은 게 확실한 실패만 재시도)
+  writer는 각 PUT을 한 번만 호출하며
+- 완료한 이슈(빈 payload 포함)를 JSONL checkpoint에 기록해, 중단 후 다시 실행하면 성공한 이슈를 건너뛴다.
+
+사용법:
+    writer = BulkUpdateWriter(jira_client, max_concurrency=8, checkpoint_path="backfill.jsonl")
+    summary = writer.run((key, payload) for key, payload in updates)
+    print(summary.as_dict())
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from modules.jira_transport import TokenBucket
+
+
+def _status_code(exc: Exception) -> Optional[int]:
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None)
+
+
+@dataclass
+class BulkUpdateSummary:
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    # checkpoint에 이미 성공으로 기록되어 건너뛴 이슈 수
+    skipped: int = 0
+    # 실행 동안 transport가 재시도한 횟수 (client가 transport_stats를 제공할 때, 같은 세션의 다른 요청 포함)
+    retries: int = 0
+    elapsed_seconds: float = 0.0
+    failures: dict[str, dict] = field(default_factory=dict)
+
+    @property
+    def requests_per_second(self) -> float:
+        sent = self.succeeded + self.failed
+        return sent / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "retries": self.retries,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "requests_per_second": round(self.requests_per_second, 2),
+            "failures": dict(self.failures),
+        }
+
+
+class UpdateCheckpoint:
+    """이슈별 완료 상태를 한 줄씩 append하는 JSONL 파일 (스레드 안전).
+
+    같은 이슈가 여러 번 기록되면 마지막 줄이 우선한다 (실패 후 재실행에서 성공한 경우).
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def completed(self) -> set[str]:
+        """성공으로 기록된 이슈 키 (파일이 없거나 줄이 깨졌으면 그 부분은 무시)."""
+        status: dict[str, str] = {}
+        try:
+            with self.path.open(encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        record = json.loads(line)
+                        status[record["issue_key"]] = record["status"]
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            return set()
+        return {key for key, value in status.items() if value == "ok"}
+
+    def record(self, issue_key: str, status: str, error: Optional[str] = None) -> None:
+        line = json.dumps({"issue_key": issue_key, "status": status, "error": error, "at": time.time()}, ensure_ascii=False)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+                handle.flush()
+
+
+class BulkUpdateWriter:
+    def __init__(
+        self,
+        client,
+        *,
+        max_concurrency: int = 8,
+        bucket: Optional[TokenBucket] = None,
+        checkpoint_path: Optional[str] = None,
+        notify_users: Optional[bool] = None,
+    ):
+        """client는 update_issue_fields(issue_key, payload)를 가진 객체 (JiraClient 또는 JiraTicketTranslator)."""
+        self.client = client
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.bucket = bucket
+        self.checkpoint = UpdateCheckpoint(checkpoint_path) if checkpoint_path else None
+        self.notify_users = notify_users
+        self._stats_lock = threading.Lock()
+
+    def _put(self, issue_key: str, payload: dict) -> None:
+        # 재시도는 transport 몫이다: 여기서 다시 보내면 응답 대기 타임아웃처럼
+        # 이미 적용됐을 수 있는 PUT까지 중복 전송하게 된다.
+        if self.bucket is not None:
+            self.bucket.acquire()
+        if self.notify_users is None:
+            self.client.update_issue_fields(issue_key, payload)
+        else:
+            self.client.update_issue_fields(issue_key, payload, notify_users=self.notify_users)
+
+    def _transport_retries(self) -> int:
+        transport_stats = getattr(self.client, "transport_stats", None)
+        if not callable(transport_stats):
+            return 0
+        return int(transport_stats().get("retries", 0))
+
+    def _finish(self, issue_key: str, future: Future, summary: BulkUpdateSummary) -> None:
+        exc = future.exception()
+        with self._stats_lock:
+            if exc is None:
+                summary.succeeded += 1
+            else:
+                summary.failed += 1
+                summary.failures[issue_key] = {"error": str(exc), "type": type(exc).__name__, "status": _status_code(exc)}
+        if exc is not None:
+            print(f"❌ Bulk update failed for {issue_key}: {exc}")
+        if self.checkpoint is not None:
+            self.checkpoint.record(issue_key, "ok" if exc is None else "failed", None if exc is None else str(exc))
+
+    def run(self, updates: Iterable[tuple[str, dict]]) -> BulkUpdateSummary:
+        """updates를 모두 보내고 요약을 반환한다 (개별 실패는 예외 대신 summary.failures에 기록).
+
+        빈 payload는 보내지 않고 성공으로 센다 (checkpoint에도 완료로 기록).
+        같은 이슈 키가 다시 나오면 뒤의 것은 건너뛴다.
+        """
+        summary = BulkUpdateSummary()
+        done = self.checkpoint.completed() if self.checkpoint is not None else set()
+        seen: set[str] = set()
+        started = time.monotonic()
+        retries_before = self._transport_retries()
+        in_flight: dict[Future, str] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="jira-bulk-update") as pool:
+            for issue_key, payload in updates:
+                summary.total += 1
+                if issue_key in done or issue_key in seen:
+                    summary.skipped += 1
+                    continue
+                seen.add(issue_key)
+                if not payload:
+                    summary.succeeded += 1
+                    if self.checkpoint is not None:
+                        self.checkpoint.record(issue_key, "ok")
+                    continue
+                # 입력 스트림을 한꺼번에 큐에 넣지 않도록 in-flight 수를 제한한다
+                while len(in_flight) >= self.max_concurrency * 2:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        self._finish(in_flight.pop(future), future, summary)
+                in_flight[pool.submit(self._put, issue_key, payload)] = issue_key
+
+            for future in list(in_flight):
+                future.exception()
+                self._finish(in_flight.pop(future), future, summary)
+
+        summary.elapsed_seconds = time.monotonic() - started
+        summary.retries = self._transport_retries() - retries_before
+        print(
+            f"📦 Bulk update: {summary.succeeded} ok, {summary.failed} failed, {summary.skipped} skipped "
+            f"({summary.requests_per_second:.1f} req/s)"
+        )
+        return summary
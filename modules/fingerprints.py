@@ -0,0 +1,148 @@
+"""이슈별 번역 입력 fingerprint 저장소 (변경 없는 재번역 건너뛰기).
+
+Jira 자동화는 이슈가 수정될 때마다 번역을 다시 호출하며, 여기에는 우리가 update_issue_fields로
+PUT한 수정도 포함된다. 번역 입력(정규화된 원문 필드 + 용어집 + 프롬프트 버전 + 모델 + 대상 언어)의
+해시를 이슈별로 저장해 두고, 같은 fingerprint로 다시 호출되면 LLM 호출 없이 건너뛴다.
+
+업데이트 후에는 "번역 결과가 반영된 필드"의 fingerprint도 함께 저장하므로,
+우리 PUT이 일으킨 재호출도 같은 방식으로 걸러진다.
+
+- InMemoryFingerprintStore: warm 컨테이너 안에서만 유지
+- SQLiteFingerprintStore: 같은 파일을 여는 여러 프로세스 간 공유
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Optional
+
+DEFAULT_SQLITE_PATH = "/tmp/jira_translator_fingerprints.sqlite3"
+# 이슈별로 보관하는 fingerprint 수 (원문 + 업데이트 결과)
+MAX_FINGERPRINTS_PER_ISSUE = 4
+
+
+def issue_fingerprint(fields: dict[str, str], context: dict) -> str:
+    """번역 입력 fingerprint (필드 순서와 무관)."""
+    payload = json.dumps({"fields": fields, "context": context}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class FingerprintStore(ABC):
+    """이슈 키 -> 최근 fingerprint 목록."""
+
+    @abstractmethod
+    def get(self, issue_key: str) -> list[str]:
+        ...
+
+    @abstractmethod
+    def put(self, issue_key: str, fingerprints: Sequence[str]) -> None:
+        """fingerprint 목록을 이슈의 최신 값으로 기록 (이전 값은 MAX_FINGERPRINTS_PER_ISSUE개까지 유지)."""
+
+    def contains(self, issue_key: str, fingerprint: str) -> bool:
+        return fingerprint in self.get(issue_key)
+
+
+def _merge(new: Sequence[str], old: Sequence[str]) -> list[str]:
+    return list(dict.fromkeys([*new, *old]))[:MAX_FINGERPRINTS_PER_ISSUE]
+
+
+class InMemoryFingerprintStore(FingerprintStore):
+    def __init__(self):
+        self._records: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, issue_key: str) -> list[str]:
+        with self._lock:
+            return list(self._records.get(issue_key.upper(), []))
+
+    def put(self, issue_key: str, fingerprints: Sequence[str]) -> None:
+        key = issue_key.upper()
+        with self._lock:
+            self._records[key] = _merge(fingerprints, self._records.get(key, []))
+
+
+class SQLiteFingerprintStore(FingerprintStore):
+    """SQLite 파일 기반 구현 (스레드별 커넥션)."""
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS issue_fingerprints (
+            issue_key TEXT PRIMARY KEY,
+            fingerprints TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, path: str = DEFAULT_SQLITE_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._connect().executescript(self._SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, issue_key: str) -> list[str]:
+        row = self._connect().execute(
+            "SELECT fingerprints FROM issue_fingerprints WHERE issue_key = ?", (issue_key.upper(),)
+        ).fetchone()
+        return json.loads(row[0]) if row else []
+
+    def put(self, issue_key: str, fingerprints: Sequence[str]) -> None:
+        conn = self._connect()
+        key = issue_key.upper()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT fingerprints FROM issue_fingerprints WHERE issue_key = ?", (key,)).fetchone()
+            merged = _merge(fingerprints, json.loads(row[0]) if row else [])
+            conn.execute(
+                "INSERT OR REPLACE INTO issue_fingerprints (issue_key, fingerprints, updated_at) VALUES (?, ?, ?)",
+                (key, json.dumps(merged), time.time()),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+
+def build_fingerprint_store() -> Optional[FingerprintStore]:
+    """환경 변수(FINGERPRINT_STORE=memory|sqlite|off, FINGERPRINT_SQLITE_PATH)로 저장소 구성."""
+    kind = os.getenv("FINGERPRINT_STORE", "memory").strip().lower()
+    if kind in {"0", "off", "false", "no", "none"}:
+        return None
+    if kind == "memory":
+        return InMemoryFingerprintStore()
+    if kind == "sqlite":
+        return SQLiteFingerprintStore(os.getenv("FINGERPRINT_SQLITE_PATH", DEFAULT_SQLITE_PATH))
+    raise EnvironmentError(f"Unknown FINGERPRINT_STORE: {kind}")
+
+
+_DEFAULT_STORE: Optional[FingerprintStore] = None
+_DEFAULT_STORE_READY = False
+_DEFAULT_STORE_LOCK = threading.Lock()
+
+
+def default_fingerprint_store() -> Optional[FingerprintStore]:
+    """프로세스 공용 저장소 (FINGERPRINT_STORE=off면 None)."""
+    global _DEFAULT_STORE, _DEFAULT_STORE_READY
+    with _DEFAULT_STORE_LOCK:
+        if not _DEFAULT_STORE_READY:
+            _DEFAULT_STORE = build_fingerprint_store()
+            _DEFAULT_STORE_READY = True
+        return _DEFAULT_STORE
+
+
+def reset_default_fingerprint_store() -> None:
+    global _DEFAULT_STORE, _DEFAULT_STORE_READY
+    with _DEFAULT_STORE_LOCK:
+        _DEFAULT_STORE = None
+        _DEFAULT_STORE_READY = False
@@ -1,4 +1,5 @@
 import re
+from dataclasses import dataclass, field
 from typing import Optional
 
 DESCRIPTION_SECTIONS = ("Observed", "Expected", "Expected Result", "Note", "Notes", "Video", "Etc.")
@@ -6,10 +7,22 @@ DESCRIPTION_SECTIONS = ("Observed", "Expected", "Expected Result", "Note", "Note
 # 번역 스킵할 섹션 (영어 키워드 기준, 대소문자 무시)
 SKIP_TRANSLATION_SECTIONS = ("QA Environment",)
 
+# 이미지 마크업: !image.png!, !image.png|thumbnail!, !image.png|width=300!
+# 첨부파일 마크업: [^attachment.pdf], [^video.mp4]
+# 한 번의 스캔으로 두 종류를 문서 순서대로 찾는다
+_ATTACHMENT_MARKUP_RE = re.compile(r'(?P<image>!(?:[^!]+?)(?:\|[^!]*)?!)|(?P<attachment>\[\^(?:[^\]]+?)\])')
+
+# 복원 대상 플레이스홀더 (종류와 상관없이 번호로 원본을 찾는다)
+_ATTACHMENT_PLACEHOLDER_RE = re.compile(r'__(?:IMAGE|ATTACHMENT)_PLACEHOLDER_(\d+)__')
+
+
 def extract_attachments_markup(text: str) -> tuple[list[str], str]:
     """
     Jira 마크업에서 이미지와 첨부파일 마크업을 추출하고 플레이스홀더로 대체
 
+    이미지/첨부파일을 하나의 정규식으로 한 번만 훑으므로 첨부가 수백 개여도 텍스트 길이에 선형이다.
+    번호는 문서에 나온 순서대로 매긴다.
+
     Args:
         text: 원본 텍스트
 
@@ -19,32 +32,22 @@ def extract_attachments_markup(text: str) -> tuple[list[str], str]:
     if not text:
         return [], ""
 
-    attachments = []
-
-    # 이미지 마크업 패턴: !image.png!, !image.png|thumbnail!, !image.png|width=300!
-    image_pattern = r'!([^!]+?)(?:\|[^!]*)?!'
+    attachments: list[str] = []
 
-    # 첨부파일 마크업 패턴: [^attachment.pdf], [^video.mp4]
-    attachment_pattern = r'\[\^([^\]]+?)\]'
-
-    def replace_image(match):
-        attachments.append(match.group(0))
-        return f"__IMAGE_PLACEHOLDER_{len(attachments)-1}__"
-
-    def replace_attachment(match):
+    def replace(match: re.Match) -> str:
         attachments.append(match.group(0))
-        return f"__ATTACHMENT_PLACEHOLDER_{len(attachments)-1}__"
-
-    # 플레이스홀더로 대체
-    text = re.sub(image_pattern, replace_image, text)
-    text = re.sub(attachment_pattern, replace_attachment, text)
+        kind = "IMAGE" if match.lastgroup == "image" else "ATTACHMENT"
+        return f"__{kind}_PLACEHOLDER_{len(attachments) - 1}__"
 
-    return attachments, text
+    return attachments, _ATTACHMENT_MARKUP_RE.sub(replace, text)
 
 def restore_attachments_markup(text: str, attachments: list[str]) -> str:
     """
     번역된 텍스트에 원본 마크업을 복원
 
+    플레이스홀더를 한 번의 정규식 치환으로 번호 → 원본 조회해 바꾼다.
+    복원한 마크업은 다시 검사하지 않고, 범위를 벗어난 번호는 그대로 둔다.
+
     Args:
         text: 번역된 텍스트 (플레이스홀더 포함)
         attachments: 원본 마크업 리스트
@@ -52,13 +55,14 @@ def restore_attachments_markup(text: str, attachments: list[str]) -> str:
     Returns:
         마크업이 복원된 텍스트
     """
-    for i, attachment_markup in enumerate(attachments):
-        # 이미지 플레이스홀더 복원
-        text = text.replace(f"__IMAGE_PLACEHOLDER_{i}__", attachment_markup)
-        # 첨부파일 플레이스홀더 복원
-        text = text.replace(f"__ATTACHMENT_PLACEHOLDER_{i}__", attachment_markup)
+    if not text or not attachments:
+        return text
 
-    return text
+    def restore(match: re.Match) -> str:
+        index = int(match.group(1))
+        return attachments[index] if index < len(attachments) else match.group(0)
+
+    return _ATTACHMENT_PLACEHOLDER_RE.sub(restore, text)
 
 
 def format_summary_value(original: str, translated: str) -> str:
@@ -120,11 +124,29 @@ def split_bracket_prefix(text: str) -> tuple[str, str]:
     return "", text
 
 def strip_bullet_prefix(text: str) -> str:
-    return re.sub(r"^\s*(?:[-*#]+|\d+[\.\)])\s*", "", text).strip()
+    return _BULLET_PREFIX_RE.sub("", text).strip()
 
 # 미디어 파일 확장자 패턴
 MEDIA_EXTENSIONS = r'\.(mp4|mov|avi|webm|mkv|jpg|jpeg|png|gif|bmp|webp|pdf|mp3|wav)'
 
+# 라인 판별 함수들이 매번 다시 컴파일하지 않도록 모듈 로드 시 한 번만 컴파일
+_BULLET_PREFIX_RE = re.compile(r"^\s*(?:[-*#]+|\d+[\.\)])\s*")
+_PLACEHOLDER_ONLY_RE = re.compile(r'(__IMAGE_PLACEHOLDER_\d+__|__ATTACHMENT_PLACEHOLDER_\d+__)[,\s]*')
+_IMAGE_ONLY_RE = re.compile(r'![^!]+![,\s]*')
+_ATTACHMENT_ONLY_RE = re.compile(r'\[\^[^\]]+\][,\s]*')
+_LINK_MEDIA_ONLY_RE = re.compile(rf'\[[^\]|]+{MEDIA_EXTENSIONS}\|[^\]]+\][,\s]*', re.IGNORECASE)
+_LINK_MEDIA_PREFIX_RE = re.compile(rf'\[[^\]|]+{MEDIA_EXTENSIONS}\|', re.IGNORECASE)
+_IMAGE_METADATA_RE = re.compile(r'(width|height|alt)=.*!$')
+_CODE_TAG_RE = re.compile(r'\{code(?::[^}]*)?\}')
+_COLOR_TAG_RE = re.compile(r"\{color:[^}]+\}|\{color\}")
+_BRACKET_LABEL_RE = re.compile(r'^\*\[[^\]]+\]\*\s*$')
+_LABEL_SPLIT_RE = re.compile(r"[\(\[]")
+_STRIP_ATTACHMENT_RE = re.compile(r'\[\^[^\]]+\]\s*')
+_STRIP_IMAGE_RE = re.compile(r'![^!]+!\s*')
+_STRIP_LINK_MEDIA_RE = re.compile(rf'\[[^\]|]+{MEDIA_EXTENSIONS}\|[^\]]+\]\s*', re.IGNORECASE)
+_STRIP_PLACEHOLDER_RE = re.compile(r'__(?:IMAGE|ATTACHMENT)_PLACEHOLDER_\d+__\s*')
+_LEADING_PUNCTUATION_RE = re.compile(r'^[\s,\-]+')
+
 
 def is_media_only_line(stripped_line: str) -> bool:
     """
@@ -141,28 +163,29 @@ def is_media_only_line(stripped_line: str) -> bool:
     if not stripped_line:
         return False
 
-    def _strip_bullet_prefix_local(text: str) -> str:
-        return re.sub(r"^\s*(?:[-*#]+|\d+[\.\)])\s*", "", text or "").strip()
-
     # 불릿 제거 후 체크
-    candidate = _strip_bullet_prefix_local(stripped_line)
+    candidate = _BULLET_PREFIX_RE.sub("", stripped_line).strip()
     if not candidate:
         return False
 
+    # 미디어/플레이스홀더 마크업은 모두 !, [, _ 로 시작한다
+    if candidate[0] not in "![_":
+        return False
+
     # 플레이스홀더만 있는 라인
-    if re.fullmatch(r'(__IMAGE_PLACEHOLDER_\d+__|__ATTACHMENT_PLACEHOLDER_\d+__)[,\s]*', candidate):
+    if _PLACEHOLDER_ONLY_RE.fullmatch(candidate):
         return True
 
     # 이미지 마크업만 있는 라인: !...! 형식 (뒤에 구두점/공백만 허용)
-    if re.fullmatch(r'![^!]+![,\s]*', candidate):
+    if _IMAGE_ONLY_RE.fullmatch(candidate):
         return True
 
     # 첨부파일 마크업만 있는 라인: [^...] 형식 (뒤에 구두점/공백만 허용)
-    if re.fullmatch(r'\[\^[^\]]+\][,\s]*', candidate):
+    if _ATTACHMENT_ONLY_RE.fullmatch(candidate):
         return True
 
     # 외부 링크 미디어: [filename.ext|url] 형식 (미디어 확장자를 가진 파일)
-    if re.fullmatch(rf'\[[^\]|]+{MEDIA_EXTENSIONS}\|[^\]]+\][,\s]*', candidate, re.IGNORECASE):
+    if _LINK_MEDIA_ONLY_RE.fullmatch(candidate):
         return True
 
     return False
@@ -178,10 +201,7 @@ def is_media_line(stripped_line: str) -> bool:
     if not stripped_line:
         return False
 
-    def _strip_bullet_prefix_local(text: str) -> str:
-        return re.sub(r"^\s*(?:[-*#]+|\d+[\.\)])\s*", "", text or "").strip()
-
-    candidates = [stripped_line, _strip_bullet_prefix_local(stripped_line)]
+    candidates = [stripped_line, _BULLET_PREFIX_RE.sub("", stripped_line).strip()]
 
     for candidate in candidates:
         if not candidate:
@@ -191,10 +211,10 @@ def is_media_line(stripped_line: str) -> bool:
         if candidate.startswith("[^"):
             return True
         # 외부 링크 미디어: [filename.ext|url] 형식
-        if re.match(rf'\[[^\]|]+{MEDIA_EXTENSIONS}\|', candidate, re.IGNORECASE):
+        if _LINK_MEDIA_PREFIX_RE.match(candidate):
             return True
         # 이미지 메타데이터 패턴 감지 (예: width=...,height=...,alt="..."!)
-        if re.search(r'(width|height|alt)=.*!$', candidate):
+        if _IMAGE_METADATA_RE.search(candidate):
             return True
     if "__IMAGE_PLACEHOLDER" in stripped_line or "__ATTACHMENT_PLACEHOLDER" in stripped_line:
         return True
@@ -215,7 +235,7 @@ def is_code_block_line(line: str) -> bool:
         return True
         
     # code 태그 감지
-    if re.search(r'\{code(?::[^}]*)?\}', stripped):
+    if _CODE_TAG_RE.search(stripped):
         return True
         
     return False
@@ -252,7 +272,7 @@ def is_inside_code_block(line: str, in_code_block: bool) -> tuple[bool, bool]:
         
     # 2. {code} 처리
     # {code} 또는 {code:xxx} 태그 찾기
-    code_tags = re.findall(r'\{code(?::[^}]*)?\}', stripped)
+    code_tags = _CODE_TAG_RE.findall(stripped)
     if code_tags:
         # 태그 개수가 홀수면 상태 토글
         if len(code_tags) % 2 == 1:
@@ -277,7 +297,7 @@ def match_bracket_label_header(line: str) -> Optional[str]:
     stripped = line.strip()
     
     # *[...]* 패턴 매칭 (볼드 + 대괄호)
-    if re.match(r'^\*\[[^\]]+\]\*\s*$', stripped):
+    if _BRACKET_LABEL_RE.match(stripped):
         return stripped
     
     return None
@@ -318,7 +338,7 @@ def match_section_header(line: str) -> Optional[str]:
         "*[QA 환경 / QA Environment]*" -> "*[QA 환경 / QA Environment]*"
     """
     # 색상/스타일 마크업 제거
-    stripped = re.sub(r"\{color:[^}]+\}|\{color\}", "", line or "").strip()
+    stripped = _COLOR_TAG_RE.sub("", line or "").strip()
     
     # 1. *[라벨]* 패턴 체크 (우선)
     bracket_header = match_bracket_label_header(stripped)
@@ -336,7 +356,7 @@ def match_section_header(line: str) -> Optional[str]:
     else:
         left = lowered
     # 괄호나 추가 설명이 붙어도 앞부분만 비교하도록 조정
-    left = re.split(r"[\(\[]", left, 1)[0].strip()
+    left = _LABEL_SPLIT_RE.split(left, 1)[0].strip()
 
     for header in DESCRIPTION_SECTIONS:
         normalized = header.lower()
@@ -352,9 +372,85 @@ def is_header_line(line: str) -> bool:
     이 줄이 섹션 헤더(Observed / Expected / Note / Video 등)인지 여부를 판단.
     영어-only 라벨과 영어/국문 혼합 라벨(예: 'Expected/기대 결과:')을 모두 헤더로 취급한다.
     """
-    cleaned = re.sub(r"\{color:[^}]+\}|\{color\}", "", line or "").strip()
+    cleaned = _COLOR_TAG_RE.sub("", line or "").strip()
     return match_section_header(cleaned) is not None
 
+class LineKind:
+    """tokenize_wiki_lines가 붙이는 라인 종류 (판별 우선순위 순)."""
+
+    CODE = "code"  # {code}/{noformat} 태그 라인 또는 코드 블록 내부
+    TABLE_HEADER = "table_header"  # ||헤더||
+    TABLE_ROW = "table_row"  # |셀|
+    MEDIA_ONLY = "media_only"  # 미디어 마크업(또는 플레이스홀더)만 있는 라인
+    HEADER = "header"  # 섹션 헤더 (Observed:, *[QA 환경 / QA Environment]* 등)
+    BLANK = "blank"
+    TEXT = "text"
+
+
+@dataclass(frozen=True)
+class WikiLine:
+    text: str
+    stripped: str
+    kind: str
+    # match_section_header 결과. 종류와 무관하게 계산한다 (코드/표 라인도 섹션 분리 기준은 기존과 동일)
+    header: Optional[str] = None
+
+
+_SECTION_PREFIXES = tuple(section.lower() for section in DESCRIPTION_SECTIONS)
+
+
+def _section_header(line: str, stripped: str) -> Optional[str]:
+    """match_section_header와 같은 결과. 헤더가 될 수 없는 라인은 정규식 없이 걸러낸다."""
+    if "{color" not in line:
+        candidate = stripped.lstrip("*_ ").lstrip().lower()
+        if not candidate.startswith(_SECTION_PREFIXES) and not candidate.startswith("["):
+            return None
+    return match_section_header(line)
+
+
+def tokenize_wiki_lines(text: str) -> list[WikiLine]:
+    """필드 텍스트를 한 번 훑어 종류/헤더가 붙은 라인 목록으로 만든다.
+
+    format_bilingual_block, _extract_translation_source_lines, extract_description_sections가
+    라인마다 코드 블록/표/미디어/헤더 판별을 따로 반복하지 않도록 한 번만 계산한다.
+    판별 규칙과 우선순위는 각 is_* 함수와 같다 (코드 > 표 > 미디어 > 헤더 > 빈 줄 > 텍스트).
+    """
+    tokens: list[WikiLine] = []
+    in_code_block = False
+    for line in (text or "").splitlines():
+        stripped = line.strip()
+        header = _section_header(line, stripped)
+
+        # is_inside_code_block과 같은 규칙 ({가 없으면 태그도 없음)
+        is_code_line = False
+        if "{" in stripped:
+            if "{noformat}" in stripped:
+                is_code_line = True
+                if stripped.count("{noformat}") % 2 == 1:
+                    in_code_block = not in_code_block
+            else:
+                tag_count = len(_CODE_TAG_RE.findall(stripped))
+                if tag_count:
+                    is_code_line = True
+                    if tag_count % 2 == 1:
+                        in_code_block = not in_code_block
+
+        if is_code_line or in_code_block:
+            kind = LineKind.CODE
+        elif stripped.startswith("|") and stripped.endswith("|"):
+            kind = LineKind.TABLE_HEADER if stripped.startswith("||") else LineKind.TABLE_ROW
+        elif is_media_only_line(stripped):
+            kind = LineKind.MEDIA_ONLY
+        elif header is not None:
+            kind = LineKind.HEADER
+        elif not stripped:
+            kind = LineKind.BLANK
+        else:
+            kind = LineKind.TEXT
+        tokens.append(WikiLine(line, stripped, kind, header))
+    return tokens
+
+
 def extract_description_sections(text: str) -> list[tuple[Optional[str], str]]:
     if not text:
         return []
@@ -372,13 +468,12 @@ def extract_description_sections(text: str) -> list[tuple[Optional[str], str]]:
         if content:
             sections.append((current_header, content))
 
-    for line in text.splitlines():
-        header = match_section_header(line)
-        if header:
+    for token in tokenize_wiki_lines(text):
+        if token.header:
             flush()
-            current_header = header
+            current_header = token.header
             continue
-        buffer.append(line)
+        buffer.append(token.text)
     flush()
 
     return sections
@@ -394,16 +489,16 @@ def strip_media_markup(text: str) -> str:
         return text
 
     # 첨부파일 마크업 제거: [^filename]
-    text = re.sub(r'\[\^[^\]]+\]\s*', '', text)
+    text = _STRIP_ATTACHMENT_RE.sub('', text)
     # 이미지 마크업 제거: !...!
-    text = re.sub(r'![^!]+!\s*', '', text)
+    text = _STRIP_IMAGE_RE.sub('', text)
     # 외부 링크 미디어 제거: [filename.ext|url]
-    text = re.sub(rf'\[[^\]|]+{MEDIA_EXTENSIONS}\|[^\]]+\]\s*', '', text, flags=re.IGNORECASE)
+    text = _STRIP_LINK_MEDIA_RE.sub('', text)
     # 플레이스홀더 제거
-    text = re.sub(r'__(?:IMAGE|ATTACHMENT)_PLACEHOLDER_\d+__\s*', '', text)
+    text = _STRIP_PLACEHOLDER_RE.sub('', text)
 
     # 앞의 구두점/공백 정리
-    text = re.sub(r'^[\s,\-]+', '', text).strip()
+    text = _LEADING_PUNCTUATION_RE.sub('', text).strip()
 
     return text
 
@@ -453,26 +548,12 @@ def match_translated_line_format(original_line: str, translated_line: str) -> st
 
 def _extract_translation_source_lines(translated: str) -> list[str]:
     """번역문에서 매칭 가능한 라인만 추출한다(코드/순수미디어/헤더 제외)."""
-    lines: list[str] = []
-    in_code_block = False
-
-    for trans_line in translated.splitlines():
-        is_code_line, in_code_block = is_inside_code_block(trans_line, in_code_block)
-        if is_code_line or in_code_block:
-            continue
-
-        trans_stripped = trans_line.strip()
-        if not trans_stripped:
-            continue
-
-        # 순수 미디어 라인, 헤더 라인은 번역 매칭에서 제외
-        # 미디어+텍스트 혼합 라인은 포함
-        if is_media_only_line(trans_stripped) or is_header_line(trans_stripped):
-            continue
+    # 순수 미디어 라인, 헤더 라인은 번역 매칭에서 제외
+    # 미디어+텍스트 혼합 라인은 포함
+    return [token.text for token in tokenize_wiki_lines(translated) if token.kind in _TRANSLATION_SOURCE_KINDS]
 
-        lines.append(trans_line)
 
-    return lines
+_TRANSLATION_SOURCE_KINDS = frozenset({LineKind.TABLE_HEADER, LineKind.TABLE_ROW, LineKind.TEXT})
 
 
 def _consume_next_translation_line(
@@ -588,14 +669,86 @@ def _format_data_table_row(line: str, translated_table_line: str) -> str:
     return "|".join(new_cells)
 
 
-def _format_table_row_with_translation(line: str, translated_table_line: str) -> str:
-    is_header_row = line.strip().startswith("||")
-    if is_header_row:
-        return _format_header_table_row(line, translated_table_line)
-    return _format_data_table_row(line, translated_table_line)
+def _table_cell_content(cell: str, is_header: bool) -> str:
+    # 헤더 셀은 별표(굵게)를 뺀 내용 기준 (_format_header_table_row와 같은 규칙)
+    return cell.strip().strip("*").strip() if is_header else cell.strip()
+
+
+def _table_row_cells(stripped_line: str, is_header: bool) -> list[str]:
+    """표 라인의 셀 원문 (양 끝 구분자 바깥의 빈 값 제외)."""
+    return stripped_line.split("||" if is_header else "|")[1:-1]
+
 
+def split_table_cells(text: str) -> tuple[str, list[str]]:
+    """텍스트에서 표 라인을 빼고, 번역할 셀 값을 중복 없이(처음 나온 순서) 모은다.
 
-def format_bilingual_block(original: str, translated: str, header: Optional[str] = None) -> str:
+    표를 행 단위로 LLM에 보내면 번역문의 |가 셀 정렬을 깨뜨리므로, 셀 하나를 번역 항목 하나로 보낸다.
+    빈 셀과 미디어(또는 플레이스홀더) 셀은 번역하지 않는다. 코드 블록 안의 |...|는 표로 보지 않는다.
+
+    Returns:
+        (표 라인을 뺀 텍스트, 셀 값 목록). 번역할 셀이 없어도 표 라인은 뺀다.
+    """
+    kept: list[str] = []
+    cells: dict[str, None] = {}
+    has_table = False
+    for token in tokenize_wiki_lines(text):
+        if token.kind != LineKind.TABLE_HEADER and token.kind != LineKind.TABLE_ROW:
+            kept.append(token.text)
+            continue
+        has_table = True
+        is_header = token.kind == LineKind.TABLE_HEADER
+        for cell in _table_row_cells(token.stripped, is_header):
+            content = _table_cell_content(cell, is_header)
+            if content and not is_media_line(content):
+                cells.setdefault(content)
+    if not has_table:
+        return text, []
+    # 번역할 셀이 없는 표(미디어/빈 셀뿐)도 빼야 번역문 라인이 표 라인에 소비되지 않는다
+    return "\n".join(kept).strip("\n"), list(cells)
+
+
+def sanitize_table_cell_translation(translated: str) -> str:
+    """셀 번역문을 표 안에 넣을 수 있게 한 줄로 만들고 셀 구분자(|)를 바꾼다."""
+    return " ".join((translated or "").split()).replace("|", "/")
+
+
+def _format_table_row_with_cells(line: str, is_header: bool, cell_translations: dict[str, str]) -> str:
+    """셀 값 -> 번역 매핑으로 표 라인을 bilingual 셀(원문/번역)로 바꾼다 (번역 없는 셀은 그대로)."""
+    separator = "||" if is_header else "|"
+    orig_cells = line.split(separator)
+    new_cells: list[str] = []
+    last = len(orig_cells) - 1
+    for i, orig_cell in enumerate(orig_cells):
+        if i == 0 or i == last:
+            new_cells.append(orig_cell)
+            continue
+        content = _table_cell_content(orig_cell, is_header)
+        if not content or (not is_header and is_media_line(content)):
+            new_cells.append(orig_cell)
+            continue
+        translated = cell_translations.get(content, "")
+        if is_header:
+            translated = translated.strip("*").strip()
+        if not translated or (not is_header and is_media_line(translated)):
+            new_cells.append(orig_cell)
+        elif is_header:
+            new_cells.append(f"*{content}/{translated}*")
+        else:
+            new_cells.append(f"{content}/{translated}")
+    return separator.join(new_cells)
+
+
+def format_bilingual_block(
+    original: str,
+    translated: str,
+    header: Optional[str] = None,
+    cell_translations: Optional[dict[str, str]] = None,
+) -> str:
+    """원문 블록과 번역문으로 bilingual 블록을 만든다.
+
+    cell_translations(셀 값 -> 번역, split_table_cells로 표를 따로 번역한 경우)가 있으면
+    표 라인은 번역문 라인을 소비하지 않고 셀 단위로 채운다.
+    """
     original = (original or "").strip("\n")
     translated = (translated or "").strip()
     
@@ -615,81 +768,46 @@ def format_bilingual_block(original: str, translated: str, header: Optional[str]
     # 텍스트 버퍼 (미디어 나오기 전까지의 텍스트를 모아둠)
     text_buffer: list[str] = []
 
-    original_lines = original.splitlines()
-    in_code_block = False
-    
-    for line in original_lines:
-        stripped = line.strip()
-        
-        # 코드블럭 상태 업데이트
-        is_code_line, in_code_block = is_inside_code_block(line, in_code_block)
-        
-        # 코드블럭 내부 또는 코드블럭 태그 라인은 스킵
-        if is_code_line or in_code_block:
-            text_buffer, translation_index = _flush_text_buffer_with_translations(
-                lines,
-                text_buffer,
-                translation_source_lines,
-                translation_index,
-            )  # 코드블럭 나오기 전 텍스트 처리
-            lines.append(line)  # 코드블럭 라인 출력
+    for token in tokenize_wiki_lines(original):
+        line = token.text
+        kind = token.kind
+
+        # 일반 텍스트는 버퍼에 추가
+        if kind == LineKind.TEXT:
+            text_buffer.append(line)
             continue
-        
+
+        # 그 밖의 라인(코드/표/미디어/헤더/빈 줄)이 나오기 전까지 모은 텍스트와 번역문 출력
+        text_buffer, translation_index = _flush_text_buffer_with_translations(
+            lines,
+            text_buffer,
+            translation_source_lines,
+            translation_index,
+        )
+
         # 테이블 라인 처리 (|로 시작하고 |로 끝나는 경우)
-        if stripped.startswith("|") and stripped.endswith("|"):
-            text_buffer, translation_index = _flush_text_buffer_with_translations(
-                lines,
-                text_buffer,
-                translation_source_lines,
-                translation_index,
-            ) # 테이블 나오기 전 텍스트 처리
+        if kind == LineKind.TABLE_HEADER or kind == LineKind.TABLE_ROW:
             # Jira가 표를 제대로 렌더링하려면 앞에 빈 줄이 필요
             lines.append("")
-            
-            # 번역된 표 라인 가져오기 (LLM이 표 전체를 하나의 라인으로 번역)
-            translated_table_line, translation_index = _consume_next_translation_line(
-                translation_source_lines,
-                translation_index,
-            )
 
-            lines.append(_format_table_row_with_translation(line, translated_table_line))
-            continue
+            if cell_translations is not None:
+                lines.append(_format_table_row_with_cells(line, kind == LineKind.TABLE_HEADER, cell_translations))
+                continue
 
-        # 순수 미디어 라인 처리 (미디어만 있는 라인은 번역 스킵)
-        if is_media_only_line(stripped):
-            text_buffer, translation_index = _flush_text_buffer_with_translations(
-                lines,
-                text_buffer,
-                translation_source_lines,
-                translation_index,
-            ) # 미디어 나오기 전 텍스트 처리
-            lines.append(line) # 미디어 라인 출력
-            continue
-        
-        # 헤더 라인 처리
-        if is_header_line(stripped):
-            text_buffer, translation_index = _flush_text_buffer_with_translations(
-                lines,
-                text_buffer,
+            # 번역된 표 라인 가져오기 (LLM이 표 전체를 하나의 라인으로 번역)
+            translated_table_line, translation_index = _consume_next_translation_line(
                 translation_source_lines,
                 translation_index,
             )
-            lines.append(line)
-            continue
 
-        # 빈 줄 처리: 문단 구분자로 사용하여 번역 블록 위치 정확도 향상
-        if not stripped:
-            text_buffer, translation_index = _flush_text_buffer_with_translations(
-                lines,
-                text_buffer,
-                translation_source_lines,
-                translation_index,
-            )
-            lines.append(line)
+            if kind == LineKind.TABLE_HEADER:
+                lines.append(_format_header_table_row(line, translated_table_line))
+            else:
+                lines.append(_format_data_table_row(line, translated_table_line))
             continue
 
-        # 일반 텍스트는 버퍼에 추가
-        text_buffer.append(line)
+        # 코드블럭/순수 미디어/헤더/빈 줄(문단 구분자)은 원문 그대로 출력
+        lines.append(line)
 
     text_buffer, translation_index = _flush_text_buffer_with_translations(
         lines,
@@ -699,3 +817,127 @@ def format_bilingual_block(original: str, translated: str, header: Optional[str]
     ) # 남은 텍스트 처리
         
     return "\n".join(lines).strip()
+
+
+# --- 증분 재번역 (이미 번역된 description의 바뀐 문단만 다시 번역) ---
+
+_TRANSLATION_LINE_TAG = "{color:#4c9aff}"
+
+
+@dataclass
+class BilingualParagraph:
+    """bilingual description의 원문 문단(연속된 텍스트 라인)과 그 아래 번역 라인."""
+
+    source_lines: list[str]
+    translation_lines: list[str] = field(default_factory=list)
+    # 문단이 속한 섹션 헤더 (스킵 섹션 판별용)
+    section: Optional[str] = None
+
+    @property
+    def source(self) -> str:
+        return "\n".join(self.source_lines)
+
+
+def _is_translation_line(token: WikiLine) -> bool:
+    return token.kind == LineKind.TEXT and _TRANSLATION_LINE_TAG in token.text
+
+
+def parse_bilingual_description(value: str) -> list:
+    """format_bilingual_block 결과(여러 섹션을 이어 붙인 값 포함)를 문단 단위로 나눈다.
+
+    반환 목록의 원소는 BilingualParagraph 또는 그대로 둘 라인(str: 헤더/코드/표/미디어/빈 줄)이다.
+    원문 문단 바로 뒤(빈 줄 하나 건너)의 {color:#4c9aff} 라인들을 그 문단의 번역으로 묶고,
+    번역 라인이 없는 문단은 translation_lines가 빈 채로 남는다 (새로 추가된 문단).
+    render_bilingual_description(parse_bilingual_description(x))는 x와 같다.
+    """
+    segments: list = []
+    current: Optional[BilingualParagraph] = None
+    pending_blanks: list[str] = []
+    section: Optional[str] = None
+
+    def close() -> None:
+        nonlocal current, pending_blanks
+        if current is not None:
+            segments.append(current)
+            current = None
+        segments.extend(pending_blanks)
+        pending_blanks = []
+
+    for token in tokenize_wiki_lines(value):
+        if token.header:
+            section = token.header
+        if token.kind == LineKind.TEXT:
+            if _is_translation_line(token):
+                if current is not None and (current.translation_lines or len(pending_blanks) <= 1):
+                    # 원문과 번역 사이의 빈 줄 한 개는 구분자
+                    pending_blanks = []
+                    current.translation_lines.append(token.text)
+                    continue
+                close()
+                segments.append(token.text)
+                continue
+            if current is not None and (current.translation_lines or pending_blanks):
+                close()
+            if current is None:
+                current = BilingualParagraph([], section=section)
+            current.source_lines.append(token.text)
+            continue
+        if token.kind == LineKind.BLANK and current is not None and not current.translation_lines:
+            pending_blanks.append(token.text)
+            continue
+        close()
+        segments.append(token.text)
+    close()
+    return segments
+
+
+def render_bilingual_description(segments: list) -> str:
+    lines: list[str] = []
+    for segment in segments:
+        if isinstance(segment, BilingualParagraph):
+            lines.extend(segment.source_lines)
+            if segment.translation_lines:
+                lines.append("")
+                lines.extend(segment.translation_lines)
+        else:
+            lines.append(segment)
+    return "\n".join(lines).strip()
+
+
+def incremental_translation_targets(segments: list, previous_value: Optional[str] = None) -> list[int]:
+    """다시 번역해야 하는 문단의 segments 인덱스.
+
+    - 번역 라인이 없는 문단 (새로 추가됨)
+    - previous_value(직전 description, 예: webhook changelog의 fromString)가 있으면,
+      번역 라인은 있지만 원문이 직전 값의 번역된 원문 중에 없는 문단 (원문만 수정되어 번역이 낡음)
+    스킵 섹션(QA Environment 등)의 문단과 미디어만 남는 문단은 제외한다.
+    """
+    previous_sources: Optional[set[str]] = None
+    if previous_value:
+        previous_sources = {
+            segment.source.strip()
+            for segment in parse_bilingual_description(previous_value)
+            if isinstance(segment, BilingualParagraph) and segment.translation_lines
+        }
+
+    targets: list[int] = []
+    for index, segment in enumerate(segments):
+        if not isinstance(segment, BilingualParagraph):
+            continue
+        if segment.section and should_skip_section_translation(segment.section):
+            continue
+        if not strip_media_markup(segment.source).strip():
+            continue
+        if not segment.translation_lines:
+            targets.append(index)
+        elif previous_sources is not None and segment.source.strip() not in previous_sources:
+            targets.append(index)
+    return targets
+
+
+def translation_lines_for_paragraph(source: str, translated: str) -> list[str]:
+    """문단 원문과 번역문으로 format_bilingual_block과 같은 형식의 번역 라인만 만든다."""
+    for segment in parse_bilingual_description(format_bilingual_block(source, translated)):
+        if isinstance(segment, BilingualParagraph):
+            return segment.translation_lines
+    return []
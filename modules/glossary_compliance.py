@@ -0,0 +1,84 @@
+"""번역 결과의 용어집(glossary) 준수 여부 검사.
+
+번역이 끝난 뒤 각 청크의 출력에 기대한 target-side 용어(en/ko + aliases)가
+실제로 쓰였는지 확인한다. 용어 매칭은 modules.glossary_matcher의 TermMatcher를 사용해
+출력 텍스트를 한 번만 스캔한다.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from models import GlossaryEntry
+from modules.glossary_matcher import TermMatcher
+
+
+@dataclass
+class ChunkCompliance:
+    chunk_id: str
+    expected_ids: tuple[str, ...]
+    missing_ids: tuple[str, ...]
+
+    @property
+    def compliant(self) -> bool:
+        return not self.missing_ids
+
+
+@dataclass
+class ComplianceReport:
+    chunks: list[ChunkCompliance] = field(default_factory=list)
+    repaired_chunk_ids: list[str] = field(default_factory=list)
+
+    @property
+    def expected_terms(self) -> int:
+        return sum(len(chunk.expected_ids) for chunk in self.chunks)
+
+    @property
+    def missing_terms(self) -> int:
+        return sum(len(chunk.missing_ids) for chunk in self.chunks)
+
+    @property
+    def rate(self) -> float:
+        """기대 용어 중 실제 번역문에 쓰인 비율 (검사 대상이 없으면 1.0)."""
+        expected = self.expected_terms
+        if not expected:
+            return 1.0
+        return (expected - self.missing_terms) / expected
+
+    @property
+    def non_compliant(self) -> list[ChunkCompliance]:
+        return [chunk for chunk in self.chunks if not chunk.compliant]
+
+    def as_dict(self) -> dict:
+        return {
+            "rate": round(self.rate, 4),
+            "checked_chunks": len(self.chunks),
+            "expected_terms": self.expected_terms,
+            "missing_terms": self.missing_terms,
+            "non_compliant_chunks": {chunk.chunk_id: list(chunk.missing_ids) for chunk in self.non_compliant},
+            "repaired_chunks": list(self.repaired_chunk_ids),
+        }
+
+
+def check_compliance(
+    expected_by_chunk: dict[str, Sequence[GlossaryEntry]],
+    translations: dict[str, str],
+    matcher: TermMatcher,
+) -> ComplianceReport:
+    """청크별 기대 용어가 번역문에 쓰였는지 검사한다.
+
+    Args:
+        expected_by_chunk: chunk id -> 해당 청크에 대해 선택된 glossary entry 목록
+        translations: chunk id -> 번역문
+        matcher: target 언어 용어로 만든 TermMatcher
+    """
+    report = ComplianceReport()
+    for chunk_id, expected_entries in expected_by_chunk.items():
+        translated = translations.get(chunk_id) or ""
+        expected_ids = tuple(dict.fromkeys(entry.id for entry in expected_entries))
+        if not expected_ids or not translated.strip():
+            continue
+        found_ids = matcher.find_entry_ids(translated)
+        missing = tuple(entry_id for entry_id in expected_ids if entry_id not in found_ids)
+        report.chunks.append(ChunkCompliance(chunk_id=chunk_id, expected_ids=expected_ids, missing_ids=missing))
+    return report
@@ -0,0 +1,194 @@
+"""용어집(glossary) multi-pattern matcher.
+
+수천 개 용어를 entry마다 정규식으로 검사하는 대신, 모든 용어를 trie 기반 정규식 하나로
+묶어 텍스트를 한 번만 스캔한다. 번역 전 후보 용어 추출(PromptBuilder)과
+번역 후 준수 검사(glossary_compliance)가 같은 matcher를 공유한다.
+
+같은 용어집으로 만든 matcher는 프로세스 단위 LRU 캐시에 보관되므로
+warm Lambda에서는 정규식 컴파일 비용을 요청마다 다시 내지 않는다.
+"""
+from __future__ import annotations
+
+import re
+from collections.abc import Hashable, Iterable, Sequence
+from functools import lru_cache
+
+from models import GlossaryEntry
+
+
+def _contains_hangul(text: str) -> bool:
+    return bool(re.search(r"[가-힣]", text))
+
+
+def _is_substring_term(term: str) -> bool:
+    # 3자 이상 한국어 용어는 조사/활용을 허용하기 위해 substring 매칭,
+    # 그 외(영어, 짧은 한국어)는 단어 경계 매칭.
+    return _contains_hangul(term) and len(term) > 2
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    """용어 목록을 공통 prefix를 공유하는 정규식으로 변환한다.
+
+    단순 alternation(a|b|c...)은 위치마다 모든 용어를 시도하지만,
+    trie 형태는 첫 글자부터 분기하므로 수천 개 용어에서도 빠르게 동작한다.
+    """
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def _render(node: dict) -> str:
+        is_terminal = "" in node
+        branches = [re.escape(char) + _render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if is_terminal:
+            # 더 긴 용어를 먼저 시도하고, 실패하면 현재 지점에서 종료
+            return f"(?:{body})?"
+        return body
+
+    return _render(trie)
+
+
+class TermMatcher:
+    """여러 용어를 한 번의 스캔으로 찾는 matcher.
+
+    용어는 소문자로 정규화되며, 매칭 결과는 해당 용어에 연결된 key(entry id 또는 index) 집합으로 반환한다.
+    boundary_terms는 단어 경계 매칭, substring_terms는 부분 문자열 매칭으로 검사한다.
+    """
+
+    def __init__(
+        self,
+        boundary_terms: dict[str, set[Hashable]],
+        substring_terms: dict[str, set[Hashable]] | None = None,
+    ):
+        self._boundary_terms: dict[str, frozenset] = {
+            term: frozenset(keys) for term, keys in boundary_terms.items() if term
+        }
+        self._substring_terms: dict[str, frozenset] = {
+            term: frozenset(keys) for term, keys in (substring_terms or {}).items() if term
+        }
+
+        self._boundary_re = (
+            re.compile(rf"(?<!\w)(?=({_trie_pattern(self._boundary_terms)})(?!\w))")
+            if self._boundary_terms else None
+        )
+        self._substring_re = (
+            re.compile(rf"(?=({_trie_pattern(self._substring_terms)}))") if self._substring_terms else None
+        )
+
+        # lookahead 매칭은 위치마다 가장 긴 용어 하나만 잡으므로,
+        # 같은 위치에서 시작하는 더 짧은 용어(prefix)를 미리 계산해 둔다.
+        # 경계 매칭 용어는 시작 위치도 단어 경계여야 하므로 따로 보관한다.
+        self._prefix_terms: dict[str, tuple[str, ...]] = {}
+        self._boundary_prefix_terms: dict[str, tuple[str, ...]] = {}
+        for term in {*self._boundary_terms, *self._substring_terms}:
+            prefixes: list[str] = []
+            boundary_prefixes: list[str] = []
+            for end in range(1, len(term)):
+                prefix = term[:end]
+                if prefix in self._substring_terms:
+                    prefixes.append(prefix)
+                if prefix in self._boundary_terms and not (term[end].isalnum() or term[end] == "_"):
+                    boundary_prefixes.append(prefix)
+            if prefixes:
+                self._prefix_terms[term] = tuple(prefixes)
+            if boundary_prefixes:
+                self._boundary_prefix_terms[term] = tuple(boundary_prefixes)
+
+    @classmethod
+    def from_terms(cls, term_to_ids: dict[str, set[Hashable]]) -> "TermMatcher":
+        """용어별 매칭 방식(경계/substring)을 _is_substring_term 규칙으로 자동 결정한다."""
+        boundary: dict[str, set[Hashable]] = {}
+        substring: dict[str, set[Hashable]] = {}
+        for term, keys in term_to_ids.items():
+            target = substring if _is_substring_term(term) else boundary
+            target.setdefault(term, set()).update(keys)
+        return cls(boundary, substring)
+
+    @classmethod
+    def for_target_language(cls, entries: Sequence[GlossaryEntry], target_lang: str) -> "TermMatcher":
+        """entry 목록에서 target 언어 쪽 용어(본 용어 + aliases)로 matcher를 만든다."""
+        term_to_ids: dict[str, set[Hashable]] = {}
+        for entry in entries:
+            if target_lang == "ko":
+                terms = (entry.ko, *entry.aliases_ko)
+            else:
+                terms = (entry.en, *entry.aliases_en)
+            for term in terms:
+                normalized = (term or "").strip().lower()
+                if normalized:
+                    term_to_ids.setdefault(normalized, set()).add(entry.id)
+        return cls.from_terms(term_to_ids)
+
+    @classmethod
+    def for_source_candidates(cls, entries: Sequence[GlossaryEntry]) -> "TermMatcher":
+        """PromptBuilder 후보 추출용 matcher (key = entries 내 index).
+
+        영어 용어는 항상 경계 매칭, 한국어 용어는 3자 이상 한글이면 substring 매칭이다.
+        """
+        boundary: dict[str, set[Hashable]] = {}
+        substring: dict[str, set[Hashable]] = {}
+        for index, entry in enumerate(entries):
+            for term in (entry.en, *entry.aliases_en):
+                normalized = (term or "").strip().lower()
+                if normalized:
+                    boundary.setdefault(normalized, set()).add(index)
+            for term in (entry.ko, *entry.aliases_ko):
+                normalized = (term or "").strip().lower()
+                if normalized:
+                    target = substring if _is_substring_term(normalized) else boundary
+                    target.setdefault(normalized, set()).add(index)
+        return cls(boundary, substring)
+
+    def find_terms(self, text: str) -> set[str]:
+        """텍스트에 등장한 (소문자) 용어 집합."""
+        return {term for term, _ in self._find(text)}
+
+    def _find(self, text: str) -> set[tuple[str, bool]]:
+        # (용어, substring 여부) 쌍 — 같은 문자열이 두 방식에 모두 등록될 수 있다.
+        if not text:
+            return set()
+        lowered = text.lower()
+        found: set[tuple[str, bool]] = set()
+        for regex, is_substring in ((self._boundary_re, False), (self._substring_re, True)):
+            if regex is None:
+                continue
+            for match in regex.finditer(lowered):
+                term = match.group(1)
+                found.add((term, is_substring))
+                found.update((prefix, True) for prefix in self._prefix_terms.get(term, ()))
+                boundary_prefixes = self._boundary_prefix_terms.get(term)
+                if boundary_prefixes and self._at_word_start(lowered, match.start()):
+                    found.update((prefix, False) for prefix in boundary_prefixes)
+        return found
+
+    @staticmethod
+    def _at_word_start(text: str, index: int) -> bool:
+        if index == 0:
+            return True
+        previous = text[index - 1]
+        return not (previous.isalnum() or previous == "_")
+
+    def find_entry_ids(self, text: str) -> set:
+        """텍스트에 용어가 등장한 key(entry id 또는 index) 집합."""
+        keys: set = set()
+        for term, is_substring in self._find(text):
+            table = self._substring_terms if is_substring else self._boundary_terms
+            keys.update(table.get(term, ()))
+        return keys
+
+
+@lru_cache(maxsize=32)
+def cached_source_matcher(entries: tuple[GlossaryEntry, ...]) -> TermMatcher:
+    """용어집 entry 튜플별 후보 추출 matcher (프로세스 단위 캐시)."""
+    return TermMatcher.for_source_candidates(entries)
+
+
+@lru_cache(maxsize=32)
+def cached_target_matcher(entries: tuple[GlossaryEntry, ...], target_lang: str) -> TermMatcher:
+    """용어집 entry 튜플 + target 언어별 준수 검사 matcher (프로세스 단위 캐시)."""
+    return TermMatcher.for_target_language(entries, target_lang)
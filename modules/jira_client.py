@@ -1,18 +1,177 @@
-import requests
+from collections.abc import Iterator
 from typing import Optional, Sequence
+import itertools
+import os
+import threading
+import time
 import urllib.parse
 import re
 
+from modules.adf import flatten_adf
+from modules.steps_field_cache import NOT_CACHED, default_steps_field_cache
+
 # Steps 필드 후보 ID 목록 (알려진 커스텀 필드, 우선순위 순)
 STEPS_FIELD_CANDIDATES = ["customfield_10237", "customfield_10399"]
 
+# 이슈 조회 모드: full = 항상 renderedFields 포함, lean = raw 값만 먼저 받고 필요한 필드만 다시 요청
+FETCH_MODES = ("lean", "full")
+
+
+class FetchStats:
+    """조회 요청 종류별 응답 크기/지연 시간 누적 (스레드 안전).
+
+    kind: "full"(renderedFields 포함 조회), "lean"(raw 조회), "lean_rendered"(lean 모드의 보충 조회),
+    "search"/"search_rendered"(JQL 검색 페이지), "adf"(ADF 원형 유지 모드의 v3 조회)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: dict[str, dict[str, float]] = {}
+
+    def record(self, kind: str, response, elapsed_ms: float) -> None:
+        try:
+            size = len(response.content or b"")
+        except TypeError:
+            size = 0
+        with self._lock:
+            entry = self._values.setdefault(kind, {"requests": 0, "bytes": 0, "elapsed_ms": 0.0})
+            entry["requests"] += 1
+            entry["bytes"] += size
+            entry["elapsed_ms"] += elapsed_ms
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                kind: {**entry, "elapsed_ms": round(entry["elapsed_ms"], 1)}
+                for kind, entry in self._values.items()
+            }
+
+
+class JiraFieldNormalizer:
+    """Jira 응답 해석/필드 정규화 (동기 JiraClient와 AsyncJiraClient 공용)."""
+
+    @staticmethod
+    def _createmeta_params(project_key: str) -> dict:
+        return {
+            "projectKeys": project_key,
+            "expand": "projects.issuetypes.fields",
+            "issuetypeNames": "버그,Bug",
+        }
+
+    @staticmethod
+    def _steps_field_from_createmeta(data: dict) -> Optional[str]:
+        """createmeta 응답에서 steps 필드 ID 탐지 (없으면 None)."""
+        for proj in data.get("projects", []):
+            for issuetype in proj.get("issuetypes", []):
+                fields = issuetype.get("fields", {})
+                # 1순위: 알려진 후보 ID 매칭
+                for candidate in STEPS_FIELD_CANDIDATES:
+                    if candidate in fields:
+                        return candidate
+                # 2순위: 필드 이름 기반 탐지
+                for field_id, field_meta in fields.items():
+                    name = (field_meta.get("name") or "").lower()
+                    if "step" in name and "reproduce" in name:
+                        return field_id
+        return None
+
+    @classmethod
+    def _steps_fields_by_project(cls, data: dict, project_keys: Sequence[str]) -> dict[str, Optional[str]]:
+        """여러 프로젝트를 요청한 createmeta 응답을 프로젝트별로 해석 (응답에 없는 프로젝트는 None).
+
+        프로젝트를 하나만 요청했으면 응답 전체를 그 프로젝트의 결과로 본다.
+        """
+        if len(project_keys) == 1:
+            return {project_keys[0]: cls._steps_field_from_createmeta(data)}
+        detected: dict[str, Optional[str]] = dict.fromkeys(project_keys)
+        for proj in data.get("projects", []):
+            key = proj.get("key")
+            if key in detected:
+                detected[key] = cls._steps_field_from_createmeta({"projects": [proj]})
+        return detected
+
+    def _normalize_issue_fields(self, issue: dict, fields: Sequence[str]) -> dict[str, str]:
+        """issue JSON(fields/renderedFields)에서 요청한 필드를 정규화 (빈 값은 제외).
+
+        raw 값이 비어 있으면 renderedFields 값으로 대체한다.
+        """
+        fetched_fields: dict[str, str] = {}
+        raw_fields = issue.get("fields", {}) or {}
+        rendered_fields = issue.get("renderedFields", {}) or {}
+
+        for field in fields:
+            raw_value = raw_fields.get(field)
+            normalized = self.normalize_field_value(raw_value)
+
+            if not normalized:
+                rendered_value = rendered_fields.get(field)
+                normalized = self.normalize_field_value(rendered_value)
+
+            if normalized:
+                fetched_fields[field] = normalized
+
+        return fetched_fields
+
+    @staticmethod
+    def _fields_needing_render(issue: dict, fields: Sequence[str], fetched_fields: dict[str, str]) -> list[str]:
+        """raw 값은 있지만 정규화 결과가 비어 renderedFields가 필요한 필드.
+
+        값 자체가 없는(null) 필드는 renderedFields도 비어 있으므로 다시 요청하지 않는다.
+        """
+        raw_fields = issue.get("fields", {}) or {}
+        return [field for field in fields if field not in fetched_fields and raw_fields.get(field) is not None]
+
+    def normalize_field_value(self, value) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, str):
+            return value.strip()
+        if isinstance(value, dict):
+            return self._flatten_adf_node(value).strip()
+        if isinstance(value, Sequence):
+            flattened = "\n".join(
+                filter(None, (self.normalize_field_value(item) for item in value))
+            )
+            return flattened.strip()
+        return str(value).strip()
+
+    def _flatten_adf_node(self, node) -> str:
+        """ADF를 wiki 마크업으로 펼친다 (modules.adf, 명시적 스택 기반)."""
+        return flatten_adf(node)
+
+
+class JiraClient(JiraFieldNormalizer):
+    def __init__(self, jira_url: str, email: str, api_token: str, fetch_mode: Optional[str] = None):
+        # requests는 cold start 단축을 위해 클라이언트 생성 시점에 import한다.
+        from modules.jira_transport import build_session
 
-class JiraClient:
-    def __init__(self, jira_url: str, email: str, api_token: str):
         self.jira_url = jira_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.auth = (email, api_token)
+        # 429/5xx 재시도 + 사이트별 공유 속도 제한 (modules.jira_transport)
+        self.session = build_session(self.jira_url, email, api_token)
         self._steps_field_cache: dict[str, Optional[str]] = {}
+        self.fetch_mode = (fetch_mode or os.getenv("JIRA_FETCH_MODE", "lean")).strip().lower()
+        if self.fetch_mode not in FETCH_MODES:
+            raise EnvironmentError(f"Unknown JIRA_FETCH_MODE: {self.fetch_mode}")
+        self.fetch_stats = FetchStats()
+
+    def warm_up_connection(self, timeout: float = 5.0) -> dict:
+        """serverInfo API를 호출해 Jira 세션의 TLS 커넥션을 미리 맺는다.
+
+        실패해도 예외를 던지지 않고 결과 dict에 에러를 담아 반환한다.
+        """
+        started = time.perf_counter()
+        try:
+            response = self.session.get(f"{self.jira_url}/rest/api/2/serverInfo", timeout=timeout)
+            result: dict = {"ok": response.ok, "status": response.status_code}
+        except Exception as exc:
+            result = {"ok": False, "error": str(exc)}
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    def transport_stats(self) -> dict:
+        """재시도/속도 제한 카운터 (세션이 RetryingSession이 아니면 빈 dict)."""
+        stats = getattr(self.session, "stats", None)
+        return stats.as_dict() if hasattr(stats, "as_dict") else {}
 
     def detect_steps_field(self, project_key: str) -> Optional[str]:
         """createmeta API로 프로젝트의 steps 필드 자동 탐지.
@@ -22,87 +181,185 @@ class JiraClient:
         2. 필드 이름에 'step'과 'reproduce' 모두 포함된 커스텀필드 (대소문자 무시)
 
         API 실패 시 None을 반환하며 예외를 발생시키지 않는다.
-        결과는 프로젝트 키별로 캐시된다.
+        결과는 프로젝트 키별로 인스턴스에 캐시되고, API 응답으로 얻은 결과는
+        프로세스/디스크 TTL 캐시(modules.steps_field_cache)에도 저장되어 다음 요청에서 재사용된다.
         """
         if project_key in self._steps_field_cache:
             return self._steps_field_cache[project_key]
+        return self.prefetch_steps_fields([project_key])[project_key]
 
-        try:
-            endpoint = f"{self.jira_url}/rest/api/2/issue/createmeta"
-            params = {
-                "projectKeys": project_key,
-                "expand": "projects.issuetypes.fields",
-                "issuetypeNames": "버그,Bug",
-            }
-            response = self.session.get(endpoint, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-
-            for proj in data.get("projects", []):
-                for issuetype in proj.get("issuetypes", []):
-                    fields = issuetype.get("fields", {})
-                    # 1순위: 알려진 후보 ID 매칭
-                    for candidate in STEPS_FIELD_CANDIDATES:
-                        if candidate in fields:
-                            self._steps_field_cache[project_key] = candidate
-                            return candidate
-                    # 2순위: 필드 이름 기반 탐지
-                    for field_id, field_meta in fields.items():
-                        name = (field_meta.get("name") or "").lower()
-                        if "step" in name and "reproduce" in name:
-                            self._steps_field_cache[project_key] = field_id
-                            return field_id
-        except Exception as exc:
-            print(f"⚠️ Steps field detection failed for {project_key}: {exc}")
+    def prefetch_steps_fields(self, project_keys: Sequence[str]) -> dict[str, Optional[str]]:
+        """여러 프로젝트의 steps 필드를 한 번의 createmeta 호출로 탐지해 캐시에 채운다.
 
-        self._steps_field_cache[project_key] = None
-        return None
+        이미 캐시된 프로젝트는 호출하지 않는다. 반환: 프로젝트 키 -> 필드 ID(없으면 None)
+        """
+        shared_cache = default_steps_field_cache()
+        results: dict[str, Optional[str]] = {}
+        pending: list[str] = []
+        for project_key in dict.fromkeys(project_keys):
+            if project_key in self._steps_field_cache:
+                results[project_key] = self._steps_field_cache[project_key]
+                continue
+            cached = shared_cache.get(self.jira_url, project_key)
+            if cached is NOT_CACHED:
+                pending.append(project_key)
+            else:
+                results[project_key] = self._steps_field_cache[project_key] = cached
+
+        if pending:
+            detected: dict[str, Optional[str]] = dict.fromkeys(pending)
+            try:
+                endpoint = f"{self.jira_url}/rest/api/2/issue/createmeta"
+                params = self._createmeta_params(",".join(pending))
+                response = self.session.get(endpoint, params=params, timeout=15)
+                response.raise_for_status()
+                detected.update(self._steps_fields_by_project(response.json(), pending))
+                shared_cache.put_many(self.jira_url, detected)
+            except Exception as exc:
+                print(f"⚠️ Steps field detection failed for {', '.join(pending)}: {exc}")
+            self._steps_field_cache.update(detected)
+            results.update(detected)
+        return results
+
+    def _timed_get(self, kind: str, endpoint: str, params: dict, timeout: float):
+        started = time.perf_counter()
+        response = self.session.get(endpoint, params=params, timeout=timeout)
+        self.fetch_stats.record(kind, response, (time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+        return response.json()
+
+    def fetch_issue_adf(self, issue_key: str, fields_to_fetch: Sequence[str]) -> dict:
+        """v3 API로 필드 raw 값을 조회 (리치 텍스트 필드는 ADF dict, 값이 없는 필드는 제외)."""
+        data = self._timed_get(
+            "adf",
+            f"{self.jira_url}/rest/api/3/issue/{issue_key}",
+            {"fields": ",".join(fields_to_fetch)},
+            15,
+        )
+        raw_fields = data.get("fields", {}) or {}
+        return {field: raw_fields[field] for field in fields_to_fetch if raw_fields.get(field) not in (None, "")}
 
     def fetch_issue_fields(
         self,
         issue_key: str,
-        fields_to_fetch: Optional[Sequence[str]] = None
+        fields_to_fetch: Optional[Sequence[str]] = None,
+        mode: Optional[str] = None,
     ) -> dict[str, str]:
+        """이슈 필드를 조회해 정규화된 문자열 dict로 반환 (빈 값은 제외).
+
+        mode(기본: self.fetch_mode)
+        - full: expand=renderedFields로 한 번에 조회
+        - lean: raw 값만 조회하고, 값은 있는데 정규화 결과가 빈 필드만 renderedFields로 다시 조회
+          (renderedFields HTML이 응답 크기를 거의 두 배로 만들기 때문)
+        """
         if not fields_to_fetch:
             # 기본값은 호출하는 쪽에서 결정해서 넘겨주도록 변경됨
             # 하지만 안전장치로 남겨둠
             fields_to_fetch = ["summary", "description"]
 
         endpoint = f"{self.jira_url}/rest/api/2/issue/{issue_key}"
-        params = {
-            "fields": ",".join(fields_to_fetch),
-            "expand": "renderedFields"
-        }
+        if (mode or self.fetch_mode) == "full":
+            params = {
+                "fields": ",".join(fields_to_fetch),
+                "expand": "renderedFields"
+            }
+            data = self._timed_get("full", endpoint, params, timeout=15)
+            return self._normalize_issue_fields(data, fields_to_fetch)
 
-        response = self.session.get(endpoint, params=params, timeout=15)
-        response.raise_for_status()
-        data = response.json()
+        data = self._timed_get("lean", endpoint, {"fields": ",".join(fields_to_fetch)}, timeout=15)
+        fetched_fields = self._normalize_issue_fields(data, fields_to_fetch)
+        missing = self._fields_needing_render(data, fields_to_fetch, fetched_fields)
+        if missing:
+            fetched_fields.update(self._fetch_rendered_fields(issue_key, missing))
+        return fetched_fields
 
-        fetched_fields: dict[str, str] = {}
-        raw_fields = data.get("fields", {}) or {}
-        rendered_fields = data.get("renderedFields", {}) or {}
+    def _fetch_rendered_fields(self, issue_key: str, fields: Sequence[str]) -> dict[str, str]:
+        endpoint = f"{self.jira_url}/rest/api/2/issue/{issue_key}"
+        params = {"fields": ",".join(fields), "expand": "renderedFields"}
+        data = self._timed_get("lean_rendered", endpoint, params, timeout=15)
+        return self._normalize_issue_fields(data, fields)
 
-        for field in fields_to_fetch:
-            raw_value = raw_fields.get(field)
-            normalized = self.normalize_field_value(raw_value)
+    def search_issues(
+        self,
+        jql: str,
+        fields: Sequence[str],
+        page_size: int = 100,
+        expand_rendered: Optional[bool] = None,
+    ) -> Iterator[tuple[str, dict[str, str]]]:
+        """JQL 검색 결과를 (이슈 키, 정규화된 필드) 순서대로 yield하는 generator.
 
-            if not normalized:
-                rendered_value = rendered_fields.get(field)
-                normalized = self.normalize_field_value(rendered_value)
+        요청한 필드만 조회하고 페이지 단위(startAt)로 가져오므로, 결과가 수만 건이어도
+        메모리에는 한 페이지만 유지된다. 필드 정규화는 fetch_issue_fields와 동일하다.
+        expand_rendered=True면 renderedFields도 요청해 raw 값이 빈 필드를 대체한다.
+        None(기본)이면 fetch_mode를 따르며, lean 모드에서는 renderedFields가 필요한 이슈만 따로 조회한다.
+        """
+        if expand_rendered is None:
+            expand_rendered = self.fetch_mode == "full"
+        endpoint = f"{self.jira_url}/rest/api/2/search"
+        field_list = list(fields)
+        start_at = 0
+        while True:
+            params = {
+                "jql": jql,
+                "fields": ",".join(field_list) or "summary",
+                "startAt": start_at,
+                "maxResults": page_size,
+            }
+            if expand_rendered:
+                params["expand"] = "renderedFields"
+            data = self._timed_get("search_rendered" if expand_rendered else "search", endpoint, params, timeout=30)
 
-            if normalized:
-                fetched_fields[field] = normalized
+            issues = data.get("issues") or []
+            for issue in issues:
+                if not issue.get("key"):
+                    continue
+                fetched_fields = self._normalize_issue_fields(issue, field_list)
+                if not expand_rendered:
+                    missing = self._fields_needing_render(issue, field_list, fetched_fields)
+                    if missing:
+                        fetched_fields.update(self._fetch_rendered_fields(issue["key"], missing))
+                yield issue["key"], fetched_fields
 
-        return fetched_fields
+            start_at += len(issues)
+            if not issues or start_at >= int(data.get("total") or 0):
+                return
 
-    def update_issue_fields(self, issue_key: str, field_payload: dict[str, str]) -> None:
+    def search_issue_keys(self, jql: str, max_results: int = 50) -> list[str]:
+        """JQL 검색 결과의 이슈 키 목록 (최대 max_results개, 검색 순서 유지)."""
+        page_size = max(1, min(100, max_results))
+        results = itertools.islice(self.search_issues(jql, ["summary"], page_size=page_size), max_results)
+        return [key for key, _ in results]
+
+    def update_issue_fields(
+        self,
+        issue_key: str,
+        field_payload: dict,
+        notify_users: Optional[bool] = None,
+        api_version: int = 2,
+    ) -> None:
+        """필드 PUT. notify_users=False면 notifyUsers=false로 watcher 메일을 보내지 않는다.
+
+        notify_users가 None이면 JIRA_NOTIFY_USERS 환경 변수(기본 true)를 따른다.
+        notifyUsers=false는 프로젝트 관리자 권한이 필요하므로, 권한 부족(403)이면 알림을 켠 채 한 번 더 보낸다.
+        api_version=3이면 리치 텍스트 필드 값으로 ADF 문서를 보낸다 (v2는 wiki 마크업 문자열).
+        """
         if not field_payload:
             print("ℹ️ 업데이트할 필드가 없습니다.")
             return
 
-        endpoint = f"{self.jira_url}/rest/api/2/issue/{issue_key}"
-        response = self.session.put(endpoint, json={"fields": field_payload}, timeout=15)
-        
+        if notify_users is None:
+            notify_users = notify_users_default()
+        endpoint = f"{self.jira_url}/rest/api/{api_version}/issue/{issue_key}"
+        if notify_users:
+            response = self.session.put(endpoint, json={"fields": field_payload}, timeout=15)
+        else:
+            response = self.session.put(
+                endpoint, params={"notifyUsers": "false"}, json={"fields": field_payload}, timeout=15
+            )
+            if response.status_code == 403:
+                print("⚠️ notifyUsers=false not permitted; retrying with notifications")
+                response = self.session.put(endpoint, json={"fields": field_payload}, timeout=15)
+
         # 👇 [추가] 에러 발생 시 상세 응답 내용 출력
         if not response.ok:
             print(f"❌ Jira API Error ({response.status_code})")
@@ -111,35 +368,11 @@ class JiraClient:
         response.raise_for_status()
         print("✅ Jira 이슈가 업데이트되었습니다.")
 
-    def normalize_field_value(self, value) -> str:
-        if value is None:
-            return ""
-        if isinstance(value, str):
-            return value.strip()
-        if isinstance(value, dict):
-            return self._flatten_adf_node(value).strip()
-        if isinstance(value, Sequence):
-            flattened = "\n".join(
-                filter(None, (self.normalize_field_value(item) for item in value))
-            )
-            return flattened.strip()
-        return str(value).strip()
 
-    def _flatten_adf_node(self, node) -> str:
-        if isinstance(node, dict):
-            node_type = node.get("type")
-            if node_type == "text":
-                return node.get("text", "")
-            if node_type == "hardBreak":
-                return "\n"
-            content = node.get("content", [])
-            text = "".join(self._flatten_adf_node(child) for child in content)
-            if node_type in {"paragraph", "heading"} and text:
-                return f"{text}\n"
-            return text
-        if isinstance(node, list):
-            return "".join(self._flatten_adf_node(child) for child in node)
-        return ""
+def notify_users_default() -> bool:
+    """JIRA_NOTIFY_USERS 환경 변수 (기본 true). false면 번역 PUT에 notifyUsers=false를 붙인다."""
+    return os.getenv("JIRA_NOTIFY_USERS", "true").strip().lower() not in {"0", "false", "no", "off"}
+
 
 def parse_issue_url(issue_url: str) -> tuple[str, str]:
     parsed = urllib.parse.urlparse(issue_url.strip())
@@ -0,0 +1,270 @@
+"""Jira REST 호출용 재시도/속도 제한 transport.
+
+Jira Cloud는 사용량이 몰리면 429(Retry-After 포함)나 일시적인 5xx를 돌려준다.
+LLM 토큰을 이미 쓴 뒤 업데이트 PUT 한 번이 실패해 번역 전체가 버려지지 않도록
+JiraClient의 세션은 RetryingSession을 사용한다.
+
+- 멱등 메서드(GET 등): 429/5xx, 연결 오류, 타임아웃에서 재시도
+- PUT 등: 서버가 요청을 처리하지 않았다고 볼 수 있는 경우(429/502/503/504, 연결 실패)만 재시도
+- 대기 시간: Retry-After(초 또는 HTTP 날짜)를 우선하고, 없으면 지수 backoff + full jitter
+- TokenBucket: 같은 Jira 사이트를 호출하는 모든 세션이 공유하는 클라이언트 측 속도 제한.
+  429를 받으면 Retry-After 동안 버킷 전체를 멈춰 다른 스레드도 함께 기다린다.
+
+requests는 JiraClient 생성 시점에만 필요하므로 이 모듈도 그때 import된다.
+"""
+from __future__ import annotations
+
+import email.utils
+import os
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import NamedTuple, Optional
+
+import requests
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "DELETE"})
+# 서버가 요청을 적용하지 않았다고 볼 수 있는 상태 코드 (비멱등 요청도 재시도 가능)
+SAFE_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# 멱등 요청에서만 재시도하는 상태 코드
+IDEMPOTENT_RETRY_STATUSES = SAFE_RETRY_STATUSES | {500}
+
+
+class TransportErrors(NamedTuple):
+    connection: type
+    timeout: type
+    read_timeout: type
+
+
+def transport_errors() -> TransportErrors:
+    """재시도 판단에 쓰는 requests 예외 타입 (requests가 없는 테스트 환경에서는 내장 예외)."""
+    return TransportErrors(
+        connection=getattr(requests, "ConnectionError", ConnectionError),
+        timeout=getattr(requests, "Timeout", TimeoutError),
+        read_timeout=getattr(requests, "ReadTimeout", TimeoutError),
+    )
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_retries: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    # Retry-After가 이보다 길면 이 값까지만 기다린다
+    max_retry_after: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """JIRA_MAX_RETRIES / JIRA_BACKOFF_BASE / JIRA_BACKOFF_MAX 환경 변수로 구성."""
+        return cls(
+            max_retries=int(os.getenv("JIRA_MAX_RETRIES", cls.max_retries)),
+            backoff_base=float(os.getenv("JIRA_BACKOFF_BASE", cls.backoff_base)),
+            backoff_max=float(os.getenv("JIRA_BACKOFF_MAX", cls.backoff_max)),
+        )
+
+    def should_retry_status(self, method: str, status: int) -> bool:
+        if method.upper() in IDEMPOTENT_METHODS:
+            return status in IDEMPOTENT_RETRY_STATUSES
+        return status in SAFE_RETRY_STATUSES
+
+    def should_retry_exception(self, method: str, exc: Exception) -> bool:
+        errors = transport_errors()
+        if method.upper() in IDEMPOTENT_METHODS:
+            return isinstance(exc, (errors.connection, errors.timeout))
+        # 응답 대기 중 타임아웃(ReadTimeout)은 서버가 이미 적용했을 수 있으므로 재시도하지 않는다.
+        return isinstance(exc, errors.connection) and not isinstance(exc, errors.read_timeout)
+
+    def backoff(self, attempt: int, rand: Callable[[float, float], float] = random.uniform) -> float:
+        """attempt(0부터) 번째 재시도 전 대기 시간 (full jitter)."""
+        return rand(0.0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 변환. 해석할 수 없으면 None."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - (time.time() if now is None else now))
+
+
+class TokenBucket:
+    """초당 rate개, 최대 capacity개까지 모이는 토큰 버킷 (스레드 안전)."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """토큰 하나를 예약하고 기다려야 하는 시간을 반환."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = max(0.0, self._paused_until - now)
+            self._tokens -= 1.0
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.rate)
+            return wait
+
+    def acquire(self) -> float:
+        """토큰이 생길 때까지 기다린다. 반환: 기다린 시간(초)."""
+        if self.rate <= 0:
+            return 0.0
+        wait = self._reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """acquire의 asyncio 버전 (이벤트 루프를 막지 않고 기다린다). 반환: 기다린 시간(초)."""
+        import asyncio
+
+        if self.rate <= 0:
+            return 0.0
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """서버가 속도 제한을 알려 오면 seconds 동안 모든 호출자를 멈춘다."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+class TransportStats:
+    """재시도/속도 제한 카운터 (스레드 안전)."""
+
+    _FIELDS = ("requests", "retries", "throttled_responses", "gave_up", "throttled_seconds", "backoff_seconds")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: dict[str, float] = dict.fromkeys(self._FIELDS, 0)
+
+    def add(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[name] += amount
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                name: round(value, 3) if isinstance(value, float) else value
+                for name, value in self._values.items()
+            }
+
+
+class RetryingSession(requests.Session):
+    """RetryPolicy와 TokenBucket을 적용하는 requests.Session."""
+
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        bucket: Optional[TokenBucket] = None,
+        *,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        super().__init__()
+        self.policy = policy or RetryPolicy()
+        self.bucket = bucket
+        self.stats = TransportStats()
+        self._sleep = sleep
+
+    def request(self, method, url, *args, **kwargs):
+        method = str(method).upper()
+        attempt = 0
+        while True:
+            if self.bucket is not None:
+                self.stats.add("throttled_seconds", self.bucket.acquire())
+            self.stats.add("requests")
+            last_attempt = attempt >= self.policy.max_retries
+            try:
+                response = self._send(method, url, *args, **kwargs)
+            except Exception as exc:
+                if not self.policy.should_retry_exception(method, exc):
+                    raise
+                if last_attempt:
+                    self.stats.add("gave_up")
+                    raise
+                delay = self.policy.backoff(attempt)
+                print(f"⚠️ Jira {method} failed ({type(exc).__name__}), retrying in {delay:.2f}s")
+            else:
+                if not self.policy.should_retry_status(method, response.status_code):
+                    return response
+                if last_attempt:
+                    self.stats.add("gave_up")
+                    return response
+                delay = self._retry_delay(response, attempt)
+                print(f"⚠️ Jira {method} returned {response.status_code}, retrying in {delay:.2f}s")
+                response.close()
+
+            self.stats.add("retries")
+            self.stats.add("backoff_seconds", delay)
+            self._sleep(delay)
+            attempt += 1
+
+    def _send(self, method, url, *args, **kwargs):
+        """실제 HTTP 요청 한 번 (재시도 없음)."""
+        return super().request(method, url, *args, **kwargs)
+
+    def _retry_delay(self, response, attempt: int) -> float:
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if response.status_code == 429:
+            self.stats.add("throttled_responses")
+        if retry_after is None:
+            return self.policy.backoff(attempt)
+        delay = min(retry_after, self.policy.max_retry_after)
+        if response.status_code == 429 and self.bucket is not None:
+            # 다른 스레드의 요청도 같은 시간 동안 보내지 않는다 (이번 호출은 아래 sleep으로 대기)
+            self.bucket.pause(delay)
+        return delay
+
+
+_SHARED_BUCKETS: dict[str, TokenBucket] = {}
+_SHARED_BUCKETS_LOCK = threading.Lock()
+
+
+def shared_token_bucket(key: str) -> Optional[TokenBucket]:
+    """key(Jira 사이트 URL)별로 프로세스 안에서 공유하는 TokenBucket.
+
+    JIRA_RATE_LIMIT(초당 요청 수, 기본 10, 0이면 제한 없음)와 JIRA_RATE_BURST(기본 20)로 구성.
+    """
+    rate = float(os.getenv("JIRA_RATE_LIMIT", "10"))
+    if rate <= 0:
+        return None
+    with _SHARED_BUCKETS_LOCK:
+        bucket = _SHARED_BUCKETS.get(key)
+        if bucket is None:
+            bucket = TokenBucket(rate, float(os.getenv("JIRA_RATE_BURST", "20")))
+            _SHARED_BUCKETS[key] = bucket
+        return bucket
+
+
+def build_session(jira_url: str, email_address: str, api_token: str) -> RetryingSession:
+    session = RetryingSession(RetryPolicy.from_env(), shared_token_bucket(jira_url))
+    session.auth = (email_address, api_token)
+    return session
@@ -0,0 +1,274 @@
+"""비동기 번역 job의 큐/결과 저장소.
+
+API Gateway 통합 타임아웃(29초)을 넘는 번역을 위해 요청을 job으로 큐에 넣고(202 Accepted),
+worker가 큐를 처리한 뒤 결과를 저장소에 기록한다. 클라이언트는 job id로 상태를 조회한다.
+
+큐(JobQueue)와 저장소(JobStore)는 인터페이스로 분리되어 있어 운영 환경에서는
+SQS/DynamoDB 등으로 교체할 수 있다. 이 모듈은 로컬 테스트용 구현을 제공한다.
+- InMemoryJobQueue / InMemoryJobStore: 같은 프로세스 안에서만 공유
+- SQLiteJobQueue / SQLiteJobStore: 같은 파일을 여는 여러 프로세스 간 공유
+"""
+from __future__ import annotations
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+DEFAULT_SQLITE_PATH = "/tmp/jira_translator_jobs.sqlite3"
+
+
+@dataclass
+class JobRecord:
+    job_id: str
+    request: dict
+    status: str = JOB_QUEUED
+    result: Optional[dict] = None
+    error: Optional[dict] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def new_job_id() -> str:
+    return uuid.uuid4().hex
+
+
+class JobQueue(ABC):
+    """처리 대기 중인 job id의 FIFO 큐."""
+
+    @abstractmethod
+    def enqueue(self, job_id: str) -> None:
+        ...
+
+    @abstractmethod
+    def dequeue(self, timeout: float = 0.0) -> Optional[str]:
+        """다음 job id (timeout 동안 없으면 None). 꺼낸 job은 다른 worker에게 다시 전달되지 않는다."""
+
+
+class JobStore(ABC):
+    """job 요청/상태/결과 저장소."""
+
+    @abstractmethod
+    def create(self, request: dict) -> JobRecord:
+        ...
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        ...
+
+    @abstractmethod
+    def update(self, job_id: str, **changes) -> Optional[JobRecord]:
+        """status/result/error 등을 갱신하고 갱신된 레코드를 반환 (없는 job이면 None)."""
+
+
+class InMemoryJobQueue(JobQueue):
+    def __init__(self):
+        self._queue: queue.Queue[str] = queue.Queue()
+
+    def enqueue(self, job_id: str) -> None:
+        self._queue.put(job_id)
+
+    def dequeue(self, timeout: float = 0.0) -> Optional[str]:
+        try:
+            if timeout > 0:
+                return self._queue.get(timeout=timeout)
+            return self._queue.get_nowait()
+        except queue.Empty:
+            return None
+
+
+class InMemoryJobStore(JobStore):
+    def __init__(self):
+        self._records: dict[str, JobRecord] = {}
+        self._lock = threading.Lock()
+
+    def create(self, request: dict) -> JobRecord:
+        record = JobRecord(job_id=new_job_id(), request=dict(request))
+        with self._lock:
+            self._records[record.job_id] = record
+        return record
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        with self._lock:
+            record = self._records.get(job_id)
+            return JobRecord(**record.as_dict()) if record else None
+
+    def update(self, job_id: str, **changes) -> Optional[JobRecord]:
+        with self._lock:
+            record = self._records.get(job_id)
+            if record is None:
+                return None
+            for key, value in changes.items():
+                setattr(record, key, value)
+            record.updated_at = time.time()
+            return JobRecord(**record.as_dict())
+
+
+class _SQLiteBase:
+    """스레드마다 커넥션을 따로 여는 SQLite 헬퍼 (같은 파일을 여러 프로세스가 공유 가능)."""
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id TEXT PRIMARY KEY,
+            request TEXT NOT NULL,
+            status TEXT NOT NULL,
+            result TEXT,
+            error TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS job_queue (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, path: str = DEFAULT_SQLITE_PATH):
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(self._SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+
+class SQLiteJobQueue(_SQLiteBase, JobQueue):
+    def enqueue(self, job_id: str) -> None:
+        self._connect().execute("INSERT INTO job_queue (job_id) VALUES (?)", (job_id,))
+
+    def dequeue(self, timeout: float = 0.0) -> Optional[str]:
+        deadline = time.monotonic() + max(0.0, timeout)
+        conn = self._connect()
+        while True:
+            # BEGIN IMMEDIATE로 쓰기 잠금을 잡아 두 worker가 같은 job을 꺼내지 않게 한다.
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT seq, job_id FROM job_queue ORDER BY seq LIMIT 1").fetchone()
+                if row is not None:
+                    conn.execute("DELETE FROM job_queue WHERE seq = ?", (row[0],))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            if row is not None:
+                return row[1]
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.05)
+
+
+class SQLiteJobStore(_SQLiteBase, JobStore):
+    _COLUMNS = ("job_id", "request", "status", "result", "error", "created_at", "updated_at")
+    _JSON_COLUMNS = {"request", "result", "error"}
+
+    def _row_to_record(self, row) -> JobRecord:
+        values = dict(zip(self._COLUMNS, row))
+        for column in self._JSON_COLUMNS:
+            values[column] = json.loads(values[column]) if values[column] is not None else None
+        return JobRecord(**values)
+
+    def create(self, request: dict) -> JobRecord:
+        record = JobRecord(job_id=new_job_id(), request=dict(request))
+        self._connect().execute(
+            "INSERT INTO jobs (job_id, request, status, result, error, created_at, updated_at) "
+            "VALUES (?, ?, ?, NULL, NULL, ?, ?)",
+            (
+                record.job_id,
+                json.dumps(record.request, ensure_ascii=False),
+                record.status,
+                record.created_at,
+                record.updated_at,
+            ),
+        )
+        return record
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        row = self._connect().execute(
+            f"SELECT {', '.join(self._COLUMNS)} FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return self._row_to_record(row) if row else None
+
+    def update(self, job_id: str, **changes) -> Optional[JobRecord]:
+        invalid = set(changes) - {"status", "result", "error"}
+        if invalid:
+            raise ValueError(f"Unsupported job fields: {', '.join(sorted(invalid))}")
+        assignments = ["updated_at = ?"]
+        params: list = [time.time()]
+        for column, value in changes.items():
+            assignments.append(f"{column} = ?")
+            if column in self._JSON_COLUMNS and value is not None:
+                value = json.dumps(value, ensure_ascii=False)
+            params.append(value)
+        params.append(job_id)
+        self._connect().execute(f"UPDATE jobs SET {', '.join(assignments)} WHERE job_id = ?", params)
+        return self.get(job_id)
+
+
+def build_job_backend(backend: Optional[str] = None) -> tuple[JobStore, JobQueue]:
+    """환경 변수(JOB_BACKEND=memory|sqlite, JOB_SQLITE_PATH)로 (store, queue)를 만든다."""
+    backend = (backend or os.getenv("JOB_BACKEND", "memory")).strip().lower()
+    if backend == "sqlite":
+        path = os.getenv("JOB_SQLITE_PATH", DEFAULT_SQLITE_PATH)
+        return SQLiteJobStore(path), SQLiteJobQueue(path)
+    if backend == "memory":
+        return InMemoryJobStore(), InMemoryJobQueue()
+    raise EnvironmentError(f"Unknown JOB_BACKEND: {backend}")
+
+
+def process_job(store: JobStore, job_id: str, execute: Callable[[dict], dict]) -> Optional[JobRecord]:
+    """job 하나를 실행하고 결과/에러를 저장소에 기록한다."""
+    record = store.get(job_id)
+    if record is None:
+        print(f"⚠️ Unknown job {job_id}")
+        return None
+    if record.status in (JOB_SUCCEEDED, JOB_FAILED):
+        return record
+
+    store.update(job_id, status=JOB_RUNNING)
+    try:
+        result = execute(record.request)
+    except Exception as exc:
+        print(f"❌ Job {job_id} failed: {exc}")
+        return store.update(job_id, status=JOB_FAILED, error={"error": str(exc), "type": type(exc).__name__})
+    return store.update(job_id, status=JOB_SUCCEEDED, result=result)
+
+
+def run_worker(
+    store: JobStore,
+    job_queue: JobQueue,
+    execute: Callable[[dict], dict],
+    *,
+    max_jobs: Optional[int] = None,
+    poll_timeout: float = 0.0,
+    should_continue: Callable[[], bool] = lambda: True,
+) -> int:
+    """큐가 빌 때(또는 max_jobs/should_continue 조건)까지 job을 처리한다. 반환: 처리한 job 수."""
+    processed = 0
+    while (max_jobs is None or processed < max_jobs) and should_continue():
+        job_id = job_queue.dequeue(timeout=poll_timeout)
+        if job_id is None:
+            break
+        process_job(store, job_id, execute)
+        processed += 1
+    return processed
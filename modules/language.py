@@ -1,4 +1,79 @@
+import hashlib
+import os
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Optional
+
+# 한국어 조사 패턴 (가장 확실한 한국어 지표)
+# 한글 + 조사 패턴: 영어 고유명사 뒤에 한국어 조사가 붙는 경우도 포함
+KOREAN_PARTICLE_PATTERNS = (
+    # 주격/목적격 조사
+    r'[\uac00-\ud7a3][이가](?:\s|$|[^\uac00-\ud7a3])',  # ~이/가
+    r'[\uac00-\ud7a3][을를](?:\s|$|[^\uac00-\ud7a3])',  # ~을/를
+    r'[\uac00-\ud7a3][은는](?:\s|$|[^\uac00-\ud7a3])',  # ~은/는
+    # 부사격 조사
+    r'[\uac00-\ud7a3]에서(?:\s|$)',  # ~에서
+    r'[\uac00-\ud7a3]에(?:\s|$)',    # ~에
+    r'[\uac00-\ud7a3]으?로(?:\s|$)', # ~으로/로
+    r'[\uac00-\ud7a3][와과](?:\s|$)', # ~와/과
+    r'[\uac00-\ud7a3]의(?:\s|$)',    # ~의
+    # 영어 단어 + 한국어 조사 (고유명사 처리)
+    r'[A-Za-z]에서(?:\s|$)',         # Records에서
+    r'[A-Za-z]으?로(?:\s|$)',        # Tab으로
+    r'[A-Za-z][을를](?:\s|$)',       # Tab을
+    r'[A-Za-z][이가](?:\s|$)',       # Tab이
+    r'[A-Za-z][은는](?:\s|$)',       # Tab은
+    r'[A-Za-z]와(?:\s|$)',           # Tab와
+)
+
+# 한국어 어미 패턴 (문장 종결, 라인 끝 기준)
+KOREAN_ENDING_PATTERNS = (
+    r'입니다[.!?\s]?$', r'습니다[.!?\s]?$', r'됩니다[.!?\s]?$',
+    r'있습니다[.!?\s]?$', r'없습니다[.!?\s]?$', r'했습니다[.!?\s]?$',
+    r'합니다[.!?\s]?$', r'됩니다[.!?\s]?$', r'집니다[.!?\s]?$',
+    r'입니까[.!?\s]?$', r'습니까[.!?\s]?$',
+    r'세요[.!?\s]?$', r'해요[.!?\s]?$', r'돼요[.!?\s]?$',
+    r'[다음임함됨없음있음][.!?\s]?$',  # 음슴체
+    r'현상입니다', r'현상임', r'발생함', r'확인됨',
+    r'느립니다', r'빠릅니다', r'많습니다', r'적습니다',
+    r'됩니다', r'않습니다', r'못합니다',
+)
+
+# 영어 문장 패턴 (관사, 전치사, be동사 등이 문장 내에서 사용될 때, 소문자 텍스트 기준)
+ENGLISH_SENTENCE_PATTERNS = (
+    r'\b(the|a|an)\s+\w+',           # 관사 + 명사
+    r'\b(is|are|was|were|be)\s+',    # be동사
+    r'\b(have|has|had)\s+(been|to)', # have + been/to
+    r'\b(to|for|from|with|by|at|in|on)\s+\w+',  # 전치사 + 명사
+    r'\b(when|where|what|who|why|how)\s+',      # 의문사
+    r'\b(if|then|else|because|although)\s+',    # 접속사
+    r'\bshould\s+(be|not|have)',     # should + 동사
+    r'\bcan\s+(be|not|have)',        # can + 동사
+    r'\bwill\s+(be|not|have)',       # will + 동사
+)
+
+# 패턴 목록을 하나로 합친 정규식: 판별에는 "하나라도 있는지"만 필요하므로 search 한 번으로 충분하다.
+# 어미 패턴만 MULTILINE($가 라인 끝)이라 scoped flag로 감싼다.
+_KOREAN_STRUCTURE_RE = re.compile(
+    "|".join([*KOREAN_PARTICLE_PATTERNS, *(f"(?m:{pattern})" for pattern in KOREAN_ENDING_PATTERNS)])
+)
+# 언어 프로필의 점수 계산용 (조사/어미를 따로 센다)
+_KOREAN_PARTICLE_RE = re.compile("|".join(KOREAN_PARTICLE_PATTERNS))
+_KOREAN_ENDING_RE = re.compile("|".join(KOREAN_ENDING_PATTERNS), re.MULTILINE)
+_ENGLISH_SENTENCE_RE = re.compile("|".join(f"(?:{pattern})" for pattern in ENGLISH_SENTENCE_PATTERNS))
+_HANGUL_RE = re.compile(r"[\uac00-\ud7a3]")
+_LATIN_RE = re.compile(r"[A-Za-z]")
+
+_IMAGE_MARKUP_RE = re.compile(r"![^!]+!")
+_ATTACHMENT_MARKUP_RE = re.compile(r"\[\^[^\]]+\]")
+_UNDERSCORE_MARKUP_RE = re.compile(r"__.*?__")
+_COLOR_MARKUP_RE = re.compile(r"\{color:[^}]+\}|\{color\}")
+_INLINE_CODE_RE = re.compile(r"`[^`]+`")
+_NON_LETTER_RE = re.compile(r"[^A-Za-z\uac00-\ud7a3]")
+
 
 def detect_text_language(text: str, extract_text_func=None) -> str:
     """
@@ -8,6 +83,12 @@ def detect_text_language(text: str, extract_text_func=None) -> str:
     - 한국어 조사/어미가 있으면 거의 확실히 한국어 (영어 고유명사가 많아도)
     - 한글이 1자라도 있고 문장 구조가 한국어면 한국어
     - 순수 영어 문장 패턴이 있을 때만 영어로 판단
+
+    판단 순서(아래 조건을 차례로 검사, 각각 early exit하는 search 한 번):
+    1. 마크업 제거 텍스트에 한글이 있으면 한국어
+       (이전 규칙: 조사/어미 → 영어 패턴 없음 → 한글 > 영어 → 한글 1자 이상, 모두 한국어로 귀결)
+    2. 원문(마크업 포함)에 한국어 조사/어미 패턴이 있으면 한국어
+    3. 마크업 제거 텍스트에 영어 문자가 있거나 원문에 영어 문장 패턴이 있으면 영어
     
     Returns:
         "ko": 한국어
@@ -17,125 +98,216 @@ def detect_text_language(text: str, extract_text_func=None) -> str:
     if not text:
         return "unknown"
     
-    # 원본 텍스트에서 언어 감지 (마크업 제거 전)
-    original_text = text
-    
     # 마크업 제거된 텍스트
     # extract_text_func가 제공되면 우선 사용하고, 아니면 기본 구현을 사용한다.
     sanitizer = extract_text_func if callable(extract_text_func) else extract_detectable_text
     sanitized = sanitizer(text)
     if not sanitized:
         return "unknown"
-    
-    # 1. 한글 문자 개수
-    korean_chars = len(re.findall(r"[\uac00-\ud7a3]", sanitized))
-    
-    # 2. 영어 문자 개수
-    latin_chars = len(re.findall(r"[A-Za-z]", sanitized))
-    
-    # 3. 한국어 조사 패턴 (가장 확실한 한국어 지표)
-    # 한글 + 조사 패턴: 영어 고유명사 뒤에 한국어 조사가 붙는 경우도 포함
-    korean_particle_patterns = [
-        # 주격/목적격 조사
-        r'[\uac00-\ud7a3][이가](?:\s|$|[^\uac00-\ud7a3])',  # ~이/가
-        r'[\uac00-\ud7a3][을를](?:\s|$|[^\uac00-\ud7a3])',  # ~을/를
-        r'[\uac00-\ud7a3][은는](?:\s|$|[^\uac00-\ud7a3])',  # ~은/는
-        # 부사격 조사
-        r'[\uac00-\ud7a3]에서(?:\s|$)',  # ~에서
-        r'[\uac00-\ud7a3]에(?:\s|$)',    # ~에
-        r'[\uac00-\ud7a3]으?로(?:\s|$)', # ~으로/로
-        r'[\uac00-\ud7a3][와과](?:\s|$)', # ~와/과
-        r'[\uac00-\ud7a3]의(?:\s|$)',    # ~의
-        # 영어 단어 + 한국어 조사 (고유명사 처리)
-        r'[A-Za-z]에서(?:\s|$)',         # Records에서
-        r'[A-Za-z]으?로(?:\s|$)',        # Tab으로
-        r'[A-Za-z][을를](?:\s|$)',       # Tab을
-        r'[A-Za-z][이가](?:\s|$)',       # Tab이
-        r'[A-Za-z][은는](?:\s|$)',       # Tab은
-        r'[A-Za-z]와(?:\s|$)',           # Tab와
-    ]
-    
-    korean_particle_count = 0
-    for pattern in korean_particle_patterns:
-        korean_particle_count += len(re.findall(pattern, original_text))
-    
-    # 4. 한국어 어미 패턴 (문장 종결)
-    korean_ending_patterns = [
-        r'입니다[.!?\s]?$', r'습니다[.!?\s]?$', r'됩니다[.!?\s]?$',
-        r'있습니다[.!?\s]?$', r'없습니다[.!?\s]?$', r'했습니다[.!?\s]?$',
-        r'합니다[.!?\s]?$', r'됩니다[.!?\s]?$', r'집니다[.!?\s]?$',
-        r'입니까[.!?\s]?$', r'습니까[.!?\s]?$',
-        r'세요[.!?\s]?$', r'해요[.!?\s]?$', r'돼요[.!?\s]?$',
-        r'[다음임함됨없음있음][.!?\s]?$',  # 음슴체
-        r'현상입니다', r'현상임', r'발생함', r'확인됨',
-        r'느립니다', r'빠릅니다', r'많습니다', r'적습니다',
-        r'됩니다', r'않습니다', r'못합니다',
-    ]
-    
-    korean_ending_count = 0
-    for pattern in korean_ending_patterns:
-        if re.search(pattern, original_text, re.MULTILINE):
-            korean_ending_count += 1
-    
-    # 5. 한국어 문장 구조 점수
-    korean_structure_score = korean_particle_count + korean_ending_count
-    
-    # 6. 영어 문장 패턴 (관사, 전치사, be동사 등이 문장 내에서 사용될 때)
-    english_sentence_patterns = [
-        r'\b(the|a|an)\s+\w+',           # 관사 + 명사
-        r'\b(is|are|was|were|be)\s+',    # be동사
-        r'\b(have|has|had)\s+(been|to)', # have + been/to
-        r'\b(to|for|from|with|by|at|in|on)\s+\w+',  # 전치사 + 명사
-        r'\b(when|where|what|who|why|how)\s+',      # 의문사
-        r'\b(if|then|else|because|although)\s+',    # 접속사
-        r'\bshould\s+(be|not|have)',     # should + 동사
-        r'\bcan\s+(be|not|have)',        # can + 동사
-        r'\bwill\s+(be|not|have)',       # will + 동사
-    ]
-    
-    english_sentence_count = 0
-    text_lower = original_text.lower()
-    for pattern in english_sentence_patterns:
-        english_sentence_count += len(re.findall(pattern, text_lower))
-    
-    # === 판단 로직 (우선순위 순) ===
-    
-    # 최우선: 한국어 조사/어미가 1개라도 있으면 한국어
-    if korean_structure_score >= 1:
-        return "ko"
-    
-    # 한글이 있고, 영어 문장 패턴이 없으면 한국어
-    if korean_chars >= 1 and english_sentence_count == 0:
+
+    if _HANGUL_RE.search(sanitized):
         return "ko"
-    
-    # 한글이 영어보다 많으면 한국어
-    if korean_chars > latin_chars:
+
+    # 조사/어미 패턴은 모두 한글을 포함하므로 원문에 한글이 없으면 검사할 필요가 없다
+    if _HANGUL_RE.search(text) and _KOREAN_STRUCTURE_RE.search(text):
         return "ko"
-    
-    # 영어 문장 패턴이 있고 한글이 없으면 영어
-    if english_sentence_count >= 1 and korean_chars == 0:
-        return "en"
-    
-    # 한글 없고 영어가 있으면 영어
-    if korean_chars == 0 and latin_chars > 0:
+
+    if _LATIN_RE.search(sanitized) or _ENGLISH_SENTENCE_RE.search(text.lower()):
         return "en"
-    
-    # 기본값: 한글이 조금이라도 있으면 한국어로 (보수적 접근)
-    if korean_chars > 0:
-        return "ko"
-    
+
     return "unknown"
 
 def extract_detectable_text(text: str) -> str:
     cleaned = text
-    cleaned = re.sub(r"![^!]+!", " ", cleaned)
-    cleaned = re.sub(r"\[\^[^\]]+\]", " ", cleaned)
-    cleaned = re.sub(r"__.*?__", " ", cleaned)
-    cleaned = re.sub(r"\{color:[^}]+\}|\{color\}", " ", cleaned)
-    cleaned = re.sub(r"`[^`]+`", " ", cleaned)
-    cleaned = re.sub(r"[^A-Za-z\uac00-\ud7a3]", "", cleaned)
+    cleaned = _IMAGE_MARKUP_RE.sub(" ", cleaned)
+    cleaned = _ATTACHMENT_MARKUP_RE.sub(" ", cleaned)
+    cleaned = _UNDERSCORE_MARKUP_RE.sub(" ", cleaned)
+    cleaned = _COLOR_MARKUP_RE.sub(" ", cleaned)
+    cleaned = _INLINE_CODE_RE.sub(" ", cleaned)
+    cleaned = _NON_LETTER_RE.sub("", cleaned)
     return cleaned
 
+DEFAULT_PROFILE_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class LanguageProfile:
+    """기본 sanitizer(extract_detectable_text) 기준 언어 판별 특징 벡터.
+
+    점수는 합친 정규식의 (겹치지 않는) 매치 수다. 판별에는 0인지 여부만 쓰이므로
+    label은 detect_text_language(text)와 항상 같다.
+
+    패턴 점수는 전체 스캔이 필요해 비싸므로 full=False로 만들면 label(과 합친 프로필의 label)에
+    필요할 때만 계산하고, 나머지는 None으로 둔다.
+    - particle_score/ending_score: 마크업 제거 텍스트에 한글이 없을 때만 필요 (원문에 한글이 없으면 0)
+    - english_score: 마크업 제거 텍스트가 있으면 영문자만으로 판별이 끝나므로 label에는 필요 없다
+    """
+
+    hangul_count: int = 0                  # 마크업 제거 텍스트의 한글 음절 수
+    latin_count: int = 0                   # 마크업 제거 텍스트의 영문자 수
+    particle_score: Optional[int] = 0      # 원문의 한국어 조사 패턴 매치 수
+    ending_score: Optional[int] = 0        # 원문의 한국어 어미 패턴 매치 수 (라인 끝 기준)
+    english_score: Optional[int] = 0       # 소문자 원문의 영어 문장 패턴 매치 수
+
+    @property
+    def is_full(self) -> bool:
+        return None not in (self.particle_score, self.ending_score, self.english_score)
+
+    @property
+    def label(self) -> str:
+        """"ko" / "en" / "unknown" (detect_text_language와 같은 순서로 판단)."""
+        if not self.hangul_count and not self.latin_count:
+            return "unknown"
+        if self.hangul_count or self.particle_score or self.ending_score:
+            return "ko"
+        # 마크업 제거 텍스트가 비어 있지 않고 한글이 없으면 영문자가 있다
+        return "en"
+
+    @classmethod
+    def combine(cls, profiles: Iterable["LanguageProfile"]) -> "LanguageProfile":
+        """청크별 프로필을 합친 프로필 (이어 붙인 텍스트를 다시 스캔하지 않는다).
+
+        "\n"으로 이어 붙인 텍스트의 프로필과 같다. 단, 청크 경계를 넘는 마크업/패턴 매치는
+        세지 않으므로 그런 경우에만 점수가 달라질 수 있다. 계산하지 않은(None) 점수는 합쳐도 None이다.
+        """
+        hangul = latin = 0
+        scores: list[Optional[int]] = [0, 0, 0]
+        for profile in profiles:
+            hangul += profile.hangul_count
+            latin += profile.latin_count
+            for index, value in enumerate((profile.particle_score, profile.ending_score, profile.english_score)):
+                scores[index] = None if value is None or scores[index] is None else scores[index] + value
+        return cls(hangul, latin, *scores)
+
+
+def _count(pattern: re.Pattern, text: str) -> int:
+    return sum(1 for _ in pattern.finditer(text))
+
+
+def build_language_profile(text: str, full: bool = True) -> LanguageProfile:
+    """텍스트를 스캔해 LanguageProfile을 만든다 (캐시 없음).
+
+    full=False면 label 판단에 필요 없는 패턴 점수는 계산하지 않는다 (마크업 제거 + 문자 수 세기만으로
+    detect_text_language의 early exit와 비슷한 비용).
+    """
+    if not text:
+        return LanguageProfile()
+    sanitized = extract_detectable_text(text)
+    # sanitized에는 영문자(UTF-8 1바이트)와 한글 음절(3바이트)만 남으므로 바이트 수로 센다
+    hangul_count = (len(sanitized.encode("utf-8")) - len(sanitized)) // 2
+    latin_count = len(sanitized) - hangul_count
+    if full or not hangul_count:
+        # 조사/어미 패턴은 모두 한글을 포함하므로 원문에 한글이 없으면 0
+        has_hangul = hangul_count > 0 or _HANGUL_RE.search(text) is not None
+        particle_score = _count(_KOREAN_PARTICLE_RE, text) if has_hangul else 0
+        ending_score = _count(_KOREAN_ENDING_RE, text) if has_hangul else 0
+    else:
+        particle_score = ending_score = None
+    return LanguageProfile(
+        hangul_count=hangul_count,
+        latin_count=latin_count,
+        particle_score=particle_score,
+        ending_score=ending_score,
+        english_score=_count(_ENGLISH_SENTENCE_RE, text.lower()) if full else None,
+    )
+
+
+class LanguageProfileCache:
+    """텍스트 해시 -> LanguageProfile LRU 캐시 (스레드 안전).
+
+    한 요청 안에서 같은 문자열(summary 양쪽, 청크 clean_text 등)을 여러 단계에서 판별하므로
+    프로필을 재사용한다. 키는 텍스트의 blake2b 해시라 큰 description 원문을 붙잡아 두지 않는다.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_PROFILE_CACHE_SIZE):
+        self.max_entries = max(0, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, LanguageProfile] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def get(self, text: str, full: bool = False) -> LanguageProfile:
+        """캐시된 프로필. full=True면 패턴 점수까지 모두 계산된 프로필 (캐시된 것이 부분 프로필이면 다시 만든다)."""
+        if not text:
+            return LanguageProfile()
+        if not self.max_entries:
+            return build_language_profile(text, full=full)
+        key = self._key(text)
+        with self._lock:
+            profile = self._entries.get(key)
+            if profile is not None and (profile.is_full or not full):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return profile
+            self.misses += 1
+        # 스캔은 락 밖에서 (같은 텍스트를 동시에 처음 보면 두 번 계산될 수 있지만 결과는 같다)
+        profile = build_language_profile(text, full=full)
+        with self._lock:
+            self._entries[key] = profile
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return profile
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_DEFAULT_PROFILE_CACHE: Optional[LanguageProfileCache] = None
+_DEFAULT_PROFILE_CACHE_LOCK = threading.Lock()
+
+
+def default_language_profile_cache() -> LanguageProfileCache:
+    """프로세스 공용 캐시. LANGUAGE_PROFILE_CACHE_SIZE(항목 수, 0이면 캐시 끔)로 구성한다."""
+    global _DEFAULT_PROFILE_CACHE
+    with _DEFAULT_PROFILE_CACHE_LOCK:
+        if _DEFAULT_PROFILE_CACHE is None:
+            _DEFAULT_PROFILE_CACHE = LanguageProfileCache(
+                int(os.getenv("LANGUAGE_PROFILE_CACHE_SIZE", DEFAULT_PROFILE_CACHE_SIZE))
+            )
+        return _DEFAULT_PROFILE_CACHE
+
+
+def reset_default_language_profile_cache() -> None:
+    """공용 캐시 객체를 버린다 (다음 호출 시 환경 변수로 다시 구성)."""
+    global _DEFAULT_PROFILE_CACHE
+    with _DEFAULT_PROFILE_CACHE_LOCK:
+        _DEFAULT_PROFILE_CACHE = None
+
+
+def language_profile(text: str, full: bool = False) -> LanguageProfile:
+    """공용 LRU 캐시를 거친 LanguageProfile (패턴 점수가 모두 필요하면 full=True)."""
+    return default_language_profile_cache().get(text, full=full)
+
+
+def detect_combined_language(texts: Iterable[str]) -> str:
+    """texts를 "\n"으로 이어 붙인 텍스트의 label (LanguageProfile.combine 기준).
+
+    텍스트별 프로필(공용 캐시)을 쓰고, 한글이 있는 텍스트가 나오면 나머지는 보지 않는다.
+    """
+    profiles: list[LanguageProfile] = []
+    for text in texts:
+        profile = language_profile(text)
+        if profile.hangul_count:
+            return "ko"
+        profiles.append(profile)
+    return LanguageProfile.combine(profiles).label
+
+
+def detect_language_cached(text: str) -> str:
+    """detect_text_language(text)와 같은 결과를 공용 캐시로 (반복 판별용)."""
+    return language_profile(text).label
+
+
 def is_bilingual_summary(summary: str, split_bracket_func) -> bool:
     """
     Summary가 이미 '한글 / 영어' 같이 양언어로 구성되어 있는지 판별.
@@ -149,8 +321,8 @@ def is_bilingual_summary(summary: str, split_bracket_func) -> bool:
     if " / " not in core:
         return False
     left, right = core.split(" / ", 1)
-    left_lang = detect_text_language(left)
-    right_lang = detect_text_language(right)
+    left_lang = detect_language_cached(left)
+    right_lang = detect_language_cached(right)
     if left_lang == "unknown" or right_lang == "unknown":
         return False
     return left_lang != right_lang
@@ -178,8 +350,8 @@ def is_steps_bilingual(value: str) -> bool:
     if len(parts) < 2:
         return False
     first, second = parts[0], parts[1]
-    first_lang = detect_text_language(first)
-    second_lang = detect_text_language(second)
+    first_lang = detect_language_cached(first)
+    second_lang = detect_language_cached(second)
     if first_lang == "unknown" or second_lang == "unknown":
         return False
     return first_lang != second_lang
@@ -0,0 +1,330 @@
+"""같은 이슈에 대한 동시 번역 요청 합치기 (single-flight).
+
+여러 사람이 같은 티켓에서 동시에 "번역"을 누르거나 webhook과 수동 호출이 겹치면
+같은 이슈를 여러 번 fetch/번역/PUT하게 된다. SingleFlight는 같은 key(이슈 키 + 필드 집합 +
+update 여부)의 요청이 진행 중이면 새로 실행하지 않고 진행 중인 결과를 함께 받게 한다.
+
+- 프로세스 내부: key별 Future를 공유
+- 프로세스 간(선택): FlightStore(파일/SQLite)로 lock을 잡고 완료된 결과를 result_ttl 동안 저장해
+  다른 프로세스의 늦은 호출도 LLM 호출 없이 결과를 받는다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Optional
+
+
+def flight_key(
+    issue_key: str,
+    fields_to_translate: Optional[Sequence[str]],
+    perform_update: bool,
+    target_language: Optional[str] = None,
+    mode: Optional[str] = None,
+    content: Optional[dict] = None,
+) -> str:
+    """요청 합치기 key. 필드 순서는 무시하고, 자동 결정(None)은 별도 값으로 취급한다.
+
+    mode(예: "adf")가 있으면 key에 포함해 번역 경로가 다른 요청끼리 합쳐지지 않게 한다.
+    content(webhook payload의 필드 값 등 요청에 담긴 원문)가 있으면 digest를 key에 넣어,
+    수정 직후의 webhook이 이전 내용으로 번역한 최근 결과를 받지 않게 한다.
+    """
+    fields = ",".join(sorted(fields_to_translate)) if fields_to_translate else "*"
+    key = f"{issue_key.upper()}|{fields}|update={int(bool(perform_update))}|lang={target_language or 'auto'}"
+    if mode:
+        key = f"{key}|mode={mode}"
+    if content:
+        payload = json.dumps(content, ensure_ascii=False, sort_keys=True, default=str)
+        key = f"{key}|content={hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]}"
+    return key
+
+
+def _is_cacheable(result) -> bool:
+    # Jira 업데이트 실패 등 에러가 담긴 결과는 재시도할 수 있도록 공유 캐시에 남기지 않는다.
+    return isinstance(result, dict) and not result.get("error")
+
+
+class FlightStore(ABC):
+    """프로세스 간 lock + 완료 결과 저장소."""
+
+    @abstractmethod
+    def acquire(self, key: str, ttl: float) -> Optional[str]:
+        """lock을 잡으면 token, 다른 곳에서 잡고 있으면 None. ttl이 지난 lock은 만료로 본다."""
+
+    @abstractmethod
+    def release(self, key: str, token: str) -> None:
+        ...
+
+    @abstractmethod
+    def get_result(self, key: str) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    def put_result(self, key: str, result: dict, ttl: float) -> None:
+        ...
+
+
+class FileFlightStore(FlightStore):
+    """디렉터리 기반 구현 (O_EXCL lock 파일 + JSON 결과 파일)."""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str, suffix: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}{suffix}"
+
+    def acquire(self, key: str, ttl: float) -> Optional[str]:
+        lock_path = self._path(key, ".lock")
+        token = uuid.uuid4().hex
+        for _ in range(2):
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                holder = self._read_lock(lock_path)
+                if holder is None:
+                    continue
+                if holder[1] >= time.time():
+                    return None
+                # 프로세스가 죽어 남은 lock은 제거 후 한 번 더 시도
+                lock_path.unlink(missing_ok=True)
+                continue
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(f"{token} {time.time() + ttl}")
+            return token
+        return None
+
+    @staticmethod
+    def _read_lock(lock_path: Path) -> Optional[tuple[str, float]]:
+        """(token, 만료 시각). 파일이 없으면 None, 쓰는 중이라 내용이 불완전하면 아직 유효한 것으로 본다."""
+        try:
+            token, expires_at = lock_path.read_text(encoding="utf-8").split(" ", 1)
+            return token, float(expires_at)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            return "", float("inf")
+
+    def release(self, key: str, token: str) -> None:
+        lock_path = self._path(key, ".lock")
+        holder = self._read_lock(lock_path)
+        if holder is not None and holder[0] == token:
+            lock_path.unlink(missing_ok=True)
+
+    def get_result(self, key: str) -> Optional[dict]:
+        try:
+            data = json.loads(self._path(key, ".result.json").read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        if data.get("expires_at", 0) < time.time():
+            return None
+        return data.get("result")
+
+    def put_result(self, key: str, result: dict, ttl: float) -> None:
+        path = self._path(key, ".result.json")
+        tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(
+            json.dumps({"expires_at": time.time() + ttl, "result": result}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, path)
+
+
+class SQLiteFlightStore(FlightStore):
+    """SQLite 파일 기반 구현 (스레드별 커넥션)."""
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS flight_locks (key TEXT PRIMARY KEY, token TEXT NOT NULL, expires_at REAL NOT NULL);
+        CREATE TABLE IF NOT EXISTS flight_results (key TEXT PRIMARY KEY, result TEXT NOT NULL, expires_at REAL NOT NULL);
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._connect().executescript(self._SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def acquire(self, key: str, ttl: float) -> Optional[str]:
+        conn = self._connect()
+        token = uuid.uuid4().hex
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM flight_locks WHERE key = ? AND expires_at < ?", (key, now))
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO flight_locks (key, token, expires_at) VALUES (?, ?, ?)",
+                (key, token, now + ttl),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return token if cursor.rowcount == 1 else None
+
+    def release(self, key: str, token: str) -> None:
+        self._connect().execute("DELETE FROM flight_locks WHERE key = ? AND token = ?", (key, token))
+
+    def get_result(self, key: str) -> Optional[dict]:
+        row = self._connect().execute(
+            "SELECT result FROM flight_results WHERE key = ? AND expires_at >= ?", (key, time.time())
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_result(self, key: str, result: dict, ttl: float) -> None:
+        self._connect().execute(
+            "INSERT OR REPLACE INTO flight_results (key, result, expires_at) VALUES (?, ?, ?)",
+            (key, json.dumps(result, ensure_ascii=False), time.time() + ttl),
+        )
+
+
+class SingleFlight:
+    """같은 key의 동시 호출을 한 번의 실행으로 합친다."""
+
+    def __init__(
+        self,
+        store: Optional[FlightStore] = None,
+        *,
+        result_ttl: float = 60.0,
+        lock_ttl: float = 300.0,
+        poll_interval: float = 0.5,
+        wait_timeout: float = 900.0,
+        max_recent: int = 256,
+    ):
+        self.store = store
+        self.result_ttl = result_ttl
+        self.lock_ttl = lock_ttl
+        self.poll_interval = poll_interval
+        self.wait_timeout = wait_timeout
+        self.max_recent = max_recent
+        self._inflight: dict[str, Future] = {}
+        # key -> (만료 시각, 결과). 오래된 것부터 (삽입 시 만료 항목 정리 + max_recent개로 제한)
+        self._recent: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _recent_result(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._recent.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                self._recent.pop(key, None)
+                return None
+            return entry[1]
+
+    def _remember(self, key: str, result: dict) -> None:
+        """최근 결과 저장 (self._lock 안에서 호출). 만료된 항목을 정리하고 max_recent개를 넘으면 오래된 것부터 버린다."""
+        now = time.monotonic()
+        self._recent.pop(key, None)
+        self._recent[key] = (now + self.result_ttl, result)
+        # result_ttl이 모두 같으므로 삽입 순서 = 만료 순서
+        while self._recent:
+            oldest_key, (expires_at, _) = next(iter(self._recent.items()))
+            if expires_at >= now and len(self._recent) <= self.max_recent:
+                break
+            self._recent.pop(oldest_key)
+
+    def do(self, key: str, fn: Callable[[], dict]) -> tuple[dict, bool]:
+        """fn()의 결과와 공유 여부를 반환. shared=True면 다른 호출의 실행 결과를 받은 것이다.
+
+        진행 중인 실행이 예외로 끝나면 기다리던 호출에도 같은 예외가 전달된다.
+        """
+        recent = self._recent_result(key)
+        if recent is not None:
+            return recent, True
+
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+        if not leader:
+            return future.result(), True
+
+        try:
+            result, shared = self._run_leader(key, fn)
+        except BaseException as exc:
+            future.set_exception(exc)
+            with self._lock:
+                self._inflight.pop(key, None)
+            raise
+
+        with self._lock:
+            # 최근 결과를 먼저 남기고 in-flight를 제거해야 그 사이 도착한 호출이 재실행하지 않는다.
+            if self.result_ttl > 0 and _is_cacheable(result):
+                self._remember(key, result)
+            self._inflight.pop(key, None)
+        future.set_result(result)
+        return result, shared
+
+    def _run_leader(self, key: str, fn: Callable[[], dict]) -> tuple[dict, bool]:
+        if self.store is None:
+            return fn(), False
+
+        deadline = time.monotonic() + self.wait_timeout
+        while True:
+            stored = self.store.get_result(key)
+            if stored is not None:
+                return stored, True
+
+            token = self.store.acquire(key, self.lock_ttl)
+            if token is not None:
+                try:
+                    # lock을 잡는 사이 다른 프로세스가 끝냈을 수 있다.
+                    stored = self.store.get_result(key)
+                    if stored is not None:
+                        return stored, True
+                    result = fn()
+                    if self.result_ttl > 0 and _is_cacheable(result):
+                        self.store.put_result(key, result, self.result_ttl)
+                    return result, False
+                finally:
+                    self.store.release(key, token)
+
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Timed out waiting for in-flight translation: {key}")
+            time.sleep(self.poll_interval)
+
+
+def build_single_flight() -> Optional[SingleFlight]:
+    """환경 변수로 SingleFlight 구성.
+
+    SINGLE_FLIGHT=off로 끌 수 있고, SINGLE_FLIGHT_STORE=file|sqlite면 프로세스 간 공유
+    (SINGLE_FLIGHT_PATH: 디렉터리 또는 SQLite 파일 경로), SINGLE_FLIGHT_RESULT_TTL(초)로 결과 보관 시간,
+    SINGLE_FLIGHT_MAX_RESULTS로 메모리에 보관하는 최근 결과 수(기본 256) 설정.
+    """
+    if os.getenv("SINGLE_FLIGHT", "on").strip().lower() in {"0", "off", "false", "no"}:
+        return None
+
+    store_kind = os.getenv("SINGLE_FLIGHT_STORE", "none").strip().lower()
+    store: Optional[FlightStore] = None
+    if store_kind == "file":
+        store = FileFlightStore(os.getenv("SINGLE_FLIGHT_PATH", "/tmp/jira_translator_flights"))
+    elif store_kind == "sqlite":
+        store = SQLiteFlightStore(os.getenv("SINGLE_FLIGHT_PATH", "/tmp/jira_translator_flights.sqlite3"))
+    elif store_kind not in {"", "none", "memory"}:
+        raise EnvironmentError(f"Unknown SINGLE_FLIGHT_STORE: {store_kind}")
+
+    return SingleFlight(
+        store,
+        result_ttl=float(os.getenv("SINGLE_FLIGHT_RESULT_TTL", "60")),
+        max_recent=max(1, int(os.getenv("SINGLE_FLIGHT_MAX_RESULTS", "256"))),
+    )
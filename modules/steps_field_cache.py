@@ -0,0 +1,160 @@
+"""createmeta로 탐지한 steps 필드의 프로세스 간 TTL 캐시.
+
+_KNOWN_STEPS_FIELDS에 없는 프로젝트는 steps 필드를 찾기 위해 무거운 createmeta
+(expand=projects.issuetypes.fields) 호출이 필요하다. JiraClient 인스턴스 캐시만으로는
+요청마다 다시 호출하게 되므로 탐지 결과를 두 단계로 보관한다.
+
+- 프로세스 메모리: warm 컨테이너 안에서 재사용
+- 디스크(JSON 파일, 기본 /tmp): 같은 실행 환경의 다른 프로세스/재시작 후에도 재사용
+
+필드를 찾지 못한 결과(None)도 negative_ttl(기본 10분) 동안 캐시한다.
+API 호출 실패는 캐시하지 않는다 (호출한 JiraClient 인스턴스에서만 기억).
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_PATH = "/tmp/jira_translator_steps_fields.json"
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_NEGATIVE_TTL_SECONDS = 10 * 60
+
+# get()에서 캐시에 없음을 나타내는 값 (None은 "필드 없음"으로 캐시된 결과)
+NOT_CACHED = object()
+
+
+class StepsFieldCache:
+    """(Jira 사이트, 프로젝트 키) -> steps 필드 ID(또는 None) TTL 캐시 (스레드 안전)."""
+
+    def __init__(
+        self,
+        path: Optional[str] = DEFAULT_CACHE_PATH,
+        *,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+    ):
+        self.path = Path(path) if path else None
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: dict[str, tuple[float, Optional[str]]] = {}
+        self._disk_loaded = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(site: str, project_key: str) -> str:
+        return f"{site.rstrip('/')}|{project_key.upper()}"
+
+    def _read_disk(self) -> dict[str, tuple[float, Optional[str]]]:
+        """디스크 캐시의 만료되지 않은 entry (파일이 없거나 깨졌으면 빈 dict)."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+        now = time.time()
+        entries: dict[str, tuple[float, Optional[str]]] = {}
+        for key, entry in (data if isinstance(data, dict) else {}).items():
+            try:
+                expires_at, field_id = float(entry["expires_at"]), entry.get("field")
+            except (TypeError, KeyError, ValueError, AttributeError):
+                continue
+            if expires_at >= now:
+                entries[key] = (expires_at, field_id)
+        return entries
+
+    def _merge(self, entries: dict[str, tuple[float, Optional[str]]]) -> None:
+        # 같은 키는 만료 시각이 늦은 쪽(= 더 최근에 탐지한 결과)을 남긴다.
+        for key, entry in entries.items():
+            current = self._entries.get(key)
+            if current is None or entry[0] > current[0]:
+                self._entries[key] = entry
+
+    def _load_disk(self) -> None:
+        """디스크 캐시를 한 번 읽어 메모리에 병합."""
+        if self._disk_loaded or self.path is None:
+            return
+        self._disk_loaded = True
+        self._merge(self._read_disk())
+
+    def _save_disk(self) -> None:
+        """다른 프로세스가 그 사이 기록한 entry를 잃지 않도록 현재 파일 내용과 병합한 뒤 교체한다."""
+        if self.path is None:
+            return
+        self._merge(self._read_disk())
+        now = time.time()
+        payload = {
+            key: {"expires_at": expires_at, "field": field_id}
+            for key, (expires_at, field_id) in self._entries.items()
+            if expires_at >= now
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            print(f"⚠️ Steps field cache write failed: {exc}")
+
+    def get(self, site: str, project_key: str):
+        """캐시된 필드 ID (찾지 못한 결과면 None). 캐시에 없거나 만료되면 NOT_CACHED."""
+        key = self._key(site, project_key)
+        with self._lock:
+            self._load_disk()
+            entry = self._entries.get(key)
+            if entry is None:
+                return NOT_CACHED
+            if entry[0] < time.time():
+                self._entries.pop(key, None)
+                return NOT_CACHED
+            return entry[1]
+
+    def put_many(self, site: str, detected: dict[str, Optional[str]]) -> None:
+        now = time.time()
+        with self._lock:
+            self._load_disk()
+            for project_key, field_id in detected.items():
+                ttl = self.ttl if field_id else self.negative_ttl
+                self._entries[self._key(site, project_key)] = (now + ttl, field_id)
+            self._save_disk()
+
+    def put(self, site: str, project_key: str, field_id: Optional[str]) -> None:
+        self.put_many(site, {project_key: field_id})
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._disk_loaded = True
+            if self.path is not None:
+                self.path.unlink(missing_ok=True)
+
+
+_DEFAULT_CACHE: Optional[StepsFieldCache] = None
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def default_steps_field_cache() -> StepsFieldCache:
+    """프로세스 공용 캐시.
+
+    STEPS_FIELD_CACHE_PATH(빈 값이면 디스크 캐시 끔), STEPS_FIELD_CACHE_TTL,
+    STEPS_FIELD_NEGATIVE_TTL(초) 환경 변수로 구성한다.
+    """
+    global _DEFAULT_CACHE
+    with _DEFAULT_CACHE_LOCK:
+        if _DEFAULT_CACHE is None:
+            _DEFAULT_CACHE = StepsFieldCache(
+                os.getenv("STEPS_FIELD_CACHE_PATH", DEFAULT_CACHE_PATH) or None,
+                ttl=float(os.getenv("STEPS_FIELD_CACHE_TTL", DEFAULT_TTL_SECONDS)),
+                negative_ttl=float(os.getenv("STEPS_FIELD_NEGATIVE_TTL", DEFAULT_NEGATIVE_TTL_SECONDS)),
+            )
+        return _DEFAULT_CACHE
+
+
+def reset_default_steps_field_cache() -> None:
+    """공용 캐시 객체를 버린다 (다음 호출 시 환경 변수로 다시 구성, 디스크 파일은 유지)."""
+    global _DEFAULT_CACHE
+    with _DEFAULT_CACHE_LOCK:
+        _DEFAULT_CACHE = None
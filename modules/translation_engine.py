@@ -1,11 +1,11 @@
 import os
 import json
+import time
 import urllib.request
 from pathlib import Path
 from collections.abc import Callable, Sequence
 from typing import Optional
 
-from openai import OpenAI
 from prompts import PromptBuilder
 from models import (
     FieldTranslationJob,
@@ -17,6 +17,20 @@ from models import (
     GLOSSARY_FILTER_THRESHOLD,
 )
 from modules import formatting, language
+from modules.glossary_compliance import ComplianceReport, check_compliance
+from modules.glossary_matcher import TermMatcher, cached_source_matcher, cached_target_matcher
+
+# 파싱된 용어집 entry의 프로세스 단위 캐시 (warm 컨테이너에서 재사용)
+# key: ("file", 경로, mtime_ns, size) 또는 ("url", url) -> (만료 시각 | None, entries)
+_GLOSSARY_ENTRY_CACHE: dict[tuple, tuple[Optional[float], tuple[GlossaryEntry, ...]]] = {}
+# GLOSSARY_BASE_URL에서 받은 용어집은 원격 변경을 반영하도록 TTL을 둔다.
+REMOTE_GLOSSARY_TTL_SECONDS = 300.0
+
+
+def clear_glossary_cache() -> None:
+    _GLOSSARY_ENTRY_CACHE.clear()
+    cached_source_matcher.cache_clear()
+    cached_target_matcher.cache_clear()
 
 
 def run_batch_translation_orchestration(
@@ -58,14 +72,21 @@ def run_batch_translation_orchestration(
     return batch_result
 
 class TranslationEngine:
-    def __init__(self, openai_api_key: str, model: str = "gpt-5.2"):
-        self.openai = OpenAI(api_key=openai_api_key)
+    def __init__(self, openai_api_key: str, model: str = "gpt-5.2", client=None):
+        if client is None:
+            # openai SDK(httpx/pydantic 포함)는 import 비용이 커서 엔진 생성 시점에 로드한다.
+            from openai import OpenAI
+
+            client = OpenAI(api_key=openai_api_key)
+        self.openai = client
         self.openai_model = model or os.getenv("OPENAI_MODEL", "gpt-5.2")
         self.glossary_terms: dict[str, str] = {}
         self.glossary_entries: list[GlossaryEntry] = []
         self.glossary_name: str = ""
         self.prompt_builder = PromptBuilder(self.glossary_terms, self.glossary_name, self.glossary_entries)
         self._last_loaded_glossary_entries: list[GlossaryEntry] = []
+        # 요청 안의 모든 필터 호출 누적: 필터에 넣은 텍스트 -> 그 프롬프트에 포함된 entry id
+        self.selected_glossary_entry_ids: dict[str, set[str]] = {}
 
     def load_glossary(self, filename: str, glossary_name: str):
         # Keep compatibility with tests/mocks that intercept _load_glossary_terms.
@@ -82,6 +103,28 @@ class TranslationEngine:
         self.glossary_terms = self.prompt_builder.glossary_terms
         self.glossary_name = glossary_name
         self.prompt_builder.glossary_name = self.glossary_name
+        self.selected_glossary_entry_ids = {}
+
+    def fork(self) -> "TranslationEngine":
+        """OpenAI 클라이언트(커넥션 풀)만 공유하고 요청 단위 상태는 독립인 엔진을 만든다.
+
+        여러 이슈를 동시에 번역할 때 worker마다 용어집 상태가 섞이지 않도록 사용한다.
+        """
+        return self.__class__(openai_api_key="", model=self.openai_model, client=self.openai)
+
+    def reset_request_state(self) -> None:
+        """요청 단위 상태(로드된 용어집, 필터 결과)를 초기화.
+
+        warm 컨테이너에서 엔진을 재사용할 때 이전 이슈의 용어집이 새 요청에 섞이지 않도록 한다.
+        OpenAI 클라이언트(커넥션 풀)와 프로세스 단위 용어집/matcher 캐시는 유지된다.
+        """
+        self.glossary_terms = {}
+        self.glossary_entries = []
+        self.glossary_name = ""
+        self.prompt_builder.set_glossary(glossary_entries=[])
+        self.prompt_builder.glossary_name = ""
+        self._last_loaded_glossary_entries = []
+        self.selected_glossary_entry_ids = {}
 
     @staticmethod
     def _unique_id(base_id: str, used_ids: set[str]) -> str:
@@ -123,10 +166,14 @@ class TranslationEngine:
     def _entries_to_terms(cls, entries: Sequence[GlossaryEntry]) -> dict[str, str]:
         return PromptBuilder.terms_from_entries(entries)
 
+    @staticmethod
+    def _local_glossary_path(filename: str) -> Path:
+        base_dir = Path(__file__).resolve().parent.parent
+        return base_dir / "glossaries" / filename
+
     def _fetch_glossary_data(self, filename: str) -> dict | None:
         """로컬 파일 우선, 없으면 GitHub에서 fetch."""
-        base_dir = Path(__file__).resolve().parent.parent
-        glossary_path = base_dir / "glossaries" / filename
+        glossary_path = self._local_glossary_path(filename)
         if glossary_path.exists():
             with glossary_path.open("r", encoding="utf-8") as f:
                 return json.load(f)
@@ -139,7 +186,74 @@ class TranslationEngine:
 
         return None
 
+    def _glossary_cache_key(self, filename: str) -> tuple[Optional[tuple], Optional[float]]:
+        """(캐시 key, TTL) 반환. 캐시할 수 없는 경우 key는 None.
+
+        로컬 파일은 mtime/size를 key에 포함해 파일이 바뀌면 자동으로 다시 읽는다.
+        """
+        try:
+            glossary_path = self._local_glossary_path(filename)
+            if glossary_path.exists():
+                stat = glossary_path.stat()
+                return ("file", str(glossary_path), stat.st_mtime_ns, stat.st_size), None
+        except OSError:
+            return None, None
+
+        base_url = os.getenv("GLOSSARY_BASE_URL", "").rstrip("/")
+        if base_url:
+            return ("url", f"{base_url}/{filename}"), REMOTE_GLOSSARY_TTL_SECONDS
+        return None, None
+
+    def glossary_version(self, filename: str) -> str:
+        """용어집 내용이 바뀌면 달라지는 식별자 (로컬 파일은 mtime/size, 원격은 URL)."""
+        cache_key, _ = self._glossary_cache_key(filename)
+        if cache_key is None:
+            return filename
+        if cache_key[0] == "file":
+            return f"{Path(cache_key[1]).name}:{cache_key[2]}:{cache_key[3]}"
+        return cache_key[1]
+
     def _load_glossary_entries(self, filename: str) -> list[GlossaryEntry]:
+        """용어집 entry 목록을 로드 (프로세스 단위 캐시 사용)."""
+        cache_key, ttl = self._glossary_cache_key(filename)
+        if cache_key is not None:
+            cached = _GLOSSARY_ENTRY_CACHE.get(cache_key)
+            if cached is not None and (cached[0] is None or cached[0] > time.monotonic()):
+                return list(cached[1])
+
+        entries = self._read_glossary_entries(filename)
+        if cache_key is not None and entries:
+            expires_at = time.monotonic() + ttl if ttl is not None else None
+            _GLOSSARY_ENTRY_CACHE[cache_key] = (expires_at, tuple(entries))
+        return entries
+
+    def preload_glossary(self, filename: str) -> int:
+        """용어집을 캐시에 올리고 후보 추출/준수 검사 matcher를 미리 컴파일한다.
+
+        반환: 로드된 entry 수 (파일이 없거나 비어 있으면 0)
+        """
+        entries = tuple(self._load_glossary_entries(filename))
+        if entries:
+            cached_source_matcher(entries)
+            for target_lang in ("ko", "en"):
+                cached_target_matcher(entries, target_lang)
+        return len(entries)
+
+    def warm_up_connection(self, timeout: float = 5.0) -> dict:
+        """OpenAI API에 가벼운 요청(models.retrieve)을 보내 TLS 커넥션을 미리 맺는다.
+
+        실패해도 예외를 던지지 않고 결과 dict에 에러를 담아 반환한다.
+        """
+        started = time.perf_counter()
+        try:
+            self.openai.with_options(timeout=timeout, max_retries=0).models.retrieve(self.openai_model)
+            result: dict = {"ok": True}
+        except Exception as exc:
+            result = {"ok": False, "error": str(exc)}
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    def _read_glossary_entries(self, filename: str) -> list[GlossaryEntry]:
         """지정된 용어집 파일에서 구조화된 glossary entry 목록을 로드.
 
         지원 포맷:
@@ -314,12 +428,48 @@ class TranslationEngine:
         filtered = self._filter_glossary_by_llm(candidates, texts)
         if len(candidates) > GLOSSARY_FILTER_THRESHOLD:
             print(f"📚 Glossary filter: {len(candidates)} → {len(filtered)} after LLM filter (2nd stage)")
+        filtered_ids = {entry.id for entry in filtered}
+        for text in texts:
+            self.selected_glossary_entry_ids.setdefault(text, set()).update(filtered_ids)
         return self.prompt_builder.build_glossary_instruction(
             texts,
             source_lang=source_lang,
             candidate_entries=filtered,
         )
 
+    @staticmethod
+    def _forced_direction_lang(target_language: Optional[str]) -> Optional[str]:
+        if target_language:
+            tl = str(target_language).strip().lower()
+            if tl in {"english", "en"}:
+                # output English => Korean -> English 프롬프트 선택
+                return "ko"
+            if tl in {"korean", "ko"}:
+                # output Korean => English -> Korean 프롬프트 선택
+                return "en"
+        return None
+
+    @classmethod
+    def resolve_direction_lang(cls, text: str, target_language: Optional[str] = None) -> str:
+        """번역 방향(원문 언어)을 결정. target_language가 주어지면 감지 결과보다 우선한다."""
+        return cls._forced_direction_lang(target_language) or language.language_profile(text).label
+
+    @classmethod
+    def resolve_chunks_direction_lang(
+        cls,
+        chunks: Sequence[TranslationChunk],
+        target_language: Optional[str] = None,
+    ) -> str:
+        """청크들을 합친 텍스트의 번역 방향.
+
+        청크별 언어 프로필(공용 LRU 캐시)을 합쳐 판단하므로, 배치 호출/재시도/용어집 검사에서
+        이어 붙인 텍스트를 매번 다시 스캔하지 않는다. 한글이 있는 청크가 나오면 바로 결정한다.
+        """
+        forced = cls._forced_direction_lang(target_language)
+        if forced:
+            return forced
+        return language.detect_combined_language(chunk.clean_text for chunk in chunks)
+
     def translate_text(self, text: str, target_language: Optional[str] = None) -> str:
         """
         텍스트를 번역 (마크업 제외)
@@ -329,18 +479,7 @@ class TranslationEngine:
             return text
 
         # 언어 감지(기본) + target_language(옵션)로 방향 강제 지원
-        # Note: calling language.detect_text_language explicitly
-        detected_lang = language.detect_text_language(text, extract_text_func=language.extract_detectable_text)
-        forced = None
-        if target_language:
-            tl = str(target_language).strip().lower()
-            if tl in {"english", "en"}:
-                # output English => Korean -> English 프롬프트 선택
-                forced = "ko"
-            elif tl in {"korean", "ko"}:
-                # output Korean => English -> Korean 프롬프트 선택
-                forced = "en"
-        direction_lang = forced or detected_lang
+        direction_lang = self.resolve_direction_lang(text, target_language)
 
         glossary_instruction = self._build_filtered_glossary_instruction([text], source_lang=direction_lang)
         system_msg = self.prompt_builder.build_system_message(
@@ -434,6 +573,18 @@ class TranslationEngine:
             fallback_chunk_list=self._translate_chunk_list,
         )
 
+    @staticmethod
+    def _field_hint(chunk_id: str) -> str:
+        # 여러 이슈를 한 배치로 묶을 때는 "ISSUE-1::summary" 형태의 id를 사용한다.
+        chunk_id = chunk_id.rsplit("::", 1)[-1]
+        if chunk_id == "summary":
+            return "summary"
+        if chunk_id.startswith("description"):
+            return "table_cell" if "__cell_" in chunk_id else "description"
+        if chunk_id.startswith("customfield_"):
+            return "steps"
+        return "other"
+
     def _call_openai_batch_once(
         self,
         chunks: Sequence[TranslationChunk],
@@ -452,16 +603,7 @@ class TranslationEngine:
         if not translatable_chunks:
             return {}
 
-        combined_text = "\n".join(chunk.clean_text for chunk in translatable_chunks)
-        detected_lang = language.detect_text_language(combined_text, extract_text_func=language.extract_detectable_text)
-        forced = None
-        if target_language:
-            tl = str(target_language).strip().lower()
-            if tl in {"english", "en"}:
-                forced = "ko"
-            elif tl in {"korean", "ko"}:
-                forced = "en"
-        direction_lang = forced or detected_lang
+        direction_lang = self.resolve_chunks_direction_lang(translatable_chunks, target_language)
         chunk_texts = [chunk.clean_text for chunk in translatable_chunks]
         glossary_instruction = self._build_filtered_glossary_instruction(
             chunk_texts,
@@ -474,18 +616,9 @@ class TranslationEngine:
         )
 
         # Structured Outputs용 페이로드 구성 (field 정보 포함으로 일관성 향상)
-        def _field_hint(chunk_id: str) -> str:
-            if chunk_id == "summary":
-                return "summary"
-            if chunk_id.startswith("description"):
-                return "description"
-            if chunk_id.startswith("customfield_"):
-                return "steps"
-            return "other"
-
         payload = {
             "items": [
-                {"id": chunk.id, "field": _field_hint(chunk.id), "text": chunk.clean_text}
+                {"id": chunk.id, "field": self._field_hint(chunk.id), "text": chunk.clean_text}
                 for chunk in translatable_chunks
             ]
         }
@@ -495,6 +628,10 @@ class TranslationEngine:
             f"{json.dumps(payload, ensure_ascii=False)}"
         )
 
+        return self._request_structured_translations(system_msg, user_msg)
+
+    def _request_structured_translations(self, system_msg: str, user_msg: str) -> dict[str, str]:
+        """system/user 메시지로 번역을 요청하고 {id: translated} 결과를 반환."""
         # 1) Structured Outputs 경로 (Lambda/Linux 등 pydantic 사용 가능 환경)
         if (
             PYDANTIC_AVAILABLE
@@ -542,6 +679,111 @@ class TranslationEngine:
                 result[str(item_id)] = str(translated).strip()
         return result
 
+    # --- Glossary compliance ---
+
+    def target_term_matcher(self, target_lang: str) -> TermMatcher:
+        """현재 glossary의 target-side 용어 matcher (용어집 단위 프로세스 캐시)."""
+        return cached_target_matcher(tuple(self.prompt_builder.glossary_entries), target_lang)
+
+    def expected_glossary_entries(
+        self,
+        chunks: Sequence[TranslationChunk],
+        direction_lang: str,
+    ) -> dict[str, list[GlossaryEntry]]:
+        """청크별로 번역문에 등장해야 하는 glossary entry를 결정.
+
+        청크 원문에서 string match된 후보 중, 이 요청에서 그 청크를 번역한 프롬프트(하위 배치/청크별
+        fallback 포함 모든 필터 호출)에 실제로 포함된 entry(LLM 필터 통과분)만 기대 용어로 취급한다.
+        이 엔진의 필터를 거치지 않은 청크(다른 worker에서 미리 번역된 summary 등)는 후보 전체를 기대한다.
+        """
+        expected: dict[str, list[GlossaryEntry]] = {}
+        for chunk in chunks:
+            if chunk.skip_translation or not chunk.clean_text.strip():
+                continue
+            candidates = self.prompt_builder.get_candidate_entries([chunk.clean_text], source_lang=direction_lang)
+            selected_ids = self.selected_glossary_entry_ids.get(chunk.clean_text)
+            if selected_ids is not None:
+                candidates = [entry for entry in candidates if entry.id in selected_ids]
+            if candidates:
+                expected[chunk.id] = candidates
+        return expected
+
+    def check_glossary_compliance(
+        self,
+        chunks: Sequence[TranslationChunk],
+        translations: dict[str, str],
+        direction_lang: str,
+    ) -> ComplianceReport:
+        target_lang = "en" if direction_lang == "ko" else "ko"
+        expected = self.expected_glossary_entries(chunks, direction_lang)
+        if not expected:
+            return ComplianceReport()
+        return check_compliance(expected, translations, self.target_term_matcher(target_lang))
+
+    def repair_glossary_violations(
+        self,
+        chunks: Sequence[TranslationChunk],
+        translations: dict[str, str],
+        report: ComplianceReport,
+        direction_lang: str,
+    ) -> dict[str, str]:
+        """용어집을 지키지 않은 청크만 모아 한 번의 수정(repair) 배치로 재요청한다."""
+        non_compliant = {item.chunk_id: item for item in report.non_compliant}
+        if not non_compliant:
+            return {}
+
+        entries_by_id = {entry.id: entry for entry in self.prompt_builder.glossary_entries}
+        chunk_by_id = {chunk.id: chunk for chunk in chunks}
+
+        items: list[dict] = []
+        missing_entries: dict[str, GlossaryEntry] = {}
+        for chunk_id, item in non_compliant.items():
+            chunk = chunk_by_id.get(chunk_id)
+            if chunk is None:
+                continue
+            required: list[str] = []
+            for entry_id in item.missing_ids:
+                entry = entries_by_id.get(entry_id)
+                if entry is None:
+                    continue
+                missing_entries[entry.id] = entry
+                if direction_lang == "ko":
+                    required.append(f"{entry.ko} -> {entry.en}")
+                else:
+                    required.append(f"{entry.en} -> {entry.ko}")
+            if not required:
+                continue
+            items.append(
+                {
+                    "id": chunk.id,
+                    "field": self._field_hint(chunk.id),
+                    "text": chunk.clean_text,
+                    "draft": translations.get(chunk.id, ""),
+                    "required_terms": required,
+                }
+            )
+        if not items:
+            return {}
+
+        glossary_instruction = self.prompt_builder.build_glossary_instruction(
+            [],
+            source_lang=direction_lang,
+            candidate_entries=list(missing_entries.values()),
+        )
+        system_msg = self.prompt_builder.build_system_message(
+            detected_lang=direction_lang,
+            glossary_instruction=glossary_instruction,
+            batch=True,
+        )
+        user_msg = (
+            "Each item has a source 'text' and a 'draft' translation that does not use the required glossary terms. "
+            "Revise the 'draft' so it uses every term in 'required_terms' (source -> target). "
+            "Change only what is needed to apply the terms; keep the rest of the draft, its line count, "
+            "and all placeholders/markup unchanged. Return the revised draft as 'translated'.\n"
+            f"{json.dumps({'items': items}, ensure_ascii=False)}"
+        )
+        return self._request_structured_translations(system_msg, user_msg)
+
     def create_translation_chunk(
         self,
         *,
@@ -620,11 +862,13 @@ class TranslationEngine:
                     chunks.append(chunk)
             if not chunks:
                 return None
+            cell_chunks, table_cells = self._plan_table_cell_chunks(field, chunks)
             return FieldTranslationJob(
                 field=field,
                 original_value=value,
-                chunks=chunks,
+                chunks=chunks + cell_chunks,
                 mode="description",
+                table_cells=table_cells,
             )
 
         chunk = self.create_translation_chunk(
@@ -640,6 +884,91 @@ class TranslationEngine:
             chunks=[chunk],
         )
 
+    @staticmethod
+    def _plan_table_cell_chunks(
+        field: str,
+        chunks: Sequence[TranslationChunk],
+    ) -> tuple[list[TranslationChunk], dict[str, str]]:
+        """섹션 chunk에서 표 라인을 빼고, 셀 값마다 번역 chunk를 하나씩 만든다 (필드 전체에서 중복 제거).
+
+        반복되는 셀 값(상태/Yes/No/플랫폼명)은 한 번만 번역되고, 셀 번역은 행 라인을 거치지 않으므로
+        번역문의 |로 셀 정렬이 깨지지 않는다.
+        """
+        table_cells: dict[str, str] = {}
+        for chunk in chunks:
+            if chunk.skip_translation:
+                continue
+            chunk.clean_text, cells = formatting.split_table_cells(chunk.clean_text)
+            for cell in cells:
+                if cell not in table_cells:
+                    table_cells[cell] = f"{field}__cell_{len(table_cells)}"
+        cell_chunks = [
+            TranslationChunk(id=chunk_id, field=field, original_text=cell, clean_text=cell, attachments=[])
+            for cell, chunk_id in table_cells.items()
+        ]
+        return cell_chunks, table_cells
+
+    @staticmethod
+    def table_cell_translations(job: FieldTranslationJob, translations: dict[str, str]) -> Optional[dict[str, str]]:
+        """셀 값 -> 표에 넣을 셀 번역 (표를 셀 단위로 번역하지 않은 job은 None)."""
+        if job.table_cells is None:
+            return None
+        return {
+            cell: formatting.sanitize_table_cell_translation(translations.get(chunk_id, ""))
+            for cell, chunk_id in job.table_cells.items()
+        }
+
+    def plan_incremental_description_job(
+        self,
+        value: str,
+        previous_value: Optional[str] = None,
+    ) -> Optional[FieldTranslationJob]:
+        """이미 번역된 description에서 새로 추가/수정된 문단만 청크로 만든다 (다시 번역할 문단이 없으면 None).
+
+        previous_value는 직전 description 값 (webhook changelog의 fromString 등).
+        없으면 번역 라인이 없는 문단만 대상으로 한다.
+        """
+        segments = formatting.parse_bilingual_description(value)
+        chunks: list[TranslationChunk] = []
+        for index in formatting.incremental_translation_targets(segments, previous_value):
+            chunk = self.create_translation_chunk(
+                chunk_id=f"description__para_{index}",
+                field="description",
+                original_text=segments[index].source,
+                header=segments[index].section,
+            )
+            if chunk:
+                chunks.append(chunk)
+        if not chunks:
+            return None
+        return FieldTranslationJob(
+            field="description",
+            original_value=value,
+            chunks=chunks,
+            mode="description_incremental",
+            segments=segments,
+        )
+
+    @staticmethod
+    def assemble_incremental_description(job: FieldTranslationJob, restored: dict[str, str]) -> str:
+        """다시 번역한 문단의 번역 라인만 교체하고 나머지 문단/라인은 그대로 둔다.
+
+        restored: chunk id -> 마크업이 복원된 번역문. 번역이 비어 있는 문단은 기존 번역 라인을 유지한다.
+        """
+        segments = list(job.segments or [])
+        for chunk in job.chunks:
+            translated = restored.get(chunk.id, "")
+            if not translated.strip():
+                continue
+            index = int(chunk.id.rsplit("_", 1)[-1])
+            paragraph = segments[index]
+            segments[index] = formatting.BilingualParagraph(
+                source_lines=paragraph.source_lines,
+                translation_lines=formatting.translation_lines_for_paragraph(paragraph.source, translated),
+                section=paragraph.section,
+            )
+        return formatting.render_bilingual_description(segments)
+
     def build_field_update_payload(self, translation_results: dict[str, dict[str, str]]) -> dict[str, str]:
         payload: dict[str, str] = {}
         for field, content in translation_results.items():
@@ -5,6 +5,11 @@ from collections.abc import Sequence
 from typing import Optional
 
 from models import GlossaryEntry
+from modules.glossary_matcher import cached_source_matcher
+
+# system message/용어집 지시문 형식을 바꾸면 올린다.
+# 이슈 fingerprint(modules.fingerprints)에 포함되어 이전 프롬프트로 번역된 이슈도 다시 번역된다.
+PROMPT_VERSION = "2026.10.2"
 
 
 class PromptBuilder:
@@ -84,41 +89,6 @@ class PromptBuilder:
             terms[entry.id] = f"{entry.ko} ({entry.note})" if entry.note else entry.ko
         return terms
 
-    @staticmethod
-    def _contains_hangul(text: str) -> bool:
-        return bool(re.search(r"[가-힣]", text))
-
-    @staticmethod
-    def _boundary_match(term: str, text_lower: str) -> bool:
-        normalized = (term or "").strip().lower()
-        if not normalized:
-            return False
-        pattern = rf"(?<!\w){re.escape(normalized)}(?!\w)"
-        return re.search(pattern, text_lower) is not None
-
-    @classmethod
-    def _match_en_term(cls, term: str, text_lower: str) -> bool:
-        return cls._boundary_match(term, text_lower)
-
-    @classmethod
-    def _match_ko_term(cls, term: str, text_lower: str) -> bool:
-        normalized = (term or "").strip().lower()
-        if not normalized:
-            return False
-
-        # 조사/활용 붙는 한국어 용어는 substring을 허용해 recall을 확보하고,
-        # 아주 짧은 토큰은 과매칭 방지를 위해 경계 매칭 유지.
-        if cls._contains_hangul(normalized) and len(normalized) > 2:
-            return normalized in text_lower
-        return cls._boundary_match(normalized, text_lower)
-
-    def _entry_match_flags(self, entry: GlossaryEntry, text_lower: str) -> tuple[bool, bool]:
-        en_terms = [entry.en, *entry.aliases_en]
-        ko_terms = [entry.ko, *entry.aliases_ko]
-        en_hit = any(self._match_en_term(term, text_lower) for term in en_terms if term)
-        ko_hit = any(self._match_ko_term(term, text_lower) for term in ko_terms if term)
-        return en_hit, ko_hit
-
     def get_candidate_entries(
         self,
         texts: Sequence[str],
@@ -134,24 +104,12 @@ class PromptBuilder:
         if not self.glossary_entries:
             return []
 
-        combined_text = "\n".join(texts).lower()
-        source = (source_lang or "").strip().lower()
-        candidates: list[GlossaryEntry] = []
-
-        for entry in self.glossary_entries:
-            en_hit, ko_hit = self._entry_match_flags(entry, combined_text)
-
-            if source == "ko":
-                matched = ko_hit or en_hit
-            elif source == "en":
-                matched = en_hit or ko_hit
-            else:
-                matched = en_hit or ko_hit
-
-            if matched:
-                candidates.append(entry)
-
-        return candidates
+        # 1단계 매칭은 용어집 전체를 한 번에 스캔하는 TermMatcher로 수행한다.
+        # en 용어는 단어 경계, 3자 이상 한국어 용어는 조사/활용을 허용하는 substring 매칭이며,
+        # source_lang과 관계없이 en/ko 어느 쪽이든 맞으면 후보로 포함한다(양방향 관대 매칭).
+        entries = tuple(self.glossary_entries)
+        matched = cached_source_matcher(entries).find_entry_ids("\n".join(texts))
+        return [entry for index, entry in enumerate(entries) if index in matched]
 
     def get_candidate_terms(
         self,
@@ -247,7 +205,8 @@ class PromptBuilder:
                 system_msg = (
                     _ko_en_common
                     + "Field context: items may be 'summary' (one-line title), 'description' (detailed body), "
-                    "or 'steps' (numbered reproduction steps). Use consistent terminology across all fields. "
+                    "'steps' (numbered reproduction steps), or 'table_cell' (a single table cell value; translate it as a short label "
+                    "on one line without '|'). Use consistent terminology across all fields. "
                     "IMPORTANT: Keep the exact same number of lines as the source text. "
                     "Do not add commentary. "
                 )
@@ -271,7 +230,8 @@ class PromptBuilder:
                 system_msg = (
                     _en_ko_common
                     + "Field context: items may be 'summary' (one-line title), 'description' (detailed body), "
-                    "or 'steps' (numbered reproduction steps). Use consistent terminology across all fields. "
+                    "'steps' (numbered reproduction steps), or 'table_cell' (a single table cell value; translate it as a short label "
+                    "on one line without '|'). Use consistent terminology across all fields. "
                     "IMPORTANT: Keep the exact same number of lines as the source text. "
                     "Do not add commentary. "
                 )
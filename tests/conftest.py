@@ -0,0 +1,36 @@
+import pytest
+
+import handler
+from modules import fingerprints, language, steps_field_cache
+
+
+@pytest.fixture(autouse=True)
+def _reset_handler_process_state(monkeypatch):
+    """warm 컨테이너용 프로세스 단위 상태가 테스트 간에 공유되지 않도록 초기화."""
+    monkeypatch.setattr(handler, "_SINGLE_FLIGHT", None)
+    monkeypatch.setattr(handler, "_SINGLE_FLIGHT_READY", False)
+
+
+@pytest.fixture(autouse=True)
+def _isolate_steps_field_cache(monkeypatch, tmp_path):
+    """steps 필드 캐시는 테스트마다 새로 만들고 디스크 캐시는 tmp_path를 사용한다."""
+    monkeypatch.setenv("STEPS_FIELD_CACHE_PATH", str(tmp_path / "steps_fields.json"))
+    steps_field_cache.reset_default_steps_field_cache()
+    yield
+    steps_field_cache.reset_default_steps_field_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_fingerprint_store():
+    """이슈 fingerprint 저장소는 테스트마다 새로 만든다."""
+    fingerprints.reset_default_fingerprint_store()
+    yield
+    fingerprints.reset_default_fingerprint_store()
+
+
+@pytest.fixture(autouse=True)
+def _reset_language_profile_cache():
+    """언어 프로필 LRU 캐시는 테스트마다 새로 만든다."""
+    language.reset_default_language_profile_cache()
+    yield
+    language.reset_default_language_profile_cache()
@@ -0,0 +1,88 @@
+"""Tests for the ADF -> wiki markup flattener."""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.adf import flatten_adf
+from modules.formatting import extract_attachments_markup, extract_description_sections, is_media_only_line
+from modules.jira_client import JiraFieldNormalizer
+
+
+def _text(value, marks=None):
+    node = {"type": "text", "text": value}
+    if marks:
+        node["marks"] = marks
+    return node
+
+
+def _para(*children):
+    return {"type": "paragraph", "content": list(children)}
+
+
+def _cell(kind, *paragraphs):
+    return {"type": kind, "content": list(paragraphs)}
+
+
+def test_blocks_are_emitted_as_wiki_markup():
+    doc = {"type": "doc", "content": [
+        {"type": "heading", "attrs": {"level": 3}, "content": [_text("Observed:")]},
+        _para(_text("Crash on "), _text("lobby", [{"type": "strong"}]), {"type": "hardBreak"},
+              {"type": "mention", "attrs": {"id": "abc", "text": "@Kim"}}),
+        {"type": "bulletList", "content": [
+            {"type": "listItem", "content": [
+                _para(_text("one")),
+                {"type": "orderedList", "content": [{"type": "listItem", "content": [_para(_text("nested"))]}]},
+            ]},
+            {"type": "listItem", "content": [_para(_text("two"))]},
+        ]},
+        {"type": "codeBlock", "attrs": {"language": "java"}, "content": [_text("int x;\nx++;")]},
+        {"type": "panel", "content": [_para(_text("in panel"))]},
+    ]}
+
+    assert flatten_adf(doc) == (
+        "Observed:\nCrash on *lobby*\n[~accountid:abc]\n* one\n*# nested\n* two\n"
+        "{code:java}\nint x;\nx++;\n{code}\nin panel\n"
+    )
+
+
+def test_tables_and_media_survive_as_placeholders():
+    doc = {"type": "doc", "content": [
+        {"type": "table", "content": [
+            {"type": "tableRow", "content": [_cell("tableHeader", _para(_text("Platform"))), _cell("tableHeader", _para(_text("Result")))]},
+            {"type": "tableRow", "content": [_cell("tableCell", _para(_text("iOS")), _para(_text("17"))), _cell("tableCell", _para(_text("Fail")))]},
+        ]},
+        {"type": "mediaSingle", "content": [{"type": "media", "attrs": {"type": "file", "id": "1", "alt": "shot.png"}}]},
+        {"type": "mediaGroup", "content": [{"type": "media", "attrs": {"type": "file", "id": "2", "alt": "log.txt"}}]},
+    ]}
+
+    flattened = JiraFieldNormalizer().normalize_field_value(doc)
+
+    assert flattened.splitlines()[:2] == ["||Platform||Result||", "|iOS 17|Fail|"]
+    attachments, text = extract_attachments_markup(flattened)
+    assert attachments == ["!shot.png|thumbnail!", "[^log.txt]"]
+    assert is_media_only_line(text.splitlines()[2])
+
+
+def test_sections_are_detected_from_adf_headings():
+    doc = {"type": "doc", "content": [
+        {"type": "heading", "attrs": {"level": 3}, "content": [_text("Observed:")]},
+        _para(_text("크래시 발생")),
+        {"type": "heading", "attrs": {"level": 3}, "content": [_text("Expected:")]},
+        _para(_text("정상 진입")),
+    ]}
+
+    sections = extract_description_sections(flatten_adf(doc))
+
+    assert [header for header, _ in sections] == ["Observed:", "Expected:"]
+
+
+def test_deeply_nested_documents_do_not_hit_recursion_limit():
+    node = _para(_text("leaf"))
+    for _ in range(sys.getrecursionlimit() * 2):
+        node = {"type": "panel", "content": [node]}
+
+    assert flatten_adf({"type": "doc", "content": [node]}) == "leaf\n"
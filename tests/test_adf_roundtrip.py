@@ -0,0 +1,138 @@
+"""Tests for the ADF-native (v3) translation round trip."""
+
+import copy
+import sys
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# Stub openai before import
+if "openai" not in sys.modules:
+    openai_stub = types.ModuleType("openai")
+    openai_stub.OpenAI = MagicMock
+    sys.modules["openai"] = openai_stub
+
+import pytest
+
+from jira_trans import JiraTicketTranslator
+from modules.adf import TRANSLATION_COLOR, apply_adf_translations, extract_adf_segments, flatten_adf
+
+
+def _text(value, marks=None):
+    node = {"type": "text", "text": value}
+    if marks:
+        node["marks"] = marks
+    return node
+
+
+def _para(*children):
+    return {"type": "paragraph", "content": list(children)}
+
+
+DOC = {"type": "doc", "version": 1, "content": [
+    {"type": "heading", "attrs": {"level": 3}, "content": [_text("Observed:")]},
+    _para(_text("상점 진입 시 "), _text("크래시", [{"type": "strong"}]), _text(" 발생"), _text("Shop.Open()", [{"type": "code"}])),
+    {"type": "table", "content": [{"type": "tableRow", "content": [
+        {"type": "tableCell", "content": [_para(_text("재현율"))]},
+    ]}]},
+    {"type": "codeBlock", "content": [_text("NullReferenceException")]},
+    {"type": "mediaSingle", "content": [{"type": "media", "attrs": {"type": "file", "id": "1", "alt": "shot.png"}}]},
+    _para(_text("*[QA 환경 / QA Environment]*")),
+    _para(_text("빌드 1.2.3")),
+]}
+
+
+def test_segments_use_stable_paths_and_skip_code_headers_and_skip_sections():
+    segments = extract_adf_segments(DOC)
+
+    assert [(segment.path, segment.text) for segment in segments] == [
+        ((1, 0), "상점 진입 시 "),
+        ((1, 1), "크래시"),
+        ((1, 2), " 발생"),
+        ((2, 0, 0, 0, 0), "재현율"),
+    ]
+    assert segments[0].chunk_id("description") == "description@1.0"
+
+
+def test_translations_are_inserted_below_original_blocks():
+    translations = {(1, 0): "Crash", (1, 1): "occurs", (1, 2): "on shop entry", (2, 0, 0, 0, 0): "Repro rate"}
+    original = copy.deepcopy(DOC)
+
+    patched = apply_adf_translations(DOC, translations)
+
+    assert DOC == original
+    inserted = patched["content"][2]
+    assert [child["text"] for child in inserted["content"]] == ["Crash ", "occurs", " on shop entry", "Shop.Open()"]
+    assert {"type": "strong"} in inserted["content"][1]["marks"]
+    assert {"type": "textColor", "attrs": {"color": TRANSLATION_COLOR}} in inserted["content"][0]["marks"]
+    cell = patched["content"][3]["content"][0]["content"][0]["content"]
+    assert [flatten_adf(block).strip() for block in cell] == ["재현율", "{color:#4c9aff}Repro rate{color}"]
+    # 표/코드/미디어 구조는 그대로 유지된다
+    assert patched["content"][4] == DOC["content"][3]
+    assert patched["content"][5] == DOC["content"][4]
+
+    # 이미 번역 블록이 붙은 단락은 다시 번역하지 않는다
+    assert extract_adf_segments(patched) == []
+
+
+@pytest.fixture
+def translator(monkeypatch):
+    translator = JiraTicketTranslator(
+        jira_url="https://example.atlassian.net",
+        email="bot@example.com",
+        api_token="token",
+        openai_api_key="sk-test",
+    )
+    translator.fingerprint_store = None
+    translator.fetch_issue_adf = MagicMock(return_value={"summary": "상점 크래시", "description": copy.deepcopy(DOC)})
+    translator.update_issue_adf_fields = MagicMock()
+    translator.update_issue_fields = MagicMock()
+    translator._enforce_glossary_compliance = MagicMock(return_value=MagicMock(as_dict=dict))
+    translator._call_openai_batch = MagicMock(
+        side_effect=lambda chunks, target_language=None: {chunk.id: f"EN[{chunk.clean_text}]" for chunk in chunks}
+    )
+    return translator
+
+
+def test_translate_issue_adf_sends_one_batch_and_puts_patched_adf(translator):
+    result = translator.translate_issue_adf("P2-1", fields_to_translate=["summary", "description"], perform_update=True)
+
+    translator.fetch_issue_adf.assert_called_once_with("P2-1", ["summary", "description"])
+    translator._call_openai_batch.assert_called_once()
+    chunk_ids = [chunk.id for chunk in translator._call_openai_batch.call_args.args[0]]
+    assert chunk_ids == ["summary", "description@1.0", "description@1.1", "description@1.2", "description@2.0.0.0.0"]
+
+    translator.update_issue_fields.assert_not_called()
+    issue_key, payload = translator.update_issue_adf_fields.call_args.args
+    assert issue_key == "P2-1"
+    assert payload["description"]["type"] == "doc"
+    assert "EN[재현율]" in flatten_adf(payload["description"])
+    assert "EN[상점 크래시]" in payload["summary"]
+    assert result["updated"] is True and result["mode"] == "adf"
+
+
+def test_translate_issue_adf_falls_back_to_per_chunk_when_batch_fails(translator):
+    translator._call_openai_batch = MagicMock(side_effect=RuntimeError("batch failed"))
+    translator._translate_chunk_text = MagicMock(side_effect=lambda chunk, target_language=None: f"EN[{chunk.clean_text}]")
+
+    result = translator.translate_issue_adf("P2-1", fields_to_translate=["summary", "description"], perform_update=True)
+
+    assert translator._translate_chunk_text.call_count == 5
+    _, payload = translator.update_issue_adf_fields.call_args.args
+    assert "EN[재현율]" in flatten_adf(payload["description"])
+    assert "EN[상점 크래시]" in payload["summary"]
+    assert result["updated"] is True and result["error"] is None
+
+
+def test_handler_routes_adf_requests(monkeypatch):
+    import handler
+
+    monkeypatch.delenv("JIRA_ADF_MODE", raising=False)
+    assert "adf" not in handler._normalize_translation_request({"issue_key": "P2-1"})
+    assert handler._normalize_translation_request({"issue_key": "P2-1", "adf": True})["adf"] is True
+    monkeypatch.setenv("JIRA_ADF_MODE", "on")
+    assert handler._normalize_translation_request({"issue_key": "P2-1"})["adf"] is True
@@ -0,0 +1,122 @@
+"""Tests for the httpx-based AsyncJiraClient."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+httpx = pytest.importorskip("httpx")
+
+from modules.async_jira_client import AsyncJiraClient
+from modules.jira_client import JiraFieldNormalizer
+from modules.jira_transport import RetryPolicy
+
+ADF = {"type": "doc", "content": [{"type": "paragraph", "content": [{"type": "text", "text": "본문"}]}]}
+
+
+def _client(handler, **kwargs):
+    kwargs.setdefault("policy", RetryPolicy(backoff_base=0.0))
+    return AsyncJiraClient(
+        "https://example.atlassian.net/",
+        "bot@example.com",
+        "token",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+def test_fetch_issue_fields_matches_sync_normalization():
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(dict(request.url.params))
+        return httpx.Response(200, json={"fields": {"summary": " 요약 ", "description": ADF}})
+
+    async def run():
+        async with _client(handler) as client:
+            return await client.fetch_issue_fields("P2-1", ["summary", "description"])
+
+    assert asyncio.run(run()) == {"summary": "요약", "description": "본문"}
+    assert requests_seen == [{"fields": "summary,description"}]
+    assert JiraFieldNormalizer().normalize_field_value(ADF) == "본문"
+
+
+def test_fetch_many_overlaps_requests_within_concurrency_limit():
+    active = {"now": 0, "peak": 0}
+
+    async def handler(request):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        key = request.url.path.rsplit("/", 1)[-1]
+        if key == "P2-404":
+            return httpx.Response(404, json={})
+        return httpx.Response(200, json={"fields": {"summary": key}})
+
+    async def run():
+        async with _client(handler, max_concurrency=2) as client:
+            return await client.fetch_many(["P2-1", "P2-2", "P2-3", "P2-404"], ["summary"])
+
+    results = asyncio.run(run())
+
+    assert results["P2-1"] == {"summary": "P2-1"}
+    assert isinstance(results["P2-404"], httpx.HTTPStatusError)
+    assert active["peak"] == 2
+
+
+def test_update_retries_throttled_put_and_detects_steps_field():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        if request.method == "PUT":
+            if calls.count("PUT") == 1:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            assert json.loads(request.content) == {"fields": {"summary": "번역"}}
+            return httpx.Response(204)
+        return httpx.Response(200, json={
+            "projects": [{"issuetypes": [{"fields": {"customfield_20001": {"name": "Steps to Reproduce"}}}]}],
+        })
+
+    async def run():
+        async with _client(handler) as client:
+            await client.update_issue_fields("P2-1", {"summary": "번역"})
+            first = await client.detect_steps_field("NEW")
+            second = await client.detect_steps_field("NEW")
+            return first, second
+
+    assert asyncio.run(run()) == ("customfield_20001", "customfield_20001")
+    assert calls == ["PUT", "PUT", "GET"]
+
+
+def test_shares_site_token_bucket_with_sync_client(monkeypatch):
+    from modules import jira_transport
+
+    monkeypatch.setattr(jira_transport, "_SHARED_BUCKETS", {})
+    monkeypatch.setenv("JIRA_RATE_LIMIT", "5")
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"fields": {"summary": "요약"}})
+
+    async def run():
+        async with _client(handler) as client:
+            await client.fetch_issue_fields("P2-1", ["summary"])
+            return client.bucket
+
+    bucket = asyncio.run(run())
+
+    assert bucket is jira_transport.shared_token_bucket("https://example.atlassian.net")
+    assert bucket.rate == 5.0
+    # 토큰 2개 소비 (429 응답 + 재시도)
+    assert bucket._tokens < bucket.capacity - 1.5
@@ -0,0 +1,62 @@
+"""Tests for one-pass attachment placeholder extraction/restore."""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.formatting import extract_attachments_markup, restore_attachments_markup
+
+
+def test_images_and_attachments_are_numbered_in_document_order():
+    text = "[^log.txt] 로그\n!shot.png|thumbnail! 화면\n!raw.png! 그리고 [^clip.mp4]"
+
+    attachments, clean = extract_attachments_markup(text)
+
+    assert attachments == ["[^log.txt]", "!shot.png|thumbnail!", "!raw.png!", "[^clip.mp4]"]
+    assert clean == (
+        "__ATTACHMENT_PLACEHOLDER_0__ 로그\n__IMAGE_PLACEHOLDER_1__ 화면\n"
+        "__IMAGE_PLACEHOLDER_2__ 그리고 __ATTACHMENT_PLACEHOLDER_3__"
+    )
+    assert restore_attachments_markup(clean, attachments) == text
+
+
+def test_hundreds_of_inline_screenshots_round_trip():
+    lines = [f"{index}. 단계 !step_{index}.png|width=300! 참고 [^log_{index}.txt]" for index in range(600)]
+    text = "\n".join(lines)
+
+    attachments, clean = extract_attachments_markup(text)
+
+    assert len(attachments) == 1200
+    assert "!" not in clean and "[^" not in clean
+    assert "__IMAGE_PLACEHOLDER_1198__" in clean
+    assert "__ATTACHMENT_PLACEHOLDER_1199__" in clean
+    assert restore_attachments_markup(clean, attachments) == text
+
+    # 번역 결과에서 순서가 바뀌어도 번호로 원본을 찾는다
+    translated = "\n".join(reversed(clean.split("\n")))
+    assert restore_attachments_markup(translated, attachments) == "\n".join(reversed(lines))
+
+
+def test_restore_looks_up_by_full_index():
+    attachments = [f"!img_{index}.png!" for index in range(12)]
+    text = "__IMAGE_PLACEHOLDER_1__ __IMAGE_PLACEHOLDER_10__ __IMAGE_PLACEHOLDER_11__"
+
+    assert restore_attachments_markup(text, attachments) == "!img_1.png! !img_10.png! !img_11.png!"
+
+
+def test_restored_markup_is_not_substituted_again():
+    attachments = ["[^__IMAGE_PLACEHOLDER_1__.txt]", "!real.png!"]
+    text = "__ATTACHMENT_PLACEHOLDER_0__ / __IMAGE_PLACEHOLDER_1__"
+
+    assert restore_attachments_markup(text, attachments) == "[^__IMAGE_PLACEHOLDER_1__.txt] / !real.png!"
+
+
+def test_unknown_placeholders_are_left_as_is():
+    attachments, clean = extract_attachments_markup("!a.png!")
+
+    assert restore_attachments_markup(f"{clean} __IMAGE_PLACEHOLDER_7__", attachments) == "!a.png! __IMAGE_PLACEHOLDER_7__"
+    assert restore_attachments_markup("텍스트", []) == "텍스트"
+    assert extract_attachments_markup("") == ([], "")
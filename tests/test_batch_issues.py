@@ -0,0 +1,194 @@
+"""Tests for multi-issue batch translation (issue_keys / jql)."""
+
+import json
+import sys
+import threading
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# Stub openai before import
+if "openai" not in sys.modules:
+    openai_stub = types.ModuleType("openai")
+    openai_stub.OpenAI = MagicMock
+    sys.modules["openai"] = openai_stub
+
+import pytest
+
+import handler
+from jira_trans import JiraTicketTranslator
+
+ISSUES = {
+    "P2-1": {"summary": "[Client] 로비에서 크래시 발생", "description": "로비 진입 시 종료"},
+    "P2-2": {"summary": "[UI] 상점 버튼이 보이지 않음"},
+    "P2-3": {"summary": "Crash when entering lobby"},
+}
+
+
+def _build_translator():
+    return JiraTicketTranslator(
+        jira_url="https://example.atlassian.net",
+        email="bot@example.com",
+        api_token="token",
+        openai_api_key="sk-test",
+    )
+
+
+@pytest.fixture
+def patched(monkeypatch):
+    calls = {"batches": [], "updates": []}
+    lock = threading.Lock()
+
+    def fake_fetch(self, issue_key, fields):
+        if issue_key not in ISSUES:
+            raise RuntimeError(f"404 {issue_key}")
+        return dict(ISSUES[issue_key])
+
+    def fake_batch(self, chunks, target_language=None, retries=2):
+        with lock:
+            calls["batches"].append([chunk.id for chunk in chunks])
+        return {chunk.id: f"T:{chunk.clean_text}" for chunk in chunks}
+
+    def fake_update(self, issue_key, payload):
+        with lock:
+            calls["updates"].append(issue_key)
+
+    monkeypatch.setattr(JiraTicketTranslator, "fetch_issue_fields", fake_fetch)
+    monkeypatch.setattr(JiraTicketTranslator, "_call_openai_batch", fake_batch)
+    monkeypatch.setattr(JiraTicketTranslator, "update_issue_fields", fake_update)
+    monkeypatch.setattr(JiraTicketTranslator, "_enforce_glossary_compliance", lambda self, *args: MagicMock(as_dict=dict))
+    return calls
+
+
+def test_summaries_sharing_glossary_and_direction_are_packed(patched):
+    translator = _build_translator()
+
+    result = translator.translate_issues(["P2-1", "P2-2", "P2-3"], fields_to_translate=["summary"], max_workers=3)
+
+    packed = [batch for batch in patched["batches"] if any("::" in chunk_id for chunk_id in batch)]
+    assert packed == [["P2-1::summary", "P2-2::summary"]]
+    # 묶어서 번역한 summary는 이슈별 배치에서 다시 요청하지 않는다
+    assert ["summary"] in patched["batches"]  # P2-3 (영어 summary, 방향이 달라 단독)
+    assert patched["batches"].count(["summary"]) == 1
+    assert result["batch"] == {
+        "total": 3,
+        "succeeded": 3,
+        "failed": 0,
+        "packed_summaries": 2,
+        "packed_batches": 1,
+    }
+    assert list(result["results"]) == ["P2-1", "P2-2", "P2-3"]
+    assert result["results"]["P2-1"]["results"]["summary"]["translated"] == "T:로비에서 크래시 발생"
+
+
+def test_failed_issue_is_reported_without_affecting_others(patched):
+    translator = _build_translator()
+
+    result = translator.translate_issues(["P2-1", "P2-404"], perform_update=True, max_workers=2)
+
+    assert set(result["results"]) == {"P2-1"}
+    assert result["errors"]["P2-404"]["type"] == "RuntimeError"
+    assert patched["updates"] == ["P2-1"]
+
+
+def test_prefetched_fields_skip_per_issue_fetch(patched, monkeypatch):
+    translator = _build_translator()
+    fetched = []
+    monkeypatch.setattr(JiraTicketTranslator, "fetch_issue_fields", lambda self, key, fields: fetched.append(key) or {})
+
+    result = translator.translate_issues(
+        ["P2-1", "P2-2"],
+        fields_to_translate=["summary"],
+        prefetched={"P2-1": dict(ISSUES["P2-1"])},
+        prefetched_fields=["summary", "description"],
+    )
+
+    # P2-1은 검색 결과를 그대로 쓰고, prefetch가 없는 P2-2만 개별 fetch
+    assert fetched == ["P2-2"]
+    assert result["results"]["P2-1"]["results"]["summary"]["translated"] == "T:로비에서 크래시 발생"
+
+
+def test_field_hint_strips_packed_issue_prefix():
+    from modules.translation_engine import TranslationEngine
+
+    assert TranslationEngine._field_hint("P2-1::summary") == "summary"
+    assert TranslationEngine._field_hint("P2-1::customfield_10399") == "steps"
+
+
+def test_fork_shares_clients_but_not_glossary_state():
+    translator = _build_translator()
+    clone = translator.fork()
+    clone.translation_engine.load_glossary("pubg_outbreak_glossary.json", "PUBG Outbreak")
+
+    assert clone.jira_client is translator.jira_client
+    assert clone.translation_engine.openai is translator.translation_engine.openai
+    assert translator.prompt_builder.glossary_entries == []
+
+
+class _DummyBatchTranslator:
+    last_call = None
+
+    def __init__(self, **kwargs):
+        pass
+
+    def search_issues(self, jql, fields, page_size=100, expand_rendered=None):
+        _DummyBatchTranslator.search_call = {"jql": jql, "fields": list(fields)}
+        yield "P2-9", {"summary": "nine"}
+        yield "P2-1", {"summary": "one"}
+
+    def translate_issues(self, issue_keys, **kwargs):
+        _DummyBatchTranslator.last_call = {"issue_keys": list(issue_keys), **kwargs}
+        return {"results": {}, "errors": {}, "batch": {"total": len(issue_keys)}}
+
+
+def _set_env(monkeypatch):
+    monkeypatch.setenv("JIRA_URL", "https://example.atlassian.net")
+    monkeypatch.setenv("JIRA_EMAIL", "bot@example.com")
+    monkeypatch.setenv("JIRA_API_TOKEN", "token")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(handler, "JiraTicketTranslator", _DummyBatchTranslator)
+    monkeypatch.setattr(handler, "_TRANSLATOR_CACHE", {})
+    _DummyBatchTranslator.last_call = None
+
+
+def _json_event(payload: dict) -> dict:
+    return {"headers": {"Content-Type": "application/json"}, "body": json.dumps(payload)}
+
+
+def test_handler_accepts_issue_keys_and_jql(monkeypatch):
+    _set_env(monkeypatch)
+    monkeypatch.setenv("BATCH_CONCURRENCY", "3")
+
+    resp = handler.lambda_handler(
+        _json_event({"issue_keys": "p2-1, P2-2", "jql": "project = P2", "concurrency": 8}),
+        context=None,
+    )
+
+    assert resp["statusCode"] == 200
+    assert json.loads(resp["body"])["issue_keys"] == ["P2-1", "P2-2", "P2-9"]
+    assert _DummyBatchTranslator.last_call["max_workers"] == 3
+    assert set(_DummyBatchTranslator.last_call["prefetched"]) == {"P2-9", "P2-1"}
+    assert _DummyBatchTranslator.search_call["fields"][:2] == ["summary", "description"]
+
+
+def test_handler_rejects_invalid_issue_keys(monkeypatch):
+    _set_env(monkeypatch)
+
+    resp = handler.lambda_handler(_json_event({"issue_keys": ["P2-1", "not a key"]}), context=None)
+
+    assert resp["statusCode"] == 400
+    assert "Invalid issue_keys" in json.loads(resp["body"])["error"]
+
+
+def test_handler_enforces_max_issue_count(monkeypatch):
+    _set_env(monkeypatch)
+    monkeypatch.setenv("BATCH_MAX_ISSUES", "2")
+
+    resp = handler.lambda_handler(_json_event({"issue_keys": ["P2-1", "P2-2", "P2-3"]}), context=None)
+
+    assert resp["statusCode"] == 400
+    assert _DummyBatchTranslator.last_call is None
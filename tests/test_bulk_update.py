@@ -0,0 +1,126 @@
+"""Tests for the concurrent bulk update writer."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.bulk_update import BulkUpdateWriter, UpdateCheckpoint
+from modules.jira_transport import TokenBucket
+
+
+class _HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.response = MagicMock(status_code=status_code)
+
+
+class _FakeClient:
+    def __init__(self, failures=None, delay=0.0):
+        self.failures = dict(failures or {})
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def update_issue_fields(self, issue_key, payload):
+        with self._lock:
+            self.calls.append(issue_key)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            remaining = self.failures.get(issue_key)
+            if remaining:
+                self.failures[issue_key] = remaining[1:]
+        try:
+            time.sleep(self.delay)
+            if remaining:
+                raise remaining[0]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _writer(client, **kwargs):
+    return BulkUpdateWriter(client, **kwargs)
+
+
+def test_updates_run_concurrently_and_are_summarized():
+    client = _FakeClient(delay=0.02)
+    updates = ((f"P2-{n}", {"summary": f"EN {n}"}) for n in range(20))
+
+    summary = _writer(client, max_concurrency=5).run(updates)
+
+    assert summary.succeeded == 20 and summary.failed == 0
+    assert 1 < client.max_active <= 5
+    assert summary.as_dict()["requests_per_second"] > 0
+
+
+def test_failures_are_not_resent_on_top_of_transport_retries():
+    client = _FakeClient(failures={
+        "P2-1": [_HTTPError(503)],
+        "P2-2": [_HTTPError(404)],
+        # PUT 응답 대기 타임아웃: 이미 적용됐을 수 있으므로 다시 보내면 안 된다
+        "P2-3": [TimeoutError("read timed out")],
+    })
+    client.transport_stats = MagicMock(side_effect=[{"retries": 3}, {"retries": 7}])
+
+    summary = _writer(client).run([("P2-1", {"a": "1"}), ("P2-2", {"a": "1"}), ("P2-3", {"a": "1"})])
+
+    assert summary.failed == 3
+    assert summary.failures["P2-2"]["status"] == 404
+    assert summary.failures["P2-3"]["type"] == "TimeoutError"
+    assert sorted(client.calls) == ["P2-1", "P2-2", "P2-3"]
+    # 재시도 횟수는 실행 동안 transport가 기록한 값
+    assert summary.retries == 4
+
+
+def test_empty_payloads_are_checkpointed(tmp_path):
+    path = str(tmp_path / "backfill.jsonl")
+    updates = [("P2-1", {}), ("P2-2", {"summary": "x"})]
+
+    first = _writer(_FakeClient(), checkpoint_path=path).run(updates)
+    assert first.succeeded == 2
+    assert UpdateCheckpoint(path).completed() == {"P2-1", "P2-2"}
+
+    client = _FakeClient()
+    second = _writer(client, checkpoint_path=path).run(updates)
+    assert client.calls == []
+    assert second.skipped == 2
+
+
+def test_checkpoint_resumes_after_failure(tmp_path):
+    path = str(tmp_path / "backfill.jsonl")
+    updates = [(f"P2-{n}", {"summary": "x"}) for n in range(4)]
+
+    first = _writer(_FakeClient(failures={"P2-2": [_HTTPError(400)]}), checkpoint_path=path).run(updates)
+    assert first.failed == 1
+    assert UpdateCheckpoint(path).completed() == {"P2-0", "P2-1", "P2-3"}
+
+    client = _FakeClient()
+    second = _writer(client, checkpoint_path=path).run(updates)
+    assert client.calls == ["P2-2"]
+    assert second.skipped == 3 and second.succeeded == 1
+    assert UpdateCheckpoint(path).completed() == {"P2-0", "P2-1", "P2-2", "P2-3"}
+
+
+def test_explicit_bucket_limits_request_rate():
+    waits = []
+    now = [0.0]
+
+    def fake_sleep(seconds):
+        waits.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=10, capacity=1, clock=lambda: now[0], sleep=fake_sleep)
+    client = _FakeClient()
+
+    _writer(client, max_concurrency=1, bucket=bucket).run((f"P2-{n}", {"a": "1"}) for n in range(5))
+
+    assert len(client.calls) == 5
+    assert round(sum(waits), 6) == 0.4
@@ -0,0 +1,163 @@
+"""Tests for fingerprint-based change detection on re-translation."""
+
+import sys
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# Stub openai before import
+if "openai" not in sys.modules:
+    openai_stub = types.ModuleType("openai")
+    openai_stub.OpenAI = MagicMock
+    sys.modules["openai"] = openai_stub
+
+import pytest
+
+import jira_trans
+from jira_trans import JiraTicketTranslator
+from modules.fingerprints import InMemoryFingerprintStore, SQLiteFingerprintStore
+
+
+@pytest.fixture
+def jira(monkeypatch):
+    """Jira 이슈 상태를 흉내 내는 fake (update하면 다음 fetch에 반영)."""
+    state = {
+        "fields": {"summary": "로비에서 크래시 발생", "description": "로비 진입 시 종료"},
+        "batches": 0,
+        "updates": 0,
+    }
+
+    def fake_fetch(self, issue_key, fields):
+        return {field: state["fields"][field] for field in fields if state["fields"].get(field)}
+
+    def fake_batch(self, chunks, target_language=None, retries=2):
+        state["batches"] += 1
+        return {chunk.id: f"EN {chunk.clean_text}" for chunk in chunks}
+
+    def fake_update(self, issue_key, payload):
+        state["updates"] += 1
+        state["fields"].update(payload)
+
+    monkeypatch.setattr(JiraTicketTranslator, "fetch_issue_fields", fake_fetch)
+    monkeypatch.setattr(JiraTicketTranslator, "_call_openai_batch", fake_batch)
+    monkeypatch.setattr(JiraTicketTranslator, "update_issue_fields", fake_update)
+    monkeypatch.setattr(JiraTicketTranslator, "_enforce_glossary_compliance", lambda self, *args: MagicMock(as_dict=dict))
+    return state
+
+
+def _translator():
+    return JiraTicketTranslator(
+        jira_url="https://example.atlassian.net",
+        email="bot@example.com",
+        api_token="token",
+        openai_api_key="sk-test",
+    )
+
+
+def test_unchanged_issue_is_skipped_before_llm_call(jira):
+    translator = _translator()
+    fields = ["summary", "description"]
+
+    first = translator.translate_issue("P2-1", fields_to_translate=fields, perform_update=True)
+    assert first["updated"] is True
+    assert jira["batches"] == 1
+
+    # 우리 PUT이 일으킨 재호출: 필드가 번역 결과로 바뀌었지만 기록된 fingerprint와 같다
+    second = translator.translate_issue("P2-1", fields_to_translate=fields, perform_update=True)
+    assert second["skipped"] == "unchanged"
+    assert jira["batches"] == 1
+    assert jira["updates"] == 1
+
+    # 미리보기(update 없음)는 항상 번역한다
+    translator.translate_issue("P2-1", fields_to_translate=fields, perform_update=False)
+    assert jira["batches"] == 2
+
+
+def test_changed_source_or_prompt_version_is_retranslated(jira, monkeypatch):
+    translator = _translator()
+    fields = ["description"]
+
+    translator.translate_issue("P2-1", fields_to_translate=fields, perform_update=True)
+    jira["fields"]["description"] = "상점 진입 시 종료"
+    result = translator.translate_issue("P2-1", fields_to_translate=fields, perform_update=True)
+    assert "skipped" not in result
+    assert jira["batches"] == 2
+
+    # 프롬프트 버전이 바뀌면 fingerprint가 달라져 기존 판별 로직으로 넘어간다
+    assert translator.translate_issue("P2-1", fields_to_translate=fields, perform_update=True)["skipped"] == "unchanged"
+    monkeypatch.setattr(jira_trans, "PROMPT_VERSION", "next")
+    assert "skipped" not in translator.translate_issue("P2-1", fields_to_translate=fields, perform_update=True)
+
+
+def test_failed_update_does_not_record_fingerprint(jira, monkeypatch):
+    translator = _translator()
+    monkeypatch.setattr(JiraTicketTranslator, "update_issue_fields", MagicMock(side_effect=RuntimeError("409")))
+
+    translator.translate_issue("P2-1", fields_to_translate=["summary"], perform_update=True)
+    translator.translate_issue("P2-1", fields_to_translate=["summary"], perform_update=True)
+
+    assert jira["batches"] == 2
+
+
+def test_partially_translated_issue_is_retried(jira, monkeypatch):
+    translator = _translator()
+    calls = []
+
+    def flaky_batch(self, chunks, target_language=None, retries=2):
+        calls.append([chunk.id for chunk in chunks])
+        # 첫 호출에서는 description 번역이 빠진다 (summary만 업데이트됨)
+        return {chunk.id: f"EN {chunk.clean_text}" for chunk in chunks if len(calls) > 1 or chunk.id == "summary"}
+
+    monkeypatch.setattr(JiraTicketTranslator, "_call_openai_batch", flaky_batch)
+
+    first = translator.translate_issue("P2-1", fields_to_translate=["summary", "description"], perform_update=True)
+    second = translator.translate_issue("P2-1", fields_to_translate=["summary", "description"], perform_update=True)
+
+    # description은 번역 라인 없이 원문만 남는다
+    assert first["updated"] is True and "{color" not in first["update_payload"]["description"]
+    assert len(calls) == 2
+    assert "{color:#4c9aff}EN 로비 진입 시 종료{color}" in second["update_payload"]["description"]
+
+
+def test_partially_translated_adf_issue_is_not_fingerprinted():
+    translator = _translator()
+    doc = {"type": "doc", "version": 1, "content": [{"type": "paragraph", "content": [{"type": "text", "text": "로비 진입 시 종료"}]}]}
+    translator.fetch_issue_adf = MagicMock(return_value={"summary": "로비에서 크래시 발생", "description": doc})
+    translator.update_issue_adf_fields = MagicMock()
+    translator._enforce_glossary_compliance = MagicMock(return_value=MagicMock(as_dict=dict))
+    translator._call_openai_batch = MagicMock(return_value={"summary": "Crash in lobby"})
+
+    translator.translate_issue_adf("P2-1", fields_to_translate=["summary", "description"], perform_update=True)
+    translator.translate_issue_adf("P2-1", fields_to_translate=["summary", "description"], perform_update=True)
+
+    assert translator._call_openai_batch.call_count == 2
+
+
+def test_reverted_translation_is_translated_again(jira):
+    translator = _translator()
+    original = dict(jira["fields"])
+
+    translator.translate_issue("P2-1", fields_to_translate=["summary", "description"], perform_update=True)
+    # 누군가 번역을 되돌려 원문만 남긴 경우
+    jira["fields"].update(original)
+    result = translator.translate_issue("P2-1", fields_to_translate=["summary", "description"], perform_update=True)
+
+    assert jira["batches"] == 2
+    assert result["updated"] is True
+    assert jira["updates"] == 2
+
+
+def test_fingerprint_stores_keep_recent_values(tmp_path):
+    for store in (InMemoryFingerprintStore(), SQLiteFingerprintStore(str(tmp_path / "fp.sqlite3"))):
+        store.put("p2-1", ["a", "b"])
+        store.put("P2-1", ["c"])
+        assert store.contains("P2-1", "a")
+        assert store.get("P2-1")[0] == "c"
+        assert store.get("P2-2") == []
+
+    reopened = SQLiteFingerprintStore(str(tmp_path / "fp.sqlite3"))
+    assert reopened.contains("P2-1", "c")
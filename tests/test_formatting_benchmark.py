@@ -0,0 +1,62 @@
+"""Tests for the synthetic ticket generator and benchmark baseline comparison."""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from benchmarks.formatting_suite import compare
+from benchmarks.synthetic_ticket import format_size, generate_ticket, parse_size
+from modules import formatting
+
+
+def test_parse_and_format_size():
+    assert parse_size("512") == 512
+    assert parse_size("1KB") == 1024
+    assert parse_size("2.5mb") == int(2.5 * 1024 * 1024)
+    assert format_size(5 * 1024 * 1024) == "5MB"
+    assert format_size(64 * 1024) == "64KB"
+    with pytest.raises(ValueError):
+        parse_size("big")
+
+
+def test_generator_is_deterministic_and_reaches_target_size():
+    first = generate_ticket(parse_size("16KB"), seed=3)
+
+    assert first == generate_ticket(parse_size("16KB"), seed=3)
+    assert first != generate_ticket(parse_size("16KB"), seed=4)
+    assert first.size_bytes >= 16 * 1024
+    assert first.size_bytes == len(first.description.encode("utf-8"))
+    sections = formatting.extract_description_sections(first.description)
+    assert len(sections) > 5
+    assert any("{code" in content for _, content in sections)
+    assert any(content.lstrip().startswith("||") or "\n||" in content for _, content in sections)
+    attachments, _ = formatting.extract_attachments_markup(first.description)
+    assert attachments
+
+
+def test_compare_flags_only_regressions_beyond_threshold():
+    baseline = {
+        "results": {
+            "a@1MB": {"best_ms": 100.0, "peak_kib": 1000.0},
+            "b@1MB": {"best_ms": 100.0, "peak_kib": 1000.0},
+            "tiny@1KB": {"best_ms": 0.1, "peak_kib": 10.0},
+            "gone@1MB": {"best_ms": 1.0, "peak_kib": 1.0},
+        }
+    }
+    current = {
+        "results": {
+            "a@1MB": {"best_ms": 140.0, "peak_kib": 1300.0},
+            "b@1MB": {"best_ms": 200.0, "peak_kib": 900.0},
+            "tiny@1KB": {"best_ms": 0.5, "peak_kib": 10.0},
+        }
+    }
+
+    assert compare(current, baseline) == [
+        "a@1MB peak_kib: 1000.0 -> 1300.0 (1.30x)",
+        "b@1MB best_ms: 100.0 -> 200.0 (2.00x)",
+    ]
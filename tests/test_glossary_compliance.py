@@ -0,0 +1,189 @@
+"""Tests for post-translation glossary compliance check + selective repair."""
+
+import sys
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# Stub openai before import
+if "openai" not in sys.modules:
+    openai_stub = types.ModuleType("openai")
+    openai_stub.OpenAI = MagicMock
+    sys.modules["openai"] = openai_stub
+
+from models import GlossaryEntry, TranslationChunk
+from modules.glossary_compliance import check_compliance
+from modules.glossary_matcher import TermMatcher
+
+
+ENTRIES = [
+    GlossaryEntry(id="Ranked", en="Ranked", ko="경쟁전"),
+    GlossaryEntry(id="Map Service", en="Map Service", ko="맵 서비스"),
+    GlossaryEntry(id="Map Service Report", en="Map Service Report", ko="맵 서비스 리포트"),
+    GlossaryEntry(id="Rifle", en="Rifle", ko="소총", aliases_en=("Long Gun",)),
+]
+
+
+class TestTermMatcher:
+    def test_korean_target_substring_match_allows_particles(self):
+        matcher = TermMatcher.for_target_language(ENTRIES, "ko")
+        assert "Ranked" in matcher.find_entry_ids("경쟁전에서 크래시가 발생합니다.")
+
+    def test_short_korean_term_requires_boundary(self):
+        matcher = TermMatcher.for_target_language(ENTRIES, "ko")
+        assert "Rifle" not in matcher.find_entry_ids("돌격소총이 사라짐")
+        assert "Rifle" in matcher.find_entry_ids("소총 이 사라짐")
+
+    def test_english_target_boundary_and_alias(self):
+        matcher = TermMatcher.for_target_language(ENTRIES, "en")
+        assert matcher.find_entry_ids("The long gun disappears") == {"Rifle"}
+        assert matcher.find_entry_ids("Unranked lobby") == set()
+
+    def test_prefix_terms_are_reported_with_longer_match(self):
+        matcher = TermMatcher.for_target_language(ENTRIES, "en")
+        found = matcher.find_entry_ids("Open the map service report.")
+        assert found == {"Map Service", "Map Service Report"}
+
+
+class TestCheckCompliance:
+    def test_rate_and_non_compliant_chunks(self):
+        matcher = TermMatcher.for_target_language(ENTRIES, "ko")
+        report = check_compliance(
+            {
+                "summary": [ENTRIES[0]],
+                "description__section_0": [ENTRIES[0], ENTRIES[3]],
+            },
+            {
+                "summary": "경쟁전 크래시",
+                "description__section_0": "Ranked 모드에서 소총 이 사라짐",
+            },
+            matcher,
+        )
+        assert report.expected_terms == 3
+        assert report.missing_terms == 1
+        assert [item.chunk_id for item in report.non_compliant] == ["description__section_0"]
+        assert report.as_dict()["non_compliant_chunks"] == {"description__section_0": ["Ranked"]}
+
+    def test_empty_report_rate_is_one(self):
+        matcher = TermMatcher.for_target_language(ENTRIES, "ko")
+        report = check_compliance({}, {}, matcher)
+        assert report.rate == 1.0
+
+
+def _build_translator():
+    from jira_trans import JiraTicketTranslator
+
+    translator = JiraTicketTranslator(
+        jira_url="https://example.atlassian.net",
+        email="bot@example.com",
+        api_token="token",
+        openai_api_key="sk-test",
+    )
+    translator.prompt_builder.set_glossary(glossary_entries=ENTRIES)
+    return translator
+
+
+def _chunk(chunk_id: str, text: str) -> TranslationChunk:
+    return TranslationChunk(id=chunk_id, field=chunk_id, original_text=text, clean_text=text, attachments=[])
+
+
+class TestEnforceGlossaryCompliance:
+    def test_only_non_compliant_chunks_are_sent_to_repair(self):
+        translator = _build_translator()
+        chunks = [_chunk("summary", "Ranked crash"), _chunk("customfield_10399", "1. Enter Ranked")]
+        translations = {"summary": "경쟁전 크래시", "customfield_10399": "1. Ranked 입장"}
+
+        captured = {}
+
+        def fake_repair(chunks_arg, translations_arg, report, direction_lang):
+            captured["ids"] = [item.chunk_id for item in report.non_compliant]
+            captured["direction"] = direction_lang
+            return {"customfield_10399": "1. 경쟁전 입장"}
+
+        translator._repair_glossary_batch = fake_repair
+
+        report = translator._enforce_glossary_compliance(chunks, translations, target_language="Korean")
+
+        assert captured == {"ids": ["customfield_10399"], "direction": "en"}
+        assert translations["customfield_10399"] == "1. 경쟁전 입장"
+        assert report.repaired_chunk_ids == ["customfield_10399"]
+        assert report.rate == 1.0
+
+    def test_repair_not_applied_when_it_does_not_improve(self):
+        translator = _build_translator()
+        chunks = [_chunk("summary", "Ranked crash")]
+        translations = {"summary": "Ranked 크래시"}
+        translator._repair_glossary_batch = lambda *args: {"summary": "랭크 크래시"}
+
+        report = translator._enforce_glossary_compliance(chunks, translations, target_language="Korean")
+
+        assert translations["summary"] == "Ranked 크래시"
+        assert report.repaired_chunk_ids == []
+        assert report.rate == 0.0
+
+    def test_repair_failure_keeps_translations(self):
+        translator = _build_translator()
+        chunks = [_chunk("summary", "Ranked crash")]
+        translations = {"summary": "Ranked 크래시"}
+
+        def boom(*args):
+            raise RuntimeError("repair boom")
+
+        translator._repair_glossary_batch = boom
+
+        report = translator._enforce_glossary_compliance(chunks, translations, target_language="Korean")
+
+        assert translations["summary"] == "Ranked 크래시"
+        assert len(report.non_compliant) == 1
+
+    def test_translate_issue_exposes_compliance_metric(self):
+        translator = _build_translator()
+        translator.fetch_issue_fields = lambda issue_key, fields: {"summary": "Ranked crash"}
+        translator.translation_engine.load_glossary = (
+            lambda filename, name: translator.prompt_builder.set_glossary(glossary_entries=ENTRIES)
+        )
+        translator._call_openai_batch = lambda chunks, target_language: {"summary": "경쟁전 크래시"}
+
+        result = translator.translate_issue("P2-1", target_language="Korean", fields_to_translate=["summary"])
+
+        assert result["metrics"]["glossary_compliance"]["rate"] == 1.0
+        assert result["metrics"]["glossary_compliance"]["expected_terms"] == 1
+
+
+def test_expected_entries_accumulate_across_filter_calls():
+    translator = _build_translator()
+    engine = translator.translation_engine
+    # LLM 필터가 호출마다 Rifle만 빼고 통과시킨다고 가정
+    engine._filter_glossary_by_llm = lambda candidates, texts: [entry for entry in candidates if entry.id != "Rifle"]
+    first = _chunk("description__section_0", "Ranked crash")
+    second = _chunk("description__section_1", "Map Service error with Rifle")
+    pretranslated = _chunk("summary", "Ranked lobby")
+
+    # 하위 배치 2번 (또는 청크별 fallback)으로 나뉘어 필터가 두 번 호출된 경우
+    engine._build_filtered_glossary_instruction([first.clean_text], source_lang="en")
+    engine._build_filtered_glossary_instruction([second.clean_text], source_lang="en")
+
+    expected = engine.expected_glossary_entries([first, second, pretranslated], "en")
+
+    assert [entry.id for entry in expected["description__section_0"]] == ["Ranked"]
+    assert [entry.id for entry in expected["description__section_1"]] == ["Map Service"]
+    # 이 엔진의 필터를 거치지 않은 청크는 후보 전체를 기대한다
+    assert [entry.id for entry in expected["summary"]] == ["Ranked"]
+
+    translator.reset_request_state()
+    assert engine.selected_glossary_entry_ids == {}
+
+
+def test_reset_request_state_clears_previous_glossary():
+    translator = _build_translator()
+    translator.translation_engine.selected_glossary_entry_ids = {"Ranked crash": {"Ranked"}}
+
+    translator.reset_request_state()
+
+    assert translator.prompt_builder.glossary_entries == []
+    assert translator.glossary_terms == {}
+    assert translator.translation_engine.selected_glossary_entry_ids == {}
@@ -0,0 +1,169 @@
+"""Tests for the shared glossary matcher, glossary cache and warm-up preload."""
+
+import json
+import random
+import re
+import sys
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# Stub openai before import
+if "openai" not in sys.modules:
+    openai_stub = types.ModuleType("openai")
+    openai_stub.OpenAI = MagicMock
+    sys.modules["openai"] = openai_stub
+
+from models import GlossaryEntry
+from prompts import PromptBuilder
+from modules import translation_engine as te_mod
+from modules.glossary_matcher import TermMatcher
+
+
+ENTRIES = [
+    GlossaryEntry(id="Ranked", en="Ranked", ko="경쟁전"),
+    GlossaryEntry(id="Map Service", en="Map Service", ko="맵 서비스"),
+    GlossaryEntry(id="Map", en="Map", ko="맵"),
+    GlossaryEntry(id="Rifle", en="Rifle", ko="소총", aliases_en=("Long Gun",)),
+    GlossaryEntry(id="Assault Rifle", en="Assault Rifle", ko="돌격소총"),
+    GlossaryEntry(id="Locked & Loaded", en="Locked & Loaded", ko="완전 무장"),
+]
+
+
+def _reference_candidates(entries, texts):
+    """entry마다 정규식을 돌리던 기존 1단계 매칭 (동작 비교 기준)."""
+
+    def boundary(term, text):
+        normalized = (term or "").strip().lower()
+        return bool(normalized) and re.search(rf"(?<!\w){re.escape(normalized)}(?!\w)", text) is not None
+
+    def ko_match(term, text):
+        normalized = (term or "").strip().lower()
+        if re.search(r"[가-힣]", normalized) and len(normalized) > 2:
+            return normalized in text
+        return boundary(normalized, text)
+
+    text = "\n".join(texts).lower()
+    return [
+        entry
+        for entry in entries
+        if any(boundary(term, text) for term in (entry.en, *entry.aliases_en) if term)
+        or any(ko_match(term, text) for term in (entry.ko, *entry.aliases_ko) if term)
+    ]
+
+
+class TestCandidateMatching:
+    def test_matches_reference_on_mixed_text(self):
+        builder = PromptBuilder({}, "", ENTRIES)
+        text = "Map Service에서 돌격소총 이 사라짐. Locked & Loaded 발동, 맵 이동"
+        assert builder.get_candidate_entries([text]) == _reference_candidates(ENTRIES, [text])
+
+    def test_matches_reference_on_random_texts(self):
+        builder = PromptBuilder({}, "", ENTRIES)
+        words = [e.en for e in ENTRIES] + [e.ko for e in ENTRIES] + ["long gun", "maps", "에서", "_"]
+        rng = random.Random(7)
+        for _ in range(300):
+            text = " ".join(
+                rng.choice(words) + rng.choice(["", "s", "를", " ", "_", "."]) for _ in range(rng.randint(1, 12))
+            )
+            assert builder.get_candidate_entries([text]) == _reference_candidates(ENTRIES, [text]), text
+
+    def test_same_term_in_boundary_and_substring_tables(self):
+        # en 용어는 항상 경계 매칭, 3자 이상 ko 용어는 substring 매칭
+        matcher = TermMatcher({"경쟁전": {0}}, {"경쟁전": {1}})
+        assert matcher.find_entry_ids("경쟁전에서") == {1}
+        assert matcher.find_entry_ids("경쟁전 시작") == {0, 1}
+
+    def test_set_glossary_replaces_index(self):
+        builder = PromptBuilder({}, "", ENTRIES)
+        assert builder.get_candidate_entries(["Ranked"])
+        builder.set_glossary(glossary_entries=[GlossaryEntry(id="Lobby", en="Lobby", ko="로비")])
+        assert builder.get_candidate_entries(["Ranked"]) == []
+        assert [e.id for e in builder.get_candidate_entries(["로비"])] == ["Lobby"]
+
+
+def _make_engine(monkeypatch, tmp_path):
+    engine = te_mod.TranslationEngine.__new__(te_mod.TranslationEngine)
+    engine.openai = MagicMock()
+    engine.openai_model = "gpt-5.2"
+    engine.prompt_builder = PromptBuilder({}, "")
+    engine._last_loaded_glossary_entries = []
+    monkeypatch.setattr(te_mod.Path, "resolve", lambda self: tmp_path / "modules" / "translation_engine.py")
+    (tmp_path / "glossaries").mkdir(parents=True, exist_ok=True)
+    return engine
+
+
+class TestGlossaryCache:
+    def test_entries_are_parsed_once_until_file_changes(self, monkeypatch, tmp_path):
+        engine = _make_engine(monkeypatch, tmp_path)
+        path = tmp_path / "glossaries" / "cache.json"
+        path.write_text(json.dumps({"terms": {"Ultimate": "궁극기"}}, ensure_ascii=False), encoding="utf-8")
+
+        calls = []
+        original = te_mod.TranslationEngine._read_glossary_entries
+
+        def counting_read(self, filename):
+            calls.append(filename)
+            return original(self, filename)
+
+        monkeypatch.setattr(te_mod.TranslationEngine, "_read_glossary_entries", counting_read)
+
+        assert len(engine._load_glossary_entries("cache.json")) == 1
+        assert len(engine._load_glossary_entries("cache.json")) == 1
+        assert calls == ["cache.json"]
+
+        path.write_text(
+            json.dumps({"terms": {"Ultimate": "궁극기", "Gadget": "가젯"}}, ensure_ascii=False), encoding="utf-8"
+        )
+        assert len(engine._load_glossary_entries("cache.json")) == 2
+        assert calls == ["cache.json", "cache.json"]
+
+    def test_missing_glossary_is_not_cached(self, monkeypatch, tmp_path):
+        engine = _make_engine(monkeypatch, tmp_path)
+        monkeypatch.delenv("GLOSSARY_BASE_URL", raising=False)
+        assert engine.preload_glossary("missing.json") == 0
+
+
+class TestWarmUp:
+    def _build_translator(self):
+        from jira_trans import JiraTicketTranslator
+
+        return JiraTicketTranslator(
+            jira_url="https://example.atlassian.net",
+            email="bot@example.com",
+            api_token="token",
+            openai_api_key="sk-test",
+        )
+
+    def test_glossary_catalog_covers_all_project_glossaries(self):
+        from jira_trans import JiraTicketTranslator
+
+        files = [filename for filename, _ in JiraTicketTranslator.glossary_catalog()]
+        assert sorted(files) == sorted(p.name for p in (PROJECT_ROOT / "glossaries").glob("*.json"))
+
+    def test_warm_up_preloads_glossaries_and_reports_connection_errors(self):
+        translator = self._build_translator()
+        translator.jira_client.session = MagicMock()
+        translator.jira_client.session.get.side_effect = RuntimeError("jira down")
+        translator.translation_engine.openai = MagicMock()
+
+        result = translator.warm_up()
+
+        assert set(result["glossaries"]) == {f for f, _ in translator.glossary_catalog()}
+        assert all(count > 0 for count in result["glossaries"].values())
+        assert result["connections"]["jira"]["ok"] is False
+        assert "jira down" in result["connections"]["jira"]["error"]
+        assert result["connections"]["openai"]["ok"] is True
+
+    def test_warm_up_without_connections_skips_network(self):
+        translator = self._build_translator()
+        translator.jira_client.session = MagicMock()
+
+        result = translator.warm_up(open_connections=False)
+
+        assert "connections" not in result
+        translator.jira_client.session.get.assert_not_called()
@@ -20,6 +20,12 @@ class _DummyTranslator:
         _DummyTranslator.last_translate_issue_kwargs = kwargs
         return {"results": {}, "update_payload": {}, "updated": False, "error": None}
 
+    def warm_up(self, open_connections: bool = True):
+        return {
+            "glossaries": {"pbb_glossary.json": 3},
+            "connections": {"jira": {"ok": True}, "openai": {"ok": True}} if open_connections else {},
+        }
+
 
 def _reset_dummy_state():
     _DummyTranslator.last_init = None
@@ -320,3 +326,97 @@ def test_missing_env_returns_500_environment_error(monkeypatch):
     assert body["type"] == "OSError"
     assert "환경 변수가 필요합니다" in body["error"]
     assert _DummyTranslator.last_init is None
+
+
+def test_translator_is_reused_across_warm_invocations(monkeypatch):
+    _reset_dummy_state()
+    _set_required_env(monkeypatch)
+    monkeypatch.setattr(handler, "JiraTicketTranslator", _DummyTranslator)
+    monkeypatch.setattr(handler, "_TRANSLATOR_CACHE", {})
+
+    first = handler._get_translator("https://example.atlassian.net", "bot@example.com", "token", "sk-test")
+    second = handler._get_translator("https://example.atlassian.net", "bot@example.com", "token", "sk-test")
+
+    assert first is second
+
+
+def test_translator_cache_rebuilds_when_credentials_change(monkeypatch):
+    _reset_dummy_state()
+    monkeypatch.setattr(handler, "JiraTicketTranslator", _DummyTranslator)
+    monkeypatch.setattr(handler, "_TRANSLATOR_CACHE", {})
+
+    first = handler._get_translator("https://example.atlassian.net", "bot@example.com", "token", "sk-test")
+    rotated = handler._get_translator("https://example.atlassian.net", "bot@example.com", "token-2", "sk-test")
+
+    assert first is not rotated
+    assert _DummyTranslator.last_init["api_token"] == "token-2"
+    assert len(handler._TRANSLATOR_CACHE) == 1
+
+
+def test_translator_cache_can_be_disabled(monkeypatch):
+    _reset_dummy_state()
+    monkeypatch.setenv("TRANSLATOR_CACHE", "off")
+    monkeypatch.setattr(handler, "JiraTicketTranslator", _DummyTranslator)
+    monkeypatch.setattr(handler, "_TRANSLATOR_CACHE", {})
+
+    first = handler._get_translator("https://example.atlassian.net", "bot@example.com", "token", "sk-test")
+    second = handler._get_translator("https://example.atlassian.net", "bot@example.com", "token", "sk-test")
+
+    assert first is not second
+    assert handler._TRANSLATOR_CACHE == {}
+
+
+def test_health_returns_ok_without_building_translator(monkeypatch):
+    _reset_dummy_state()
+    _clear_required_env(monkeypatch)
+    monkeypatch.setattr(handler, "JiraTicketTranslator", _DummyTranslator)
+    monkeypatch.setattr(handler, "_TRANSLATOR_CACHE", {})
+
+    resp = handler.lambda_handler({"resource": "/health", "httpMethod": "GET"}, context=None)
+
+    assert resp["statusCode"] == 200
+    assert json.loads(resp["body"]) == {"status": "ok"}
+    assert _DummyTranslator.last_init is None
+
+
+def test_health_warm_builds_and_caches_translator(monkeypatch):
+    _reset_dummy_state()
+    _set_required_env(monkeypatch)
+    monkeypatch.setattr(handler, "JiraTicketTranslator", _DummyTranslator)
+    monkeypatch.setattr(handler, "_TRANSLATOR_CACHE", {})
+
+    resp = handler.lambda_handler(
+        {"path": "/prod/health", "queryStringParameters": {"warm": "true"}},
+        context=None,
+    )
+
+    body = json.loads(resp["body"])
+    assert resp["statusCode"] == 200
+    assert body["status"] == "ok"
+    assert body["warm"]["glossaries"] == {"pbb_glossary.json": 3}
+    assert len(handler._TRANSLATOR_CACHE) == 1
+    assert _DummyTranslator.last_translate_issue_kwargs is None
+
+
+def test_scheduled_event_triggers_warm_up(monkeypatch):
+    _reset_dummy_state()
+    _set_required_env(monkeypatch)
+    monkeypatch.setattr(handler, "JiraTicketTranslator", _DummyTranslator)
+    monkeypatch.setattr(handler, "_TRANSLATOR_CACHE", {})
+
+    resp = handler.lambda_handler({"source": "aws.events", "detail-type": "Scheduled Event"}, context=None)
+
+    assert resp["statusCode"] == 200
+    assert "warm" in json.loads(resp["body"])
+
+
+def test_health_warm_without_env_returns_503(monkeypatch):
+    _reset_dummy_state()
+    _clear_required_env(monkeypatch)
+    monkeypatch.setenv("JIRA_URL", "https://example.atlassian.net")
+    monkeypatch.setattr(handler, "JiraTicketTranslator", _DummyTranslator)
+
+    resp = handler.lambda_handler({"resource": "/health", "queryStringParameters": {"warm": "1"}}, context=None)
+
+    assert resp["statusCode"] == 503
+    assert json.loads(resp["body"])["status"] == "error"
@@ -0,0 +1,30 @@
+"""Cold start 회귀 방지: handler import 시 무거운 SDK가 로드되지 않아야 한다."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.import_time import check_budget, load_budget, profile_import
+
+
+def test_handler_import_does_not_load_heavy_sdks():
+    profile = profile_import("handler")
+    for package in ("openai", "pydantic", "httpx", "requests"):
+        assert not profile.imported(package), f"handler import pulled in {package}"
+
+
+def test_import_budget_forbidden_modules_are_respected():
+    assert check_budget(load_budget(), timing=False) == []
+
+
+# wall-clock 예산은 머신/부하에 따라 흔들리므로 명시적으로 켰을 때만 검사한다
+# (IMPORT_BUDGET_TIMING=1 pytest, 또는 python benchmarks/import_time.py --check)
+@pytest.mark.skipif(not os.getenv("IMPORT_BUDGET_TIMING"), reason="set IMPORT_BUDGET_TIMING=1 to check import time")
+def test_import_time_budget_is_respected():
+    assert check_budget(load_budget()) == []
@@ -0,0 +1,151 @@
+"""Tests for incremental re-translation of already-translated descriptions."""
+
+import sys
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# Stub openai before import
+if "openai" not in sys.modules:
+    openai_stub = types.ModuleType("openai")
+    openai_stub.OpenAI = MagicMock
+    sys.modules["openai"] = openai_stub
+
+import pytest
+
+import handler
+from jira_trans import JiraTicketTranslator
+from modules.formatting import (
+    BilingualParagraph,
+    format_bilingual_block,
+    incremental_translation_targets,
+    parse_bilingual_description,
+    render_bilingual_description,
+)
+
+TRANSLATED = "\n\n".join(
+    [
+        format_bilingual_block(
+            "* 로비 진입 후 상점 탭을 연다\n* 클라이언트가 종료된다\n!crash.png|thumbnail!\n||플랫폼||결과||\n|iOS|실패|",
+            "* Open the shop tab in the lobby\n* The client quits\n||Platform||Result||\n|iOS|Fail|",
+            header="Observed:",
+        ),
+        format_bilingual_block("상점이 열려야 한다", "The shop should open", header="Expected:"),
+        "*[QA 환경 / QA Environment]*\n빌드 1.2.3",
+    ]
+)
+
+
+def _translator():
+    return JiraTicketTranslator(
+        jira_url="https://example.atlassian.net",
+        email="bot@example.com",
+        api_token="token",
+        openai_api_key="sk-test",
+    )
+
+
+def test_parse_pairs_source_paragraphs_with_translation_lines():
+    segments = parse_bilingual_description(TRANSLATED)
+    paragraphs = [segment for segment in segments if isinstance(segment, BilingualParagraph)]
+
+    assert [paragraph.source for paragraph in paragraphs] == [
+        "* 로비 진입 후 상점 탭을 연다\n* 클라이언트가 종료된다",
+        "상점이 열려야 한다",
+        "빌드 1.2.3",
+    ]
+    assert paragraphs[0].translation_lines == [
+        "* {color:#4c9aff}Open the shop tab in the lobby{color}",
+        "* {color:#4c9aff}The client quits{color}",
+    ]
+    assert paragraphs[1].section == "Expected:"
+    assert paragraphs[2].translation_lines == []
+    assert render_bilingual_description(segments) == TRANSLATED
+
+
+def test_only_new_paragraphs_are_targets_without_previous_value():
+    current = TRANSLATED.replace("Expected:\n", "Expected:\n로딩 후 바로 열려야 한다\n\n", 1)
+    segments = parse_bilingual_description(current)
+
+    targets = incremental_translation_targets(segments)
+
+    # QA Environment(스킵 섹션) 문단은 번역하지 않는다
+    assert [segments[index].source for index in targets] == ["로딩 후 바로 열려야 한다"]
+
+
+def test_edited_source_is_detected_against_previous_value():
+    current = TRANSLATED.replace("상점이 열려야 한다", "상점이 1초 안에 열려야 한다")
+    segments = parse_bilingual_description(current)
+
+    assert incremental_translation_targets(segments) == []
+    targets = incremental_translation_targets(segments, previous_value=TRANSLATED)
+    assert [segments[index].source for index in targets] == ["상점이 1초 안에 열려야 한다"]
+
+
+@pytest.fixture
+def jira(monkeypatch):
+    state = {"fields": {"summary": "[Shop] 크래시 / [Shop] Crash", "description": TRANSLATED}, "batches": []}
+
+    def fake_fetch(self, issue_key, fields):
+        return {field: state["fields"][field] for field in fields if state["fields"].get(field)}
+
+    def fake_batch(self, chunks, target_language=None, retries=2):
+        state["batches"].append([chunk.clean_text for chunk in chunks])
+        return {chunk.id: f"EN {chunk.clean_text}" for chunk in chunks}
+
+    monkeypatch.setattr(JiraTicketTranslator, "fetch_issue_fields", fake_fetch)
+    monkeypatch.setattr(JiraTicketTranslator, "_call_openai_batch", fake_batch)
+    monkeypatch.setattr(JiraTicketTranslator, "_enforce_glossary_compliance", lambda self, *args: MagicMock(as_dict=dict))
+    return state
+
+
+def test_translate_issue_sends_only_changed_paragraphs(jira):
+    edited = TRANSLATED.replace("상점이 열려야 한다", "상점이 1초 안에 열려야 한다").replace(
+        "빌드 1.2.3", "빌드 1.2.3\n\nNote:\n재현율 100%"
+    )
+    jira["fields"]["description"] = edited
+
+    result = _translator().translate_issue(
+        "P2-1",
+        fields_to_translate=["description"],
+        incremental=True,
+        previous_fields={"description": TRANSLATED},
+    )
+
+    assert jira["batches"] == [["상점이 1초 안에 열려야 한다", "재현율 100%"]]
+    description = result["update_payload"]["description"]
+    assert description.startswith(TRANSLATED.split("Expected:")[0])
+    assert "상점이 1초 안에 열려야 한다\n\n{color:#4c9aff}EN 상점이 1초 안에 열려야 한다{color}" in description
+    assert "The shop should open" not in description
+    assert description.endswith("Note:\n재현율 100%\n\n{color:#4c9aff}EN 재현율 100%{color}")
+
+
+def test_translated_description_is_still_skipped_without_incremental_or_changes(jira):
+    translator = _translator()
+
+    assert "description" not in translator.translate_issue("P2-1", fields_to_translate=["description"])["update_payload"]
+    result = translator.translate_issue("P2-1", fields_to_translate=["description"], incremental=True)
+    assert "description" not in result["update_payload"]
+    assert jira["batches"] == []
+
+
+def test_webhook_request_carries_changelog_and_incremental_flag(monkeypatch):
+    monkeypatch.delenv("JIRA_INCREMENTAL_MODE", raising=False)
+    event = {
+        "webhookEvent": "jira:issue_updated",
+        "issue": {"key": "p2-1", "fields": {"description": "새 값"}},
+        "changelog": {"items": [{"field": "description", "fieldId": "description", "fromString": "이전 값", "toString": "새 값"}]},
+        "incremental": True,
+    }
+
+    request = handler._normalize_translation_request(event)
+
+    assert request["previous_fields"] == {"description": "이전 값"}
+    assert request["incremental"] is True
+
+    monkeypatch.setenv("JIRA_INCREMENTAL_MODE", "on")
+    assert handler._normalize_translation_request({"issue_key": "P2-1"})["incremental"] is True
@@ -0,0 +1,117 @@
+"""Tests for JiraClient issue retrieval (JQL search pagination, lean fetch)."""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.jira_client import JiraClient
+
+
+def _response(payload):
+    response = MagicMock()
+    response.json.return_value = payload
+    response.content = json.dumps(payload).encode("utf-8")
+    return response
+
+
+def _page(issues, total):
+    return _response({"issues": issues, "total": total})
+
+
+def _client(pages, fetch_mode="lean"):
+    client = JiraClient("https://example.atlassian.net/", "bot@example.com", "token", fetch_mode=fetch_mode)
+    client.session = MagicMock()
+    client.session.get.side_effect = pages
+    return client
+
+
+def test_search_issues_pages_lazily_with_projection():
+    client = _client([
+        _page([{"key": "P2-1", "fields": {"summary": "one"}}, {"key": "P2-2", "fields": {"summary": "two"}}], 3),
+        _page([{"key": "P2-3", "fields": {"summary": "three"}}], 3),
+    ])
+
+    results = client.search_issues("project = P2", ["summary", "description"], page_size=2)
+    assert next(results) == ("P2-1", {"summary": "one"})
+    # 첫 페이지를 다 소비하기 전에는 다음 페이지를 요청하지 않는다
+    assert client.session.get.call_count == 1
+
+    assert list(results) == [("P2-2", {"summary": "two"}), ("P2-3", {"summary": "three"})]
+    assert client.session.get.call_count == 2
+    first_params = client.session.get.call_args_list[0].kwargs["params"]
+    second_params = client.session.get.call_args_list[1].kwargs["params"]
+    assert first_params["fields"] == "summary,description"
+    assert "expand" not in first_params
+    assert (first_params["startAt"], second_params["startAt"]) == (0, 2)
+    assert second_params["maxResults"] == 2
+
+
+def test_search_issues_normalizes_like_fetch_issue_fields():
+    adf = {"type": "doc", "content": [{"type": "paragraph", "content": [{"type": "text", "text": "본문"}]}]}
+    client = _client([
+        _page([{
+            "key": "P2-1",
+            "fields": {"summary": "요약", "description": adf, "customfield_10237": None},
+            "renderedFields": {"customfield_10237": "<p>1. 실행</p>"},
+        }], 1),
+    ])
+
+    results = list(client.search_issues("key = P2-1", ["summary", "description", "customfield_10237"], expand_rendered=True))
+
+    assert results == [("P2-1", {
+        "summary": "요약",
+        "description": "본문",
+        "customfield_10237": client.normalize_field_value("<p>1. 실행</p>"),
+    })]
+    assert client.session.get.call_args.kwargs["params"]["expand"] == "renderedFields"
+
+
+def test_search_issue_keys_stops_at_max_results():
+    client = _client([
+        _page([{"key": f"P2-{i}", "fields": {}} for i in range(1, 3)], 10),
+        _page([{"key": f"P2-{i}", "fields": {}} for i in range(3, 5)], 10),
+    ])
+
+    assert client.search_issue_keys("project = P2", max_results=3) == ["P2-1", "P2-2", "P2-3"]
+    assert client.session.get.call_count == 2
+    assert client.session.get.call_args_list[0].kwargs["params"]["fields"] == "summary"
+
+
+def test_lean_fetch_requests_rendered_only_for_empty_present_fields():
+    client = _client([
+        _response({"fields": {"summary": "요약", "description": "   ", "customfield_10399": None}}),
+        _response({"fields": {"description": "   "}, "renderedFields": {"description": "<p>본문</p>"}}),
+    ])
+
+    fields = client.fetch_issue_fields("P2-1", ["summary", "description", "customfield_10399"])
+
+    assert fields == {"summary": "요약", "description": client.normalize_field_value("<p>본문</p>")}
+    first, second = (call.kwargs["params"] for call in client.session.get.call_args_list)
+    assert first == {"fields": "summary,description,customfield_10399"}
+    # null인 customfield_10399는 다시 요청하지 않는다
+    assert second == {"fields": "description", "expand": "renderedFields"}
+    stats = client.fetch_stats.as_dict()
+    assert stats["lean"]["requests"] == 1
+    assert stats["lean_rendered"]["requests"] == 1
+    assert stats["lean"]["bytes"] > 0
+
+
+def test_lean_fetch_skips_second_request_when_raw_values_suffice():
+    client = _client([_response({"fields": {"summary": "요약", "description": "본문"}})])
+
+    assert client.fetch_issue_fields("P2-1", ["summary", "description"]) == {"summary": "요약", "description": "본문"}
+    assert client.session.get.call_count == 1
+
+
+def test_full_fetch_mode_expands_rendered_fields():
+    client = _client([_response({"fields": {"summary": "요약"}})], fetch_mode="full")
+
+    client.fetch_issue_fields("P2-1", ["summary"])
+
+    assert client.session.get.call_args.kwargs["params"]["expand"] == "renderedFields"
+    assert set(client.fetch_stats.as_dict()) == {"full"}
@@ -0,0 +1,111 @@
+"""Tests for the Jira retry/backoff transport."""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.jira_transport import RetryingSession, RetryPolicy, TokenBucket, parse_retry_after, transport_errors
+
+URL = "https://example.atlassian.net/rest/api/2/issue/P2-1"
+ERRORS = transport_errors()
+
+
+def _session(script, **policy):
+    """script의 (상태 코드, 헤더) 응답을 순서대로 돌려주거나 예외를 던지는 세션."""
+    sleeps = []
+    calls = []
+    session = RetryingSession(RetryPolicy(**policy), sleep=sleeps.append)
+    steps = list(script)
+
+    def send(method, url, *args, **kwargs):
+        calls.append(method)
+        step = steps.pop(0)
+        if isinstance(step, Exception):
+            raise step
+        status, headers = step
+        return SimpleNamespace(status_code=status, headers=headers, close=lambda: None)
+
+    session._send = send
+    return session, calls, sleeps
+
+
+def test_get_retries_transient_errors_with_backoff():
+    session, calls, sleeps = _session(
+        [(503, {}), ERRORS.connection("reset"), (500, {}), (200, {})],
+        backoff_base=1.0,
+    )
+
+    response = session.request("GET", URL)
+
+    assert response.status_code == 200
+    assert len(calls) == 4
+    # full jitter: attempt별 상한 1, 2, 4초
+    assert all(0 <= delay <= cap for delay, cap in zip(sleeps, [1, 2, 4]))
+    stats = session.stats.as_dict()
+    assert stats["requests"] == 4
+    assert stats["retries"] == 3
+    assert stats["gave_up"] == 0
+
+
+def test_429_honors_retry_after_and_counts_throttling():
+    session, _, sleeps = _session([(429, {"Retry-After": "7"}), (200, {})])
+
+    assert session.request("GET", URL).status_code == 200
+    assert sleeps == [7.0]
+    assert session.stats.as_dict()["throttled_responses"] == 1
+    assert session.stats.as_dict()["backoff_seconds"] == 7.0
+
+
+def test_put_is_retried_only_on_safe_errors():
+    session, calls, _ = _session([(502, {}), (200, {})])
+    assert session.request("PUT", URL, json={"fields": {}}).status_code == 200
+    assert calls == ["PUT", "PUT"]
+
+    # 500은 서버가 이미 적용했을 수 있으므로 PUT에서는 재시도하지 않는다
+    session, calls, _ = _session([(500, {}), (200, {})])
+    assert session.request("PUT", URL, json={"fields": {}}).status_code == 500
+    assert calls == ["PUT"]
+
+    session, calls, _ = _session([ERRORS.read_timeout("slow"), (200, {})])
+    with pytest.raises(ERRORS.read_timeout):
+        session.request("PUT", URL, json={"fields": {}})
+    assert calls == ["PUT"]
+
+
+def test_gives_up_after_max_retries():
+    session, calls, _ = _session([(503, {})] * 3, max_retries=2)
+
+    response = session.request("GET", URL)
+
+    assert response.status_code == 503
+    assert len(calls) == 3
+    assert session.stats.as_dict()["gave_up"] == 1
+
+
+def test_parse_retry_after_accepts_seconds_and_http_date():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480.0) == 10.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_token_bucket_limits_rate_and_pauses():
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0], sleep=sleep)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.5]
+    bucket.pause(5)
+    assert bucket.acquire() == 5.0
+    assert sleeps == [0.5, 5.0]
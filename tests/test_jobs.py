@@ -0,0 +1,166 @@
+"""Tests for async job mode (queue/store stand-ins, 202 + polling, worker)."""
+
+import json
+import threading
+
+import pytest
+
+import handler
+from modules import jobs
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path, monkeypatch):
+    monkeypatch.setenv("JOB_SQLITE_PATH", str(tmp_path / "jobs.sqlite3"))
+    return jobs.build_job_backend(request.param)
+
+
+class TestJobBackends:
+    def test_queue_is_fifo_and_dequeues_once(self, backend):
+        store, job_queue = backend
+        first = store.create({"issue_key": "P2-1"})
+        second = store.create({"issue_key": "P2-2"})
+        job_queue.enqueue(first.job_id)
+        job_queue.enqueue(second.job_id)
+
+        assert job_queue.dequeue() == first.job_id
+        assert job_queue.dequeue() == second.job_id
+        assert job_queue.dequeue() is None
+
+    def test_process_job_records_result_and_error(self, backend):
+        store, _ = backend
+        ok = store.create({"issue_key": "P2-1"})
+        bad = store.create({"issue_key": "P2-2"})
+
+        def execute(request):
+            if request["issue_key"] == "P2-2":
+                raise RuntimeError("boom")
+            return {"issue_key": request["issue_key"], "updated": True}
+
+        jobs.process_job(store, ok.job_id, execute)
+        jobs.process_job(store, bad.job_id, execute)
+
+        assert store.get(ok.job_id).status == jobs.JOB_SUCCEEDED
+        assert store.get(ok.job_id).result == {"issue_key": "P2-1", "updated": True}
+        assert store.get(bad.job_id).status == jobs.JOB_FAILED
+        assert store.get(bad.job_id).error == {"error": "boom", "type": "RuntimeError"}
+
+    def test_concurrent_workers_never_share_a_job(self, backend):
+        store, job_queue = backend
+        for index in range(30):
+            job_queue.enqueue(store.create({"n": index}).job_id)
+
+        seen: list[str] = []
+        lock = threading.Lock()
+
+        def execute(request):
+            with lock:
+                seen.append(request["n"])
+            return {}
+
+        threads = [threading.Thread(target=jobs.run_worker, args=(store, job_queue, execute)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(seen) == list(range(30))
+
+
+class _DummyTranslator:
+    calls = []
+
+    def __init__(self, **kwargs):
+        pass
+
+    def translate_issue(self, **kwargs):
+        _DummyTranslator.calls.append(kwargs)
+        return {"results": {}, "update_payload": {}, "updated": False, "error": None}
+
+
+@pytest.fixture
+def async_env(monkeypatch):
+    monkeypatch.setenv("JIRA_URL", "https://example.atlassian.net")
+    monkeypatch.setenv("JIRA_EMAIL", "bot@example.com")
+    monkeypatch.setenv("JIRA_API_TOKEN", "token")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(handler, "JiraTicketTranslator", _DummyTranslator)
+    monkeypatch.setattr(handler, "_TRANSLATOR_CACHE", {})
+    monkeypatch.setenv("JOB_BACKEND", "memory")
+    monkeypatch.setattr(handler, "_JOB_BACKEND", jobs.build_job_backend("memory"))
+    _DummyTranslator.calls = []
+
+
+def _status(job_id: str) -> dict:
+    resp = handler.lambda_handler(
+        {"httpMethod": "GET", "path": f"/translate/{job_id}", "pathParameters": {"job_id": job_id}},
+        context=None,
+    )
+    return {"statusCode": resp["statusCode"], **json.loads(resp["body"])}
+
+
+def test_async_request_returns_202_and_worker_completes_job(async_env):
+    resp = handler.lambda_handler(
+        {
+            "httpMethod": "POST",
+            "path": "/translate",
+            "queryStringParameters": {"async": "true"},
+            "headers": {"Content-Type": "application/json"},
+            "body": json.dumps({"issue_key": "P2-1", "update": True}),
+        },
+        context=None,
+    )
+
+    assert resp["statusCode"] == 202
+    job_id = json.loads(resp["body"])["job_id"]
+    assert _DummyTranslator.calls == []
+    assert _status(job_id)["status"] == "queued"
+
+    assert handler.worker_handler({}, context=None) == {"processed": 1}
+
+    status = _status(job_id)
+    assert status["status"] == "succeeded"
+    assert status["result"]["issue_key"] == "P2-1"
+    assert _DummyTranslator.calls[0]["perform_update"] is True
+
+
+def test_async_request_is_validated_before_enqueue(async_env):
+    resp = handler.lambda_handler(
+        {"queryStringParameters": {"async": "true"}, "headers": {"Content-Type": "application/json"}, "body": "{}"},
+        context=None,
+    )
+
+    assert resp["statusCode"] == 400
+    assert handler.worker_handler({}, context=None) == {"processed": 0}
+
+
+def test_worker_processes_sqs_style_records(async_env):
+    store, _ = handler._job_backend()
+    record = store.create({"issue_key": "P2-7", "fields_to_translate": None, "update": False})
+
+    result = handler.worker_handler({"Records": [{"body": json.dumps({"job_id": record.job_id})}]}, context=None)
+
+    assert result == {"processed": 1}
+    assert store.get(record.job_id).status == "succeeded"
+
+
+def test_unknown_job_returns_404(async_env):
+    assert _status("0" * 32)["statusCode"] == 404
+
+
+def test_async_mode_is_rejected_without_job_backend(async_env, monkeypatch):
+    monkeypatch.delenv("JOB_BACKEND")
+    resp = handler.lambda_handler(
+        {
+            "httpMethod": "POST",
+            "path": "/translate",
+            "queryStringParameters": {"async": "true"},
+            "headers": {"Content-Type": "application/json"},
+            "body": json.dumps({"issue_key": "P2-1"}),
+        },
+        context=None,
+    )
+
+    assert resp["statusCode"] == 400
+    assert _status("0" * 32)["statusCode"] == 404
+    assert _DummyTranslator.calls == []
@@ -10,3 +10,24 @@ def test_detect_text_language_uses_custom_sanitizer():
 def test_detect_text_language_default_path_unchanged():
     result = detect_text_language("This is an English sentence.")
     assert result == "en"
+
+
+def _load_corpus() -> list[dict]:
+    import json
+    from pathlib import Path
+
+    path = Path(__file__).resolve().parent / "data" / "language_corpus.jsonl"
+    with path.open(encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle]
+
+
+def test_detect_text_language_matches_regression_corpus():
+    # tests/data/language_corpus.jsonl: 패턴별 findall/search 구현(단일 스캔 이전)의 판정을 고정한 코퍼스
+    corpus = _load_corpus()
+    assert len(corpus) > 3000
+
+    mismatches = [(row["text"], row["lang"]) for row in corpus if detect_text_language(row["text"]) != row["lang"]]
+
+    assert mismatches == []
+    assert {row["lang"] for row in corpus} == {"ko", "en", "unknown"}
+
@@ -0,0 +1,146 @@
+"""Tests for the memoized per-text language profile."""
+
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from models import TranslationChunk
+from modules import formatting, language
+from modules.language import LanguageProfile, LanguageProfileCache, build_language_profile, detect_text_language
+from modules.translation_engine import TranslationEngine
+import translation_style_report
+
+CORPUS_PATH = Path(__file__).resolve().parent / "data" / "language_corpus.jsonl"
+
+
+def _corpus_texts() -> list[str]:
+    with CORPUS_PATH.open(encoding="utf-8") as handle:
+        return [json.loads(line)["text"] for line in handle]
+
+
+def test_profile_features_and_label():
+    profile = build_language_profile("로비에서 상점을 열면 종료됩니다. !shot.png! Shop UI")
+
+    assert profile.hangul_count == len("로비에서상점을열면종료됩니다")
+    assert profile.latin_count == len("ShopUI")
+    assert profile.particle_score >= 2
+    assert profile.ending_score == 1  # 위치와 무관한 "됩니다"
+    assert build_language_profile("상점이 열린다\n다음 단계로 이동").ending_score == 1  # 라인 끝의 "다"
+    assert profile.label == "ko"
+    assert build_language_profile("The shop is closed").english_score >= 2
+    assert build_language_profile("").label == "unknown"
+    assert build_language_profile("!a.png! 123").label == "unknown"
+
+
+def test_profile_label_matches_detector_on_corpus():
+    texts = _corpus_texts()
+
+    assert [build_language_profile(text).label for text in texts] == [detect_text_language(text) for text in texts]
+
+
+def test_combined_chunk_profiles_match_joined_text():
+    texts = _corpus_texts()
+    groups = [texts[index:index + 3] for index in range(0, len(texts), 7)]
+
+    for group in groups:
+        combined = LanguageProfile.combine(build_language_profile(text) for text in group)
+        assert combined.label == detect_text_language("\n".join(group))
+
+    parts = ["상점 탭을 연다", "Shop UI"]
+    combined = LanguageProfile.combine(map(build_language_profile, parts))
+    joined = build_language_profile("\n".join(parts))
+    assert (combined.hangul_count, combined.latin_count) == (joined.hangul_count, joined.latin_count)
+
+
+def test_pattern_scores_are_computed_lazily():
+    partial = build_language_profile("로비에서 상점을 열면 종료됩니다.", full=False)
+
+    # 한글 수만으로 판단되므로 패턴 점수는 계산하지 않는다
+    assert (partial.particle_score, partial.ending_score, partial.english_score) == (None, None, None)
+    assert partial.label == "ko" and not partial.is_full
+    assert build_language_profile("Shop UI", full=False).particle_score == 0
+
+    # 한글이 마크업 안에만 있으면 합친 프로필 판단에 조사/어미 점수가 필요하다
+    hidden = build_language_profile("!로비에서 확인됨!", full=False)
+    assert hidden.label == "unknown" and hidden.ending_score == 1
+    assert LanguageProfile.combine([hidden, build_language_profile("Shop", full=False)]).label == "ko"
+
+    cache = LanguageProfileCache()
+    assert not cache.get("로비에서 상점을 열면 종료됩니다.").is_full
+    full = cache.get("로비에서 상점을 열면 종료됩니다.", full=True)
+    assert full.is_full and full.particle_score >= 2
+    assert cache.get("로비에서 상점을 열면 종료됩니다.") is full
+
+
+def test_combined_language_stops_at_first_korean_text(monkeypatch):
+    scanned: list[str] = []
+    original = language.build_language_profile
+
+    def counting_build(text, full=True):
+        scanned.append(text)
+        return original(text, full=full)
+
+    monkeypatch.setattr(language, "build_language_profile", counting_build)
+
+    assert language.detect_combined_language(["Shop UI", "상점 탭", "Replay"]) == "ko"
+    assert scanned == ["Shop UI", "상점 탭"]
+    assert language.detect_combined_language(["!로비에서 확인됨!", "Shop"]) == "ko"
+    assert language.detect_combined_language(["", "!a.png!"]) == "unknown"
+
+
+def test_cache_is_bounded_lru():
+    cache = LanguageProfileCache(max_entries=2)
+
+    cache.get("첫 번째")
+    cache.get("second")
+    cache.get("첫 번째")  # 최근 사용으로 갱신
+    cache.get("third")    # 가장 오래된 "second"가 밀려난다
+
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 3)
+    cache.get("첫 번째")
+    cache.get("second")
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    disabled = LanguageProfileCache(max_entries=0)
+    assert disabled.get("한국어").label == "ko"
+    assert len(disabled) == 0
+
+
+def test_default_cache_reads_size_from_env(monkeypatch):
+    monkeypatch.setenv("LANGUAGE_PROFILE_CACHE_SIZE", "3")
+    language.reset_default_language_profile_cache()
+
+    assert language.default_language_profile_cache().max_entries == 3
+    assert language.default_language_profile_cache() is language.default_language_profile_cache()
+
+
+def test_pipeline_callers_share_profiles(monkeypatch):
+    scanned: list[str] = []
+    original = language.build_language_profile
+
+    def counting_build(text, full=True):
+        scanned.append(text)
+        return original(text, full=full)
+
+    monkeypatch.setattr(language, "build_language_profile", counting_build)
+    chunks = [
+        TranslationChunk(id="description__section_0", field="description", original_text="상점 탭을 연다", clean_text="상점 탭을 연다", attachments=[]),
+        TranslationChunk(id="summary", field="summary", original_text="Shop crash", clean_text="Shop crash", attachments=[]),
+    ]
+
+    # 배치 호출 + 용어집 검사 + 재시도에서 같은 청크 목록의 방향을 여러 번 판단한다
+    for _ in range(3):
+        assert TranslationEngine.resolve_chunks_direction_lang(chunks) == "ko"
+    assert TranslationEngine.resolve_chunks_direction_lang(chunks, target_language="Korean") == "en"
+    assert TranslationEngine.resolve_direction_lang("Shop crash") == "en"
+
+    assert language.is_bilingual_summary("[Shop] 상점 크래시 / Shop crash", formatting.split_bracket_prefix)
+    assert translation_style_report.extract_source_summary("[Shop] 상점 크래시 / Shop crash") == "[Shop] 상점 크래시"
+
+    # 청크별로 한 번씩만 스캔하고 이어 붙인 텍스트는 스캔하지 않는다
+    assert sorted(scanned) == sorted(["상점 탭을 연다", "Shop crash", "상점 크래시"])
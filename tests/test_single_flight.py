@@ -0,0 +1,219 @@
+"""Tests for single-flight coalescing of concurrent translate requests."""
+
+import hashlib
+import hmac
+import json
+import threading
+import time
+
+import pytest
+
+import handler
+from modules.single_flight import (
+    FileFlightStore,
+    SingleFlight,
+    SQLiteFlightStore,
+    flight_key,
+)
+
+
+def test_flight_key_ignores_field_order():
+    assert flight_key("p2-1", ["summary", "description"], True) == flight_key("P2-1", ["description", "summary"], True)
+    assert flight_key("P2-1", None, True) != flight_key("P2-1", ["summary"], True)
+    assert flight_key("P2-1", None, True) != flight_key("P2-1", None, False)
+
+
+def test_flight_key_includes_request_content_digest():
+    base = flight_key("P2-1", None, True)
+    old = flight_key("P2-1", None, True, content={"webhook_fields": {"summary": "이전 값"}})
+    new = flight_key("P2-1", None, True, content={"webhook_fields": {"summary": "새 값"}})
+
+    assert len({base, old, new}) == 3
+    assert old == flight_key("P2-1", None, True, content={"webhook_fields": {"summary": "이전 값"}})
+    assert flight_key("P2-1", None, True, content={}) == base
+
+
+def test_recent_results_are_bounded_and_expired_entries_swept(monkeypatch):
+    flight = SingleFlight(result_ttl=60, max_recent=2)
+    for index in range(5):
+        flight.do(f"P2-{index}", lambda: {"error": None})
+
+    assert list(flight._recent) == ["P2-3", "P2-4"]
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 120)
+    flight.do("P2-9", lambda: {"error": None})
+    assert list(flight._recent) == ["P2-9"]
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"results": {"summary": "ok"}, "error": None}
+
+    outcomes = []
+
+    def call():
+        outcomes.append(flight.do("P2-1|*", work))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=call) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in outcomes) == [False, True, True, True]
+    assert all(result["results"] == {"summary": "ok"} for result, _ in outcomes)
+
+
+def test_recent_result_is_reused_until_ttl_expires(monkeypatch):
+    flight = SingleFlight(result_ttl=60)
+    calls = []
+
+    def work():
+        calls.append(1)
+        return {"error": None}
+
+    flight.do("k", work)
+    assert flight.do("k", work) == ({"error": None}, True)
+    assert len(calls) == 1
+
+
+def test_failures_propagate_and_are_not_cached():
+    flight = SingleFlight()
+
+    def boom():
+        raise RuntimeError("llm down")
+
+    with pytest.raises(RuntimeError):
+        flight.do("k", boom)
+
+    error_result = {"error": "Jira PUT failed"}
+    assert flight.do("k", lambda: error_result) == (error_result, False)
+    assert flight.do("k", lambda: {"error": None}) == ({"error": None}, False)
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store_factory(request, tmp_path):
+    if request.param == "file":
+        return lambda: FileFlightStore(str(tmp_path / "flights"))
+    return lambda: SQLiteFlightStore(str(tmp_path / "flights.sqlite3"))
+
+
+def test_cross_process_store_shares_finished_result(store_factory):
+    # SingleFlight 인스턴스 2개 = 같은 store를 쓰는 서로 다른 프로세스
+    first = SingleFlight(store_factory())
+    second = SingleFlight(store_factory())
+    calls = []
+
+    def work():
+        calls.append(1)
+        return {"results": {}, "error": None}
+
+    assert first.do("P2-1|*", work)[1] is False
+    assert second.do("P2-1|*", work) == ({"results": {}, "error": None}, True)
+    assert len(calls) == 1
+
+
+def test_cross_process_waiter_polls_until_holder_finishes(store_factory):
+    holder_store = store_factory()
+    token = holder_store.acquire("k", ttl=60)
+    assert token is not None
+
+    waiter = SingleFlight(store_factory(), poll_interval=0.01)
+    outcome = {}
+    thread = threading.Thread(target=lambda: outcome.setdefault("value", waiter.do("k", lambda: {"error": "ran"})))
+    thread.start()
+    time.sleep(0.05)
+    holder_store.put_result("k", {"error": None, "by": "holder"}, ttl=60)
+    holder_store.release("k", token)
+    thread.join(5)
+
+    assert outcome["value"] == ({"error": None, "by": "holder"}, True)
+
+
+def test_expired_lock_is_taken_over(store_factory):
+    store = store_factory()
+    assert store.acquire("k", ttl=-1) is not None
+    assert store.acquire("k", ttl=60) is not None
+
+
+class _SlowTranslator:
+    calls = 0
+
+    def __init__(self, **kwargs):
+        pass
+
+    def translate_issue(self, **kwargs):
+        _SlowTranslator.calls += 1
+        time.sleep(0.1)
+        return {"results": {}, "update_payload": {}, "updated": True, "error": None}
+
+    def translate_issue_from_webhook(self, **kwargs):
+        return self.translate_issue(**kwargs)
+
+
+def test_handler_coalesces_concurrent_requests(monkeypatch):
+    monkeypatch.setenv("JIRA_URL", "https://example.atlassian.net")
+    monkeypatch.setenv("JIRA_EMAIL", "bot@example.com")
+    monkeypatch.setenv("JIRA_API_TOKEN", "token")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(handler, "JiraTicketTranslator", _SlowTranslator)
+    monkeypatch.setattr(handler, "_TRANSLATOR_CACHE", {})
+    _SlowTranslator.calls = 0
+    event = {
+        "headers": {"Content-Type": "application/json"},
+        "body": json.dumps({"issue_key": "P2-1", "update": True}),
+    }
+
+    bodies = []
+    threads = [
+        threading.Thread(target=lambda: bodies.append(json.loads(handler.lambda_handler(event, None)["body"])))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert _SlowTranslator.calls == 1
+    assert sorted(body["coalesced"] for body in bodies) == [False, True, True, True]
+
+
+def test_edit_webhook_is_not_served_stale_recent_result(monkeypatch):
+    monkeypatch.setenv("JIRA_URL", "https://example.atlassian.net")
+    monkeypatch.setenv("JIRA_EMAIL", "bot@example.com")
+    monkeypatch.setenv("JIRA_API_TOKEN", "token")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("JIRA_WEBHOOK_SECRET", "s3cret")
+    monkeypatch.setattr(handler, "JiraTicketTranslator", _SlowTranslator)
+    monkeypatch.setattr(handler, "_TRANSLATOR_CACHE", {})
+    _SlowTranslator.calls = 0
+
+    def webhook(summary):
+        payload = {"webhookEvent": "jira:issue_updated", "issue": {"key": "P2-1", "fields": {"summary": summary}}, "update": True}
+        body = json.dumps(payload, ensure_ascii=False)
+        signature = "sha256=" + hmac.new(b"s3cret", body.encode("utf-8"), hashlib.sha256).hexdigest()
+        return {"headers": {"Content-Type": "application/json", "X-Hub-Signature": signature}, "body": body}
+
+    manual = {"headers": {"Content-Type": "application/json"}, "body": json.dumps({"issue_key": "P2-1", "update": True})}
+    bodies = [
+        json.loads(handler.lambda_handler(event, None)["body"])
+        for event in (manual, webhook("로비 크래시"), webhook("로비 크래시 (수정)"), webhook("로비 크래시 (수정)"))
+    ]
+
+    assert _SlowTranslator.calls == 3
+    assert [body["coalesced"] for body in bodies] == [False, False, False, True]
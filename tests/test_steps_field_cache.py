@@ -0,0 +1,106 @@
+"""Tests for the cross-invocation steps field cache."""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.jira_client import JiraClient
+from modules.steps_field_cache import NOT_CACHED, StepsFieldCache, reset_default_steps_field_cache
+
+SITE = "https://example.atlassian.net"
+
+
+def _createmeta(projects):
+    response = MagicMock()
+    response.json.return_value = {"projects": projects}
+    return response
+
+
+def _project(key, fields):
+    return {"key": key, "issuetypes": [{"fields": fields}]}
+
+
+def _client():
+    client = JiraClient(SITE, "bot@example.com", "token")
+    client.session = MagicMock()
+    return client
+
+
+def test_cache_persists_to_disk_with_negative_ttl(tmp_path):
+    path = tmp_path / "steps.json"
+    cache = StepsFieldCache(str(path), ttl=60, negative_ttl=0.05)
+    cache.put_many(SITE, {"NEW": "customfield_20001", "NONE": None})
+
+    reloaded = StepsFieldCache(str(path), ttl=60, negative_ttl=0.05)
+    assert reloaded.get(SITE, "new") == "customfield_20001"
+    assert reloaded.get(SITE, "NONE") is None
+    assert reloaded.get(SITE, "OTHER") is NOT_CACHED
+
+    time.sleep(0.06)
+    assert reloaded.get(SITE, "NONE") is NOT_CACHED
+    assert reloaded.get(SITE, "NEW") == "customfield_20001"
+
+
+def test_concurrent_writers_merge_with_file_contents(tmp_path):
+    path = str(tmp_path / "steps.json")
+    first = StepsFieldCache(path, ttl=60)
+    second = StepsFieldCache(path, ttl=60)
+    # 두 프로세스가 모두 파일을 읽은 뒤 각자 다른 프로젝트를 기록
+    assert first.get(SITE, "ONE") is NOT_CACHED
+    assert second.get(SITE, "TWO") is NOT_CACHED
+
+    first.put(SITE, "ONE", "customfield_1")
+    second.put(SITE, "TWO", "customfield_2")
+
+    reloaded = StepsFieldCache(path, ttl=60)
+    assert reloaded.get(SITE, "ONE") == "customfield_1"
+    assert reloaded.get(SITE, "TWO") == "customfield_2"
+
+
+def test_detection_is_reused_by_new_client_instances():
+    first = _client()
+    first.session.get.return_value = _createmeta([{"issuetypes": [{"fields": {"customfield_10237": {}}}]}])
+    assert first.detect_steps_field("NEW") == "customfield_10237"
+
+    second = _client()
+    assert second.detect_steps_field("NEW") == "customfield_10237"
+    second.session.get.assert_not_called()
+
+    # 프로세스 캐시를 비워도 디스크 캐시에서 복원된다
+    reset_default_steps_field_cache()
+    third = _client()
+    assert third.detect_steps_field("NEW") == "customfield_10237"
+    third.session.get.assert_not_called()
+
+
+def test_api_failure_is_not_shared_across_instances():
+    failing = _client()
+    failing.session.get.side_effect = RuntimeError("jira down")
+    assert failing.detect_steps_field("NEW") is None
+
+    healthy = _client()
+    healthy.session.get.return_value = _createmeta([{"issuetypes": [{"fields": {"customfield_10399": {}}}]}])
+    assert healthy.detect_steps_field("NEW") == "customfield_10399"
+
+
+def test_prefetch_detects_many_projects_with_one_createmeta_call():
+    client = _client()
+    client.session.get.return_value = _createmeta([
+        _project("AAA", {"customfield_10237": {}}),
+        _project("BBB", {"customfield_30000": {"name": "Steps to Reproduce"}}),
+    ])
+
+    detected = client.prefetch_steps_fields(["AAA", "BBB", "CCC"])
+
+    assert detected == {"AAA": "customfield_10237", "BBB": "customfield_30000", "CCC": None}
+    client.session.get.assert_called_once()
+    assert client.session.get.call_args.kwargs["params"]["projectKeys"] == "AAA,BBB,CCC"
+
+    other = _client()
+    assert other.prefetch_steps_fields(["AAA", "CCC"]) == {"AAA": "customfield_10237", "CCC": None}
+    other.session.get.assert_not_called()
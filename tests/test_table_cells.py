@@ -0,0 +1,145 @@
+"""Tests for translating Jira table cells as individual, deduplicated items."""
+
+import sys
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# Stub openai before import
+if "openai" not in sys.modules:
+    openai_stub = types.ModuleType("openai")
+    openai_stub.OpenAI = MagicMock
+    sys.modules["openai"] = openai_stub
+
+from jira_trans import JiraTicketTranslator
+from modules.formatting import format_bilingual_block, split_table_cells
+
+PLATFORMS = ["iOS", "Android", "PC", "PS5", "Xbox"]
+
+QA_MATRIX = "\n".join(
+    ["Observed:", "상점 탭 진입 결과", "||플랫폼||빌드||결과||비고||"]
+    + [f"|{platform}|1.2.{build}|{'실패' if build % 2 else '성공'}|!shot_{build}.png|thumbnail!|"
+       for build in range(10) for platform in PLATFORMS]
+    + ["재현율 100%"]
+)
+
+
+def test_split_table_cells_dedupes_and_skips_media_and_code():
+    text = "\n".join(
+        [
+            "설명",
+            "||*상태*||비고||",
+            "|성공|!a.png!|",
+            "|성공| |",
+            "|실패|__IMAGE_PLACEHOLDER_0__|",
+            "{code}",
+            "|코드|안|",
+            "{code}",
+        ]
+    )
+
+    remaining, cells = split_table_cells(text)
+
+    assert cells == ["상태", "비고", "성공", "실패"]
+    assert remaining == "설명\n{code}\n|코드|안|\n{code}"
+    assert split_table_cells("표 없음") == ("표 없음", [])
+
+
+def test_cell_translations_never_shift_cells():
+    original = "표 결과\n||플랫폼||결과||\n|iOS|실패|\n|Android|성공|\n마지막 줄"
+    # 번역문에는 표 라인이 없다 (셀은 따로 번역)
+    translated = "Table result\nLast line"
+    cells = {"플랫폼": "Platform", "결과": "*Result*", "실패": "Fail", "성공": "Pass"}
+
+    block = format_bilingual_block(original, translated, cell_translations=cells)
+
+    assert block.split("\n") == [
+        "표 결과",
+        "",
+        "{color:#4c9aff}Table result{color}",
+        "",
+        "||*플랫폼/Platform*||*결과/Result*||",
+        "",
+        "|iOS|실패/Fail|",
+        "",
+        "|Android|성공/Pass|",
+        "마지막 줄",
+        "",
+        "{color:#4c9aff}Last line{color}",
+    ]
+
+
+def _translator(monkeypatch, state):
+    translator = JiraTicketTranslator(
+        jira_url="https://example.atlassian.net",
+        email="bot@example.com",
+        api_token="token",
+        openai_api_key="sk-test",
+    )
+
+    def fake_batch(self, chunks, target_language=None, retries=2):
+        state["items"] = [(chunk.id, chunk.clean_text) for chunk in chunks]
+        translations = {chunk.id: f"EN {chunk.clean_text}" for chunk in chunks}
+        # 셀 번역에 |와 줄바꿈이 섞여 와도 표가 깨지지 않아야 한다
+        for chunk in chunks:
+            if chunk.clean_text == "실패":
+                translations[chunk.id] = "Fail |\nCrash"
+        return translations
+
+    monkeypatch.setattr(JiraTicketTranslator, "_call_openai_batch", fake_batch)
+    monkeypatch.setattr(JiraTicketTranslator, "_enforce_glossary_compliance", lambda self, *args: MagicMock(as_dict=dict))
+    return translator
+
+
+def test_translate_issue_sends_each_unique_cell_once(monkeypatch):
+    state: dict = {}
+    translator = _translator(monkeypatch, state)
+
+    result = translator.translate_issue(
+        "P2-1",
+        fields_to_translate=["description"],
+        issue_fields={"summary": "상점 크래시", "description": QA_MATRIX},
+    )
+
+    items = dict(state["items"])
+    assert items["description__section_0"] == "상점 탭 진입 결과\n재현율 100%"
+    cell_texts = [text for chunk_id, text in state["items"] if "__cell_" in chunk_id]
+    # 헤더 4 + 플랫폼 5 + 빌드 10 + 결과 2 (미디어 셀 제외, 반복 값은 한 번만)
+    assert len(cell_texts) == 21
+    assert len(set(cell_texts)) == len(cell_texts)
+
+    description = result["results"]["description"]["translated"]
+    rows = [line for line in description.split("\n") if line.startswith("|")]
+    assert rows[0] == "||*플랫폼/EN 플랫폼*||*빌드/EN 빌드*||*결과/EN 결과*||*비고/EN 비고*||"
+    assert rows[1] == "|iOS/EN iOS|1.2.0/EN 1.2.0|성공/EN 성공|!shot_0.png|thumbnail!|"
+    assert rows[6] == "|iOS/EN iOS|1.2.1/EN 1.2.1|실패/Fail / Crash|!shot_1.png|thumbnail!|"
+    assert len(rows) == 51
+    # 셀 구분자 5개 + 이미지 마크업 안의 | 1개 (번역문의 |는 /로 바뀜)
+    assert all(row.count("|") == 6 for row in rows[1:])
+    # 표 뒤의 텍스트도 번역문의 두 번째 줄과 짝지어진다 (fake는 첫 줄에만 EN을 붙임)
+    assert description.endswith("|\n재현율 100%\n\n{color:#4c9aff}재현율 100%{color}")
+
+
+def test_media_only_table_does_not_shift_translation_lines(monkeypatch):
+    state: dict = {}
+    translator = _translator(monkeypatch, state)
+    description = "Observed:\n|[^a.mp4]|[^b.mp4]|\nFirst line\nSecond line\n\nExpected:\n||Platform||Result||\n|iOS|Fail|"
+
+    result = translator.translate_issue(
+        "P2-1",
+        fields_to_translate=["description"],
+        issue_fields={"summary": "상점 크래시", "description": description},
+    )
+
+    items = dict(state["items"])
+    # 번역할 셀이 없는 표 라인도 섹션 텍스트에서 빠진다
+    assert items["description__section_0"] == "First line\nSecond line"
+    description = result["results"]["description"]["translated"]
+    assert description.startswith(
+        "Observed:\n\n|[^a.mp4]|[^b.mp4]|\nFirst line\nSecond line\n\n"
+        "{color:#4c9aff}EN First line{color}\n{color:#4c9aff}Second line{color}"
+    )
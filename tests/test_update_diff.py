@@ -0,0 +1,128 @@
+"""Tests for field-level diff updates and notifyUsers handling."""
+
+import sys
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# Stub openai before import
+if "openai" not in sys.modules:
+    openai_stub = types.ModuleType("openai")
+    openai_stub.OpenAI = MagicMock
+    sys.modules["openai"] = openai_stub
+
+import pytest
+
+from jira_trans import JiraTicketTranslator
+from modules.jira_client import JiraClient
+
+
+@pytest.fixture
+def jira(monkeypatch):
+    state = {"fields": {"summary": "로비에서 크래시 발생", "description": "Already English"}, "puts": []}
+
+    def fake_fetch(self, issue_key, fields):
+        return {field: state["fields"][field] for field in fields if state["fields"].get(field)}
+
+    def fake_build_payload(self, results):
+        return {field: state["translated"].get(field, state["fields"][field]) for field in results}
+
+    def fake_update(self, issue_key, payload):
+        state["puts"].append(dict(payload))
+
+    monkeypatch.setattr(JiraTicketTranslator, "fetch_issue_fields", fake_fetch)
+    monkeypatch.setattr(JiraTicketTranslator, "build_field_update_payload", fake_build_payload)
+    monkeypatch.setattr(JiraTicketTranslator, "update_issue_fields", fake_update)
+    monkeypatch.setattr(
+        JiraTicketTranslator, "_call_openai_batch",
+        lambda self, chunks, target_language=None, retries=2: {c.id: f"EN {c.clean_text}" for c in chunks},
+    )
+    monkeypatch.setattr(JiraTicketTranslator, "_enforce_glossary_compliance", lambda self, *args: MagicMock(as_dict=dict))
+    return state
+
+
+def _translator():
+    translator = JiraTicketTranslator(
+        jira_url="https://example.atlassian.net",
+        email="bot@example.com",
+        api_token="token",
+        openai_api_key="sk-test",
+    )
+    translator.fingerprint_store = None
+    return translator
+
+
+def test_diff_drops_fields_equal_to_current_value():
+    translator = _translator()
+    changed, unchanged = translator.diff_update_payload(
+        {"summary": "New title", "description": "  same body  ", "customfield_1": "x"},
+        {"summary": "Old title", "description": "same body"},
+    )
+    assert changed == {"summary": "New title", "customfield_1": "x"}
+    assert unchanged == ["description"]
+
+
+def test_only_changed_fields_are_put(jira):
+    jira["translated"] = {"summary": "EN title", "description": "Already English"}
+    result = _translator().translate_issue("P2-1", fields_to_translate=["summary", "description"], perform_update=True)
+
+    assert jira["puts"] == [{"summary": "EN title"}]
+    assert result["unchanged_fields"] == ["description"]
+    assert result["updated"] is True
+
+
+def test_put_is_skipped_when_nothing_changed(jira):
+    jira["translated"] = {}
+    result = _translator().translate_issue("P2-1", fields_to_translate=["summary", "description"], perform_update=True)
+
+    assert jira["puts"] == []
+    assert result["updated"] is False
+    assert result["error"] is None
+
+
+def _client():
+    client = JiraClient("https://example.atlassian.net", "bot@example.com", "token")
+    client.session = MagicMock()
+    client.session.put.return_value = MagicMock(ok=True, status_code=204)
+    return client
+
+
+def test_notify_users_false_adds_query_param(monkeypatch):
+    client = _client()
+    client.update_issue_fields("P2-1", {"summary": "x"}, notify_users=False)
+    assert client.session.put.call_args.kwargs["params"] == {"notifyUsers": "false"}
+
+    monkeypatch.setenv("JIRA_NOTIFY_USERS", "false")
+    client = _client()
+    client.update_issue_fields("P2-1", {"summary": "x"})
+    assert client.session.put.call_args.kwargs["params"] == {"notifyUsers": "false"}
+
+    client = _client()
+    client.update_issue_fields("P2-1", {"summary": "x"}, notify_users=True)
+    assert "params" not in client.session.put.call_args.kwargs
+
+
+def test_notify_users_false_falls_back_when_forbidden():
+    client = _client()
+    client.session.put.side_effect = [MagicMock(ok=False, status_code=403), MagicMock(ok=True, status_code=204)]
+
+    client.update_issue_fields("P2-1", {"summary": "x"}, notify_users=False)
+
+    assert client.session.put.call_count == 2
+    assert "params" not in client.session.put.call_args.kwargs
+
+
+def test_failed_translation_is_not_recorded_as_unchanged(jira):
+    jira["translated"] = {}
+    translator = _translator()
+    translator.fingerprint_store = MagicMock()
+    translator.fingerprint_store.contains.return_value = False
+    translator.build_field_update_payload = lambda results: {}
+
+    translator.translate_issue("P2-1", fields_to_translate=["summary"], perform_update=True)
+
+    translator.fingerprint_store.put.assert_not_called()
@@ -0,0 +1,187 @@
+"""Tests for the Jira webhook ingestion path."""
+
+import hashlib
+import hmac
+import json
+import sys
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# Stub openai before import
+if "openai" not in sys.modules:
+    openai_stub = types.ModuleType("openai")
+    openai_stub.OpenAI = MagicMock
+    sys.modules["openai"] = openai_stub
+
+import handler
+from jira_trans import JiraTicketTranslator
+
+ADF_DESCRIPTION = {
+    "type": "doc",
+    "version": 1,
+    "content": [{"type": "paragraph", "content": [{"type": "text", "text": "로비 진입 시 종료"}]}],
+}
+
+
+def _build_translator():
+    translator = JiraTicketTranslator(
+        jira_url="https://example.atlassian.net",
+        email="bot@example.com",
+        api_token="token",
+        openai_api_key="sk-test",
+    )
+    translator.fetch_issue_fields = MagicMock(return_value={"customfield_10399": "1. 로비 진입"})
+    translator.translate_issue = MagicMock(return_value={"results": {}, "error": None})
+    return translator
+
+
+def test_webhook_fields_are_normalized_and_only_missing_fields_fetched():
+    translator = _build_translator()
+
+    translator.translate_issue_from_webhook(
+        "P2-1",
+        {"summary": "  로비 크래시 ", "description": ADF_DESCRIPTION},
+    )
+
+    translator.fetch_issue_fields.assert_called_once_with("P2-1", ["customfield_10399"])
+    kwargs = translator.translate_issue.call_args.kwargs
+    assert kwargs["issue_fields"] == {
+        "summary": "로비 크래시",
+        "description": "로비 진입 시 종료",
+        "customfield_10399": "1. 로비 진입",
+    }
+    assert kwargs["fields_to_translate"] == ["summary", "description", "customfield_10399"]
+
+
+def test_complete_webhook_payload_skips_jira_fetch():
+    translator = _build_translator()
+
+    translator.translate_issue_from_webhook(
+        "P2-1",
+        {"summary": "Lobby crash", "description": None, "customfield_10399": "1. Enter lobby"},
+    )
+
+    translator.fetch_issue_fields.assert_not_called()
+    assert translator.translate_issue.call_args.kwargs["issue_fields"] == {
+        "summary": "Lobby crash",
+        "customfield_10399": "1. Enter lobby",
+    }
+
+
+class _DummyTranslator:
+    last_webhook = None
+
+    def __init__(self, **kwargs):
+        pass
+
+    def translate_issue_from_webhook(self, **kwargs):
+        _DummyTranslator.last_webhook = kwargs
+        return {"results": {}, "update_payload": {}, "updated": False, "error": None}
+
+    def translate_issue(self, **kwargs):
+        _DummyTranslator.last_fetch = kwargs
+        return {"results": {}, "update_payload": {}, "updated": False, "error": None}
+
+
+def _set_env(monkeypatch):
+    monkeypatch.setenv("JIRA_URL", "https://example.atlassian.net")
+    monkeypatch.setenv("JIRA_EMAIL", "bot@example.com")
+    monkeypatch.setenv("JIRA_API_TOKEN", "token")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.delenv("JIRA_WEBHOOK_SECRET", raising=False)
+    monkeypatch.setattr(handler, "JiraTicketTranslator", _DummyTranslator)
+    monkeypatch.setattr(handler, "_TRANSLATOR_CACHE", {})
+    _DummyTranslator.last_webhook = None
+    _DummyTranslator.last_fetch = None
+
+
+def _webhook_event(payload: dict, headers: dict | None = None) -> dict:
+    return {
+        "httpMethod": "POST",
+        "resource": "/webhook",
+        "path": "/webhook",
+        "queryStringParameters": {"update": "true"},
+        "headers": {"Content-Type": "application/json", **(headers or {})},
+        "body": json.dumps(payload, ensure_ascii=False),
+    }
+
+
+PAYLOAD = {
+    "webhookEvent": "jira:issue_created",
+    "issue": {"key": "p2-42", "fields": {"summary": "로비 크래시"}},
+}
+
+
+def _signed(payload: dict) -> dict:
+    body = json.dumps(payload, ensure_ascii=False)
+    return {"X-Hub-Signature": "sha256=" + hmac.new(b"s3cret", body.encode("utf-8"), hashlib.sha256).hexdigest()}
+
+
+def test_handler_routes_webhook_payload(monkeypatch):
+    _set_env(monkeypatch)
+    monkeypatch.setenv("JIRA_WEBHOOK_SECRET", "s3cret")
+
+    resp = handler.lambda_handler(_webhook_event(PAYLOAD, _signed(PAYLOAD)), context=None)
+
+    assert resp["statusCode"] == 200
+    assert json.loads(resp["body"])["issue_key"] == "P2-42"
+    assert _DummyTranslator.last_webhook["webhook_fields"] == {"summary": "로비 크래시"}
+    assert _DummyTranslator.last_webhook["perform_update"] is True
+
+
+def test_handler_ignores_unrelated_webhook_events(monkeypatch):
+    _set_env(monkeypatch)
+
+    resp = handler.lambda_handler(_webhook_event({**PAYLOAD, "webhookEvent": "comment_created"}), context=None)
+
+    assert resp["statusCode"] == 200
+    assert json.loads(resp["body"])["ignored"] is True
+    assert _DummyTranslator.last_webhook is None
+
+
+def test_handler_verifies_webhook_signature(monkeypatch):
+    _set_env(monkeypatch)
+    monkeypatch.setenv("JIRA_WEBHOOK_SECRET", "s3cret")
+    body = json.dumps(PAYLOAD, ensure_ascii=False)
+    signature = "sha256=" + hmac.new(b"s3cret", body.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    bad = handler.lambda_handler(_webhook_event(PAYLOAD, {"X-Hub-Signature": "sha256=bad"}), context=None)
+    good = handler.lambda_handler(_webhook_event(PAYLOAD, {"X-Hub-Signature": signature}), context=None)
+
+    assert bad["statusCode"] == 401
+    assert good["statusCode"] == 200
+
+
+def test_webhook_shaped_body_on_translate_route_requires_signature(monkeypatch):
+    _set_env(monkeypatch)
+    monkeypatch.setenv("JIRA_WEBHOOK_SECRET", "s3cret")
+    payload = {**PAYLOAD, "update": True}
+    body = json.dumps(payload, ensure_ascii=False)
+    signature = "sha256=" + hmac.new(b"s3cret", body.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    def translate_event(headers=None):
+        return {**_webhook_event(payload, headers), "resource": "/translate", "path": "/translate"}
+
+    unsigned = handler.lambda_handler(translate_event(), context=None)
+
+    assert unsigned["statusCode"] == 401
+    assert _DummyTranslator.last_webhook is None
+    assert handler.lambda_handler(translate_event({"X-Hub-Signature": signature}), context=None)["statusCode"] == 200
+
+
+def test_unsigned_webhook_fields_are_ignored_without_secret(monkeypatch):
+    _set_env(monkeypatch)
+    payload = {**PAYLOAD, "issue": {"key": "p2-42", "fields": {"summary": "임의로 넣은 내용"}}}
+
+    resp = handler.lambda_handler(_webhook_event(payload), context=None)
+
+    assert resp["statusCode"] == 200
+    # payload의 필드 값은 쓰지 않고 Jira에서 다시 조회하는 일반 경로로 번역한다
+    assert _DummyTranslator.last_webhook is None
+    assert _DummyTranslator.last_fetch["issue_key"] == "P2-42"
+    assert _DummyTranslator.last_fetch["perform_update"] is True
@@ -0,0 +1,84 @@
+"""Tests for the single-pass wiki markup line lexer."""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.formatting import (
+    LineKind,
+    extract_description_sections,
+    format_bilingual_block,
+    is_header_line,
+    is_inside_code_block,
+    is_media_only_line,
+    match_section_header,
+    tokenize_wiki_lines,
+)
+
+SAMPLE = "\n".join([
+    "*[QA 환경 / QA Environment]*",
+    "Build 1.2.3",
+    "",
+    "Observed:",
+    "* 로비 진입 시 크래시",
+    "  # 상점 탭 열기",
+    "!shot.png|thumbnail!",
+    "[^video.mp4],",
+    "[clip.mp4|https://example.com/clip.mp4]",
+    "__IMAGE_PLACEHOLDER_3__",
+    "[^log.txt] - 로그 첨부",
+    "{color:#ff0000}Expected Result:{color}",
+    "{code:java}",
+    "Note: 코드 안의 헤더",
+    "",
+    "{code}",
+    "{noformat}a{noformat}",
+    "||항목||결과||",
+    "|iOS|실패|",
+    "|",
+    "* \tNote (추가)",
+    "_Video/영상:_",
+    "{color:#4c9aff}Translated{color}",
+    "   ",
+    "Etc.",
+])
+
+
+def _legacy_kind(line, in_code_block):
+    """tokenize 이전 format_bilingual_block의 판별 순서."""
+    stripped = line.strip()
+    is_code_line, in_code_block = is_inside_code_block(line, in_code_block)
+    if is_code_line or in_code_block:
+        return LineKind.CODE, in_code_block
+    if stripped.startswith("|") and stripped.endswith("|"):
+        return (LineKind.TABLE_HEADER if stripped.startswith("||") else LineKind.TABLE_ROW), in_code_block
+    if is_media_only_line(stripped):
+        return LineKind.MEDIA_ONLY, in_code_block
+    if is_header_line(stripped):
+        return LineKind.HEADER, in_code_block
+    if not stripped:
+        return LineKind.BLANK, in_code_block
+    return LineKind.TEXT, in_code_block
+
+
+def test_tokens_match_individual_line_checks():
+    in_code_block = False
+    for token in tokenize_wiki_lines(SAMPLE):
+        expected, in_code_block = _legacy_kind(token.text, in_code_block)
+        assert token.kind == expected, token.text
+        assert token.header == match_section_header(token.text), token.text
+
+
+def test_sections_and_bilingual_block_use_token_stream():
+    sections = extract_description_sections(SAMPLE)
+    assert [header for header, _ in sections][:3] == ["*[QA 환경 / QA Environment]*", "Observed:", "Expected Result:"]
+
+    original = "로비 진입 시 크래시\n!shot.png!\n||항목||결과||\n|iOS|실패|"
+    translated = "Crash on lobby entry\n||Item||Result||\n|iOS|Fail|"
+    assert format_bilingual_block(original, translated) == (
+        "로비 진입 시 크래시\n\n{color:#4c9aff}Crash on lobby entry{color}\n!shot.png!\n\n"
+        "||*항목/Item*||*결과/Result*||\n\n|iOS/iOS|실패/Fail|"
+    )
@@ -88,8 +88,8 @@ def extract_source_summary(text: str) -> str:
 
     left = core[:sep_match.start()]
     right = core[sep_match.end():]
-    left_lang = language.detect_text_language(left)
-    right_lang = language.detect_text_language(right)
+    left_lang = language.detect_language_cached(left)
+    right_lang = language.detect_language_cached(right)
     if left_lang != "unknown" and right_lang != "unknown" and left_lang != right_lang:
         return f"{prefix}{left.strip()}".strip()
     return cleaned
@@ -108,15 +108,15 @@ def extract_source_steps(text: str) -> str:
     if len(parts) < 2:
         return cleaned
 
-    first_lang = language.detect_text_language(parts[0])
-    second_lang = language.detect_text_language(parts[1])
+    first_lang = language.detect_language_cached(parts[0])
+    second_lang = language.detect_language_cached(parts[1])
     if first_lang == "unknown" or second_lang == "unknown" or first_lang == second_lang:
         return cleaned
 
     # Keep contiguous blocks in the first paragraph's language.
     kept: list[str] = []
     for part in parts:
-        current_lang = language.detect_text_language(part)
+        current_lang = language.detect_language_cached(part)
         if current_lang in {first_lang, "unknown"}:
             kept.append(part)
             continue
@@ -174,16 +174,18 @@ def translate_source_fields(
         all_chunks.extend(job.chunks)
 
     chunk_translations: dict[str, str] = {}
-    if all_chunks:
+    pending_chunks = [chunk for chunk in all_chunks if chunk.clean_text.strip()]
+    if pending_chunks:
         try:
-            chunk_translations = translator._call_openai_batch(all_chunks, target_language)
+            chunk_translations = translator._call_openai_batch(pending_chunks, target_language)
         except Exception as exc:
             print(f"⚠️ Batch translation failed, fallback to per-chunk mode: {exc}")
             chunk_translations = translator._translate_chunks_individually(jobs, target_language)
 
     for field, job in jobs.items():
         assembled: list[str] = []
-        for chunk in job.chunks:
+        cell_translations = translator.translation_engine.table_cell_translations(job, chunk_translations)
+        for chunk in job.content_chunks:
             translated_raw = chunk_translations.get(chunk.id, "")
             restored = translator.restore_attachments_markup(translated_raw, chunk.attachments)
             if job.mode == "description":
@@ -199,6 +201,7 @@ def translate_source_fields(
                         chunk.original_text,
                         restored,
                         header=chunk.header,
+                        cell_translations=cell_translations,
                     )
                 if block:
                     assembled.append(block)